@@ -0,0 +1,172 @@
+from __future__ import annotations
+
+import argparse
+import copy
+import json
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from workshop.toolbox.stacks.research_core.evidence_claims import ClaimCandidate
+from workshop.toolbox.stacks.research_core.evidence_reconcile import _has_opposition, _norm_tokens, reconcile_claims
+from workshop.toolbox.stacks.research_core.evidence_schema import Claim, EvidenceItem
+from workshop.toolbox.stacks.research_core.evidence_scoring import score_item, score_items
+
+_SUBJECTS = (
+    "metformin statins aspirin vitamin exercise fasting sleep caffeine sodium omega zinc melatonin insulin "
+    "ketamine lithium ibuprofen probiotics creatine iron folate"
+).split()
+_OUTCOMES = (
+    "mortality glucose cholesterol pressure recovery cognition weight inflammation fractures anxiety "
+    "depression stroke fatigue migraine"
+).split()
+_DIRECTIONS = ("increase", "reduce", "improve", "worse", "lower", "higher", "change")
+_FILLER = "trial cohort adults randomized observational review dose week month baseline follow".split()
+_SOURCES = ("official", "academic", "reputable_news", "reference", "vendor", "blog", "forum", "unknown")
+QUESTION = "does metformin reduce mortality and improve glucose in adults"
+
+
+def build_synthetic_bundle(claims: int, *, seed: int = 5) -> Tuple[List[ClaimCandidate], Dict[str, EvidenceItem]]:
+    """Claim candidates plus the evidence items they cite, roughly one item per three claims."""
+    rng = random.Random(seed)
+    item_count = max(1, claims // 3)
+    items: Dict[str, EvidenceItem] = {}
+    for idx in range(item_count):
+        item_id = f"item{idx:05d}"
+        items[item_id] = EvidenceItem(
+            id=item_id,
+            title=f"{rng.choice(_SUBJECTS).title()} and {rng.choice(_OUTCOMES)}",
+            url=f"https://site{idx % 211}.example.org/{idx}",
+            source_type=rng.choice(_SOURCES),
+            published_date=rng.choice((None, "2025-06-01", "2024-01-15", "2026-09-30")),
+            retrieved_at="2026-10-01T00:00:00Z",
+            snippet=" ".join(rng.choice(_FILLER + _OUTCOMES) for _ in range(20)),
+            content_excerpt=" ".join(rng.choice(_FILLER + _SUBJECTS + _OUTCOMES) for _ in range(rng.choice((10, 40)))),
+            domain=f"site{idx % 211}.example.org",
+        )
+    item_ids = list(items)
+    candidates: List[ClaimCandidate] = []
+    for _ in range(claims):
+        value = round(rng.uniform(1, 60), 1)
+        text = (
+            f"{rng.choice(_SUBJECTS)} {rng.choice(_DIRECTIONS)} {rng.choice(_OUTCOMES)} by {value}% "
+            f"in {' '.join(rng.sample(_FILLER, 3))}"
+        )
+        numbers = {"values": [{"value": value, "unit": "%"}]} if rng.random() < 0.5 else None
+        candidates.append(ClaimCandidate(text=text, item_id=rng.choice(item_ids), numbers=numbers))
+    return candidates, items
+
+
+def _pairwise_conflicts(claims: List[Claim]) -> List[Dict[str, str]]:
+    """The original all-pairs conflict pass, kept as the comparison baseline."""
+    conflicts: List[Dict[str, str]] = []
+    for i in range(len(claims)):
+        for j in range(i + 1, len(claims)):
+            a, b = claims[i], claims[j]
+            if len(_norm_tokens(a.text) & _norm_tokens(b.text)) < 3:
+                continue
+            ad, bd = _has_opposition(a.text), _has_opposition(b.text)
+            if ad != 0 and bd != 0 and ad != bd:
+                a.contradicting_item_ids = sorted(set(a.contradicting_item_ids + b.supporting_item_ids))
+                b.contradicting_item_ids = sorted(set(b.contradicting_item_ids + a.supporting_item_ids))
+                conflicts.append({"type": "directional", "claim_a": a.id, "claim_b": b.id})
+                continue
+            if a.numbers and b.numbers:
+                av = a.numbers.get("values", [{}])[0].get("value")
+                bv = b.numbers.get("values", [{}])[0].get("value")
+                if isinstance(av, (int, float)) and isinstance(bv, (int, float)) and min(abs(av), abs(bv)) > 0:
+                    if abs(av - bv) / min(abs(av), abs(bv)) > 0.2:
+                        conflicts.append({"type": "numeric", "claim_a": a.id, "claim_b": b.id})
+    return conflicts
+
+
+def _strip_claims(claims: List[Claim]) -> List[Claim]:
+    return [
+        Claim(id=c.id, text=c.text, scope=c.scope, numbers=c.numbers, supporting_item_ids=list(c.supporting_item_ids))
+        for c in claims
+    ]
+
+
+def _pair_keys(conflicts: List[Dict[str, str]]) -> List[Tuple[str, str, str]]:
+    return [(row["type"], row["claim_a"], row["claim_b"]) for row in conflicts if row.get("claim_a")]
+
+
+def run_benchmark(sizes: List[int], *, pairwise_max: int = 1000) -> List[Dict[str, Any]]:
+    """Time reconcile_claims and score_items on synthetic bundles of ``sizes`` claims.
+
+    The all-pairs baseline only runs for sizes up to ``pairwise_max`` (0 disables it).
+    """
+    results: List[Dict[str, Any]] = []
+    for size in sizes:
+        candidates, items = build_synthetic_bundle(size)
+        started = time.perf_counter()
+        claims, conflicts = reconcile_claims(candidates, items_by_id=items)
+        reconcile_s = time.perf_counter() - started
+
+        batch = list(items.values())
+        started = time.perf_counter()
+        score_items(copy.deepcopy(batch), question=QUESTION, needs_recency=True)
+        score_batch_s = time.perf_counter() - started
+        looped = copy.deepcopy(batch)
+        started = time.perf_counter()
+        for item in looped:
+            item.score, item.score_breakdown = score_item(item, question=QUESTION, needs_recency=True)
+        score_loop_s = time.perf_counter() - started
+
+        row: Dict[str, Any] = {
+            "candidates": size,
+            "claims": len(claims),
+            "conflicts": len(conflicts),
+            "reconcile_ms": round(reconcile_s * 1000.0, 3),
+            "items": len(batch),
+            "score_items_ms": round(score_batch_s * 1000.0, 3),
+            "score_item_loop_ms": round(score_loop_s * 1000.0, 3),
+        }
+        if size <= pairwise_max:
+            stripped = _strip_claims(claims)
+            started = time.perf_counter()
+            baseline = _pairwise_conflicts(stripped)
+            row["pairwise_conflict_ms"] = round((time.perf_counter() - started) * 1000.0, 3)
+            row["conflicts_match"] = _pair_keys(baseline) == _pair_keys(conflicts)
+        results.append(row)
+    return results
+
+
+def _render_markdown(results: List[Dict[str, Any]]) -> str:
+    lines = [
+        "# Evidence Reconcile And Scoring",
+        "",
+        "| candidates | claims | conflicts | reconcile ms | pairwise conflict ms | match | items | score_items ms | score_item loop ms |",
+        "| ---: | ---: | ---: | ---: | ---: | :---: | ---: | ---: | ---: |",
+    ]
+    for row in results:
+        lines.append(
+            f"| {row['candidates']} | {row['claims']} | {row['conflicts']} | {row['reconcile_ms']} "
+            f"| {row.get('pairwise_conflict_ms', '-')} | {row.get('conflicts_match', '-')} | {row['items']} "
+            f"| {row['score_items_ms']} | {row['score_item_loop_ms']} |"
+        )
+    return "\n".join(lines)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark evidence claim reconciliation and batch scoring.")
+    parser.add_argument("--sizes", default="100,1000,5000", help="Comma-separated claim-candidate counts.")
+    parser.add_argument("--pairwise-max", type=int, default=1000, help="Largest size to also time the all-pairs baseline on (0 disables).")
+    parser.add_argument("--json-output", help="Write raw results to this path.")
+    args = parser.parse_args()
+    sizes = [int(item) for item in str(args.sizes).split(",") if item.strip()]
+    results = run_benchmark(sizes, pairwise_max=args.pairwise_max)
+    if args.json_output:
+        Path(args.json_output).write_text(json.dumps(results, indent=2), encoding="utf-8")
+    print(_render_markdown(results))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
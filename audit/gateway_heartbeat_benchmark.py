@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+import argparse
+import json
+import shutil
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from gateway.protocol import utcnow_iso
+from gateway.store import GatewayStore
+
+# mode -> GatewayStore keyword arguments
+MODES: Dict[str, Dict[str, Any]] = {
+    "connection_per_call": {"pool_size": 0, "coalesce_seconds": 0.0},
+    "pooled": {"pool_size": 4, "coalesce_seconds": 0.0},
+    "pooled_coalesced": {"pool_size": 4, "coalesce_seconds": 0.05},
+}
+
+
+def _heartbeat(store: GatewayStore, node: int, beat: int) -> float:
+    started = time.perf_counter()
+    now = utcnow_iso()
+    store.upsert_presence(
+        {
+            "session_id": f"sess-{node:05d}",
+            "client_id": f"node-{node:05d}",
+            "user_id": "bench",
+            "surface": "node",
+            "status": "online",
+            "activity": "heartbeat",
+            "detail": f"beat {beat}",
+            "updated_at": now,
+            "metadata": {"beat": beat},
+        }
+    )
+    store.record_health(
+        {
+            "service_id": f"node-{node:05d}",
+            "surface": "node",
+            "status": "healthy",
+            "summary": f"beat {beat}",
+            "updated_at": now,
+        }
+    )
+    return time.perf_counter() - started
+
+
+def _percentile(values: list[float], q: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+def run_mode(mode: str, *, nodes: int, seconds: int, workers: int) -> Dict[str, Any]:
+    """Every node sends one presence + health heartbeat per simulated second, paced in real time."""
+    root = Path(tempfile.mkdtemp(prefix="somi_gateway_bench_"))
+    store = GatewayStore(root_dir=root, **MODES[mode])
+    latencies: list[float] = []
+    late_seconds = 0
+    try:
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+            for beat in range(seconds):
+                tick = time.perf_counter()
+                latencies.extend(pool.map(lambda node: _heartbeat(store, node, beat), range(nodes)))
+                spent = time.perf_counter() - tick
+                if spent > 1.0:
+                    late_seconds += 1
+                else:
+                    time.sleep(1.0 - spent)
+        store.flush()
+        elapsed = time.perf_counter() - started
+        rows = len(store.list_presence(limit=nodes + 10))
+        return {
+            "mode": mode,
+            "heartbeats": len(latencies),
+            "elapsed_s": round(elapsed, 2),
+            "p50_ms": round(_percentile(latencies, 0.50) * 1000.0, 3),
+            "p95_ms": round(_percentile(latencies, 0.95) * 1000.0, 3),
+            "max_ms": round(max(latencies or [0.0]) * 1000.0, 3),
+            "late_seconds": late_seconds,
+            "flushes": store.flush_count,
+            "connections_opened": store._pool.opened,
+            "presence_rows": rows,
+        }
+    finally:
+        store.close()
+        shutil.rmtree(root, ignore_errors=True)
+
+
+def _render_markdown(result: Dict[str, Any]) -> str:
+    lines = [
+        "# Gateway Heartbeat Stress",
+        "",
+        f"Nodes: {result['nodes']}  Seconds: {result['seconds']}  Workers: {result['workers']}",
+        "",
+        "| mode | heartbeats | p50 ms | p95 ms | max ms | late seconds | flushes | connections |",
+        "| --- | ---: | ---: | ---: | ---: | ---: | ---: | ---: |",
+    ]
+    for row in result["modes"]:
+        lines.append(
+            f"| {row['mode']} | {row['heartbeats']} | {row['p50_ms']} | {row['p95_ms']} | {row['max_ms']} | "
+            f"{row['late_seconds']} | {row['flushes']} | {row['connections_opened']} |"
+        )
+    return "\n".join(lines)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Stress GatewayStore with N nodes sending presence and health heartbeats every second.")
+    parser.add_argument("--nodes", type=int, default=200)
+    parser.add_argument("--seconds", type=int, default=5)
+    parser.add_argument("--workers", type=int, default=8, help="Threads delivering heartbeats concurrently.")
+    parser.add_argument("--mode", action="append", choices=sorted(MODES), help="Modes to run (default: all).")
+    parser.add_argument("--json-output", help="Write raw results to this path.")
+    args = parser.parse_args()
+    modes = args.mode or list(MODES)
+    result = {
+        "nodes": args.nodes,
+        "seconds": args.seconds,
+        "workers": args.workers,
+        "modes": [run_mode(mode, nodes=args.nodes, seconds=args.seconds, workers=args.workers) for mode in modes],
+    }
+    if args.json_output:
+        Path(args.json_output).write_text(json.dumps(result, indent=2), encoding="utf-8")
+    print(_render_markdown(result))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
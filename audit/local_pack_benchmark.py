@@ -0,0 +1,163 @@
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from workshop.toolbox.stacks.research_core.local_pack_index import LocalPackIndex
+from workshop.toolbox.stacks.research_core.local_packs import _scan_search_rows
+
+_VOCABULARY = (
+    "water filter purify boil shelter insulation generator battery inverter solar microgrid radio antenna "
+    "relay wound triage splint sanitation latrine chlorine seed compost irrigation pump valve diagnostics "
+    "fuse breaker wiring voltage charge storage ration signal mesh repeater bandage fever hydration"
+).split()
+DEFAULT_QUERIES = (
+    "how do i purify water offline",
+    "battery inverter wiring",
+    "radio relay antenna",
+    "wound triage bandage",
+    "seed compost irrigation",
+)
+
+
+def _paragraph(rng: random.Random, words: int) -> str:
+    return " ".join(rng.choice(_VOCABULARY) for _ in range(words)).capitalize() + "."
+
+
+def build_synthetic_packs(root_dir: Path, *, packs: int, docs_per_pack: int, paragraphs: int = 6, seed: int = 7) -> None:
+    rng = random.Random(seed)
+    for pack_no in range(packs):
+        pack_dir = root_dir / "knowledge_packs" / f"bench_pack_{pack_no:04d}"
+        pack_dir.mkdir(parents=True, exist_ok=True)
+        manifest = {
+            "id": pack_dir.name,
+            "category": rng.choice(("repair", "survival", "infrastructure", "health")),
+            "summary": _paragraph(rng, 14),
+            "tags": rng.sample(_VOCABULARY, 4),
+            "schema_version": 1,
+            "variant": "compact",
+        }
+        (pack_dir / "manifest.json").write_text(json.dumps(manifest), encoding="utf-8")
+        for doc_no in range(docs_per_pack):
+            body = "\n\n".join(_paragraph(rng, 60) for _ in range(paragraphs))
+            title = " ".join(rng.sample(_VOCABULARY, 3)).title()
+            (pack_dir / f"doc_{doc_no:03d}.md").write_text(f"# {title}\n\n{body}\n", encoding="utf-8")
+
+
+def _latency_summary(samples: List[float]) -> Dict[str, float]:
+    ordered = sorted(samples)
+    p95 = ordered[min(len(ordered) - 1, int(round(0.95 * (len(ordered) - 1))))]
+    return {
+        "mean_ms": round(statistics.fmean(ordered) * 1000.0, 3),
+        "p50_ms": round(statistics.median(ordered) * 1000.0, 3),
+        "p95_ms": round(p95 * 1000.0, 3),
+    }
+
+
+def _time_queries(fn, queries: List[str], repeat: int) -> List[float]:
+    samples: List[float] = []
+    for _ in range(max(1, repeat)):
+        for query in queries:
+            started = time.perf_counter()
+            fn(query)
+            samples.append(time.perf_counter() - started)
+    return samples
+
+
+def run_benchmark(
+    sizes: List[int],
+    *,
+    docs_per_pack: int = 10,
+    queries: List[str] | None = None,
+    repeat: int = 3,
+    include_scan: bool = True,
+) -> List[Dict[str, Any]]:
+    """Measure scan vs indexed query latency for each pack count in ``sizes``."""
+    query_list = list(queries or DEFAULT_QUERIES)
+    results: List[Dict[str, Any]] = []
+    for size in sizes:
+        work_dir = Path(tempfile.mkdtemp(prefix="somi_pack_bench_"))
+        try:
+            build_synthetic_packs(work_dir, packs=size, docs_per_pack=docs_per_pack)
+            index = LocalPackIndex(work_dir, refresh_interval_s=3600.0)
+            started = time.perf_counter()
+            build_stats = index.refresh(force=True)
+            build_s = time.perf_counter() - started
+
+            started = time.perf_counter()
+            index.refresh(force=True)
+            noop_refresh_s = time.perf_counter() - started
+
+            changed = work_dir / "knowledge_packs" / "bench_pack_0000" / "doc_000.md"
+            changed.write_text(changed.read_text(encoding="utf-8") + "\nExtra maintenance note.\n", encoding="utf-8")
+            started = time.perf_counter()
+            incremental_stats = index.refresh(force=True)
+            incremental_s = time.perf_counter() - started
+
+            row: Dict[str, Any] = {
+                "packs": size,
+                "documents": size * docs_per_pack,
+                "chunks": index.stats().get("chunks", 0),
+                "index_build_ms": round(build_s * 1000.0, 3),
+                "noop_refresh_ms": round(noop_refresh_s * 1000.0, 3),
+                "incremental_refresh_ms": round(incremental_s * 1000.0, 3),
+                "packs_rebuilt_initial": build_stats.get("rebuilt", 0),
+                "packs_rebuilt_incremental": incremental_stats.get("rebuilt", 0),
+                "indexed": _latency_summary(_time_queries(lambda q: index.search(q, limit=4), query_list, repeat)),
+            }
+            if include_scan:
+                row["scan"] = _latency_summary(_time_queries(lambda q: _scan_search_rows(work_dir, q, limit=4), query_list, repeat))
+                row["speedup_mean"] = round(row["scan"]["mean_ms"] / max(row["indexed"]["mean_ms"], 1e-6), 2)
+            results.append(row)
+        finally:
+            shutil.rmtree(work_dir, ignore_errors=True)
+    return results
+
+
+def _render_markdown(results: List[Dict[str, Any]]) -> str:
+    lines = [
+        "# Local Pack Query Latency",
+        "",
+        "| packs | docs | build ms | incr refresh ms | indexed p50 ms | indexed p95 ms | scan p50 ms | scan p95 ms | speedup |",
+        "| ---: | ---: | ---: | ---: | ---: | ---: | ---: | ---: | ---: |",
+    ]
+    for row in results:
+        scan = dict(row.get("scan") or {})
+        lines.append(
+            f"| {row['packs']} | {row['documents']} | {row['index_build_ms']} | {row['incremental_refresh_ms']} "
+            f"| {row['indexed']['p50_ms']} | {row['indexed']['p95_ms']} | {scan.get('p50_ms', '-')} "
+            f"| {scan.get('p95_ms', '-')} | {row.get('speedup_mean', '-')} |"
+        )
+    return "\n".join(lines)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark local knowledge-pack query latency against pack size.")
+    parser.add_argument("--sizes", default="5,25,100", help="Comma-separated pack counts to benchmark.")
+    parser.add_argument("--docs-per-pack", type=int, default=10, help="Synthetic documents per pack.")
+    parser.add_argument("--repeat", type=int, default=3, help="Passes over the query set per size.")
+    parser.add_argument("--skip-scan", action="store_true", help="Only time the persisted index, not the scanning search.")
+    parser.add_argument("--json-output", help="Write raw results to this path.")
+    args = parser.parse_args()
+    sizes = [int(item) for item in str(args.sizes).split(",") if item.strip()]
+    results = run_benchmark(sizes, docs_per_pack=args.docs_per_pack, repeat=args.repeat, include_scan=not args.skip_scan)
+    if args.json_output:
+        Path(args.json_output).write_text(json.dumps(results, indent=2), encoding="utf-8")
+    print(_render_markdown(results))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
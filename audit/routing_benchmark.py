@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from audit.safe_search_corpus import build_everyday_corpus, build_research_smoke_corpus
+from routing.planner import build_query_plan
+from routing.query_analysis import clear_query_analysis_cache
+from workshop.toolbox.stacks.research_core.browse_planner import build_browse_plan
+from workshop.toolbox.stacks.research_core.router import ResearchRouter
+
+
+def _load_websearch_handler() -> Any:
+    try:
+        from workshop.toolbox.stacks.web_core.websearch import WebSearchHandler
+    except Exception:
+        return None
+    return WebSearchHandler()
+
+
+def _stages(handler: Any) -> Dict[str, Callable[[str], Any]]:
+    router = ResearchRouter()
+    stages: Dict[str, Callable[[str], Any]] = {
+        "query_plan": build_query_plan,
+        "browse_plan": lambda q: build_browse_plan(q, route_hint="websearch"),
+        "research_domains": router._choose_domains,
+    }
+    if handler is not None:
+        stages["websearch_intent"] = lambda q: (
+            handler._is_research_query(q.lower()),
+            handler._force_intent_from_terms(q.lower()),
+            handler._query_focus_terms(q),
+        )
+    return stages
+
+
+def run_benchmark(queries: List[str], *, repeats: int = 3) -> Dict[str, Any]:
+    """Per-query routing overhead in microseconds, best of ``repeats`` passes.
+
+    ``cold`` clears the shared query analyses before every query, so each turn
+    pays for its own scan; ``turn`` then runs every stage again on the same
+    prompt, which is what the later consumers of a turn see.
+    """
+    stages = _stages(_load_websearch_handler())
+    cold: Dict[str, float] = {name: float("inf") for name in stages}
+    turn: Dict[str, float] = {name: float("inf") for name in stages}
+    for _ in range(max(1, int(repeats))):
+        spent = {name: 0.0 for name in stages}
+        warm = {name: 0.0 for name in stages}
+        for query in queries:
+            clear_query_analysis_cache()
+            for name, stage in stages.items():
+                started = time.perf_counter()
+                stage(query)
+                spent[name] += time.perf_counter() - started
+            for name, stage in stages.items():
+                started = time.perf_counter()
+                stage(query)
+                warm[name] += time.perf_counter() - started
+        for name in stages:
+            cold[name] = min(cold[name], spent[name])
+            turn[name] = min(turn[name], warm[name])
+    count = max(1, len(queries))
+    rows = [
+        {"stage": name, "cold_us": round(cold[name] / count * 1e6, 1), "repeat_us": round(turn[name] / count * 1e6, 1)}
+        for name in stages
+    ]
+    return {
+        "queries": len(queries),
+        "stages": rows,
+        "total_cold_us": round(sum(row["cold_us"] for row in rows), 1),
+        "total_repeat_us": round(sum(row["repeat_us"] for row in rows), 1),
+    }
+
+
+def _render_markdown(result: Dict[str, Any]) -> str:
+    lines = [
+        "# Routing Overhead Per Query",
+        "",
+        f"Queries: {result['queries']}",
+        "",
+        "| stage | first call us | repeat call us |",
+        "| --- | ---: | ---: |",
+    ]
+    for row in result["stages"]:
+        lines.append(f"| {row['stage']} | {row['cold_us']} | {row['repeat_us']} |")
+    lines.append(f"| total | {result['total_cold_us']} | {result['total_repeat_us']} |")
+    return "\n".join(lines)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Microbenchmark the per-query cost of routing and search intent analysis.")
+    parser.add_argument("--limit", type=int, default=1000, help="Everyday corpus queries to time (research smoke queries are always added).")
+    parser.add_argument("--repeats", type=int, default=3, help="Passes over the corpus; the fastest is reported.")
+    parser.add_argument("--json-output", help="Write raw results to this path.")
+    args = parser.parse_args()
+    queries = [case.query for case in build_everyday_corpus(limit=args.limit)]
+    queries.extend(case.query for case in build_research_smoke_corpus())
+    result = run_benchmark(queries, repeats=args.repeats)
+    if args.json_output:
+        Path(args.json_output).write_text(json.dumps(result, indent=2), encoding="utf-8")
+    print(_render_markdown(result))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -9,10 +9,12 @@ import os
 import re
 import subprocess
 import sys
+import threading
 import time
 from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
-from typing import Any, Dict, Iterable, List
+from typing import Any, Dict, Iterable, List, Tuple
 from urllib.parse import urlparse
 
 import httpx
@@ -23,6 +25,7 @@ if str(REPO_ROOT) not in sys.path:
 
 from audit.safe_search_corpus import BenchmarkCase, build_named_corpus, slice_cases
 from workshop.toolbox.stacks.research_core.searxng import search_searxng
+from workshop.toolbox.stacks.web_core import websearch as websearch_module
 from workshop.toolbox.stacks.web_core.websearch import WebSearchHandler
 from workshop.toolbox.stacks.web_core.websearch_tools.generalsearch import search_general
 
@@ -799,6 +802,126 @@ def _main_isolated(args: argparse.Namespace) -> int:
     return 0
 
 
+_ADEQUACY_QUESTION = "how much sodium per day for adults"
+_ADEQUACY_TEXT = (
+    "Adults should limit sodium intake to less than 2000 mg per day according to the review. "
+    "Cohort studies confirm that lowering salt intake reduces systolic blood pressure by about 5 mmHg. "
+)
+
+
+def _stub_pages(slow_delay_s: float) -> Dict[str, Tuple[float, str]]:
+    body = "<html><body><article>" + "<p>" + _ADEQUACY_TEXT * 3 + "</p></article></body></html>"
+    return {
+        "/sodium-review": (0.05, body),
+        "/sodium-guidance": (0.15, body),
+        "/sodium-slow-host": (float(slow_delay_s), body),
+        "/sodium-extra": (0.25, body),
+    }
+
+
+class _StubPageHandler(BaseHTTPRequestHandler):
+    def do_GET(self) -> None:  # noqa: N802
+        delay, body = self.server.pages.get(self.path, (0.0, ""))  # type: ignore[attr-defined]
+        time.sleep(delay)
+        payload = body.encode("utf-8")
+        with contextlib.suppress(Exception):
+            self.send_response(200 if body else 404)
+            self.send_header("Content-Type", "text/html; charset=utf-8")
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+    def log_message(self, *_args: Any) -> None:
+        return
+
+
+@contextlib.contextmanager
+def _stub_http_server(pages: Dict[str, Tuple[float, str]]):
+    """Serve ``pages`` (path -> (delay seconds, html)) from 127.0.0.1 on a free port."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StubPageHandler)
+    server.daemon_threads = True
+    server.pages = pages  # type: ignore[attr-defined]
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    # The fetch path refuses loopback hosts; open it up for this server only while the harness runs.
+    original_is_safe_url = websearch_module._is_safe_url
+    host = f"127.0.0.1:{server.server_address[1]}"
+    websearch_module._is_safe_url = lambda url: _host(url) == host or original_is_safe_url(url)
+    try:
+        yield f"http://{host}"
+    finally:
+        websearch_module._is_safe_url = original_is_safe_url
+        server.shutdown()
+        server.server_close()
+
+
+async def measure_time_to_adequate(
+    *,
+    slow_delay_s: float = 3.0,
+    top_n: int = 3,
+    max_n: int = 4,
+    question: str = _ADEQUACY_QUESTION,
+) -> Dict[str, Any]:
+    """
+    Time-to-adequate-evidence for the blocking fetch versus the streaming fetch.
+
+    Both modes see the same stub pages, one of which sits behind a slow host.
+    """
+    pages = _stub_pages(slow_delay_s)
+    with _stub_http_server(pages) as base_url:
+        rows = [
+            {"title": f"Sodium intake {path.strip('/').replace('-', ' ')}", "url": base_url + path, "description": "Daily sodium limits for adults."}
+            for path in pages
+        ]
+
+        handler = WebSearchHandler()
+        started = time.perf_counter()
+        blocking_rows = await handler._fetch_and_attach_content(rows, "general", top_n=top_n, max_n=max_n)
+        blocking_s = time.perf_counter() - started
+
+        handler = WebSearchHandler()
+        streamed: List[Dict[str, Any]] = []
+        first_row_s = 0.0
+        started = time.perf_counter()
+        async for row in handler._stream_fetch_and_attach_content(rows, "general", top_n=top_n, max_n=max_n, question=question):
+            if not streamed:
+                first_row_s = time.perf_counter() - started
+            streamed.append(row)
+        streaming_s = time.perf_counter() - started
+
+    from workshop.toolbox.stacks.research_core.composer import assess_row_adequacy
+
+    return {
+        "question": question,
+        "slow_delay_s": float(slow_delay_s),
+        "blocking_s": round(blocking_s, 3),
+        "blocking_rows_with_content": sum(1 for row in blocking_rows if row.get("content")),
+        "streaming_first_row_s": round(first_row_s, 3),
+        "streaming_adequate_s": round(streaming_s, 3),
+        "streaming_rows": len(streamed),
+        "streaming_adequate": assess_row_adequacy(question, streamed).adequate,
+    }
+
+
+def _render_time_to_adequate_markdown(result: Dict[str, Any]) -> str:
+    return "\n".join(
+        [
+            "# Time to Adequate Evidence",
+            "",
+            f"- Question: {result['question']}",
+            f"- Slow host delay: {result['slow_delay_s']:.2f}s",
+            "",
+            "| Mode | Seconds | Rows |",
+            "| --- | ---: | ---: |",
+            f"| blocking gather | {result['blocking_s']:.3f} | {result['blocking_rows_with_content']} |",
+            f"| streaming, first row | {result['streaming_first_row_s']:.3f} | 1 |",
+            f"| streaming, adequate | {result['streaming_adequate_s']:.3f} | {result['streaming_rows']} |",
+            "",
+            f"Adequate when the stream stopped: {'yes' if result['streaming_adequate'] else 'no'}",
+        ]
+    )
+
+
 def main() -> int:
     parser = argparse.ArgumentParser(description="Run resumable safe search benchmarks against Somi.")
     parser.add_argument("--output", help="Write markdown report to this path.")
@@ -823,7 +946,15 @@ def main() -> int:
     parser.add_argument("--stdout-summary-only", action="store_true", help="Print only the compact summary to stdout.")
     parser.add_argument("--hard-exit", action="store_true", help="Force process termination after writing outputs to avoid lingering worker threads during long benchmark runs.")
     parser.add_argument("--single-case-stdin", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument("--time-to-adequate", action="store_true", help="Measure time-to-adequate-evidence against a local stub HTTP server instead of running the corpus.")
+    parser.add_argument("--slow-delay", type=float, default=3.0, help="Delay in seconds of the slow stub host for --time-to-adequate.")
     args = parser.parse_args()
+    if args.time_to_adequate:
+        result = asyncio.run(measure_time_to_adequate(slow_delay_s=float(args.slow_delay)))
+        if args.json_output:
+            _append_jsonl(Path(args.json_output), result)
+        print(_render_time_to_adequate_markdown(result))
+        return 0
     if args.single_case_stdin:
         return _finalize_exit(asyncio.run(_single_case_from_stdin()), hard_exit=bool(args.hard_exit))
     if args.isolated:
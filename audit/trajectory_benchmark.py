@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+import argparse
+import json
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from learning.trajectories import CORRECTION_MARKERS, GROUNDING_ROUTES, TrajectoryStore
+
+_ROUTES = ("websearch", "normal", "planning", "command", "search_only")
+
+
+def _turns(thread_count: int, turns_per_thread: int, user_id: str) -> List[Dict[str, Any]]:
+    turns: List[Dict[str, Any]] = []
+    for thread in range(thread_count):
+        for idx in range(turns_per_thread):
+            seq = thread * turns_per_thread + idx
+            turns.append(
+                {
+                    "user_id": user_id,
+                    "thread_id": f"thread-{thread:05d}",
+                    "session_id": f"session-{thread % 50}",
+                    "turn_id": seq,
+                    "turn_index": idx + 1,
+                    "prompt": "actually, use the other file" if seq % 7 == 3 else f"question {seq}",
+                    "response": "See https://example.org/source for details." if seq % 3 else "Done.",
+                    "route": _ROUTES[seq % len(_ROUTES)],
+                    "model_name": "bench-model",
+                    "latency_ms": 200 + seq % 400,
+                }
+            )
+    return turns
+
+
+def _legacy_counts(store: TrajectoryStore) -> Dict[str, int]:
+    """What a scorecard cost before the index: parse every thread file and recount."""
+    counts = {"turn_count": 0, "grounding_total": 0, "grounding_hits": 0, "correction_total": 0}
+    for path in store.root_dir.glob("*.jsonl"):
+        rows = [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines() if line.strip()]
+        counts["turn_count"] += len(rows)
+        for idx, row in enumerate(rows):
+            if str(row.get("route") or "").lower() in GROUNDING_ROUTES:
+                counts["grounding_total"] += 1
+                counts["grounding_hits"] += 1 if row.get("grounded") else 0
+            if idx + 1 < len(rows):
+                prompt = str(rows[idx + 1].get("prompt") or "").lower()
+                counts["correction_total"] += 1 if any(marker in prompt for marker in CORRECTION_MARKERS) else 0
+    return counts
+
+
+def _timed(fn: Any) -> tuple[float, Any]:
+    started = time.perf_counter()
+    result = fn()
+    return round((time.perf_counter() - started) * 1000.0, 1), result
+
+
+def run_benchmark(*, threads: int = 10000, turns_per_thread: int = 4, write_sample: int = 500) -> Dict[str, Any]:
+    """Milliseconds for writing, migrating and scoring ``threads`` synthetic trajectories."""
+    root = Path(tempfile.mkdtemp(prefix="somi_trajectory_bench_"))
+    try:
+        turns = _turns(threads, turns_per_thread, "bench_user")
+        store = TrajectoryStore(root)
+        bulk_ms, _ = _timed(lambda: store.record_turns(turns))
+
+        sample = _turns(max(1, write_sample // turns_per_thread), turns_per_thread, "sample_user")
+        per_turn_ms, _ = _timed(lambda: [store.record_turn(**turn) for turn in sample])
+
+        store.index_path.unlink()
+        for sidecar in root.glob("trajectory_index.sqlite3-*"):
+            sidecar.unlink()
+        migrate_ms, reopened = _timed(lambda: TrajectoryStore(root))
+        legacy_ms, legacy = _timed(lambda: _legacy_counts(reopened))
+        indexed_ms, indexed = _timed(reopened.aggregate)
+        list_ms, _ = _timed(lambda: reopened.list_threads(user_id="bench_user", limit=40))
+        consistent = all(indexed[key] == legacy[key] for key in legacy)
+        return {
+            "threads": threads,
+            "turns": len(turns) + len(sample),
+            "timings_ms": {
+                "bulk_write": bulk_ms,
+                "per_turn_write_sample": per_turn_ms,
+                "offline_migration": migrate_ms,
+                "legacy_scorecard_scan": legacy_ms,
+                "indexed_scorecard": indexed_ms,
+                "list_threads": list_ms,
+            },
+            "bulk_turns_per_second": round(len(turns) / max(bulk_ms / 1000.0, 1e-9), 1),
+            "per_turn_turns_per_second": round(len(sample) / max(per_turn_ms / 1000.0, 1e-9), 1),
+            "counters_match_scan": consistent,
+        }
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+
+
+def _render_markdown(result: Dict[str, Any]) -> str:
+    lines = [
+        "# Trajectory Store Benchmark",
+        "",
+        f"Threads: {result['threads']}  Turns: {result['turns']}",
+        "",
+        "| step | ms |",
+        "| --- | ---: |",
+    ]
+    for name, value in result["timings_ms"].items():
+        lines.append(f"| {name} | {value} |")
+    lines.extend(
+        [
+            "",
+            f"Bulk writes: {result['bulk_turns_per_second']} turns/s; per-turn writes: {result['per_turn_turns_per_second']} turns/s",
+            f"Indexed counters match a full scan: {result['counters_match_scan']}",
+        ]
+    )
+    return "\n".join(lines)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the indexed trajectory store against full trajectory scans.")
+    parser.add_argument("--threads", type=int, default=10000, help="Synthetic threads to write.")
+    parser.add_argument("--turns-per-thread", type=int, default=4)
+    parser.add_argument("--write-sample", type=int, default=500, help="Turns written one at a time for the per-turn comparison.")
+    parser.add_argument("--json-output", help="Write raw results to this path.")
+    args = parser.parse_args()
+    result = run_benchmark(threads=args.threads, turns_per_thread=args.turns_per_thread, write_sample=args.write_sample)
+    if args.json_output:
+        Path(args.json_output).write_text(json.dumps(result, indent=2), encoding="utf-8")
+    print(_render_markdown(result))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -330,12 +330,20 @@ VISION_ANALYSIS_SECOND_PROMPT = True
 OCR_CACHE_ENABLED = True
 OCR_CACHE_TTL_DAYS = 30
 OCR_CACHE_MAX_ITEMS = 2000
+OCR_CACHE_PHASH_ENABLED = False  # near-duplicate reuse can serve another document's text (same template, different values)
+OCR_CACHE_PHASH_MAX_DISTANCE = 4
 OCR_SECOND_PASS = True
 OCR_MAX_PASSES = 2
 OCR_TEMPERATURE = 0.0
 OCR_TIMEOUT_SEC = 120
 OCR_NUM_PREDICT = 1024
 OCR_MAX_CONCURRENCY = 2
+OCR_PAGE_PARALLEL = True
+OCR_TRANSPORT_ENABLED = True
+OCR_TRANSPORT_MAX_DIM = 2048
+OCR_TRANSPORT_FORMAT = "JPEG"
+OCR_TRANSPORT_QUALITY = 88
+OCR_TRANSPORT_MIN_BYTES = 262144
 OCR_PREPROCESS_POLICY = "auto"
 OCR_MIN_COVERAGE = 0.70
 OCR_MAX_UNK_RATIO = 0.05
@@ -393,6 +401,9 @@ MONTAGUE_MIN_ITEMS_PER_PROJECT = 2
 MONTAGUE_MAX_EVIDENCE_PER_LINK = 5
 MONTAGUE_CLUSTER_WEIGHTS = {"tag": 0.55, "co": 0.30, "recency": 0.15}
 MONTAGUE_RECENCY_DECAY_DAYS = 21
+# Incremental runs leave a skipped item's last_switch_at alone, so its switch cooldown counts from its last
+# re-score instead of from the latest pass; set False to restamp every item on every pass as before.
+MONTAGUE_INCREMENTAL_CLUSTERING = True  # only re-score items that are new or changed since their last assignment
 MONTAGUE_CALENDAR_PROVIDER = "null"  # null|json
 MONTAGUE_CALENDAR_JSON_PATH = "sessions/calendar/events.json"
 MONTAGUE_CALENDAR_CACHE_PATH = "executive/index/calendar_cache.json"
@@ -75,6 +75,7 @@ class LifeModelingRunner:
                 max_evidence_per_link=int(getattr(settings, "MONTAGUE_MAX_EVIDENCE_PER_LINK", 5)),
                 weights=dict(getattr(settings, "MONTAGUE_CLUSTER_WEIGHTS", {"tag": 0.55, "co": 0.3, "recency": 0.15})),
                 recency_decay_days=int(getattr(settings, "MONTAGUE_RECENCY_DECAY_DAYS", 21)),
+                incremental=bool(getattr(settings, "MONTAGUE_INCREMENTAL_CLUSTERING", True)),
             )
             for c in clusters:
                 self.store.write("project_cluster", c)
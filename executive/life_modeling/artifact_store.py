@@ -1,18 +1,69 @@
 from __future__ import annotations
 
 import json
+import threading
 from pathlib import Path
 from typing import Any, Iterable
 
 from executive.life_modeling.schemas import inject_schema
+from runtime.jsonl_log import read_last_jsonl
+
+
+class _TypeOffsets:
+    """Byte offset of the newest newline-terminated row of one artifact type, kept in step with appends."""
+
+    def __init__(self) -> None:
+        self.reset()
+
+    def reset(self) -> None:
+        self.sig: tuple[int, int, int] = (0, 0, 0)
+        self.size = 0
+        self.last_offset = -1
+
+    def refresh(self, path: Path) -> bool:
+        """Bring the offsets in line with ``path``; only bytes appended since the last refresh are parsed."""
+        try:
+            stat = path.stat()
+        except OSError:
+            self.reset()
+            return False
+        sig = (int(stat.st_ino), int(stat.st_size), int(stat.st_mtime_ns))
+        if sig == self.sig:
+            return True
+        if sig[0] != self.sig[0] or stat.st_size < self.size:
+            self.reset()
+        with path.open("rb") as f:
+            f.seek(self.size)
+            pos = self.size
+            for line in f:
+                if not line.endswith(b"\n"):
+                    break
+                try:
+                    row = json.loads(line)
+                except Exception:
+                    row = None
+                if isinstance(row, dict):
+                    self.last_offset = pos
+                pos += len(line)
+        self.size = pos
+        self.sig = sig
+        return True
 
 
 class ArtifactStore:
-    """Phase 7 artifact persistence with schema injection."""
+    """
+    Phase 7 artifact persistence with schema injection.
+
+    Each type keeps an in-memory offset of its newest row, validated against
+    the file's inode, size and mtime, so ``read_latest`` seeks straight to it
+    instead of scanning the JSONL.
+    """
 
     def __init__(self, root_dir: str = "sessions/artifacts/life_modeling"):
         self.root = Path(root_dir)
         self.root.mkdir(parents=True, exist_ok=True)
+        self._offsets: dict[str, _TypeOffsets] = {}
+        self._offsets_lock = threading.Lock()
 
     def _path(self, artifact_type: str) -> Path:
         safe = "".join(ch if ch.isalnum() or ch in {"_", "-"} else "_" for ch in str(artifact_type or "unknown"))
@@ -24,20 +75,28 @@ class ArtifactStore:
             f.write(json.dumps(row, ensure_ascii=False) + "\n")
         return row
 
+    def _read_at(self, path: Path, offset: int) -> dict[str, Any] | None:
+        with path.open("rb") as f:
+            f.seek(offset)
+            try:
+                row = json.loads(f.readline())
+            except Exception:
+                return None
+        return row if isinstance(row, dict) else None
+
     def read_latest(self, artifact_type: str) -> dict[str, Any] | None:
         path = self._path(artifact_type)
-        if not path.exists():
-            return None
-        last = None
-        with path.open("r", encoding="utf-8") as f:
-            for line in f:
-                txt = line.strip()
-                if not txt:
-                    continue
-                try:
-                    last = json.loads(txt)
-                except Exception:
-                    continue
+        with self._offsets_lock:
+            offsets = self._offsets.setdefault(path.name, _TypeOffsets())
+            try:
+                ok = offsets.refresh(path)
+            except OSError:
+                ok = False
+            # Bytes past ``size`` are an unterminated trailing row, which only the reverse reader sees.
+            indexed = ok and offsets.last_offset >= 0 and offsets.size == offsets.sig[1]
+            last = self._read_at(path, offsets.last_offset) if indexed else None
+        if last is None:
+            last = read_last_jsonl(path)
         return inject_schema(artifact_type, last) if isinstance(last, dict) else None
 
     def iter_all(self, artifact_type: str) -> Iterable[dict[str, Any]]:
@@ -1,12 +1,24 @@
 from __future__ import annotations
 
+import bisect
 import hashlib
 import json
+import threading
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Any, Iterable
 
 
+def _ts_epoch(value: Any) -> float | None:
+    try:
+        dt = datetime.fromisoformat(str(value or "").replace("Z", "+00:00"))
+    except Exception:
+        return None
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt.timestamp()
+
+
 class Indexer:
     def __init__(self, artifacts_dir: str = "sessions/artifacts", index_dir: str = "executive/index"):
         self.artifacts_dir = Path(artifacts_dir)
@@ -14,14 +26,58 @@ class Indexer:
         self.index_dir.mkdir(parents=True, exist_ok=True)
         self.index_path = self.index_dir / "artifact_index.json"
         self.state_path = self.index_dir / "index_state.json"
+        # Parsed index plus (updated_at epoch, position) lists sorted by time, overall and per type;
+        # reused while artifact_index.json keeps the same mtime and size.
+        self._cache_lock = threading.Lock()
+        self._cache_sig: tuple[int, int] | None = None
+        self._cache_index: dict[str, Any] = {"items": []}
+        self._by_time: list[tuple[float, int]] = []
+        self._by_type: dict[str, list[tuple[float, int]]] = {}
+
+    def _index_sig(self) -> tuple[int, int] | None:
+        try:
+            stat = self.index_path.stat()
+        except OSError:
+            return None
+        return int(stat.st_mtime_ns), int(stat.st_size)
+
+    def _set_cache(self, index: dict[str, Any], sig: tuple[int, int] | None) -> None:
+        by_time: list[tuple[float, int]] = []
+        by_type: dict[str, list[tuple[float, int]]] = {}
+        for pos, meta in enumerate(list(index.get("items") or [])):
+            if not isinstance(meta, dict):
+                continue
+            ts = _ts_epoch(meta.get("updated_at"))
+            if ts is None:
+                continue
+            by_time.append((ts, pos))
+            by_type.setdefault(str(meta.get("artifact_type") or ""), []).append((ts, pos))
+        by_time.sort()
+        for entries in by_type.values():
+            entries.sort()
+        self._cache_index = index
+        self._cache_sig = sig
+        self._by_time = by_time
+        self._by_type = by_type
+
+    def _cached(self) -> tuple[dict[str, Any], list[tuple[float, int]], dict[str, list[tuple[float, int]]]]:
+        sig = self._index_sig()
+        with self._cache_lock:
+            if sig is None or sig != self._cache_sig:
+                index: dict[str, Any] = {"items": []}
+                if sig is not None:
+                    try:
+                        loaded = json.loads(self.index_path.read_text(encoding="utf-8"))
+                        if isinstance(loaded, dict):
+                            index = loaded
+                    except Exception:
+                        pass
+                self._set_cache(index, sig)
+            return self._cache_index, self._by_time, self._by_type
 
     def load_index(self) -> dict[str, Any]:
-        if not self.index_path.exists():
-            return {"items": []}
-        try:
-            return json.loads(self.index_path.read_text(encoding="utf-8"))
-        except Exception:
-            return {"items": []}
+        index = self._cached()[0]
+        return {"items": [dict(item) for item in list(index.get("items") or []) if isinstance(item, dict)]}
 
     def _load_state(self) -> dict[str, Any]:
         if not self.state_path.exists():
@@ -92,6 +148,7 @@ class Indexer:
         state = self._load_state()
         by_file = {str(x.get("path")): x for x in list(idx.get("items") or []) if isinstance(x, dict)}
         file_state = dict(state.get("files") or {})
+        changed = not self.index_path.exists()
 
         for file in sorted(self.artifacts_dir.glob("*.jsonl")):
             key = str(file)
@@ -108,40 +165,38 @@ class Indexer:
                 continue
             by_file[key] = meta
             file_state[key] = st
+            changed = True
 
         existing = {str(p) for p in self.artifacts_dir.glob("*.jsonl")}
+        changed = changed or any(k not in existing for k in by_file) or any(k not in existing for k in file_state)
         by_file = {k: v for k, v in by_file.items() if k in existing}
         file_state = {k: v for k, v in file_state.items() if k in existing}
 
         out = {"items": list(by_file.values())}
-        self._write_atomic(self.index_path, out)
-        self._write_atomic(self.state_path, {"files": file_state})
+        if changed:
+            self._write_atomic(self.index_path, out)
+            self._write_atomic(self.state_path, {"files": file_state})
+            with self._cache_lock:
+                self._set_cache(out, self._index_sig())
         return out
 
     def iter_recent_artifacts(self, days: int, types: list[str] | None = None) -> Iterable[dict[str, Any]]:
-        cutoff = datetime.now(timezone.utc) - timedelta(days=max(1, int(days)))
-        allow = {str(t) for t in list(types or [])}
-        for meta in list(self.load_index().get("items") or []):
-            if not isinstance(meta, dict):
-                continue
-            if allow and str(meta.get("artifact_type") or "") not in allow:
-                continue
-            ts = str(meta.get("updated_at") or "")
-            try:
-                dt = datetime.fromisoformat(ts.replace("Z", "+00:00"))
-                if dt.tzinfo is None:
-                    dt = dt.replace(tzinfo=timezone.utc)
-            except Exception:
-                continue
-            if dt >= cutoff:
-                yield {
-                    "path": str(meta.get("path") or ""),
-                    "artifact_type": str(meta.get("artifact_type") or ""),
-                    "thread_id": meta.get("thread_id"),
-                    "tags": list(meta.get("tags") or []),
-                    "updated_at": ts,
-                    "count": int(meta.get("count") or 0),
-                }
+        cutoff = (datetime.now(timezone.utc) - timedelta(days=max(1, int(days)))).timestamp()
+        allow = sorted({str(t) for t in list(types or [])})
+        index, by_time, by_type = self._cached()
+        items = list(index.get("items") or [])
+        lists = [by_type.get(t, []) for t in allow] if allow else [by_time]
+        hits = sorted(entry for entries in lists for entry in entries[bisect.bisect_left(entries, (cutoff, -1)) :])
+        for _ts, pos in hits:
+            meta = items[pos]
+            yield {
+                "path": str(meta.get("path") or ""),
+                "artifact_type": str(meta.get("artifact_type") or ""),
+                "thread_id": meta.get("thread_id"),
+                "tags": list(meta.get("tags") or []),
+                "updated_at": str(meta.get("updated_at") or ""),
+                "count": int(meta.get("count") or 0),
+            }
 
 
 _default = Indexer()
@@ -3,12 +3,18 @@ from __future__ import annotations
 import hashlib
 import json
 import math
+import threading
 from collections import Counter, defaultdict
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
 
+# state_path -> ((mtime_ns, size), parsed state); reused until the file changes on disk.
+_STATE_CACHE: dict[str, tuple[tuple[int, int], dict[str, Any]]] = {}
+_STATE_LOCK = threading.Lock()
+
+
 def _parse_ts(value: str | None) -> datetime:
     if not value:
         return datetime(1970, 1, 1, tzinfo=timezone.utc)
@@ -63,6 +69,71 @@ def _score(item: dict[str, Any], cluster: dict[str, Any], *, w: dict[str, float]
     return s, reasons, j, c, r
 
 
+def _state_sig(path: Path) -> tuple[int, int] | None:
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return int(stat.st_mtime_ns), int(stat.st_size)
+
+
+def _load_state(path: Path) -> dict[str, Any]:
+    sig = _state_sig(path)
+    if sig is None:
+        return {}
+    key = str(path)
+    with _STATE_LOCK:
+        cached = _STATE_CACHE.get(key)
+        if cached is not None and cached[0] == sig:
+            return cached[1]
+    try:
+        state = json.loads(path.read_text(encoding="utf-8"))
+    except Exception:
+        state = {}
+    state = state if isinstance(state, dict) else {}
+    with _STATE_LOCK:
+        _STATE_CACHE[key] = (sig, state)
+    return state
+
+
+def _save_state(path: Path, state: dict[str, Any]) -> None:
+    path.write_text(json.dumps(state, ensure_ascii=False, indent=2), encoding="utf-8")
+    sig = _state_sig(path)
+    with _STATE_LOCK:
+        if sig is not None:
+            _STATE_CACHE[str(path)] = (sig, state)
+
+
+class _ClusterIndex:
+    """Inverted tag -> cluster and thread -> cluster postings; clusters outside them share nothing with an item."""
+
+    def __init__(self, clusters: list[dict[str, Any]]) -> None:
+        self.by_tag: dict[str, set[int]] = defaultdict(set)
+        self.by_thread: dict[str, set[int]] = defaultdict(set)
+        self.by_project: dict[str, int] = {}
+        for idx, cluster in enumerate(clusters):
+            self.add(idx, cluster)
+
+    def add(self, idx: int, cluster: dict[str, Any], item: dict[str, Any] | None = None) -> None:
+        rows = [item] if item is not None else list(cluster.get("items") or [])
+        for tag in [*(cluster.get("tags") or []), *(t for row in rows for t in (row.get("tags") or []))]:
+            self.by_tag[tag].add(idx)
+        for thread in list(cluster.get("linked_thread_ids") or []):
+            if thread:
+                self.by_thread[thread].add(idx)
+        pid = str(cluster.get("project_id") or "")
+        if pid:
+            self.by_project.setdefault(pid, idx)
+
+    def candidates(self, item: dict[str, Any]) -> set[int]:
+        out: set[int] = set()
+        for tag in set(item.get("tags") or []):
+            out |= self.by_tag.get(tag, set())
+        if item.get("thread_ref"):
+            out |= self.by_thread.get(item.get("thread_ref"), set())
+        return out
+
+
 def cluster_projects(
     items: list[dict[str, Any]],
     *,
@@ -76,18 +147,28 @@ def cluster_projects(
     max_evidence_per_link: int = 5,
     weights: dict[str, float] | None = None,
     recency_decay_days: int = 21,
+    incremental: bool = False,
 ) -> tuple[list[dict[str, Any]], dict[str, Any]]:
+    """
+    Assign items to project clusters and return the active clusters plus the assignment state.
+
+    Only clusters that share a tag or thread with an item are scored; every
+    other cluster can only earn the item's recency term. With ``incremental``
+    an item whose ``updated_at`` matches its recorded assignment, and whose
+    cluster still lists it, is not re-scored. Its ``last_switch_at`` is left
+    as is, so the switch cooldown counts from its last re-score; a full pass
+    restamps every item. The assignment state is cached in memory and written
+    back only when it changed.
+    """
     weights = weights or {"tag": 0.55, "co": 0.30, "recency": 0.15}
     now = datetime.now(timezone.utc)
     clusters = [dict(c) for c in list(prev_clusters or [])]
 
     state_file = Path(state_path)
     state_file.parent.mkdir(parents=True, exist_ok=True)
-    try:
-        state = json.loads(state_file.read_text(encoding="utf-8")) if state_file.exists() else {}
-    except Exception:
-        state = {}
-    assignments = dict(state.get("item_assignments") or {})
+    state = _load_state(state_file)
+    prior_assignments = dict(state.get("item_assignments") or {})
+    assignments = dict(prior_assignments)
 
     for c in clusters:
         c.setdefault("items", [])
@@ -95,17 +176,29 @@ def cluster_projects(
         c.setdefault("linked_thread_ids", [])
         c.setdefault("tags", [])
         c.setdefault("evidence", {})
+    index = _ClusterIndex(clusters)
 
     for item in sorted(items, key=lambda x: (str(x.get("id") or ""))):
+        item_id = str(item.get("id") or "")
+        prev = assignments.get(item_id)
+        if incremental and prev and item_id and str(prev.get("item_updated_at") or "") == str(item.get("updated_at") or ""):
+            held = index.by_project.get(str(prev.get("project_id") or ""))
+            if held is not None and item_id in set(clusters[held].get("linked_item_ids") or []):
+                continue
+
         best_idx, best_score, best_reason = None, 0.0, []
-        for i, cluster in enumerate(clusters):
-            score, reason_codes, *_ = _score(item, cluster, w=weights, recency_decay_days=recency_decay_days)
+        candidates = index.candidates(item)
+        if len(candidates) < len(clusters):
+            # Clusters outside the postings all tie on the recency-only score; the first of them stands in.
+            candidates.add(next(i for i in range(len(clusters)) if i not in candidates))
+        for i in sorted(candidates):
+            score, reason_codes, *_ = _score(item, clusters[i], w=weights, recency_decay_days=recency_decay_days)
             if score > best_score:
                 best_idx, best_score, best_reason = i, score, reason_codes
 
         if best_idx is None or best_score < assign_threshold:
             seed_tags = sorted(item.get("tags") or [])
-            seed_items = [str(item.get("id") or "")]
+            seed_items = [item_id]
             new_id = _project_id(seed_tags, seed_items)
             clusters.append(
                 {
@@ -117,25 +210,30 @@ def cluster_projects(
                     "items": [item],
                     "linked_item_ids": [item.get("id")],
                     "linked_thread_ids": [item.get("thread_ref")] if item.get("thread_ref") else [],
-                    "evidence": {str(item.get("id") or ""): {"artifact_ids": [item.get("id")], "reason_codes": ["seed"]}},
+                    "evidence": {item_id: {"artifact_ids": [item.get("id")], "reason_codes": ["seed"]}},
                     "updated_at": now.isoformat(),
                 }
             )
-            assignments[str(item.get("id") or "")] = {"project_id": new_id, "last_switch_at": now.isoformat(), "last_score": 1.0}
+            index.add(len(clusters) - 1, clusters[-1])
+            assignments[item_id] = {
+                "project_id": new_id,
+                "last_switch_at": now.isoformat(),
+                "last_score": 1.0,
+                "item_updated_at": str(item.get("updated_at") or ""),
+            }
             continue
 
-        chosen = clusters[best_idx]
-        item_id = str(item.get("id") or "")
-        prev = assignments.get(item_id)
+        chosen_idx = best_idx
         if prev:
             old_pid = str(prev.get("project_id") or "")
             old_score = float(prev.get("last_score") or 0.0)
             cooldown_ok = (now - _parse_ts(prev.get("last_switch_at"))).total_seconds() >= (switch_cooldown_hours * 3600)
-            if old_pid and old_pid != chosen.get("project_id"):
+            if old_pid and old_pid != clusters[best_idx].get("project_id"):
                 if best_score < (old_score + switch_margin) or not cooldown_ok:
-                    fallback = next((c for c in clusters if c.get("project_id") == old_pid), None)
+                    fallback = index.by_project.get(old_pid)
                     if fallback is not None:
-                        chosen = fallback
+                        chosen_idx = fallback
+        chosen = clusters[chosen_idx]
 
         if item_id and item_id not in set(chosen.get("linked_item_ids") or []):
             chosen.setdefault("items", []).append(item)
@@ -150,8 +248,13 @@ def cluster_projects(
                 "reason_codes": (best_reason or ["tag_overlap"])[:3],
             }
             chosen["updated_at"] = now.isoformat()
-        assignments[item_id] = {"project_id": chosen.get("project_id"), "last_switch_at": now.isoformat(), "last_score": round(best_score, 4)}
-
+            index.add(chosen_idx, chosen, item)
+        assignments[item_id] = {
+            "project_id": chosen.get("project_id"),
+            "last_switch_at": now.isoformat(),
+            "last_score": round(best_score, 4),
+            "item_updated_at": str(item.get("updated_at") or ""),
+        }
     compact: list[dict[str, Any]] = []
     for cluster in clusters:
         ids = sorted({str(x) for x in list(cluster.get("linked_item_ids") or []) if x})
@@ -166,8 +269,11 @@ def cluster_projects(
     active.sort(key=lambda c: (-int(c.get("open_items") or 0), _parse_ts(c.get("updated_at")).timestamp() * -1, str(c.get("project_id") or "")))
     active = active[:max_active_projects]
 
-    state_payload = {"item_assignments": assignments, "updated_at": now.isoformat()}
-    state_file.write_text(json.dumps(state_payload, ensure_ascii=False, indent=2), encoding="utf-8")
+    if assignments != prior_assignments or not state_file.exists():
+        state_payload = {"item_assignments": assignments, "updated_at": now.isoformat()}
+        _save_state(state_file, state_payload)
+    else:
+        state_payload = {"item_assignments": assignments, "updated_at": state.get("updated_at")}
 
     for cluster in active:
         if not cluster.get("project_id"):
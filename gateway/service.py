@@ -7,6 +7,8 @@ from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Any
 
+from runtime.event_bus import EventBus, Subscription
+
 from .auth import authorize_action as decide_action
 from .auth import build_auth_context, normalize_scopes
 from .protocol import (
@@ -109,12 +111,84 @@ def _path_within_roots(requested_path: str, roots: list[str]) -> bool:
     return False
 
 
+def _status_row(kind: str, item: dict[str, Any]) -> dict[str, Any]:
+    if kind == "presence":
+        return {
+            "kind": "presence",
+            "timestamp": str(item.get("updated_at") or ""),
+            "surface": str(item.get("surface") or ""),
+            "status": str(item.get("status") or ""),
+            "title": str(item.get("client_id") or item.get("session_id") or "presence"),
+            "detail": _clip(item.get("activity") or item.get("detail") or "", limit=180),
+        }
+    if kind == "health":
+        return {
+            "kind": "health",
+            "timestamp": str(item.get("updated_at") or ""),
+            "surface": str(item.get("surface") or ""),
+            "status": str(item.get("status") or ""),
+            "title": str(item.get("service_id") or "health"),
+            "detail": _clip(item.get("summary") or "", limit=180),
+        }
+    if kind == "pairing":
+        return {
+            "kind": "pairing",
+            "timestamp": str(item.get("updated_at") or item.get("created_at") or ""),
+            "surface": str(item.get("requested_surface") or ""),
+            "status": str(item.get("status") or ""),
+            "title": str(item.get("client_label") or item.get("pairing_id") or "pairing"),
+            "detail": f"code={item.get('code', '')}",
+        }
+    if kind == "node":
+        return {
+            "kind": "node",
+            "timestamp": str(item.get("updated_at") or item.get("created_at") or ""),
+            "surface": "node",
+            "status": str(item.get("status") or ""),
+            "title": str(item.get("client_label") or item.get("node_id") or "node"),
+            "detail": f"{item.get('node_type', '')} :: {', '.join(list(item.get('capabilities') or [])[:3])}",
+        }
+    return {
+        "kind": "event",
+        "timestamp": str(item.get("created_at") or ""),
+        "surface": str(item.get("surface") or ""),
+        "status": str(item.get("level") or "info"),
+        "title": str(item.get("title") or item.get("event_type") or "event"),
+        "detail": _clip(item.get("body") or "", limit=180),
+    }
+
+
+def _merge_status_rows(
+    presence: list[dict[str, Any]],
+    health: list[dict[str, Any]],
+    pairings: list[dict[str, Any]],
+    nodes: list[dict[str, Any]],
+    events: list[dict[str, Any]],
+    *,
+    limit: int,
+) -> list[dict[str, Any]]:
+    rows: list[dict[str, Any]] = []
+    rows.extend(_status_row("presence", item) for item in presence)
+    rows.extend(_status_row("health", item) for item in health)
+    rows.extend(_status_row("pairing", item) for item in pairings)
+    rows.extend(_status_row("node", item) for item in nodes)
+    rows.extend(_status_row("event", item) for item in events)
+    rows.sort(key=lambda row: str(row.get("timestamp") or ""), reverse=True)
+    return rows[: max(1, int(limit or 24))]
+
+
 class GatewayService:
     def __init__(self, root_dir: str | Path = "sessions/gateway", delivery_gateway=None) -> None:
         self.root_dir = Path(root_dir)
         self.root_dir.mkdir(parents=True, exist_ok=True)
         self.store = GatewayStore(root_dir=self.root_dir)
         self.delivery_gateway = delivery_gateway
+        # Status-feed rows for every presence/health/pairing/node/event write, topic "gateway.<kind>".
+        self.bus = EventBus(history=1024, subscriber_capacity=256)
+
+    def _publish_status(self, kind: str, item: dict[str, Any] | None) -> None:
+        if item:
+            self.bus.publish(f"gateway.{kind}", {**_status_row(kind, item), "record": dict(item)})
 
     def _is_pairing_expired(self, pairing: dict[str, Any] | None) -> bool:
         if not pairing:
@@ -212,7 +286,9 @@ class GatewayService:
             updated_at=utcnow_iso(),
             metadata=dict(metadata or {}),
         )
-        return self.store.upsert_presence(record.to_record())
+        item = self.store.upsert_presence(record.to_record())
+        self._publish_status("presence", item)
+        return item
 
     def record_health(
         self,
@@ -231,7 +307,9 @@ class GatewayService:
             updated_at=utcnow_iso(),
             metadata=dict(metadata or {}),
         )
-        return self.store.record_health(record.to_record())
+        item = self.store.record_health(record.to_record())
+        self._publish_status("health", item)
+        return item
 
     def publish_event(
         self,
@@ -259,7 +337,9 @@ class GatewayService:
             created_at=utcnow_iso(),
             metadata=dict(metadata or {}),
         )
-        return self.store.append_event(record.to_record())
+        item = self.store.append_event(record.to_record())
+        self._publish_status("event", item)
+        return item
 
     def record_prompt_ingress(
         self,
@@ -314,6 +394,7 @@ class GatewayService:
             metadata=dict(metadata or {}),
         )
         item = self.store.issue_pairing(record.to_record())
+        self._publish_status("pairing", item)
         self.publish_event(
             event_type="pairing_requested",
             surface=str(requested_surface or "remote"),
@@ -337,12 +418,13 @@ class GatewayService:
         pairing = self.store.get_pairing_by_code(str(pairing_code or "").strip()) if str(pairing_code or "").strip() else None
         if pairing:
             if self._is_pairing_expired(pairing):
-                self.store.confirm_pairing(
+                expired = self.store.confirm_pairing(
                     code=str(pairing_code or "").strip(),
                     status="expired",
                     metadata={"expired_at": utcnow_iso()},
                     updated_at=utcnow_iso(),
                 )
+                self._publish_status("pairing", expired)
                 raise ValueError("Pairing code expired")
             session = self.register_session(
                 user_id=user_id,
@@ -437,6 +519,7 @@ class GatewayService:
             metadata=merged_metadata,
         )
         item = self.store.upsert_node(record.to_record())
+        self._publish_status("node", item)
         self.publish_event(
             event_type="node_registered",
             surface="node",
@@ -469,6 +552,7 @@ class GatewayService:
         row["capabilities"] = merged_capabilities
         row["metadata"] = merged_metadata
         item = self.store.upsert_node(row)
+        self._publish_status("node", item)
         session_id = str(item.get("session_id") or "")
         if session_id:
             try:
@@ -617,6 +701,7 @@ class GatewayService:
         node["updated_at"] = utcnow_iso()
         node["metadata"] = node_meta
         item = self.store.upsert_node(node)
+        self._publish_status("node", item)
         session_id = str(item.get("session_id") or "")
         if session_id:
             try:
@@ -661,7 +746,7 @@ class GatewayService:
         node_meta["token_rotated_at"] = now
         node["metadata"] = node_meta
         node["updated_at"] = now
-        self.store.upsert_node(node)
+        self._publish_status("node", self.store.upsert_node(node))
         return {"token": raw_token, "token_preview": preview, "record": token}
 
     def confirm_pairing(
@@ -683,6 +768,7 @@ class GatewayService:
         )
         if not item:
             return None
+        self._publish_status("pairing", item)
         if str(session_id or "").strip():
             session = self.store.get_session(session_id)
             if session:
@@ -713,7 +799,7 @@ class GatewayService:
                     node["trust_level"] = str(auth.get("trust_level") or node.get("trust_level") or "paired_remote")
                     node["status"] = "online"
                     node["updated_at"] = utcnow_iso()
-                    self.store.upsert_node(node)
+                    self._publish_status("node", self.store.upsert_node(node))
         return item
 
     def authorize_action(self, session_id: str, action: str) -> dict[str, Any]:
@@ -758,64 +844,36 @@ class GatewayService:
         return decision
 
     def status_feed(self, *, limit: int = 24) -> list[dict[str, Any]]:
-        rows: list[dict[str, Any]] = []
-        for item in self.store.list_presence(limit=limit):
-            rows.append(
-                {
-                    "kind": "presence",
-                    "timestamp": str(item.get("updated_at") or ""),
-                    "surface": str(item.get("surface") or ""),
-                    "status": str(item.get("status") or ""),
-                    "title": str(item.get("client_id") or item.get("session_id") or "presence"),
-                    "detail": _clip(item.get("activity") or item.get("detail") or "", limit=180),
-                }
-            )
-        for item in self.store.list_health(limit=limit):
-            rows.append(
-                {
-                    "kind": "health",
-                    "timestamp": str(item.get("updated_at") or ""),
-                    "surface": str(item.get("surface") or ""),
-                    "status": str(item.get("status") or ""),
-                    "title": str(item.get("service_id") or "health"),
-                    "detail": _clip(item.get("summary") or "", limit=180),
-                }
-            )
-        for item in self.store.list_pairings(limit=limit):
-            rows.append(
-                {
-                    "kind": "pairing",
-                    "timestamp": str(item.get("updated_at") or item.get("created_at") or ""),
-                    "surface": str(item.get("requested_surface") or ""),
-                    "status": str(item.get("status") or ""),
-                    "title": str(item.get("client_label") or item.get("pairing_id") or "pairing"),
-                    "detail": f"code={item.get('code', '')}",
-                }
-            )
-        for item in self.store.list_nodes(limit=limit):
-            rows.append(
-                {
-                    "kind": "node",
-                    "timestamp": str(item.get("updated_at") or item.get("created_at") or ""),
-                    "surface": "node",
-                    "status": str(item.get("status") or ""),
-                    "title": str(item.get("client_label") or item.get("node_id") or "node"),
-                    "detail": f"{item.get('node_type', '')} :: {', '.join(list(item.get('capabilities') or [])[:3])}",
-                }
-            )
-        for item in self.store.list_events(limit=limit):
-            rows.append(
-                {
-                    "kind": "event",
-                    "timestamp": str(item.get("created_at") or ""),
-                    "surface": str(item.get("surface") or ""),
-                    "status": str(item.get("level") or "info"),
-                    "title": str(item.get("title") or item.get("event_type") or "event"),
-                    "detail": _clip(item.get("body") or "", limit=180),
-                }
-            )
-        rows.sort(key=lambda row: str(row.get("timestamp") or ""), reverse=True)
-        return rows[: max(1, int(limit or 24))]
+        return _merge_status_rows(
+            self.store.list_presence(limit=limit),
+            self.store.list_health(limit=limit),
+            self.store.list_pairings(limit=limit),
+            self.store.list_nodes(limit=limit),
+            self.store.list_events(limit=limit),
+            limit=limit,
+        )
+
+    def subscribe_status(self, *, kinds: list[str] | None = None, since: int | None = None) -> Subscription:
+        """Live status-feed deltas for a GUI panel; ``kinds`` narrows to e.g. ``["node", "event"]``."""
+        return self.bus.subscribe([f"gateway.{kind}" for kind in (kinds or [])] or ["gateway."], since=since)
+
+    def status_deltas(self, *, cursor: int | None = None, limit: int = 24) -> dict[str, Any]:
+        """
+        Status rows written since ``cursor``, for sessions that poll instead of holding a subscription.
+
+        No cursor, one older than the retained history, or one ahead of this
+        bus (saved before a gateway restart) answers with the full
+        ``status_feed`` and ``resync=True``; the returned cursor is then
+        passed back on the next call.
+        """
+        if cursor is None:
+            return {"cursor": self.bus.last_seq, "resync": True, "rows": self.status_feed(limit=limit)}
+        window = self.bus.since(int(cursor), topics=["gateway."], limit=max(1, int(limit or 24)))
+        if window["gap"]:
+            return {"cursor": self.bus.last_seq, "resync": True, "rows": self.status_feed(limit=limit)}
+        rows = [{key: value for key, value in event["payload"].items() if key != "record"} for event in window["events"]]
+        rows.reverse()
+        return {"cursor": window["cursor"], "resync": False, "rows": rows}
 
     def snapshot(self, *, limit: int = 12) -> dict[str, Any]:
         sessions = self.store.list_sessions(limit=limit)
@@ -826,7 +884,8 @@ class GatewayService:
         nodes = self.store.list_nodes(limit=limit)
         remote_audit = self.store.list_remote_audit(limit=limit)
         node_tokens = self.store.list_node_tokens(limit=limit)
-        status_feed = self.status_feed(limit=limit)
+        # Built from the rows just read, so writes from other services on this store are included.
+        status_feed = _merge_status_rows(presence, health, pairings, nodes, events, limit=limit)
 
         trust_counts: dict[str, int] = {}
         for row in sessions:
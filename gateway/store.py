@@ -1,11 +1,16 @@
 from __future__ import annotations
 
+import atexit
 import json
+import queue
 import secrets
 import sqlite3
+import threading
+import weakref
+from contextlib import contextmanager
 from pathlib import Path
 from threading import RLock
-from typing import Any
+from typing import Any, Callable, Iterator
 
 
 def _json_dumps(value: Any) -> str:
@@ -25,21 +30,179 @@ def _json_loads(raw: str | None) -> Any:
         return {}
 
 
+_LIVE_STORES: "weakref.WeakSet[GatewayStore]" = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_live_stores() -> None:
+    for store in list(_LIVE_STORES):
+        try:
+            store.close()
+        except Exception:
+            pass
+
+
+class _ConnectionPool:
+    """Long-lived connections handed out one caller at a time; ``size=0`` opens and closes per use."""
+
+    def __init__(self, factory: Callable[[], sqlite3.Connection], size: int) -> None:
+        self._factory = factory
+        self.size = max(0, int(size))
+        self._idle: queue.LifoQueue[sqlite3.Connection] = queue.LifoQueue(maxsize=max(1, self.size))
+        self.opened = 0
+
+    @contextmanager
+    def connection(self) -> Iterator[sqlite3.Connection]:
+        try:
+            conn = self._idle.get_nowait()
+        except queue.Empty:
+            conn = self._factory()
+            self.opened += 1
+        try:
+            with conn:
+                yield conn
+        finally:
+            if self.size <= 0:
+                conn.close()
+            else:
+                try:
+                    self._idle.put_nowait(conn)
+                except queue.Full:
+                    conn.close()
+
+    def close(self) -> None:
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                break
+
+
+# Statements for the write-coalesced tables, keyed by table; rows are flushed with executemany.
+_COALESCED_SQL = {
+    "gateway_presence": """
+        INSERT INTO gateway_presence (
+            session_id, client_id, user_id, surface, status, activity, detail, updated_at, metadata_json
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+        ON CONFLICT(session_id) DO UPDATE SET
+            client_id=excluded.client_id,
+            user_id=excluded.user_id,
+            surface=excluded.surface,
+            status=excluded.status,
+            activity=excluded.activity,
+            detail=excluded.detail,
+            updated_at=excluded.updated_at,
+            metadata_json=excluded.metadata_json
+    """,
+    "gateway_health": """
+        INSERT INTO gateway_health (
+            service_key, service_id, surface, status, summary, updated_at, metadata_json
+        ) VALUES (?, ?, ?, ?, ?, ?, ?)
+        ON CONFLICT(service_key) DO UPDATE SET
+            status=excluded.status,
+            summary=excluded.summary,
+            updated_at=excluded.updated_at,
+            metadata_json=excluded.metadata_json
+    """,
+    "gateway_events": """
+        INSERT OR IGNORE INTO gateway_events (
+            event_id, event_type, surface, title, body, level, user_id, session_id, client_id, created_at, metadata_json
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """,
+}
+
+
 class GatewayStore:
-    def __init__(self, root_dir: str | Path = "sessions/gateway") -> None:
+    """
+    SQLite persistence for gateway sessions, presence, health, events, pairings and nodes.
+
+    Connections come from a small pool of long-lived WAL connections. Presence,
+    health and event writes are coalesced: they are buffered (latest row per key
+    wins) and flushed together in one transaction after ``coalesce_seconds``,
+    once ``coalesce_max`` rows are pending, or before any read of those tables.
+    ``coalesce_seconds=0`` writes through immediately.
+    """
+
+    def __init__(
+        self,
+        root_dir: str | Path = "sessions/gateway",
+        *,
+        pool_size: int = 4,
+        coalesce_seconds: float = 0.05,
+        coalesce_max: int = 512,
+    ) -> None:
         self.root_dir = Path(root_dir)
         self.root_dir.mkdir(parents=True, exist_ok=True)
         self.db_path = self.root_dir / "gateway.sqlite3"
         self._lock = RLock()
+        self._pool = _ConnectionPool(self._open, pool_size)
+        self.coalesce_seconds = max(0.0, float(coalesce_seconds))
+        self.coalesce_max = max(1, int(coalesce_max))
+        self._pending: dict[tuple[str, str], tuple[Any, ...]] = {}
+        self._pending_lock = threading.Lock()
+        self._flush_timer: threading.Timer | None = None
+        self.flush_count = 0
         self._init_db()
+        _LIVE_STORES.add(self)
 
-    def _connect(self) -> sqlite3.Connection:
+    def _open(self) -> sqlite3.Connection:
         conn = sqlite3.connect(str(self.db_path), timeout=30.0, check_same_thread=False)
         conn.row_factory = sqlite3.Row
         conn.execute("PRAGMA journal_mode=WAL")
         conn.execute("PRAGMA synchronous=NORMAL")
         return conn
 
+    def _connect(self):
+        return self._pool.connection()
+
+    def _write(self, table: str, key: str, params: tuple[Any, ...]) -> None:
+        if self.coalesce_seconds <= 0:
+            with self._lock, self._connect() as conn:
+                conn.execute(_COALESCED_SQL[table], params)
+            return
+        with self._pending_lock:
+            self._pending[(table, key)] = params
+            due = len(self._pending) >= self.coalesce_max
+            if not due and self._flush_timer is None:
+                self._flush_timer = threading.Timer(self.coalesce_seconds, self.flush)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+        if due:
+            self.flush()
+
+    def flush(self) -> int:
+        """Write every buffered presence/health/event row in one transaction; returns the row count."""
+        if not self._pending:
+            return 0
+        # Held across swap and write so an older batch can never land after a newer one.
+        with self._lock:
+            with self._pending_lock:
+                pending, self._pending = self._pending, {}
+                timer, self._flush_timer = self._flush_timer, None
+            if timer is not None and timer is not threading.current_thread():
+                timer.cancel()
+            if not pending:
+                return 0
+            grouped: dict[str, list[tuple[Any, ...]]] = {}
+            for (table, _key), params in pending.items():
+                grouped.setdefault(table, []).append(params)
+            try:
+                with self._connect() as conn:
+                    for table, rows in grouped.items():
+                        conn.executemany(_COALESCED_SQL[table], rows)
+            except Exception:
+                # Keep the batch for the next flush unless a newer row for the same key arrived meanwhile.
+                with self._pending_lock:
+                    for key, params in pending.items():
+                        self._pending.setdefault(key, params)
+                raise
+            self.flush_count += 1
+        return len(pending)
+
+    def close(self) -> None:
+        self.flush()
+        self._pool.close()
+
     def _init_db(self) -> None:
         with self._lock, self._connect() as conn:
             conn.executescript(
@@ -215,7 +378,7 @@ class GatewayStore:
         return self.get_session(str(row.get("session_id") or "")) or {}
 
     def get_session(self, session_id: str) -> dict[str, Any] | None:
-        with self._lock, self._connect() as conn:
+        with self._connect() as conn:
             row = conn.execute(
                 "SELECT * FROM gateway_sessions WHERE session_id = ?",
                 (str(session_id or ""),),
@@ -230,44 +393,29 @@ class GatewayStore:
             params.append(str(surface).strip().lower())
         sql += " ORDER BY last_seen_at DESC LIMIT ?"
         params.append(max(1, int(limit or 20)))
-        with self._lock, self._connect() as conn:
+        with self._connect() as conn:
             rows = conn.execute(sql, tuple(params)).fetchall()
         return [self._decode_row(row) or {} for row in rows]
 
     def upsert_presence(self, record: dict[str, Any]) -> dict[str, Any]:
         row = dict(record or {})
-        with self._lock, self._connect() as conn:
-            conn.execute(
-                """
-                INSERT INTO gateway_presence (
-                    session_id, client_id, user_id, surface, status, activity, detail, updated_at, metadata_json
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                ON CONFLICT(session_id) DO UPDATE SET
-                    client_id=excluded.client_id,
-                    user_id=excluded.user_id,
-                    surface=excluded.surface,
-                    status=excluded.status,
-                    activity=excluded.activity,
-                    detail=excluded.detail,
-                    updated_at=excluded.updated_at,
-                    metadata_json=excluded.metadata_json
-                """,
-                (
-                    row.get("session_id", ""),
-                    row.get("client_id", ""),
-                    row.get("user_id", ""),
-                    row.get("surface", ""),
-                    row.get("status", "online"),
-                    row.get("activity", ""),
-                    row.get("detail", ""),
-                    row.get("updated_at", ""),
-                    _json_dumps(row.get("metadata") or {}),
-                ),
-            )
-        return self.get_presence(str(row.get("session_id") or "")) or {}
+        item = {
+            "session_id": row.get("session_id", ""),
+            "client_id": row.get("client_id", ""),
+            "user_id": row.get("user_id", ""),
+            "surface": row.get("surface", ""),
+            "status": row.get("status", "online"),
+            "activity": row.get("activity", ""),
+            "detail": row.get("detail", ""),
+            "updated_at": row.get("updated_at", ""),
+        }
+        metadata_json = _json_dumps(row.get("metadata") or {})
+        self._write("gateway_presence", str(item["session_id"]), (*item.values(), metadata_json))
+        return {**item, "metadata": _json_loads(metadata_json)}
 
     def get_presence(self, session_id: str) -> dict[str, Any] | None:
-        with self._lock, self._connect() as conn:
+        self.flush()
+        with self._connect() as conn:
             row = conn.execute(
                 "SELECT * FROM gateway_presence WHERE session_id = ?",
                 (str(session_id or ""),),
@@ -275,6 +423,7 @@ class GatewayStore:
         return self._decode_row(row)
 
     def list_presence(self, *, limit: int = 20, surface: str = "") -> list[dict[str, Any]]:
+        self.flush()
         sql = "SELECT * FROM gateway_presence"
         params: list[Any] = []
         if str(surface or "").strip():
@@ -282,7 +431,7 @@ class GatewayStore:
             params.append(str(surface).strip().lower())
         sql += " ORDER BY updated_at DESC LIMIT ?"
         params.append(max(1, int(limit or 20)))
-        with self._lock, self._connect() as conn:
+        with self._connect() as conn:
             rows = conn.execute(sql, tuple(params)).fetchall()
         return [self._decode_row(row) or {} for row in rows]
 
@@ -291,33 +440,21 @@ class GatewayStore:
         service_id = str(row.get("service_id") or "")
         surface = str(row.get("surface") or "").strip().lower()
         service_key = f"{surface}:{service_id}"
-        with self._lock, self._connect() as conn:
-            conn.execute(
-                """
-                INSERT INTO gateway_health (
-                    service_key, service_id, surface, status, summary, updated_at, metadata_json
-                ) VALUES (?, ?, ?, ?, ?, ?, ?)
-                ON CONFLICT(service_key) DO UPDATE SET
-                    status=excluded.status,
-                    summary=excluded.summary,
-                    updated_at=excluded.updated_at,
-                    metadata_json=excluded.metadata_json
-                """,
-                (
-                    service_key,
-                    service_id,
-                    surface,
-                    row.get("status", ""),
-                    row.get("summary", ""),
-                    row.get("updated_at", ""),
-                    _json_dumps(row.get("metadata") or {}),
-                ),
-            )
-        return self.get_health(service_id=service_id, surface=surface) or {}
+        item = {
+            "service_id": service_id,
+            "surface": surface,
+            "status": row.get("status", ""),
+            "summary": row.get("summary", ""),
+            "updated_at": row.get("updated_at", ""),
+        }
+        metadata_json = _json_dumps(row.get("metadata") or {})
+        self._write("gateway_health", service_key, (service_key, *item.values(), metadata_json))
+        return {**item, "metadata": _json_loads(metadata_json)}
 
     def get_health(self, *, service_id: str, surface: str) -> dict[str, Any] | None:
+        self.flush()
         service_key = f"{str(surface or '').strip().lower()}:{str(service_id or '')}"
-        with self._lock, self._connect() as conn:
+        with self._connect() as conn:
             row = conn.execute(
                 "SELECT * FROM gateway_health WHERE service_key = ?",
                 (service_key,),
@@ -328,6 +465,7 @@ class GatewayStore:
         return item
 
     def list_health(self, *, limit: int = 20, surface: str = "") -> list[dict[str, Any]]:
+        self.flush()
         sql = "SELECT * FROM gateway_health"
         params: list[Any] = []
         if str(surface or "").strip():
@@ -335,7 +473,7 @@ class GatewayStore:
             params.append(str(surface).strip().lower())
         sql += " ORDER BY updated_at DESC LIMIT ?"
         params.append(max(1, int(limit or 20)))
-        with self._lock, self._connect() as conn:
+        with self._connect() as conn:
             rows = conn.execute(sql, tuple(params)).fetchall()
         out: list[dict[str, Any]] = []
         for row in rows:
@@ -346,31 +484,25 @@ class GatewayStore:
 
     def append_event(self, record: dict[str, Any]) -> dict[str, Any]:
         row = dict(record or {})
-        with self._lock, self._connect() as conn:
-            conn.execute(
-                """
-                INSERT INTO gateway_events (
-                    event_id, event_type, surface, title, body, level, user_id, session_id, client_id, created_at, metadata_json
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    row.get("event_id", ""),
-                    row.get("event_type", ""),
-                    row.get("surface", ""),
-                    row.get("title", ""),
-                    row.get("body", ""),
-                    row.get("level", "info"),
-                    row.get("user_id", ""),
-                    row.get("session_id", ""),
-                    row.get("client_id", ""),
-                    row.get("created_at", ""),
-                    _json_dumps(row.get("metadata") or {}),
-                ),
-            )
-        return self.get_event(str(row.get("event_id") or "")) or {}
+        item = {
+            "event_id": row.get("event_id", ""),
+            "event_type": row.get("event_type", ""),
+            "surface": row.get("surface", ""),
+            "title": row.get("title", ""),
+            "body": row.get("body", ""),
+            "level": row.get("level", "info"),
+            "user_id": row.get("user_id", ""),
+            "session_id": row.get("session_id", ""),
+            "client_id": row.get("client_id", ""),
+            "created_at": row.get("created_at", ""),
+        }
+        metadata_json = _json_dumps(row.get("metadata") or {})
+        self._write("gateway_events", str(item["event_id"]), (*item.values(), metadata_json))
+        return {**item, "metadata": _json_loads(metadata_json)}
 
     def get_event(self, event_id: str) -> dict[str, Any] | None:
-        with self._lock, self._connect() as conn:
+        self.flush()
+        with self._connect() as conn:
             row = conn.execute(
                 "SELECT * FROM gateway_events WHERE event_id = ?",
                 (str(event_id or ""),),
@@ -378,6 +510,7 @@ class GatewayStore:
         return self._decode_row(row)
 
     def list_events(self, *, limit: int = 40, surface: str = "", event_type: str = "") -> list[dict[str, Any]]:
+        self.flush()
         clauses: list[str] = []
         params: list[Any] = []
         if str(surface or "").strip():
@@ -391,7 +524,7 @@ class GatewayStore:
             sql += " WHERE " + " AND ".join(clauses)
         sql += " ORDER BY created_at DESC LIMIT ?"
         params.append(max(1, int(limit or 40)))
-        with self._lock, self._connect() as conn:
+        with self._connect() as conn:
             rows = conn.execute(sql, tuple(params)).fetchall()
         return [self._decode_row(row) or {} for row in rows]
 
@@ -424,7 +557,7 @@ class GatewayStore:
         return self.get_pairing(str(row.get("pairing_id") or "")) or {}
 
     def get_pairing(self, pairing_id: str) -> dict[str, Any] | None:
-        with self._lock, self._connect() as conn:
+        with self._connect() as conn:
             row = conn.execute(
                 "SELECT * FROM gateway_pairings WHERE pairing_id = ?",
                 (str(pairing_id or ""),),
@@ -432,7 +565,7 @@ class GatewayStore:
         return self._decode_row(row)
 
     def get_pairing_by_code(self, code: str) -> dict[str, Any] | None:
-        with self._lock, self._connect() as conn:
+        with self._connect() as conn:
             row = conn.execute(
                 """
                 SELECT * FROM gateway_pairings
@@ -490,7 +623,7 @@ class GatewayStore:
             params.append(str(status).strip().lower())
         sql += " ORDER BY updated_at DESC LIMIT ?"
         params.append(max(1, int(limit or 20)))
-        with self._lock, self._connect() as conn:
+        with self._connect() as conn:
             rows = conn.execute(sql, tuple(params)).fetchall()
         return [self._decode_row(row) or {} for row in rows]
 
@@ -533,7 +666,7 @@ class GatewayStore:
         return self.get_node(str(row.get("node_id") or "")) or {}
 
     def get_node(self, node_id: str) -> dict[str, Any] | None:
-        with self._lock, self._connect() as conn:
+        with self._connect() as conn:
             row = conn.execute(
                 "SELECT * FROM gateway_nodes WHERE node_id = ?",
                 (str(node_id or ""),),
@@ -541,7 +674,7 @@ class GatewayStore:
         return self._decode_row(row)
 
     def get_node_by_session(self, session_id: str) -> dict[str, Any] | None:
-        with self._lock, self._connect() as conn:
+        with self._connect() as conn:
             row = conn.execute(
                 "SELECT * FROM gateway_nodes WHERE session_id = ?",
                 (str(session_id or ""),),
@@ -562,7 +695,7 @@ class GatewayStore:
             sql += " WHERE " + " AND ".join(clauses)
         sql += " ORDER BY updated_at DESC LIMIT ?"
         params.append(max(1, int(limit or 20)))
-        with self._lock, self._connect() as conn:
+        with self._connect() as conn:
             rows = conn.execute(sql, tuple(params)).fetchall()
         return [self._decode_row(row) or {} for row in rows]
 
@@ -596,7 +729,7 @@ class GatewayStore:
         return self.get_remote_audit(str(row.get("audit_id") or "")) or {}
 
     def get_remote_audit(self, audit_id: str) -> dict[str, Any] | None:
-        with self._lock, self._connect() as conn:
+        with self._connect() as conn:
             row = conn.execute(
                 "SELECT * FROM gateway_remote_audit WHERE audit_id = ?",
                 (str(audit_id or ""),),
@@ -611,7 +744,7 @@ class GatewayStore:
             params.append(str(node_id).strip().lower())
         sql += " ORDER BY created_at DESC LIMIT ?"
         params.append(max(1, int(limit or 40)))
-        with self._lock, self._connect() as conn:
+        with self._connect() as conn:
             rows = conn.execute(sql, tuple(params)).fetchall()
         return [self._decode_row(row) or {} for row in rows]
 
@@ -644,7 +777,7 @@ class GatewayStore:
         return self.get_node_token(str(row.get("token_id") or "")) or {}
 
     def get_node_token(self, token_id: str) -> dict[str, Any] | None:
-        with self._lock, self._connect() as conn:
+        with self._connect() as conn:
             row = conn.execute(
                 "SELECT * FROM gateway_node_tokens WHERE token_id = ?",
                 (str(token_id or ""),),
@@ -659,7 +792,7 @@ class GatewayStore:
             params.append(str(node_id).strip().lower())
         sql += " ORDER BY rotated_at DESC LIMIT ?"
         params.append(max(1, int(limit or 20)))
-        with self._lock, self._connect() as conn:
+        with self._connect() as conn:
             rows = conn.execute(sql, tuple(params)).fetchall()
         return [self._decode_row(row) or {} for row in rows]
 
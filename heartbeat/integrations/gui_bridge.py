@@ -7,9 +7,11 @@ from zoneinfo import ZoneInfo
 class HeartbeatGUIBridge:
     def __init__(self, heartbeat_service):
         self.heartbeat_service = heartbeat_service
+        # Own cursor on the heartbeat bus, primed with UI events retained from before the GUI attached.
+        self._events = heartbeat_service.subscribe_events(ui_only=True, since=0)
 
     def poll_events(self) -> list[dict]:
-        return self.heartbeat_service.drain_events()
+        return [item["payload"] for item in self._events.poll(self.heartbeat_service.max_ui_drain)]
 
     def _state_snapshot(self) -> dict:
         return self.heartbeat_service.get_status().get("state", {})
@@ -9,11 +9,12 @@ from types import SimpleNamespace
 from typing import Any
 from zoneinfo import ZoneInfo
 
-from heartbeat.events import EventQueue, EventRingBuffer, event_signature, make_event
+from heartbeat.events import EventRingBuffer, event_signature, make_event
 from heartbeat.policy import HeartbeatPolicy
 from heartbeat.state import HeartbeatState
 from heartbeat.tasks import AgentpediaGrowthTask, AutomationDispatchTask, DailyGreetingTask, DelightTask, GoalNudgeTask, MemoryHygieneTask, ReminderCheckTask, WeatherWarnTask
 from heartbeat.tasks.base import HeartbeatContext, TaskRegistry
+from runtime.event_bus import EventBus, Subscription
 
 
 class HeartbeatService:
@@ -52,7 +53,12 @@ class HeartbeatService:
         self._thread: threading.Thread | None = None
 
         self._ring = EventRingBuffer(maxlen=int(getattr(settings_module, "HB_MAX_EVENTS_BUFFER", 200)))
-        self._ui_queue = EventQueue()
+        # Every recorded event is published as "heartbeat.event"; UI-worthy ones also as "heartbeat.ui".
+        self.events = EventBus(
+            history=int(getattr(settings_module, "HB_MAX_EVENTS_BUFFER", 200)),
+            subscriber_capacity=int(getattr(settings_module, "HB_MAX_EVENTS_BUFFER", 200)),
+        )
+        self._ui_events = self.events.subscribe(["heartbeat.ui"])
         self._registry = TaskRegistry()
         self._policy = HeartbeatPolicy(
             breadcrumb_minutes=int(getattr(settings_module, "HB_ALIVE_BREADCRUMB_MINUTES", 30)),
@@ -168,8 +174,12 @@ class HeartbeatService:
                 self.state.error_count += 1
                 self.state.last_error = event.get("detail") or event.get("title")
         self._ring.append(event)
+        self.events.publish("heartbeat.event", event)
         if for_ui:
-            self._ui_queue.put(event)
+            self._push_ui(event)
+
+    def _push_ui(self, event: dict[str, Any]) -> None:
+        self.events.publish("heartbeat.ui", event)
 
     def _emit_lifecycle(self, title: str) -> None:
         event = make_event("INFO", "lifecycle", title, timezone=self.timezone)
@@ -286,7 +296,11 @@ class HeartbeatService:
 
     def drain_events(self, max_n: int | None = None) -> list[dict[str, Any]]:
         max_n = self.max_ui_drain if max_n is None else max_n
-        return self._ui_queue.drain(max_n=max_n)
+        return [item["payload"] for item in self._ui_events.poll(max_n)]
+
+    def subscribe_events(self, *, ui_only: bool = True, since: int | None = None) -> Subscription:
+        """Push-based alternative to ``drain_events``; each subscriber gets its own bounded ring and cursor."""
+        return self.events.subscribe(["heartbeat.ui" if ui_only else "heartbeat.event"], since=since)
 
     def _run_loop(self) -> None:
         while not self._stop_event.is_set():
@@ -318,7 +332,7 @@ class HeartbeatService:
                 self._record_event(status_event, for_ui=False)
 
                 if self._policy.should_emit_ui_event(status_event, now):
-                    self._ui_queue.put(status_event)
+                    self._push_ui(status_event)
 
                 if (not paused) and (not self._in_quiet_hours(now)) and self._policy.allow_breadcrumb(now):
                     breadcrumb = make_event(
@@ -2,10 +2,13 @@ from __future__ import annotations
 
 import json
 import re
+import sqlite3
+import threading
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable
 
+from runtime.jsonl_log import tail_jsonl
 
 CORRECTION_MARKERS = (
     "actually",
@@ -17,6 +20,8 @@ CORRECTION_MARKERS = (
     "i meant",
     "instead",
 )
+GROUNDING_ROUTES = {"websearch", "normal", "search_only", "planning"}
+INDEX_SCHEMA_VERSION = 1
 
 
 def _now_iso() -> str:
@@ -36,7 +41,7 @@ def _safe_part(value: Any) -> str:
 
 def infer_grounding(route: str, content: str, tool_events: list[dict[str, Any]] | None = None) -> bool:
     route_name = str(route or "").strip().lower()
-    if route_name not in {"websearch", "normal", "search_only", "planning"}:
+    if route_name not in GROUNDING_ROUTES:
         return False
     text = str(content or "")
     if "http://" in text or "https://" in text:
@@ -50,15 +55,133 @@ def infer_grounding(route: str, content: str, tool_events: list[dict[str, Any]]
     return False
 
 
+def _is_correction(prompt: Any) -> bool:
+    lowered = str(prompt or "").lower()
+    return any(marker in lowered for marker in CORRECTION_MARKERS)
+
+
+def _summary_deltas(rows: list[dict[str, Any]]) -> dict[str, Any]:
+    """Counter increments for consecutive rows of one thread; a correction counts against the turn before it."""
+    deltas = {
+        "row_count": len(rows),
+        "grounding_total": 0,
+        "grounding_hits": 0,
+        "correction_total": 0,
+        "latency_ms_total": 0,
+        "first_is_correction": 1 if rows and _is_correction(rows[0].get("prompt")) else 0,
+    }
+    for idx, row in enumerate(rows):
+        if str(row.get("route") or "").strip().lower() in GROUNDING_ROUTES:
+            deltas["grounding_total"] += 1
+            if bool(row.get("grounded", False)):
+                deltas["grounding_hits"] += 1
+        if idx > 0 and _is_correction(row.get("prompt")):
+            deltas["correction_total"] += 1
+        deltas["latency_ms_total"] += int(row.get("latency_ms") or 0)
+    return deltas
+
+
 class TrajectoryStore:
+    """
+    Per-thread JSONL trajectories plus a SQLite index of per-thread counters.
+
+    The JSONL files stay the source of truth for ``load``/``replay``; every
+    write also updates the thread's summary row in the same call, so
+    ``list_threads`` and ``aggregate`` never parse trajectory files. An index
+    missing or older than the files' format is rebuilt once from them.
+    """
+
     def __init__(self, root_dir: str | Path = "sessions/trajectories") -> None:
         self.root_dir = Path(root_dir)
         self.root_dir.mkdir(parents=True, exist_ok=True)
+        self.index_path = self.root_dir / "trajectory_index.sqlite3"
+        self._write_lock = threading.Lock()
+        self._ensure_index()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.index_path, timeout=30.0)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA busy_timeout = 30000")
+        conn.execute("PRAGMA journal_mode = WAL")
+        return conn
+
+    def _ensure_index(self) -> None:
+        with self._connect() as conn:
+            conn.executescript(
+                """
+                CREATE TABLE IF NOT EXISTS thread_summaries (
+                    user_id TEXT NOT NULL,
+                    thread_id TEXT NOT NULL,
+                    file_name TEXT NOT NULL,
+                    row_count INTEGER NOT NULL DEFAULT 0,
+                    last_turn_index INTEGER NOT NULL DEFAULT 0,
+                    last_recorded_at TEXT NOT NULL DEFAULT '',
+                    grounding_total INTEGER NOT NULL DEFAULT 0,
+                    grounding_hits INTEGER NOT NULL DEFAULT 0,
+                    correction_total INTEGER NOT NULL DEFAULT 0,
+                    latency_ms_total INTEGER NOT NULL DEFAULT 0,
+                    PRIMARY KEY(user_id, thread_id)
+                );
+
+                CREATE INDEX IF NOT EXISTS idx_thread_summaries_recent
+                ON thread_summaries(user_id, last_recorded_at);
+                """
+            )
+            version = int(conn.execute("PRAGMA user_version").fetchone()[0] or 0)
+        if version < INDEX_SCHEMA_VERSION:
+            self.rebuild_index()
+
+    def rebuild_index(self) -> dict[str, int]:
+        """Offline migration: recompute every thread summary from the JSONL files."""
+        summaries: list[tuple[Any, ...]] = []
+        files = 0
+        for path in sorted(self.root_dir.glob("*.jsonl")):
+            rows: list[dict[str, Any]] = []
+            with path.open("r", encoding="utf-8", errors="ignore") as handle:
+                for line in handle:
+                    try:
+                        payload = json.loads(line)
+                    except Exception:
+                        continue
+                    if isinstance(payload, dict):
+                        rows.append(payload)
+            if not rows:
+                continue
+            files += 1
+            latest = rows[-1]
+            deltas = _summary_deltas(rows)
+            summaries.append(
+                (
+                    str(latest.get("user_id") or ""),
+                    str(latest.get("thread_id") or ""),
+                    path.name,
+                    deltas["row_count"],
+                    int(latest.get("turn_index") or 0),
+                    str(latest.get("recorded_at") or ""),
+                    deltas["grounding_total"],
+                    deltas["grounding_hits"],
+                    deltas["correction_total"],
+                    deltas["latency_ms_total"],
+                )
+            )
+        with self._write_lock, self._connect() as conn:
+            conn.execute("DELETE FROM thread_summaries")
+            conn.executemany(
+                """
+                INSERT OR REPLACE INTO thread_summaries(
+                    user_id, thread_id, file_name, row_count, last_turn_index, last_recorded_at,
+                    grounding_total, grounding_hits, correction_total, latency_ms_total
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                summaries,
+            )
+            conn.execute(f"PRAGMA user_version = {INDEX_SCHEMA_VERSION}")
+        return {"files": files, "threads": len(summaries)}
 
     def path_for(self, *, user_id: str, thread_id: str) -> Path:
         return self.root_dir / f"{_safe_part(user_id)}__{_safe_part(thread_id)}.jsonl"
 
-    def record_turn(
+    def _build_row(
         self,
         *,
         user_id: str,
@@ -74,7 +197,7 @@ class TrajectoryStore:
         tool_events: list[dict[str, Any]] | None = None,
         metadata: dict[str, Any] | None = None,
     ) -> dict[str, Any]:
-        row = {
+        return {
             "recorded_at": _now_iso(),
             "user_id": str(user_id or "default_user"),
             "thread_id": str(thread_id or "general"),
@@ -90,51 +213,139 @@ class TrajectoryStore:
             "metadata": dict(metadata or {}),
             "grounded": infer_grounding(str(route or ""), str(response or ""), list(tool_events or [])),
         }
-        path = self.path_for(user_id=str(user_id or "default_user"), thread_id=str(thread_id or "general"))
-        with path.open("a", encoding="utf-8") as handle:
-            handle.write(json.dumps(row, ensure_ascii=False, sort_keys=True) + "\n")
+
+    def _write_rows(self, rows: list[dict[str, Any]]) -> None:
+        grouped: dict[tuple[str, str], list[dict[str, Any]]] = {}
+        for row in rows:
+            grouped.setdefault((row["user_id"], row["thread_id"]), []).append(row)
+        summaries: list[dict[str, Any]] = []
+        with self._write_lock:
+            for (user_id, thread_id), thread_rows in grouped.items():
+                path = self.path_for(user_id=user_id, thread_id=thread_id)
+                with path.open("a", encoding="utf-8") as handle:
+                    handle.write("".join(json.dumps(row, ensure_ascii=False, sort_keys=True) + "\n" for row in thread_rows))
+                latest = thread_rows[-1]
+                summaries.append(
+                    {
+                        "user_id": user_id,
+                        "thread_id": thread_id,
+                        "file_name": path.name,
+                        "last_turn_index": int(latest.get("turn_index") or 0),
+                        "last_recorded_at": str(latest.get("recorded_at") or ""),
+                        **_summary_deltas(thread_rows),
+                    }
+                )
+            with self._connect() as conn:
+                conn.executemany(
+                    """
+                    INSERT INTO thread_summaries(
+                        user_id, thread_id, file_name, row_count, last_turn_index, last_recorded_at,
+                        grounding_total, grounding_hits, correction_total, latency_ms_total
+                    ) VALUES (
+                        :user_id, :thread_id, :file_name, :row_count, :last_turn_index, :last_recorded_at,
+                        :grounding_total, :grounding_hits, :correction_total, :latency_ms_total
+                    )
+                    ON CONFLICT(user_id, thread_id) DO UPDATE SET
+                        correction_total=correction_total + excluded.correction_total
+                            + CASE WHEN :first_is_correction AND row_count > 0 THEN 1 ELSE 0 END,
+                        row_count=row_count + excluded.row_count,
+                        last_turn_index=excluded.last_turn_index,
+                        last_recorded_at=excluded.last_recorded_at,
+                        grounding_total=grounding_total + excluded.grounding_total,
+                        grounding_hits=grounding_hits + excluded.grounding_hits,
+                        latency_ms_total=latency_ms_total + excluded.latency_ms_total
+                    """,
+                    summaries,
+                )
+
+    def record_turn(
+        self,
+        *,
+        user_id: str,
+        thread_id: str,
+        session_id: str,
+        turn_id: int,
+        turn_index: int,
+        prompt: str,
+        response: str,
+        route: str,
+        model_name: str,
+        latency_ms: int,
+        tool_events: list[dict[str, Any]] | None = None,
+        metadata: dict[str, Any] | None = None,
+    ) -> dict[str, Any]:
+        row = self._build_row(
+            user_id=user_id,
+            thread_id=thread_id,
+            session_id=session_id,
+            turn_id=turn_id,
+            turn_index=turn_index,
+            prompt=prompt,
+            response=response,
+            route=route,
+            model_name=model_name,
+            latency_ms=latency_ms,
+            tool_events=tool_events,
+            metadata=metadata,
+        )
+        self._write_rows([row])
         return row
 
+    def record_turns(self, turns: Iterable[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Record many turns (``record_turn`` keyword dicts) with one append per thread and one index transaction."""
+        rows = [self._build_row(**dict(turn)) for turn in turns]
+        if rows:
+            self._write_rows(rows)
+        return rows
+
     def load(self, *, user_id: str, thread_id: str, limit: int = 200) -> list[dict[str, Any]]:
-        path = self.path_for(user_id=user_id, thread_id=thread_id)
-        if not path.exists():
-            return []
-        rows: list[dict[str, Any]] = []
-        with path.open("r", encoding="utf-8", errors="ignore") as handle:
-            for line in handle:
-                raw = line.strip()
-                if not raw:
-                    continue
-                try:
-                    payload = json.loads(raw)
-                except Exception:
-                    continue
-                if isinstance(payload, dict):
-                    rows.append(payload)
-        return rows[-max(1, int(limit or 200)) :]
+        return tail_jsonl(self.path_for(user_id=user_id, thread_id=thread_id), limit=max(1, int(limit or 200)))
 
     def list_threads(self, *, user_id: str | None = None, limit: int = 40) -> list[dict[str, Any]]:
-        rows: list[dict[str, Any]] = []
-        for path in sorted(self.root_dir.glob("*.jsonl"), key=lambda item: item.stat().st_mtime, reverse=True):
-            payloads = self.load(
-                user_id=path.stem.split("__", 1)[0],
-                thread_id=path.stem.split("__", 1)[1] if "__" in path.stem else "general",
-                limit=1,
-            )
-            if not payloads:
-                continue
-            latest = payloads[-1]
-            if user_id and str(latest.get("user_id") or "") != str(user_id):
-                continue
-            rows.append(
-                {
-                    "user_id": str(latest.get("user_id") or ""),
-                    "thread_id": str(latest.get("thread_id") or ""),
-                    "last_recorded_at": str(latest.get("recorded_at") or ""),
-                    "turn_count": int(latest.get("turn_index") or 0),
-                }
-            )
-        return rows[: max(1, int(limit or 40))]
+        clauses = ["row_count > 0"]
+        params: list[Any] = []
+        if user_id:
+            clauses.append("user_id = ?")
+            params.append(str(user_id))
+        params.append(max(1, int(limit or 40)))
+        with self._connect() as conn:
+            rows = conn.execute(
+                f"""
+                SELECT user_id, thread_id, last_recorded_at, last_turn_index
+                FROM thread_summaries
+                WHERE {" AND ".join(clauses)}
+                ORDER BY last_recorded_at DESC
+                LIMIT ?
+                """,
+                tuple(params),
+            ).fetchall()
+        return [
+            {
+                "user_id": str(row["user_id"]),
+                "thread_id": str(row["thread_id"]),
+                "last_recorded_at": str(row["last_recorded_at"]),
+                "turn_count": int(row["last_turn_index"] or 0),
+            }
+            for row in rows
+        ]
+
+    def aggregate(self, *, user_id: str | None = None) -> dict[str, Any]:
+        """Totals across a user's threads (or all threads) straight from the summary rows."""
+        where_sql = " WHERE user_id = ?" if user_id else ""
+        with self._connect() as conn:
+            row = conn.execute(
+                f"""
+                SELECT COUNT(*) AS thread_count,
+                       COALESCE(SUM(row_count), 0) AS turn_count,
+                       COALESCE(SUM(grounding_total), 0) AS grounding_total,
+                       COALESCE(SUM(grounding_hits), 0) AS grounding_hits,
+                       COALESCE(SUM(correction_total), 0) AS correction_total,
+                       COALESCE(SUM(latency_ms_total), 0) AS latency_ms_total
+                FROM thread_summaries{where_sql}
+                """,
+                (str(user_id),) if user_id else (),
+            ).fetchone()
+        return {key: int(row[key] or 0) for key in row.keys()}
 
     def replay(self, *, user_id: str, thread_id: str, limit: int = 40) -> dict[str, Any]:
         rows = self.load(user_id=user_id, thread_id=thread_id, limit=limit)
@@ -2,11 +2,11 @@ from __future__ import annotations
 
 import json
 import time
-from collections import deque
 from pathlib import Path
 from typing import Any
 
 from executive.memory.store import SQLiteMemoryStore
+from runtime.jsonl_log import tail_jsonl
 from runtime.task_graph import load_task_graph
 from state import SessionEventStore
 
@@ -22,6 +22,10 @@ def _clip(text: Any, *, limit: int = 140) -> str:
 
 
 class SomiOntology:
+    # Kinds rebuilt from scratch by refresh_thread: per thread, and per user (thread_id "").
+    THREAD_KINDS = ("Conversation", "Task", "Artifact", "Action")
+    USER_KINDS = ("Goal", "Reminder", "Job", "System", "Channel", "Automation", "Node")
+
     def __init__(
         self,
         *,
@@ -45,6 +49,7 @@ class SomiOntology:
         self.jobs_root = Path(jobs_root)
         self.refresh_ttl_seconds = max(0.0, float(refresh_ttl_seconds or 0.0))
         self._last_refresh: dict[str, float] = {}
+        self.last_refresh_stats: dict[str, int] = {}
 
     def _key(self, user_id: str, thread_id: str) -> str:
         return f"{str(user_id)}::{str(thread_id)}"
@@ -107,26 +112,9 @@ class SomiOntology:
         return [dict(item) for item in list(specs.get(str(kind or ""), []))]
 
     def _iter_recent_jsonl(self, path: Path, *, max_rows: int = 40) -> list[dict[str, Any]]:
-        rows: deque[dict[str, Any]] = deque(maxlen=max_rows)
-        if not path.exists():
-            return []
-        try:
-            with path.open("r", encoding="utf-8") as handle:
-                for line in handle:
-                    raw = line.strip()
-                    if not raw:
-                        continue
-                    try:
-                        data = json.loads(raw)
-                    except Exception:
-                        continue
-                    if isinstance(data, dict):
-                        rows.append(data)
-        except Exception:
-            return []
-        return list(rows)
-
-    def _upsert_baseline_systems(self, *, user_id: str, thread_id: str) -> None:
+        return tail_jsonl(path, limit=max_rows)
+
+    def _baseline_system_objects(self, *, user_id: str, thread_id: str) -> list[OntologyObject]:
         systems = [
             ("state_plane", "online"),
             ("workflow_runtime", "online"),
@@ -136,8 +124,9 @@ class SomiOntology:
             ("desktop", "enabled"),
             ("telegram", "queued"),
         ]
+        objects: list[OntologyObject] = []
         for name, status in systems:
-            self.store.upsert_object(
+            objects.append(
                 OntologyObject(
                     object_id=self._system_object_id(name),
                     kind="System",
@@ -150,7 +139,7 @@ class SomiOntology:
                 )
             )
         for name, status in channels:
-            self.store.upsert_object(
+            objects.append(
                 OntologyObject(
                     object_id=self._channel_object_id(name),
                     kind="Channel",
@@ -162,6 +151,7 @@ class SomiOntology:
                     attributes={"thread_id": thread_id},
                 )
             )
+        return objects
 
     def refresh_thread(self, *, user_id: str, thread_id: str, force: bool = False) -> None:
         cache_key = self._key(user_id, thread_id)
@@ -182,13 +172,12 @@ class SomiOntology:
                 if value and not value.lower().startswith("retracted:"):
                     goals.append(value)
 
-        self.store.delete_scope(owner_user_id=str(user_id), thread_id=str(thread_id), kinds=["Conversation", "Task", "Artifact", "Action"])
-        self.store.delete_scope(owner_user_id=str(user_id), thread_id="", kinds=["Goal", "Reminder", "Job", "System", "Channel", "Automation", "Node"])
-
+        objects: list[OntologyObject] = []
+        links: list[OntologyLink] = []
         user_object_id = self._user_object_id(str(user_id))
         conversation_object_id = self._conversation_object_id(str(user_id), str(thread_id))
 
-        self.store.upsert_object(
+        objects.append(
             OntologyObject(
                 object_id=user_object_id,
                 kind="User",
@@ -209,7 +198,7 @@ class SomiOntology:
             "last_user_text": str((turns[-1] or {}).get("user_text") or "") if turns else "",
             "last_assistant_text": str((turns[-1] or {}).get("assistant_text") or "") if turns else "",
         }
-        self.store.upsert_object(
+        objects.append(
             OntologyObject(
                 object_id=conversation_object_id,
                 kind="Conversation",
@@ -221,7 +210,7 @@ class SomiOntology:
                 attributes=convo_attributes,
             )
         )
-        self.store.upsert_link(
+        links.append(
             OntologyLink(
                 from_id=user_object_id,
                 relation="participates_in",
@@ -233,7 +222,7 @@ class SomiOntology:
 
         for row in list(graph.get("tasks") or []):
             task_object_id = self._task_object_id(str(row.get("task_id") or "task"))
-            self.store.upsert_object(
+            objects.append(
                 OntologyObject(
                     object_id=task_object_id,
                     kind="Task",
@@ -249,7 +238,7 @@ class SomiOntology:
                     },
                 )
             )
-            self.store.upsert_link(
+            links.append(
                 OntologyLink(
                     from_id=conversation_object_id,
                     relation="has_task",
@@ -261,7 +250,7 @@ class SomiOntology:
 
         for title in goals[:50]:
             goal_object_id = self._goal_object_id(title)
-            self.store.upsert_object(
+            objects.append(
                 OntologyObject(
                     object_id=goal_object_id,
                     kind="Goal",
@@ -273,7 +262,7 @@ class SomiOntology:
                     attributes={"title": title},
                 )
             )
-            self.store.upsert_link(
+            links.append(
                 OntologyLink(
                     from_id=user_object_id,
                     relation="owns_goal",
@@ -285,7 +274,7 @@ class SomiOntology:
 
         for row in reminders[:80]:
             reminder_id = str(row.get("id") or "")
-            self.store.upsert_object(
+            objects.append(
                 OntologyObject(
                     object_id=self._reminder_object_id(reminder_id),
                     kind="Reminder",
@@ -301,7 +290,7 @@ class SomiOntology:
                     },
                 )
             )
-            self.store.upsert_link(
+            links.append(
                 OntologyLink(
                     from_id=user_object_id,
                     relation="owns_reminder",
@@ -328,7 +317,7 @@ class SomiOntology:
                 or artifact_id,
                 limit=220,
             )
-            self.store.upsert_object(
+            objects.append(
                 OntologyObject(
                     object_id=self._artifact_object_id(artifact_id),
                     kind="Artifact",
@@ -344,7 +333,7 @@ class SomiOntology:
                     },
                 )
             )
-            self.store.upsert_link(
+            links.append(
                 OntologyLink(
                     from_id=conversation_object_id,
                     relation="produced_artifact",
@@ -364,7 +353,7 @@ class SomiOntology:
                 if not isinstance(row, dict):
                     continue
                 job_id = str(row.get("job_id") or path.stem)
-                self.store.upsert_object(
+                objects.append(
                     OntologyObject(
                         object_id=self._job_object_id(job_id),
                         kind="Job",
@@ -379,7 +368,7 @@ class SomiOntology:
                         },
                     )
                 )
-                self.store.upsert_link(
+                links.append(
                     OntologyLink(
                         from_id=user_object_id,
                         relation="owns_job",
@@ -398,7 +387,7 @@ class SomiOntology:
                 automation_id = str(row.get("automation_id") or "")
                 if not automation_id:
                     continue
-                self.store.upsert_object(
+                objects.append(
                     OntologyObject(
                         object_id=self._automation_object_id(automation_id),
                         kind="Automation",
@@ -414,7 +403,7 @@ class SomiOntology:
                         },
                     )
                 )
-                self.store.upsert_link(
+                links.append(
                     OntologyLink(
                         from_id=user_object_id,
                         relation="owns_automation",
@@ -433,7 +422,7 @@ class SomiOntology:
                 node_id = str(row.get("node_id") or "")
                 if not node_id:
                     continue
-                self.store.upsert_object(
+                objects.append(
                     OntologyObject(
                         object_id=self._node_object_id(node_id),
                         kind="Node",
@@ -450,7 +439,7 @@ class SomiOntology:
                         },
                     )
                 )
-                self.store.upsert_link(
+                links.append(
                     OntologyLink(
                         from_id=user_object_id,
                         relation="controls_node",
@@ -460,20 +449,41 @@ class SomiOntology:
                     )
                 )
 
-        self._upsert_baseline_systems(user_id=str(user_id), thread_id=str(thread_id))
-        self._sync_runbook_actions(user_id=str(user_id), thread_id=str(thread_id))
+        objects.extend(self._baseline_system_objects(user_id=str(user_id), thread_id=str(thread_id)))
+        action_objects, action_links = self._runbook_actions(objects, user_id=str(user_id), thread_id=str(thread_id))
+        objects.extend(action_objects)
+        links.extend(action_links)
+        self.last_refresh_stats = self.store.sync_projection(
+            objects,
+            links,
+            scopes=[
+                (str(user_id), str(thread_id), list(self.THREAD_KINDS)),
+                (str(user_id), "", list(self.USER_KINDS)),
+            ],
+            link_scope=(str(user_id), str(thread_id)),
+        )
         self._last_refresh[cache_key] = now
 
-    def _sync_runbook_actions(self, *, user_id: str, thread_id: str) -> None:
-        targets: list[dict[str, Any]] = []
-        targets.extend(self.store.list_objects(kind="Task", owner_user_id=str(user_id), thread_id=str(thread_id), limit=80))
-        targets.extend(self.store.list_objects(kind="Artifact", owner_user_id=str(user_id), thread_id=str(thread_id), limit=80))
-        targets.extend(self.store.list_objects(kind="Job", owner_user_id=str(user_id), thread_id="", limit=80))
-        targets.extend(self.store.list_objects(kind="Automation", owner_user_id=str(user_id), thread_id="", limit=80))
-        targets.extend(self.store.list_objects(kind="Node", owner_user_id=str(user_id), thread_id="", limit=80))
+    def _runbook_actions(
+        self,
+        projected: list[OntologyObject],
+        *,
+        user_id: str,
+        thread_id: str,
+    ) -> tuple[list[OntologyObject], list[OntologyLink]]:
+        latest: dict[str, OntologyObject] = {}
+        for item in projected:
+            latest.pop(item.object_id, None)
+            latest[item.object_id] = item
+        targets: list[OntologyObject] = []
+        for kind in ("Task", "Artifact", "Job", "Automation", "Node"):
+            # The most recently projected rows of each kind first, as the store's updated_at ordering used to give.
+            targets.extend([item for item in reversed(latest.values()) if item.kind == kind][:80])
+        objects: list[OntologyObject] = []
+        links: list[OntologyLink] = []
         for row in targets:
-            target_id = str(row.get("object_id") or "")
-            target_kind = str(row.get("kind") or "")
+            target_id = str(row.object_id or "")
+            target_kind = str(row.kind or "")
             for spec in self._runbook_spec(target_kind):
                 action_id = self._action_object_id(target_id, str(spec.get("action_type") or "action"))
                 attrs = {
@@ -485,7 +495,7 @@ class SomiOntology:
                     "runbook_id": str(spec.get("runbook_id") or ""),
                     "approval_chain": [],
                 }
-                self.store.upsert_object(
+                objects.append(
                     OntologyObject(
                         object_id=action_id,
                         kind="Action",
@@ -497,7 +507,7 @@ class SomiOntology:
                         attributes=attrs,
                     )
                 )
-                self.store.upsert_link(
+                links.append(
                     OntologyLink(
                         from_id=target_id,
                         relation="can_run_action",
@@ -506,6 +516,7 @@ class SomiOntology:
                         thread_id=str(thread_id),
                     )
                 )
+        return objects, links
 
     def list_actions(self, *, owner_user_id: str, thread_id: str | None = None, limit: int = 40) -> list[dict[str, Any]]:
         return self.store.list_objects(kind="Action", owner_user_id=str(owner_user_id), thread_id=thread_id, limit=limit)
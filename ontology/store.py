@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import hashlib
 import json
 import sqlite3
 import threading
@@ -21,6 +22,29 @@ def _json(value: Any, default: Any) -> str:
         return json.dumps(default, ensure_ascii=False, sort_keys=True)
 
 
+def _object_payload(item: OntologyObject | dict[str, Any]) -> tuple[dict[str, Any], tuple[str, ...]]:
+    """Normalized row plus the column tuple written for it; the last two columns are updated_at and content_hash."""
+    row = item.to_record() if isinstance(item, OntologyObject) else dict(item or {})
+    columns = (
+        str(row.get("object_id") or ""),
+        str(row.get("kind") or "System"),
+        str(row.get("label") or ""),
+        str(row.get("status") or "active"),
+        str(row.get("owner_user_id") or ""),
+        str(row.get("thread_id") or ""),
+        str(row.get("source") or ""),
+        _json(dict(row.get("attributes") or {}), {}),
+        str(row.get("searchable_text") or ""),
+    )
+    content_hash = hashlib.sha1("\x1f".join(columns).encode("utf-8")).hexdigest()
+    updated_at = str(row.get("updated_at") or _now_iso())
+    return row, columns + (updated_at, content_hash)
+
+
+def _chunks(values: list[Any], size: int = 400) -> list[list[Any]]:
+    return [values[idx : idx + size] for idx in range(0, len(values), size)]
+
+
 class OntologyStore:
     def __init__(self, db_path: str | Path = "sessions/state/ontology.sqlite3") -> None:
         self.db_path = Path(db_path)
@@ -52,7 +76,8 @@ class OntologyStore:
                         source TEXT NOT NULL DEFAULT '',
                         attributes_json TEXT NOT NULL DEFAULT '{}',
                         searchable_text TEXT NOT NULL DEFAULT '',
-                        updated_at TEXT NOT NULL
+                        updated_at TEXT NOT NULL,
+                        content_hash TEXT NOT NULL DEFAULT ''
                     );
 
                     CREATE INDEX IF NOT EXISTS idx_objects_kind_user
@@ -72,8 +97,14 @@ class OntologyStore:
 
                     CREATE INDEX IF NOT EXISTS idx_links_from_rel
                     ON links(from_id, relation, owner_user_id, thread_id);
+
+                    CREATE INDEX IF NOT EXISTS idx_links_scope
+                    ON links(owner_user_id, thread_id);
                     """
                 )
+                columns = {str(row[1]) for row in conn.execute("PRAGMA table_info(objects)").fetchall()}
+                if "content_hash" not in columns:
+                    conn.execute("ALTER TABLE objects ADD COLUMN content_hash TEXT NOT NULL DEFAULT ''")
                 try:
                     conn.execute(
                         """
@@ -90,53 +121,55 @@ class OntologyStore:
                 except sqlite3.OperationalError:
                     self._fts_enabled = False
 
-    def upsert_object(self, item: OntologyObject | dict[str, Any]) -> dict[str, Any]:
-        row = item.to_record() if isinstance(item, OntologyObject) else dict(item or {})
-        updated_at = str(row.get("updated_at") or _now_iso())
-        payload = (
-            str(row.get("object_id") or ""),
-            str(row.get("kind") or "System"),
-            str(row.get("label") or ""),
-            str(row.get("status") or "active"),
-            str(row.get("owner_user_id") or ""),
-            str(row.get("thread_id") or ""),
-            str(row.get("source") or ""),
-            _json(dict(row.get("attributes") or {}), {}),
-            str(row.get("searchable_text") or ""),
-            updated_at,
+    _UPSERT_OBJECT_SQL = """
+        INSERT INTO objects(
+            object_id, kind, label, status, owner_user_id, thread_id, source, attributes_json, searchable_text, updated_at, content_hash
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        ON CONFLICT(object_id) DO UPDATE SET
+            kind=excluded.kind,
+            label=excluded.label,
+            status=excluded.status,
+            owner_user_id=excluded.owner_user_id,
+            thread_id=excluded.thread_id,
+            source=excluded.source,
+            attributes_json=excluded.attributes_json,
+            searchable_text=excluded.searchable_text,
+            updated_at=excluded.updated_at,
+            content_hash=excluded.content_hash
+    """
+
+    _UPSERT_LINK_SQL = """
+        INSERT INTO links(
+            from_id, relation, to_id, owner_user_id, thread_id, attributes_json, updated_at
+        ) VALUES (?, ?, ?, ?, ?, ?, ?)
+        ON CONFLICT(from_id, relation, to_id, owner_user_id, thread_id) DO UPDATE SET
+            attributes_json=excluded.attributes_json,
+            updated_at=excluded.updated_at
+    """
+
+    def _delete_fts(self, conn: sqlite3.Connection, object_ids: list[str]) -> None:
+        if not self._fts_enabled:
+            return
+        # object_id is UNINDEXED in the FTS table, so one IN scan per chunk beats one scan per id.
+        for chunk in _chunks(object_ids):
+            conn.execute(f"DELETE FROM object_fts WHERE object_id IN ({','.join(['?'] * len(chunk))})", tuple(chunk))
+
+    def _insert_fts(self, conn: sqlite3.Connection, payloads: list[tuple[str, ...]]) -> None:
+        if not self._fts_enabled:
+            return
+        conn.executemany(
+            "INSERT INTO object_fts(object_id, kind, label, searchable_text) VALUES (?, ?, ?, ?)",
+            [(p[0], p[1], p[2], p[8]) for p in payloads],
         )
+
+    def upsert_object(self, item: OntologyObject | dict[str, Any]) -> dict[str, Any]:
+        row, payload = _object_payload(item)
         with self._connect() as conn:
-            conn.execute(
-                """
-                INSERT INTO objects(
-                    object_id, kind, label, status, owner_user_id, thread_id, source, attributes_json, searchable_text, updated_at
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                ON CONFLICT(object_id) DO UPDATE SET
-                    kind=excluded.kind,
-                    label=excluded.label,
-                    status=excluded.status,
-                    owner_user_id=excluded.owner_user_id,
-                    thread_id=excluded.thread_id,
-                    source=excluded.source,
-                    attributes_json=excluded.attributes_json,
-                    searchable_text=excluded.searchable_text,
-                    updated_at=excluded.updated_at
-                """,
-                payload,
-            )
-            if self._fts_enabled:
-                conn.execute("DELETE FROM object_fts WHERE object_id = ?", (str(row.get("object_id") or ""),))
-                conn.execute(
-                    "INSERT INTO object_fts(object_id, kind, label, searchable_text) VALUES (?, ?, ?, ?)",
-                    (
-                        str(row.get("object_id") or ""),
-                        str(row.get("kind") or "System"),
-                        str(row.get("label") or ""),
-                        str(row.get("searchable_text") or ""),
-                    ),
-                )
+            conn.execute(self._UPSERT_OBJECT_SQL, payload)
+            self._delete_fts(conn, [payload[0]])
+            self._insert_fts(conn, [payload])
         out = dict(row)
-        out["updated_at"] = updated_at
+        out["updated_at"] = payload[9]
         return out
 
     def upsert_link(self, link: OntologyLink | dict[str, Any]) -> dict[str, Any]:
@@ -144,14 +177,7 @@ class OntologyStore:
         updated_at = str(row.get("updated_at") or _now_iso())
         with self._connect() as conn:
             conn.execute(
-                """
-                INSERT INTO links(
-                    from_id, relation, to_id, owner_user_id, thread_id, attributes_json, updated_at
-                ) VALUES (?, ?, ?, ?, ?, ?, ?)
-                ON CONFLICT(from_id, relation, to_id, owner_user_id, thread_id) DO UPDATE SET
-                    attributes_json=excluded.attributes_json,
-                    updated_at=excluded.updated_at
-                """,
+                self._UPSERT_LINK_SQL,
                 (
                     str(row.get("from_id") or ""),
                     str(row.get("relation") or ""),
@@ -183,9 +209,7 @@ class OntologyStore:
         with self._connect() as conn:
             object_ids = [str(row[0]) for row in conn.execute(f"SELECT object_id FROM objects{where_sql}", tuple(params)).fetchall()]
             conn.execute(f"DELETE FROM objects{where_sql}", tuple(params))
-            if self._fts_enabled:
-                for object_id in object_ids:
-                    conn.execute("DELETE FROM object_fts WHERE object_id = ?", (object_id,))
+            self._delete_fts(conn, object_ids)
             link_clauses = []
             link_params: list[Any] = []
             if owner_user_id:
@@ -197,6 +221,96 @@ class OntologyStore:
             link_where = " WHERE " + " AND ".join(link_clauses) if link_clauses else ""
             conn.execute(f"DELETE FROM links{link_where}", tuple(link_params))
 
+    def sync_projection(
+        self,
+        objects: list[OntologyObject | dict[str, Any]],
+        links: list[OntologyLink | dict[str, Any]],
+        *,
+        scopes: list[tuple[str, str, list[str]]],
+        link_scope: tuple[str, str],
+    ) -> dict[str, int]:
+        """
+        Make the store match a freshly computed projection in one transaction.
+
+        Objects are compared by content hash, so unchanged rows (and their FTS
+        entries) are not rewritten. Rows of the listed ``(owner, thread, kinds)``
+        scopes that are no longer projected are deleted together with their FTS
+        entries and any links touching them; links owned by ``link_scope`` are
+        diffed the same way. Later duplicates of an object id or link key win.
+        """
+        projected: dict[str, tuple[str, ...]] = {}
+        for item in objects:
+            _row, payload = _object_payload(item)
+            if payload[0]:
+                projected.pop(payload[0], None)
+                projected[payload[0]] = payload
+        wanted_links: dict[tuple[str, ...], tuple[str, ...]] = {}
+        for link in links:
+            row = link.to_record() if isinstance(link, OntologyLink) else dict(link or {})
+            key = (
+                str(row.get("from_id") or ""),
+                str(row.get("relation") or ""),
+                str(row.get("to_id") or ""),
+                str(row.get("owner_user_id") or ""),
+                str(row.get("thread_id") or ""),
+            )
+            wanted_links[key] = key + (_json(dict(row.get("attributes") or {}), {}), str(row.get("updated_at") or _now_iso()))
+        stats = {"inserted": 0, "updated": 0, "unchanged": 0, "deleted": 0, "links_written": 0, "links_deleted": 0}
+        with self._connect() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            existing: dict[str, str] = {}
+            for chunk in _chunks(list(projected)):
+                sql = f"SELECT object_id, content_hash FROM objects WHERE object_id IN ({','.join(['?'] * len(chunk))})"
+                existing.update((str(row[0]), str(row[1])) for row in conn.execute(sql, tuple(chunk)).fetchall())
+            changed = [payload for object_id, payload in projected.items() if existing.get(object_id) != payload[10]]
+            stats["updated"] = sum(1 for payload in changed if payload[0] in existing)
+            stats["inserted"] = len(changed) - stats["updated"]
+            stats["unchanged"] = len(projected) - len(changed)
+            if changed:
+                conn.executemany(self._UPSERT_OBJECT_SQL, changed)
+                self._delete_fts(conn, [payload[0] for payload in changed if payload[0] in existing])
+                self._insert_fts(conn, changed)
+
+            vanished: list[str] = []
+            for owner_user_id, thread_id, kinds in scopes:
+                if not kinds:
+                    continue
+                sql = (
+                    "SELECT object_id FROM objects WHERE owner_user_id = ? AND thread_id = ? "
+                    f"AND kind IN ({','.join(['?'] * len(kinds))})"
+                )
+                rows = conn.execute(sql, (str(owner_user_id), str(thread_id), *[str(kind) for kind in kinds])).fetchall()
+                vanished.extend(str(row[0]) for row in rows if str(row[0]) not in projected)
+            vanished = list(dict.fromkeys(vanished))
+            for chunk in _chunks(vanished):
+                marks = ",".join(["?"] * len(chunk))
+                conn.execute(f"DELETE FROM objects WHERE object_id IN ({marks})", tuple(chunk))
+                cursor = conn.execute(f"DELETE FROM links WHERE from_id IN ({marks}) OR to_id IN ({marks})", tuple(chunk) * 2)
+                stats["links_deleted"] += max(0, int(cursor.rowcount or 0))
+            self._delete_fts(conn, vanished)
+            stats["deleted"] = len(vanished)
+
+            link_owner, link_thread = str(link_scope[0]), str(link_scope[1])
+            current_links = {
+                (str(row[0]), str(row[1]), str(row[2]), link_owner, link_thread): str(row[3])
+                for row in conn.execute(
+                    "SELECT from_id, relation, to_id, attributes_json FROM links WHERE owner_user_id = ? AND thread_id = ?",
+                    (link_owner, link_thread),
+                ).fetchall()
+            }
+            stale_links = [key for key in current_links if key not in wanted_links]
+            if stale_links:
+                conn.executemany(
+                    "DELETE FROM links WHERE from_id = ? AND relation = ? AND to_id = ? AND owner_user_id = ? AND thread_id = ?",
+                    stale_links,
+                )
+                stats["links_deleted"] += len(stale_links)
+            link_rows = [row for key, row in wanted_links.items() if current_links.get(key) != row[5]]
+            if link_rows:
+                conn.executemany(self._UPSERT_LINK_SQL, link_rows)
+            stats["links_written"] = len(link_rows)
+        return stats
+
     def list_objects(
         self,
         *,
@@ -1,6 +1,6 @@
 from ops.artifact_hygiene import format_artifact_hygiene, run_artifact_hygiene
-from ops.backup_creator import create_phase_backup, format_backup_creation
-from ops.backup_verifier import verify_backup_dir, verify_recent_backups
+from ops.backup_creator import create_phase_backup, format_backup_creation, gc_backup_objects
+from ops.backup_verifier import verify_backup_dir, verify_backup_manifest, verify_recent_backups
 from ops.continuity_recovery import build_continuity_recovery_snapshot, format_continuity_recovery_snapshot
 from ops.control_plane import OpsControlPlane
 from ops.context_budget import format_context_budget_status, run_context_budget_status
@@ -21,6 +21,7 @@ __all__ = [
     "format_artifact_hygiene",
     "create_phase_backup",
     "format_backup_creation",
+    "gc_backup_objects",
     "format_continuity_recovery_snapshot",
     "format_context_budget_status",
     "format_docs_integrity",
@@ -40,6 +41,7 @@ __all__ = [
     "run_observability_snapshot",
     "run_somi_doctor",
     "verify_backup_dir",
+    "verify_backup_manifest",
     "verify_recent_backups",
     "write_support_bundle",
 ]
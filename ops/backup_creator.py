@@ -1,11 +1,19 @@
 from __future__ import annotations
 
+import hashlib
+import json
+import os
 import re
 import shutil
+import sqlite3
+import uuid
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Iterable
 
+from runtime.hashing import sha256_file
+
 DEFAULT_EXCLUDED_PREFIXES = (
     ".git",
     ".venv",
@@ -39,6 +47,11 @@ DEFAULT_ROOT_FILES = (
     "agents.py",
 )
 PHASE_DIR_PATTERN = re.compile(r"^phase\d+_", re.IGNORECASE)
+SQLITE_SUFFIXES = {".sqlite", ".sqlite3", ".db"}
+SQLITE_SIDECAR_SUFFIXES = ("-wal", "-shm", "-journal")
+SQLITE_HEADER = b"SQLite format 3\x00"
+MANIFEST_NAME = "backup_manifest.json"
+OBJECTS_DIR_NAME = ".objects"
 
 
 def _now_stamp() -> str:
@@ -101,6 +114,75 @@ def _default_include_paths(root_dir: Path) -> list[str]:
     return _normalize_paths(includes)
 
 
+def _is_sqlite_file(path: Path) -> bool:
+    if path.suffix.lower() not in SQLITE_SUFFIXES:
+        return False
+    try:
+        with path.open("rb") as handle:
+            return handle.read(len(SQLITE_HEADER)) == SQLITE_HEADER
+    except OSError:
+        return False
+
+
+def _is_sqlite_sidecar(path: Path) -> bool:
+    """WAL/SHM/journal files; the online backup of their database already includes their committed pages."""
+    name = path.name
+    for suffix in SQLITE_SIDECAR_SUFFIXES:
+        if name.endswith(suffix):
+            return _is_sqlite_file(path.with_name(name[: -len(suffix)]))
+    return False
+
+
+def _snapshot_sqlite(source: Path, target: Path) -> None:
+    """Consistent copy of a live database through the SQLite online backup API."""
+    target.parent.mkdir(parents=True, exist_ok=True)
+    # Read-only, so a backup can never create, migrate or roll back anything in the source.
+    src = sqlite3.connect(f"{source.resolve().as_uri()}?mode=ro", uri=True, timeout=30.0)
+    try:
+        dst = sqlite3.connect(str(target))
+        try:
+            src.backup(dst)
+        finally:
+            dst.close()
+    finally:
+        src.close()
+
+
+def _copy_file(source: Path, target: Path) -> bool:
+    """Copy one file into a backup; returns True when it went through the SQLite backup API."""
+    if _is_sqlite_file(source):
+        _snapshot_sqlite(source, target)
+        shutil.copystat(source, target)
+        return True
+    shutil.copy2(source, target)
+    return False
+
+
+def _collect_files(
+    source_root: Path,
+    *,
+    root_dir: Path,
+    excluded_prefixes: set[str],
+    stats: dict[str, int],
+) -> list[Path]:
+    files: list[Path] = []
+    for path in source_root.rglob("*"):
+        rel_path = path.relative_to(root_dir)
+        if _should_skip(rel_path, excluded_prefixes=excluded_prefixes):
+            if path.is_dir():
+                stats["skipped_dirs"] += 1
+            else:
+                stats["skipped_files"] += 1
+            continue
+        if path.is_dir():
+            continue
+        if _is_sqlite_sidecar(path):
+            stats["skipped_files"] += 1
+            continue
+        files.append(path)
+    return files
+
+
 def _copy_tree(
     source_root: Path,
     destination_root: Path,
@@ -121,11 +203,150 @@ def _copy_tree(
         if path.is_dir():
             target.mkdir(parents=True, exist_ok=True)
             continue
+        if _is_sqlite_sidecar(path):
+            stats["skipped_files"] += 1
+            continue
         target.parent.mkdir(parents=True, exist_ok=True)
-        shutil.copy2(path, target)
+        if _copy_file(path, target):
+            stats["sqlite_snapshots"] += 1
         stats["copied_files"] += 1
 
 
+def _object_path(objects_root: Path, digest: str) -> Path:
+    return objects_root / digest[:2] / digest
+
+
+def _copy_hashing(source: Path, target: Path) -> str:
+    digest = hashlib.sha256()
+    with source.open("rb") as src, target.open("wb") as dst:
+        while True:
+            chunk = src.read(1024 * 1024)
+            if not chunk:
+                break
+            digest.update(chunk)
+            dst.write(chunk)
+    shutil.copystat(source, target)
+    return digest.hexdigest()
+
+
+def _wal_signature(path: Path) -> list[int]:
+    wal = path.with_name(path.name + "-wal")
+    try:
+        stat = wal.stat()
+    except OSError:
+        return []
+    return [int(stat.st_size), int(stat.st_mtime_ns)]
+
+
+def _latest_manifest(backup_root: Path, project_root: Path) -> dict[str, Any]:
+    """Newest manifest written for ``project_root``; its stat cache lets unchanged files skip hashing."""
+    best: dict[str, Any] = {}
+    if not backup_root.exists():
+        return best
+    for child in backup_root.iterdir():
+        manifest_path = child / MANIFEST_NAME
+        if child.name.startswith(".") or not manifest_path.is_file():
+            continue
+        try:
+            manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+        except Exception:
+            continue
+        if not isinstance(manifest, dict) or str(manifest.get("root_dir") or "") != str(project_root):
+            continue
+        if str(manifest.get("created_at") or "") > str(best.get("created_at") or ""):
+            best = manifest
+    return best
+
+
+def _store_incremental(
+    source: Path,
+    rel_text: str,
+    *,
+    destination: Path,
+    objects_root: Path,
+    previous: dict[str, Any],
+) -> dict[str, Any]:
+    stat = source.stat()
+    sqlite_file = _is_sqlite_file(source)
+    wal = _wal_signature(source) if sqlite_file else []
+    prior = previous.get(rel_text) if isinstance(previous.get(rel_text), dict) else {}
+    digest = ""
+    outcome = "reused"
+    if (
+        prior
+        and int(prior.get("source_size", -1)) == int(stat.st_size)
+        and int(prior.get("mtime_ns", -1)) == int(stat.st_mtime_ns)
+        and list(prior.get("wal") or []) == wal
+        and _object_path(objects_root, str(prior.get("sha256") or "00")).exists()
+    ):
+        digest = str(prior["sha256"])
+    else:
+        staging = objects_root / "tmp" / uuid.uuid4().hex
+        staging.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            if sqlite_file:
+                _snapshot_sqlite(source, staging)
+                shutil.copystat(source, staging)
+                digest = sha256_file(staging)
+            else:
+                digest = _copy_hashing(source, staging)
+            obj = _object_path(objects_root, digest)
+            if obj.exists():
+                outcome = "deduplicated"
+            else:
+                obj.parent.mkdir(parents=True, exist_ok=True)
+                os.replace(staging, obj)
+                outcome = "stored"
+        finally:
+            if staging.exists():
+                staging.unlink()
+    obj = _object_path(objects_root, digest)
+    target = destination / rel_text
+    target.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        os.link(obj, target)
+        linked = True
+    except OSError:
+        shutil.copy2(obj, target)
+        linked = False
+    return {
+        "path": rel_text,
+        "sha256": digest,
+        "size": int(obj.stat().st_size),
+        "source_size": int(stat.st_size),
+        "mtime_ns": int(stat.st_mtime_ns),
+        "wal": wal,
+        "kind": "sqlite" if sqlite_file else "file",
+        "outcome": outcome,
+        "linked": linked,
+    }
+
+
+def gc_backup_objects(backup_root: str | Path) -> dict[str, int]:
+    """Delete content objects no remaining backup manifest references."""
+    root = Path(backup_root)
+    objects_root = root / OBJECTS_DIR_NAME
+    referenced: set[str] = set()
+    for child in root.iterdir() if root.exists() else []:
+        manifest_path = child / MANIFEST_NAME
+        if not manifest_path.is_file():
+            continue
+        try:
+            manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+        except Exception:
+            # An unreadable manifest could reference anything; keep every object.
+            return {"removed": 0, "kept": -1}
+        referenced.update(str(row.get("sha256") or "") for row in dict(manifest.get("files") or {}).values())
+    removed = kept = 0
+    for obj in objects_root.glob("??/*") if objects_root.exists() else []:
+        if obj.name in referenced:
+            kept += 1
+            continue
+        obj.unlink()
+        removed += 1
+    return {"removed": removed, "kept": kept}
+
+
 def create_phase_backup(
     root_dir: str | Path,
     *,
@@ -133,7 +354,20 @@ def create_phase_backup(
     include_paths: Iterable[str | Path] | None = None,
     output_root: str | Path | None = None,
     excluded_prefixes: Iterable[str | Path] | None = None,
+    incremental: bool = False,
+    workers: int = 4,
 ) -> dict[str, Any]:
+    """
+    Copy the include roots into a fresh timestamped directory under the backup root.
+
+    Live SQLite databases are always captured through the online backup API;
+    their -wal/-shm/-journal files are skipped. With ``incremental`` every file
+    is stored once in a content-addressed ``.objects`` pool beside the backups
+    and hard-linked into the new directory. Files whose size and mtime match
+    the previous manifest are linked without being read. Copies run on
+    ``workers`` threads and a ``backup_manifest.json`` records the sha256 of
+    every entry for the verifier.
+    """
     project_root = Path(root_dir).resolve()
     backup_root = Path(output_root).resolve() if output_root else (project_root / "audit" / "backups").resolve()
     backup_root.mkdir(parents=True, exist_ok=True)
@@ -150,9 +384,11 @@ def create_phase_backup(
         "copied_roots": 0,
         "skipped_dirs": 0,
         "skipped_files": 0,
+        "sqlite_snapshots": 0,
     }
     copied_roots: list[str] = []
     missing: list[str] = []
+    pending: list[Path] = []
 
     for item in include_list:
         source = (project_root / item).resolve()
@@ -171,16 +407,66 @@ def create_phase_backup(
         copied_roots.append(rel_text)
         stats["copied_roots"] += 1
         target = destination / rel_path
-        if source.is_dir():
+        if incremental:
+            if source.is_dir():
+                target.mkdir(parents=True, exist_ok=True)
+                pending.extend(_collect_files(source, root_dir=project_root, excluded_prefixes=excluded, stats=stats))
+            else:
+                pending.append(source)
+        elif source.is_dir():
             target.mkdir(parents=True, exist_ok=True)
             _copy_tree(source, destination, root_dir=project_root, excluded_prefixes=excluded, stats=stats)
         else:
             target.parent.mkdir(parents=True, exist_ok=True)
-            shutil.copy2(source, target)
+            if _copy_file(source, target):
+                stats["sqlite_snapshots"] += 1
             stats["copied_files"] += 1
 
+    manifest_path = ""
+    if incremental:
+        objects_root = backup_root / OBJECTS_DIR_NAME
+        previous = dict(_latest_manifest(backup_root, project_root).get("files") or {})
+        rel_paths = list(dict.fromkeys(_relative_text(path.relative_to(project_root)) for path in pending))
+        with ThreadPoolExecutor(max_workers=max(1, int(workers or 1))) as pool:
+            entries = list(
+                pool.map(
+                    lambda rel_text: _store_incremental(
+                        project_root / rel_text,
+                        rel_text,
+                        destination=destination,
+                        objects_root=objects_root,
+                        previous=previous,
+                    ),
+                    rel_paths,
+                )
+            )
+        shutil.rmtree(objects_root / "tmp", ignore_errors=True)
+        stats.update({"stored_files": 0, "reused_files": 0, "deduplicated_files": 0})
+        for entry in entries:
+            stats[f"{entry['outcome']}_files"] += 1
+            if entry["kind"] == "sqlite":
+                stats["sqlite_snapshots"] += 1
+        stats["copied_files"] = len(entries)
+        stats["linked_files"] = sum(1 for entry in entries if entry["linked"])
+        manifest = {
+            "version": 1,
+            "label": _sanitize_label(label),
+            "root_dir": str(project_root),
+            "objects_root": OBJECTS_DIR_NAME,
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            "files": {
+                entry["path"]: {key: entry[key] for key in ("sha256", "size", "source_size", "mtime_ns", "wal", "kind")}
+                for entry in entries
+            },
+        }
+        target_manifest = destination / MANIFEST_NAME
+        target_manifest.write_text(json.dumps(manifest, ensure_ascii=False, indent=2), encoding="utf-8")
+        manifest_path = str(target_manifest)
+
     return {
         "ok": not missing and stats["copied_roots"] > 0 and stats["copied_files"] > 0,
+        "mode": "incremental" if incremental else "full",
+        "manifest": manifest_path,
         "label": _sanitize_label(label),
         "root_dir": str(project_root),
         "backup_root": str(backup_root),
@@ -203,6 +489,16 @@ def format_backup_creation(report: dict[str, Any]) -> str:
             f"- backup_dir: {report.get('backup_dir', '')}",
             f"- copied_roots: {int(stats.get('copied_roots') or 0)}",
             f"- copied_files: {int(stats.get('copied_files') or 0)}",
+            *(
+                [
+                    f"- stored_files: {int(stats.get('stored_files') or 0)}",
+                    f"- reused_files: {int(stats.get('reused_files') or 0)}",
+                    f"- deduplicated_files: {int(stats.get('deduplicated_files') or 0)}",
+                ]
+                if str(report.get("mode") or "") == "incremental"
+                else []
+            ),
+            f"- sqlite_snapshots: {int(stats.get('sqlite_snapshots') or 0)}",
             f"- skipped_dirs: {int(stats.get('skipped_dirs') or 0)}",
             f"- skipped_files: {int(stats.get('skipped_files') or 0)}",
             f"- missing: {len(list(report.get('missing') or []))}",
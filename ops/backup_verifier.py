@@ -1,10 +1,13 @@
 from __future__ import annotations
 
+import json
 import os
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
+from runtime.hashing import sha256_file
+
 CRITICAL_BACKUP_PATHS = (
     "agents.py",
     "somi.py",
@@ -12,6 +15,7 @@ CRITICAL_BACKUP_PATHS = (
     "docs/architecture/SYSTEM_MAP.md",
 )
 CHECKPOINT_SUFFIXES = {".py", ".md", ".json", ".yaml", ".yml", ".toml", ".txt"}
+MANIFEST_NAME = "backup_manifest.json"
 PHASE_LOG_HINTS = {
     "framework_release_notes.md",
     "upgrade_path_verified.md",
@@ -61,6 +65,9 @@ def list_recent_backups(
         if not root.exists():
             continue
         for path in sorted(root.iterdir(), key=lambda item: item.stat().st_mtime, reverse=True):
+            if path.name.startswith("."):
+                # The incremental backups' shared .objects pool, not a backup.
+                continue
             rows.append(
                 {
                     "name": path.name,
@@ -92,7 +99,58 @@ def _phase_checkpoint_ok(
     return phase_named
 
 
-def verify_backup_dir(path: str | Path, *, required_paths: tuple[str, ...] = CRITICAL_BACKUP_PATHS) -> dict[str, Any]:
+def verify_backup_manifest(path: str | Path, *, deep: bool = False) -> dict[str, Any]:
+    """
+    Check an incremental backup against its ``backup_manifest.json``.
+
+    Every entry must exist with the recorded size. Entries still hard-linked to
+    their content object are trusted by identity; ``deep`` rehashes them too.
+    Copies that could not be linked are always rehashed.
+    """
+    target = Path(path)
+    manifest_path = target / MANIFEST_NAME
+    try:
+        manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        return {"ok": False, "present": False, "issues": ["manifest_missing"], "checked": 0, "mismatched": []}
+    except Exception:
+        return {"ok": False, "present": True, "issues": ["manifest_unreadable"], "checked": 0, "mismatched": []}
+    files = dict(manifest.get("files") or {}) if isinstance(manifest, dict) else {}
+    objects_root = target.parent / str(manifest.get("objects_root") or ".objects")
+    mismatched: list[dict[str, str]] = []
+    rehashed = 0
+    for rel_text, entry in files.items():
+        item = target / rel_text
+        digest = str(dict(entry or {}).get("sha256") or "")
+        if not item.is_file():
+            mismatched.append({"path": rel_text, "reason": "missing"})
+            continue
+        if item.stat().st_size != int(dict(entry or {}).get("size") or 0):
+            mismatched.append({"path": rel_text, "reason": "size"})
+            continue
+        obj = objects_root / digest[:2] / digest
+        linked = obj.exists() and os.path.samefile(item, obj)
+        if deep or not linked:
+            rehashed += 1
+            if sha256_file(item) != digest:
+                mismatched.append({"path": rel_text, "reason": "sha256"})
+    issues = ["manifest_mismatch"] if mismatched else []
+    return {
+        "ok": not issues,
+        "present": True,
+        "issues": issues,
+        "checked": len(files),
+        "rehashed": rehashed,
+        "mismatched": mismatched[:50],
+    }
+
+
+def verify_backup_dir(
+    path: str | Path,
+    *,
+    required_paths: tuple[str, ...] = CRITICAL_BACKUP_PATHS,
+    deep: bool = False,
+) -> dict[str, Any]:
     target = Path(path)
     if not target.exists():
         return {"ok": False, "path": str(target), "issues": ["missing_backup"], "present": [], "missing": list(required_paths)}
@@ -137,6 +195,11 @@ def verify_backup_dir(path: str | Path, *, required_paths: tuple[str, ...] = CRI
             if sample_files < 10:
                 issues.append("backup_too_small")
 
+    manifest: dict[str, Any] | None = None
+    if (target / MANIFEST_NAME).exists():
+        manifest = verify_backup_manifest(target, deep=deep)
+        issues.extend(item for item in manifest["issues"] if item not in issues)
+
     return {
         "ok": not issues,
         "path": str(target),
@@ -148,6 +211,7 @@ def verify_backup_dir(path: str | Path, *, required_paths: tuple[str, ...] = CRI
         "sample_file_count": sample_files,
         "source_like_count": source_like_count,
         "upgrade_logs_present": sorted(set(upgrade_logs_present)),
+        "manifest": manifest,
     }
 
 
@@ -155,9 +219,10 @@ def verify_recent_backups(
     backups_root: str | Path | list[str | Path] | tuple[str | Path, ...] = "backups",
     *,
     limit: int = 5,
+    deep: bool = False,
 ) -> dict[str, Any]:
     rows = list_recent_backups(backups_root, limit=limit)
-    reports = [verify_backup_dir(row["path"]) for row in rows if bool(row.get("is_dir"))]
+    reports = [verify_backup_dir(row["path"], deep=deep) for row in rows if bool(row.get("is_dir"))]
     verified_count = sum(1 for item in reports if bool(item.get("ok", False)))
     mode_counts: dict[str, int] = {}
     for item in reports:
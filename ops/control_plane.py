@@ -8,8 +8,11 @@ from typing import Any
 from deploy import evaluate_rollout, list_profiles
 from runtime.autonomy_profiles import evaluate_autonomy_request, get_autonomy_profile, list_autonomy_profiles
 from runtime.background_tasks import BackgroundTaskStore
+from runtime.jsonl_log import JsonlRotation, append_jsonl, tail_jsonl
 from runtime.skill_apprenticeship import SkillApprenticeshipLedger
 
+from .metrics_store import MetricsRollupStore, is_synthetic_signal
+
 
 def _now_iso() -> str:
     return datetime.now(timezone.utc).isoformat()
@@ -25,29 +28,17 @@ def _read_json(path: Path, *, default: dict[str, Any]) -> dict[str, Any]:
     return raw if isinstance(raw, dict) else dict(default)
 
 
+# events.jsonl and metrics.jsonl grow with every tool call; roll them into gzip segments
+# at 32 MiB or after a week, whichever comes first.
+OPS_LOG_ROTATION = JsonlRotation(max_bytes=32 * 1024 * 1024, max_age_seconds=7 * 86400.0, keep_segments=8)
+
+
 def _append_jsonl(path: Path, payload: dict[str, Any]) -> dict[str, Any]:
-    path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("a", encoding="utf-8") as handle:
-        handle.write(json.dumps(payload, ensure_ascii=False, sort_keys=True) + "\n")
-    return payload
+    return append_jsonl(path, payload, rotation=OPS_LOG_ROTATION)
 
 
 def _tail_jsonl(path: Path, *, limit: int = 20) -> list[dict[str, Any]]:
-    if not path.exists():
-        return []
-    rows: list[dict[str, Any]] = []
-    with path.open("r", encoding="utf-8", errors="ignore") as handle:
-        for line in handle:
-            raw = line.strip()
-            if not raw:
-                continue
-            try:
-                payload = json.loads(raw)
-            except Exception:
-                continue
-            if isinstance(payload, dict):
-                rows.append(payload)
-    return rows[-max(1, int(limit or 20)) :]
+    return tail_jsonl(path, limit=max(1, int(limit or 20)))
 
 
 class OpsControlPlane:
@@ -57,6 +48,7 @@ class OpsControlPlane:
         self.config_path = self.root_dir / "runtime_config.json"
         self.events_path = self.root_dir / "events.jsonl"
         self.metrics_path = self.root_dir / "metrics.jsonl"
+        self.metrics_store = MetricsRollupStore(self.root_dir / "metrics_rollup.sqlite3")
         self.background_task_store = BackgroundTaskStore(root_dir=self.root_dir / "background_tasks")
         self.skill_apprenticeship = SkillApprenticeshipLedger(root_dir=self.root_dir / "skill_apprenticeship")
         self._ensure_config()
@@ -334,6 +326,15 @@ class OpsControlPlane:
             "meta": dict(meta or {}),
         }
         _append_jsonl(self.metrics_path, row)
+        self.metrics_store.record(
+            metric_type="tool",
+            name=row["tool_name"],
+            latency_ms=row["elapsed_ms"],
+            channel=row["channel"],
+            status="ok" if row["success"] else "failed",
+            # Kept in the bucket key so digests can still drop test traffic that is only marked in ``meta``.
+            synthetic=is_synthetic_signal(row["tool_name"], row["meta"]),
+        )
         return row
 
     def create_background_task(
@@ -496,26 +497,49 @@ class OpsControlPlane:
             "meta": dict(meta or {}),
         }
         _append_jsonl(self.metrics_path, row)
+        self.metrics_store.record(
+            metric_type="model",
+            name=row["model_name"],
+            latency_ms=row["latency_ms"],
+            channel=row["route"],
+            status=row["status"],
+        )
         return row
 
-    def snapshot(self, *, event_limit: int = 30, metric_limit: int = 60) -> dict[str, Any]:
+    def metric_rollups(self, *, window_seconds: float = 86400.0) -> dict[str, Any]:
+        rows = self.metrics_store.summarize(window_seconds=window_seconds)
+        return {
+            "window_seconds": float(window_seconds),
+            "tools": [row for row in rows if row["metric_type"] == "tool"],
+            "models": [row for row in rows if row["metric_type"] == "model"],
+        }
+
+    def snapshot(
+        self,
+        *,
+        event_limit: int = 30,
+        metric_limit: int = 60,
+        metric_window_seconds: float = 86400.0,
+    ) -> dict[str, Any]:
         config = self._load_config()
         events = _tail_jsonl(self.events_path, limit=event_limit)
         metrics = _tail_jsonl(self.metrics_path, limit=metric_limit)
+        rollups = self.metric_rollups(window_seconds=metric_window_seconds)
         policy_counts: dict[str, int] = {}
-        tool_metrics = [row for row in metrics if str(row.get("metric_type") or "") == "tool"]
-        model_metrics = [row for row in metrics if str(row.get("metric_type") or "") == "model"]
+        tool_rollups = list(rollups["tools"])
+        model_rollups = list(rollups["models"])
         for row in events:
             if str(row.get("type") or "") != "policy_decision":
                 continue
             decision = str(row.get("decision") or "unknown")
             policy_counts[decision] = policy_counts.get(decision, 0) + 1
 
-        tool_successes = sum(1 for row in tool_metrics if bool(row.get("success", False)))
-        tool_failures = max(0, len(tool_metrics) - tool_successes)
+        tool_total = sum(int(row["count"]) for row in tool_rollups)
+        tool_failures = sum(int(row["error_count"]) for row in tool_rollups)
+        model_total = sum(int(row["count"]) for row in model_rollups)
         average_model_latency = (
-            round(sum(int(row.get("latency_ms") or 0) for row in model_metrics) / max(1, len(model_metrics)), 2)
-            if model_metrics
+            round(sum(float(row["average_latency_ms"]) * int(row["count"]) for row in model_rollups) / max(1, model_total), 2)
+            if model_total
             else 0.0
         )
 
@@ -528,14 +552,17 @@ class OpsControlPlane:
             "skill_apprenticeship": self.skill_apprenticeship.snapshot(limit=min(6, max(2, event_limit // 2))),
             "recent_events": events,
             "recent_metrics": metrics,
+            "metric_rollups": rollups,
             "policy_decision_counts": policy_counts,
             "tool_metrics": {
-                "total": len(tool_metrics),
-                "successes": tool_successes,
+                "total": tool_total,
+                "successes": tool_total - tool_failures,
                 "failures": tool_failures,
+                "window_seconds": float(metric_window_seconds),
             },
             "model_metrics": {
-                "total": len(model_metrics),
+                "total": model_total,
                 "average_latency_ms": average_model_latency,
+                "window_seconds": float(metric_window_seconds),
             },
         }
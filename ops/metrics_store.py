@@ -0,0 +1,257 @@
+from __future__ import annotations
+
+import re
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+# Upper bounds (ms) of the latency histogram buckets; the last bucket is open-ended.
+LATENCY_BOUNDS_MS = (10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000, 60000)
+HIST_COLUMNS = tuple(f"h{idx}" for idx in range(len(LATENCY_BOUNDS_MS) + 1))
+
+# Statuses that count as successful samples; anything else is an error.
+OK_STATUSES = frozenset({"ok", "completed", "success"})
+
+# Tool names or metadata that mark test, eval and fixture traffic rather than real use.
+SYNTHETIC_SIGNAL_RE = re.compile(r"(?:^|[\W_])(breaker|eval|dummy|synthetic|fixture|approval\.tool|risk\.tool|test)(?:$|[\W_])", re.IGNORECASE)
+
+# resolution -> (bucket width in seconds, retention in seconds)
+RESOLUTIONS: dict[str, tuple[int, int]] = {
+    "minute": (60, 2 * 86400),
+    "hour": (3600, 45 * 86400),
+    "day": (86400, 400 * 86400),
+}
+
+
+def is_synthetic_signal(*parts: Any) -> bool:
+    blob = " ".join(str(part or "") for part in parts if str(part or "").strip())
+    return bool(SYNTHETIC_SIGNAL_RE.search(blob))
+
+
+def _hist_slot(latency_ms: int) -> int:
+    for idx, bound in enumerate(LATENCY_BOUNDS_MS):
+        if latency_ms <= bound:
+            return idx
+    return len(LATENCY_BOUNDS_MS)
+
+
+def histogram_percentile(hist: list[int], q: float, *, max_ms: int = 0) -> float:
+    """Latency at quantile ``q`` (0..1), interpolated linearly inside the histogram bucket that holds it."""
+    total = sum(hist)
+    if total <= 0:
+        return 0.0
+    rank = max(0.0, min(1.0, float(q))) * total
+    seen = 0
+    for idx, count in enumerate(hist):
+        if count <= 0:
+            continue
+        if seen + count >= rank:
+            lower = float(LATENCY_BOUNDS_MS[idx - 1]) if idx > 0 else 0.0
+            upper = float(LATENCY_BOUNDS_MS[idx]) if idx < len(LATENCY_BOUNDS_MS) else float(max(max_ms, lower))
+            value = lower + (upper - lower) * ((rank - seen) / float(count))
+            return round(min(value, float(max_ms)) if max_ms else value, 1)
+        seen += count
+    return float(max_ms)
+
+
+def resolution_for_window(window_seconds: float) -> str:
+    """Finest resolution whose retention still covers ``window_seconds``."""
+    for name, (_width, retention) in RESOLUTIONS.items():
+        if window_seconds <= retention:
+            return name
+    return "day"
+
+
+class MetricsRollupStore:
+    """
+    Tool and model metrics folded into fixed-interval buckets.
+
+    Every sample updates one minute, one hour and one day bucket keyed by
+    ``(metric_type, name, channel, status, synthetic)``; a bucket holds the sample count,
+    latency sum and max, and a latency histogram, so counts, error rates and
+    p50/p95/p99 can be read back over any window without raw rows. Buckets
+    older than their resolution's retention are pruned, which keeps each
+    resolution a bounded ring.
+    """
+
+    def __init__(self, db_path: str | Path = "sessions/ops/metrics_rollup.sqlite3") -> None:
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._schema_lock = threading.Lock()
+        self._last_prune_minute = 0
+        self._ensure_schema()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path, timeout=30.0)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA busy_timeout = 30000")
+        conn.execute("PRAGMA journal_mode = WAL")
+        return conn
+
+    def _ensure_schema(self) -> None:
+        hist_sql = ",\n".join(f"                        {column} INTEGER NOT NULL DEFAULT 0" for column in HIST_COLUMNS)
+        with self._schema_lock:
+            with self._connect() as conn:
+                columns = [str(row["name"]) for row in conn.execute("PRAGMA table_info(rollups)")]
+                if columns and "synthetic" not in columns:
+                    # Buckets from before the synthetic flag joined the key are carried over as real traffic.
+                    conn.execute("ALTER TABLE rollups RENAME TO rollups_unflagged")
+                conn.executescript(
+                    f"""
+                    CREATE TABLE IF NOT EXISTS rollups (
+                        resolution TEXT NOT NULL,
+                        bucket_start INTEGER NOT NULL,
+                        metric_type TEXT NOT NULL,
+                        name TEXT NOT NULL,
+                        channel TEXT NOT NULL DEFAULT '',
+                        status TEXT NOT NULL DEFAULT 'ok',
+                        synthetic INTEGER NOT NULL DEFAULT 0,
+                        count INTEGER NOT NULL DEFAULT 0,
+                        latency_sum INTEGER NOT NULL DEFAULT 0,
+                        latency_max INTEGER NOT NULL DEFAULT 0,
+{hist_sql},
+                        PRIMARY KEY(resolution, bucket_start, metric_type, name, channel, status, synthetic)
+                    );
+                    """
+                )
+                if columns and "synthetic" not in columns:
+                    carried = ", ".join(columns)
+                    conn.execute(f"INSERT INTO rollups({carried}) SELECT {carried} FROM rollups_unflagged")
+                    conn.execute("DROP TABLE rollups_unflagged")
+
+    def record(
+        self,
+        *,
+        metric_type: str,
+        name: str,
+        latency_ms: int,
+        channel: str = "",
+        status: str = "ok",
+        synthetic: bool = False,
+        ts: float | None = None,
+    ) -> None:
+        now = float(ts if ts is not None else time.time())
+        latency = max(0, int(latency_ms or 0))
+        slot = _hist_slot(latency)
+        hist = [1 if idx == slot else 0 for idx in range(len(HIST_COLUMNS))]
+        rows = [
+            (
+                resolution,
+                int(now // width) * width,
+                str(metric_type),
+                str(name),
+                str(channel),
+                str(status or "ok"),
+                int(bool(synthetic)),
+                latency,
+                latency,
+                *hist,
+            )
+            for resolution, (width, _retention) in RESOLUTIONS.items()
+        ]
+        columns = ", ".join(HIST_COLUMNS)
+        increments = ", ".join(f"{column}={column}+excluded.{column}" for column in HIST_COLUMNS)
+        with self._connect() as conn:
+            conn.executemany(
+                f"""
+                INSERT INTO rollups(
+                    resolution, bucket_start, metric_type, name, channel, status, synthetic, count, latency_sum, latency_max, {columns}
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, 1, ?, ?, {", ".join(["?"] * len(HIST_COLUMNS))})
+                ON CONFLICT(resolution, bucket_start, metric_type, name, channel, status, synthetic) DO UPDATE SET
+                    count=count+1,
+                    latency_sum=latency_sum+excluded.latency_sum,
+                    latency_max=MAX(latency_max, excluded.latency_max),
+                    {increments}
+                """,
+                rows,
+            )
+            minute = int(now // 60)
+            if minute != self._last_prune_minute:
+                self._last_prune_minute = minute
+                self._prune(conn, now)
+
+    def _prune(self, conn: sqlite3.Connection, now: float) -> None:
+        for resolution, (width, retention) in RESOLUTIONS.items():
+            conn.execute(
+                "DELETE FROM rollups WHERE resolution = ? AND bucket_start < ?",
+                (resolution, int((now - retention) // width) * width),
+            )
+
+    def summarize(
+        self,
+        *,
+        window_seconds: float = 86400.0,
+        metric_type: str | None = None,
+        now: float | None = None,
+    ) -> list[dict[str, Any]]:
+        """
+        One row per ``(metric_type, name, synthetic)`` over the last ``window_seconds``.
+
+        Reads the finest resolution that still retains the window, so the window
+        edge is aligned to that resolution's bucket width.
+        """
+        current = float(now if now is not None else time.time())
+        resolution = resolution_for_window(float(window_seconds))
+        width = RESOLUTIONS[resolution][0]
+        since = int((current - float(window_seconds)) // width) * width
+        clauses = ["resolution = ?", "bucket_start >= ?"]
+        params: list[Any] = [resolution, since]
+        if metric_type:
+            clauses.append("metric_type = ?")
+            params.append(str(metric_type))
+        hist_sums = ", ".join(f"SUM({column}) AS {column}" for column in HIST_COLUMNS)
+        sql = f"""
+            SELECT metric_type, name, channel, status, synthetic,
+                   SUM(count) AS count, SUM(latency_sum) AS latency_sum, MAX(latency_max) AS latency_max, {hist_sums}
+            FROM rollups
+            WHERE {" AND ".join(clauses)}
+            GROUP BY metric_type, name, channel, status, synthetic
+        """
+        with self._connect() as conn:
+            rows = conn.execute(sql, tuple(params)).fetchall()
+        grouped: dict[tuple[str, str, bool], dict[str, Any]] = {}
+        for row in rows:
+            key = (str(row["metric_type"]), str(row["name"]), bool(row["synthetic"]))
+            bucket = grouped.setdefault(
+                key,
+                {
+                    "metric_type": key[0],
+                    "name": key[1],
+                    "synthetic": key[2],
+                    "count": 0,
+                    "error_count": 0,
+                    "latency_sum": 0,
+                    "max_latency_ms": 0,
+                    "channels": set(),
+                    "statuses": set(),
+                    "hist": [0] * len(HIST_COLUMNS),
+                },
+            )
+            count = int(row["count"] or 0)
+            bucket["count"] += count
+            if str(row["status"]) not in OK_STATUSES:
+                bucket["error_count"] += count
+            bucket["latency_sum"] += int(row["latency_sum"] or 0)
+            bucket["max_latency_ms"] = max(bucket["max_latency_ms"], int(row["latency_max"] or 0))
+            bucket["channels"].add(str(row["channel"]))
+            bucket["statuses"].add(str(row["status"]))
+            for idx, column in enumerate(HIST_COLUMNS):
+                bucket["hist"][idx] += int(row[column] or 0)
+        out: list[dict[str, Any]] = []
+        for bucket in grouped.values():
+            count = max(1, int(bucket["count"]))
+            hist = list(bucket.pop("hist"))
+            max_ms = int(bucket["max_latency_ms"])
+            bucket["average_latency_ms"] = round(int(bucket.pop("latency_sum")) / float(count), 2)
+            bucket["p50_latency_ms"] = histogram_percentile(hist, 0.50, max_ms=max_ms)
+            bucket["p95_latency_ms"] = histogram_percentile(hist, 0.95, max_ms=max_ms)
+            bucket["p99_latency_ms"] = histogram_percentile(hist, 0.99, max_ms=max_ms)
+            bucket["channels"] = sorted(item for item in bucket["channels"] if item.strip())
+            bucket["statuses"] = sorted(item for item in bucket["statuses"] if item.strip())
+            bucket["window_seconds"] = float(window_seconds)
+            bucket["resolution"] = resolution
+            out.append(bucket)
+        out.sort(key=lambda row: (row["metric_type"], row["name"], row["synthetic"]))
+        return out
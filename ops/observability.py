@@ -7,9 +7,9 @@ import re
 from typing import Any
 
 from .control_plane import OpsControlPlane
+from .metrics_store import is_synthetic_signal as _is_synthetic_signal
 
 
-_SYNTHETIC_SIGNAL_RE = re.compile(r"(?:^|[\W_])(breaker|eval|dummy|synthetic|fixture|approval\.tool|risk\.tool|test)(?:$|[\W_])", re.IGNORECASE)
 _BENIGN_POLICY_REASON_RE = re.compile(r"not exposed to channel 'heartbeat'", re.IGNORECASE)
 
 
@@ -30,11 +30,6 @@ def _average(values: list[int]) -> float:
     return round(sum(values) / float(len(values)), 2)
 
 
-def _is_synthetic_signal(*parts: Any) -> bool:
-    blob = " ".join(str(part or "") for part in parts if str(part or "").strip())
-    return bool(_SYNTHETIC_SIGNAL_RE.search(blob))
-
-
 def _is_benign_policy_event(row: dict[str, Any]) -> bool:
     payload = dict(row.get("payload") or {})
     tool_name = str(payload.get("tool") or "")
@@ -115,6 +110,64 @@ def _model_hotspots(model_metrics: list[dict[str, Any]], *, limit: int = 3) -> l
     return ranked[: max(1, int(limit or 3))]
 
 
+def _rollup_tool_hotspots(tool_rollups: list[dict[str, Any]], *, limit: int = 3) -> list[dict[str, Any]]:
+    ranked: list[dict[str, Any]] = []
+    for row in tool_rollups:
+        tool_name = str(row.get("name") or "tool").strip() or "tool"
+        if row.get("synthetic") or _is_synthetic_signal(tool_name):
+            continue
+        total = int(row.get("count") or 0)
+        failures = int(row.get("error_count") or 0)
+        ranked.append(
+            {
+                "tool_name": tool_name,
+                "average_latency_ms": float(row.get("average_latency_ms") or 0.0),
+                "p50_latency_ms": float(row.get("p50_latency_ms") or 0.0),
+                "p95_latency_ms": float(row.get("p95_latency_ms") or 0.0),
+                "p99_latency_ms": float(row.get("p99_latency_ms") or 0.0),
+                "max_latency_ms": int(row.get("max_latency_ms") or 0),
+                "failure_count": failures,
+                "total": total,
+                "failure_rate": round(failures / max(1, total), 3),
+                "channels": list(row.get("channels") or []),
+            }
+        )
+    ranked.sort(
+        key=lambda row: (
+            -float(row.get("average_latency_ms") or 0.0),
+            -int(row.get("failure_count") or 0),
+            str(row.get("tool_name") or ""),
+        )
+    )
+    return ranked[: max(1, int(limit or 3))]
+
+
+def _rollup_model_hotspots(model_rollups: list[dict[str, Any]], *, limit: int = 3) -> list[dict[str, Any]]:
+    ranked: list[dict[str, Any]] = []
+    for row in model_rollups:
+        ranked.append(
+            {
+                "model_name": str(row.get("name") or "model").strip() or "model",
+                "average_latency_ms": float(row.get("average_latency_ms") or 0.0),
+                "p50_latency_ms": float(row.get("p50_latency_ms") or 0.0),
+                "p95_latency_ms": float(row.get("p95_latency_ms") or 0.0),
+                "p99_latency_ms": float(row.get("p99_latency_ms") or 0.0),
+                "max_latency_ms": int(row.get("max_latency_ms") or 0),
+                "routes": list(row.get("channels") or []),
+                "statuses": list(row.get("statuses") or []),
+                "total": int(row.get("count") or 0),
+            }
+        )
+    ranked.sort(
+        key=lambda row: (
+            -float(row.get("average_latency_ms") or 0.0),
+            -int(row.get("max_latency_ms") or 0),
+            str(row.get("model_name") or ""),
+        )
+    )
+    return ranked[: max(1, int(limit or 3))]
+
+
 def _failure_hotspots(
     tool_metrics: list[dict[str, Any]],
     recent_events: list[dict[str, Any]],
@@ -135,6 +188,13 @@ def _failure_hotspots(
             bucket["detail"] = detail
 
     for row in tool_metrics:
+        if "error_count" in row:
+            if int(row.get("error_count") or 0) <= 0:
+                continue
+            tool_name = str(row.get("name") or "tool").strip() or "tool"
+            channels = ", ".join(list(row.get("channels") or [])) or "chat"
+            bump(tool_name, kind="tool", detail=f"tool failure on {channels}", count=int(row.get("error_count") or 0))
+            continue
         if bool(row.get("success", False)):
             continue
         tool_name = str(row.get("tool_name") or "tool").strip() or "tool"
@@ -194,15 +254,24 @@ def build_observability_digest(
     recent_events = filtered_events
     policy_counts = filtered_policy_counts
 
-    tool_metrics = [
-        row
-        for row in recent_metrics
-        if str(row.get("metric_type") or "") == "tool"
-        and not _is_synthetic_signal(row.get("tool_name"), row.get("meta"))
-    ]
-    model_metrics = [row for row in recent_metrics if str(row.get("metric_type") or "") == "model"]
-    tool_hotspots = _tool_hotspots(tool_metrics)
-    model_hotspots = _model_hotspots(model_metrics)
+    rollups = snapshot.get("metric_rollups")
+    if isinstance(rollups, dict):
+        # Rollups cover the whole snapshot window; the raw tail is only a fallback for hand-built snapshots.
+        tool_metrics = [
+            row for row in list(rollups.get("tools") or []) if not row.get("synthetic") and not _is_synthetic_signal(row.get("name"))
+        ]
+        tool_hotspots = _rollup_tool_hotspots(tool_metrics)
+        model_hotspots = _rollup_model_hotspots(list(rollups.get("models") or []))
+    else:
+        tool_metrics = [
+            row
+            for row in recent_metrics
+            if str(row.get("metric_type") or "") == "tool"
+            and not _is_synthetic_signal(row.get("tool_name"), row.get("meta"))
+        ]
+        model_metrics = [row for row in recent_metrics if str(row.get("metric_type") or "") == "model"]
+        tool_hotspots = _tool_hotspots(tool_metrics)
+        model_hotspots = _model_hotspots(model_metrics)
     failure_hotspots = _failure_hotspots(tool_metrics, recent_events, background_tasks)
     recovery_pressure = int(background_tasks.get("retry_ready_count") or 0) + int(background_tasks.get("failed_count") or 0)
     blocked_count = int(policy_counts.get("blocked") or 0)
@@ -260,6 +329,7 @@ def build_observability_digest(
 
     return {
         "generated_at": _now_iso(),
+        "window_seconds": float(dict(rollups).get("window_seconds") or 0.0) if isinstance(rollups, dict) else 0.0,
         "status": status,
         "summary_line": summary_line,
         "alerts": alerts,
@@ -275,10 +345,10 @@ def build_observability_digest(
     }
 
 
-def run_observability_snapshot(root_dir: str | Path = ".") -> dict[str, Any]:
+def run_observability_snapshot(root_dir: str | Path = ".", *, window_seconds: float = 86400.0) -> dict[str, Any]:
     root = Path(root_dir)
     ops = OpsControlPlane(root_dir=root / "sessions" / "ops")
-    snapshot = ops.snapshot(event_limit=20, metric_limit=50)
+    snapshot = ops.snapshot(event_limit=20, metric_limit=50, metric_window_seconds=window_seconds)
     digest = build_observability_digest(snapshot)
     return {
         "generated_at": _now_iso(),
@@ -305,8 +375,13 @@ def format_observability_snapshot(report: dict[str, Any]) -> str:
     lines.append("Hotspots:")
     if tool_hotspots:
         top = tool_hotspots[0]
+        percentiles = (
+            f" p95={int(float(top.get('p95_latency_ms') or 0.0))}ms p99={int(float(top.get('p99_latency_ms') or 0.0))}ms"
+            if "p95_latency_ms" in top
+            else ""
+        )
         lines.append(
-            f"- tool: {top.get('tool_name', '')} avg={int(float(top.get('average_latency_ms') or 0.0))}ms failures={top.get('failure_count', 0)}"
+            f"- tool: {top.get('tool_name', '')} avg={int(float(top.get('average_latency_ms') or 0.0))}ms{percentiles} failures={top.get('failure_count', 0)}"
         )
     else:
         lines.append("- tool: none")
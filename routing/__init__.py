@@ -1,13 +1,16 @@
 from routing.followup import PrevTurnState, can_reuse_evidence
 from routing.planner import build_query_plan
+from routing.query_analysis import QueryAnalysis, analyze_query
 from routing.signals import extract_signals
 from routing.types import QueryPlan, QuerySignals, TimeAnchor
 
 __all__ = [
+    "analyze_query",
     "build_query_plan",
     "extract_signals",
     "can_reuse_evidence",
     "PrevTurnState",
+    "QueryAnalysis",
     "QueryPlan",
     "QuerySignals",
     "TimeAnchor",
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-from typing import Dict, Tuple
+from typing import Dict, Optional, Tuple
+
+from routing.query_analysis import QueryAnalysis, analyze_query, register_terms
 
 _KEYWORDS: Dict[str, set[str]] = {
     "finance": {"price", "quote", "market", "stock", "shares", "bitcoin", "btc", "eth", "oil", "wti", "brent", "fx", "exchange rate", "crypto"},
@@ -9,14 +11,19 @@ _KEYWORDS: Dict[str, set[str]] = {
     "sports": {"sports", "match", "game", "score", "fixture", "standings", "league", "tournament"},
     "software": {"software", "release", "version", "changelog", "patch", "github", "library", "framework"},
 }
+register_terms(*_KEYWORDS.values())
+
+
+def classify_domain(text: str, *, analysis: Optional[QueryAnalysis] = None) -> Tuple[str, float]:
+    qa = analysis or analyze_query(text)
+    return qa.memo("routing.domain", lambda: _classify(qa))
 
 
-def classify_domain(text: str) -> Tuple[str, float]:
-    tl = str(text or "").lower()
+def _classify(qa: QueryAnalysis) -> Tuple[str, float]:
     scores = {d: 0 for d in _KEYWORDS}
     for domain, keys in _KEYWORDS.items():
         for k in keys:
-            if k in tl:
+            if qa.has(k):
                 scores[domain] += 1
     best = max(scores, key=scores.get)
     top = scores[best]
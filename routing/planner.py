@@ -1,9 +1,9 @@
 from __future__ import annotations
 
-import re
 from typing import Optional
 
 from routing.followup import PrevTurnState
+from routing.query_analysis import REGEX_WORD_CHARS, QueryAnalysis, analyze_query
 from routing.signals import extract_signals
 from routing.types import QueryPlan, TimeAnchor
 
@@ -18,17 +18,21 @@ def _rewrite_search_query(text: str, anchor: Optional[TimeAnchor], *, include_re
     return " ".join(q.split())
 
 
-def _has_hard_search_request(text: str) -> bool:
-    return bool(re.search(r"\b(search|look up|google|find online|check online)\b", text or "", re.I))
+_HARD_SEARCH_TERMS = ("search", "look up", "google", "find online", "check online")
 
-def build_query_plan(text: str, prev: Optional[PrevTurnState] = None) -> QueryPlan:
+
+def _has_hard_search_request(text: str, analysis: Optional[QueryAnalysis] = None) -> bool:
+    return (analysis or analyze_query(text)).has_any_word(_HARD_SEARCH_TERMS, word_chars=REGEX_WORD_CHARS)
+
+def build_query_plan(text: str, prev: Optional[PrevTurnState] = None, *, analysis: Optional[QueryAnalysis] = None) -> QueryPlan:
     _ = prev
-    signals = extract_signals(text)
+    qa = analysis or analyze_query(text)
+    signals = extract_signals(text, analysis=qa)
 
     if signals.is_personal:
         return QueryPlan("LLM_ONLY", signals.domain, False, signals.time_anchor, False, "", "personal_query_hardblock", 0.99)
 
-    if signals.time_anchor is not None and not signals.recency and not _has_hard_search_request(text):
+    if signals.time_anchor is not None and not signals.recency and not _has_hard_search_request(text, qa):
         # Finance historical queries still need tool execution for reliable numeric ranges.
         if signals.domain == "finance":
             return QueryPlan(
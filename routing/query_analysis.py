@@ -0,0 +1,195 @@
+from __future__ import annotations
+
+import re
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, Optional
+
+# Characters that glue a term to its neighbours in ``has_word``. The default
+# treats "_" as a separator; REGEX_WORD_CHARS matches a ``\b`` regex instead.
+WORD_CHARS = frozenset("abcdefghijklmnopqrstuvwxyz0123456789")
+REGEX_WORD_CHARS = WORD_CHARS | {"_"}
+_ANALYSIS_CACHE_SIZE = 256
+
+
+def normalize_query_text(text: str) -> str:
+    return " ".join(str(text or "").split()).lower()
+
+
+class TermMatcher:
+    """
+    Aho-Corasick automaton over a fixed set of lowercase terms.
+
+    ``scan`` walks the text once and reports every occurrence of every term,
+    overlapping ones included, as ``{term: [start offsets]}``.
+    """
+
+    def __init__(self, terms: Iterable[str]) -> None:
+        self.terms: FrozenSet[str] = frozenset(t for t in (str(term or "").lower() for term in terms) if t)
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[List[str]] = [[]]
+        for term in self.terms:
+            node = 0
+            for ch in term:
+                nxt = self._goto[node].get(ch)
+                if nxt is None:
+                    nxt = len(self._goto)
+                    self._goto[node][ch] = nxt
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._out.append([])
+                node = nxt
+            self._out[node].append(term)
+        queue = list(self._goto[0].values())
+        for node in queue:
+            for ch, child in self._goto[node].items():
+                queue.append(child)
+                state = self._fail[node]
+                while state and ch not in self._goto[state]:
+                    state = self._fail[state]
+                target = self._goto[state].get(ch, 0)
+                self._fail[child] = target if target != child else 0
+                self._out[child].extend(self._out[self._fail[child]])
+
+    def scan(self, text: str) -> Dict[str, List[int]]:
+        goto, fail, out = self._goto, self._fail, self._out
+        hits: Dict[str, List[int]] = {}
+        node = 0
+        for idx, ch in enumerate(text):
+            while node and ch not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(ch, 0)
+            for term in out[node]:
+                hits.setdefault(term, []).append(idx - len(term) + 1)
+        return hits
+
+
+_VOCABULARY: set[str] = set()
+_MATCHER: Optional[TermMatcher] = None
+_LOCK = threading.RLock()
+_CACHE: "OrderedDict[str, QueryAnalysis]" = OrderedDict()
+
+
+def register_terms(*groups: Iterable[str]) -> None:
+    """Add terms to the shared automaton; callers register their keyword tables at import time."""
+    global _MATCHER
+    fresh = {t for group in groups for t in (str(term or "").lower() for term in group) if t}
+    with _LOCK:
+        if fresh - _VOCABULARY:
+            _VOCABULARY.update(fresh)
+            _MATCHER = None
+
+
+def _matcher() -> TermMatcher:
+    global _MATCHER
+    with _LOCK:
+        if _MATCHER is None:
+            _MATCHER = TermMatcher(_VOCABULARY)
+        return _MATCHER
+
+
+class QueryAnalysis:
+    """
+    Everything the routing and search layers derive from one prompt.
+
+    ``text`` is the whitespace-collapsed lowercase prompt. It is scanned once
+    against every registered keyword table; ``has``/``has_word`` answer from
+    that scan (terms outside the vocabulary fall back to a direct check), and
+    ``memo`` caches derived signals so each predicate runs once per prompt.
+    """
+
+    def __init__(self, text: str) -> None:
+        self.text = normalize_query_text(text)
+        self._hits: Optional[Dict[str, List[int]]] = None
+        self._hit_terms: FrozenSet[str] = frozenset()
+        self._scanned: FrozenSet[str] = frozenset()
+        self._memo: Dict[str, Any] = {}
+
+    def _scan(self) -> Dict[str, List[int]]:
+        if self._hits is None:
+            matcher = _matcher()
+            self._hits = matcher.scan(self.text)
+            self._hit_terms = frozenset(self._hits)
+            self._scanned = matcher.terms
+        return self._hits
+
+    def _occurrences(self, term: str) -> Optional[List[int]]:
+        hits = self._scan()
+        if term in self._scanned:
+            return hits.get(term, [])
+        return None
+
+    def has(self, term: str) -> bool:
+        """Substring match."""
+        needle = str(term or "").lower()
+        if not needle:
+            return False
+        found = self._occurrences(needle)
+        return bool(found) if found is not None else needle in self.text
+
+    def has_word(self, term: str, *, word_chars: FrozenSet[str] = WORD_CHARS) -> bool:
+        """
+        Match ``term`` only where it is not glued to a character in ``word_chars``.
+
+        Terms that carry their own padding (``" vs "``) are plain substring checks.
+        """
+        needle = str(term or "").lower()
+        if not needle.strip():
+            return False
+        if needle != needle.strip():
+            return self.has(needle)
+        needle = " ".join(needle.split())
+        found = self._occurrences(needle)
+        if found is None:
+            glue = "[" + re.escape("".join(sorted(word_chars))) + "]"
+            return re.search(rf"(?<!{glue}){re.escape(needle)}(?!{glue})", self.text) is not None
+        text, size = self.text, len(needle)
+        for start in found:
+            end = start + size
+            if (start == 0 or text[start - 1] not in word_chars) and (end >= len(text) or text[end] not in word_chars):
+                return True
+        return False
+
+    def has_any(self, terms: Iterable[str]) -> bool:
+        terms = terms if isinstance(terms, (tuple, list, set, frozenset)) else tuple(terms)
+        self._scan()
+        if not self._hit_terms.isdisjoint(terms):
+            return True
+        if self._scanned.issuperset(terms):
+            return False
+        return any(self.has(term) for term in terms if term not in self._scanned)
+
+    def has_any_word(self, terms: Iterable[str], *, word_chars: FrozenSet[str] = WORD_CHARS) -> bool:
+        terms = terms if isinstance(terms, (tuple, list, set, frozenset)) else tuple(terms)
+        self._scan()
+        if any(self.has_word(term, word_chars=word_chars) for term in self._hit_terms.intersection(terms)):
+            return True
+        if self._scanned.issuperset(terms):
+            return False
+        return any(self.has_word(term, word_chars=word_chars) for term in terms if term not in self._scanned)
+
+    def memo(self, key: str, compute: Callable[[], Any]) -> Any:
+        if key not in self._memo:
+            self._memo[key] = compute()
+        return self._memo[key]
+
+
+def analyze_query(text: str) -> QueryAnalysis:
+    """Shared analysis for ``text``; repeated calls within a turn return the same object."""
+    key = normalize_query_text(text)
+    with _LOCK:
+        analysis = _CACHE.get(key)
+        if analysis is not None:
+            _CACHE.move_to_end(key)
+            return analysis
+        analysis = QueryAnalysis(key)
+        _CACHE[key] = analysis
+        while len(_CACHE) > _ANALYSIS_CACHE_SIZE:
+            _CACHE.popitem(last=False)
+        return analysis
+
+
+def clear_query_analysis_cache() -> None:
+    with _LOCK:
+        _CACHE.clear()
@@ -1,29 +1,47 @@
 from __future__ import annotations
 
 import re
+from typing import Optional
 
 from routing.domain import classify_domain
+from routing.query_analysis import REGEX_WORD_CHARS, QueryAnalysis, analyze_query, register_terms
 from routing.timeparse import extract_time_anchor
 from routing.types import QuerySignals
 
-_EXPLICIT = re.compile(r"\b(search|look up|google|find online|check online|sources?|cite|link|verify|confirm)\b", re.I)
-_RECENCY = re.compile(r"\b(latest|current|today|now|right now|this week|updated|breaking|live|recent)\b", re.I)
-_VOLATILE = re.compile(r"\b(price|quote|market|stock|shares|bitcoin|btc|eth|oil|wti|brent|fx|exchange rate|weather|forecast|temperature|rain|humidity|wind|news|headline|current events)\b", re.I)
-_RESEARCH = re.compile(r"\b(paper|study|pubmed|pmid|doi|arxiv|guideline|systematic review|meta-analysis|clinical trial|nct\d*|github|repo|repository|readme|documentation|docs|release notes|changelog|open source|package|library|framework)\b", re.I)
-_EXACTNESS = re.compile(r"\b(exact|precisely|closing|close|open|high|low|with sources|cite|on\s+\d{4}-\d{2}-\d{2})\b", re.I)
-_PERSONAL = re.compile(r"\b(what'?s my|my goals?|my reminders?|remind me|what do you remember about me|my state|my memory)\b", re.I)
+_EXPLICIT_TERMS = ("search", "look up", "google", "find online", "check online", "source", "sources", "cite", "link", "verify", "confirm")
+_RECENCY_TERMS = ("latest", "current", "today", "now", "right now", "this week", "updated", "breaking", "live", "recent")
+_VOLATILE_TERMS = (
+    "price", "quote", "market", "stock", "shares", "bitcoin", "btc", "eth", "oil", "wti", "brent", "fx",
+    "exchange rate", "weather", "forecast", "temperature", "rain", "humidity", "wind", "news", "headline", "current events",
+)
+_RESEARCH_TERMS = (
+    "paper", "study", "pubmed", "pmid", "doi", "arxiv", "guideline", "systematic review", "meta-analysis", "clinical trial",
+    "nct", "github", "repo", "repository", "readme", "documentation", "docs", "release notes", "changelog", "open source",
+    "package", "library", "framework",
+)
+_EXACTNESS_TERMS = ("exact", "precisely", "closing", "close", "open", "high", "low", "with sources", "cite")
+_PERSONAL_TERMS = (
+    "whats my", "what's my", "my goal", "my goals", "my reminder", "my reminders", "remind me",
+    "what do you remember about me", "my state", "my memory",
+)
+register_terms(_EXPLICIT_TERMS, _RECENCY_TERMS, _VOLATILE_TERMS, _RESEARCH_TERMS, _EXACTNESS_TERMS, _PERSONAL_TERMS)
 
+# Patterns the keyword tables cannot express.
+_NCT_ID = re.compile(r"\bnct\d+\b", re.I)
+_EXACT_DATE = re.compile(r"\bon\s+\d{4}-\d{2}-\d{2}\b", re.I)
 
-def extract_signals(text: str) -> QuerySignals:
+
+def extract_signals(text: str, *, analysis: Optional[QueryAnalysis] = None) -> QuerySignals:
     raw = str(text or "")
-    domain, _ = classify_domain(raw)
+    qa = analysis or analyze_query(raw)
+    domain, _ = classify_domain(raw, analysis=qa)
     return QuerySignals(
-        explicit=bool(_EXPLICIT.search(raw)),
-        recency=bool(_RECENCY.search(raw)),
-        volatile=bool(_VOLATILE.search(raw)),
-        research=bool(_RESEARCH.search(raw)),
-        exactness=bool(_EXACTNESS.search(raw)),
+        explicit=qa.has_any_word(_EXPLICIT_TERMS, word_chars=REGEX_WORD_CHARS),
+        recency=qa.has_any_word(_RECENCY_TERMS, word_chars=REGEX_WORD_CHARS),
+        volatile=qa.has_any_word(_VOLATILE_TERMS, word_chars=REGEX_WORD_CHARS),
+        research=qa.has_any_word(_RESEARCH_TERMS, word_chars=REGEX_WORD_CHARS) or bool(_NCT_ID.search(raw)),
+        exactness=qa.has_any_word(_EXACTNESS_TERMS, word_chars=REGEX_WORD_CHARS) or bool(_EXACT_DATE.search(raw)),
         time_anchor=extract_time_anchor(raw),
         domain=domain,
-        is_personal=bool(_PERSONAL.search(raw)),
+        is_personal=qa.has_any_word(_PERSONAL_TERMS, word_chars=REGEX_WORD_CHARS),
     )
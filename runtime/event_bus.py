@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from collections import deque
+from typing import Any, Iterable
+
+
+def _matches(topic: str, prefixes: tuple[str, ...]) -> bool:
+    return not prefixes or any(topic.startswith(prefix) for prefix in prefixes)
+
+
+class Subscription:
+    """
+    One consumer's bounded ring of events.
+
+    When the ring is full the oldest event is dropped and counted in
+    ``dropped``; ``cursor`` is the sequence number of the last event handed
+    out, so a consumer that falls behind can resume through ``EventBus.since``.
+    """
+
+    def __init__(self, bus: "EventBus", prefixes: tuple[str, ...], capacity: int) -> None:
+        self._bus = bus
+        self.prefixes = prefixes
+        self.capacity = max(1, int(capacity))
+        self._ring: deque[dict[str, Any]] = deque(maxlen=self.capacity)
+        self._ready = threading.Event()
+        self._async_waiters: list[tuple[asyncio.AbstractEventLoop, asyncio.Event]] = []
+        self.cursor = 0
+        self.dropped = 0
+        self.closed = False
+
+    def _push(self, event: dict[str, Any]) -> None:
+        if len(self._ring) >= self.capacity:
+            self.dropped += 1
+        self._ring.append(event)
+        self._ready.set()
+        for loop, waiter in list(self._async_waiters):
+            try:
+                loop.call_soon_threadsafe(waiter.set)
+            except RuntimeError:
+                pass
+
+    def poll(self, max_n: int | None = None) -> list[dict[str, Any]]:
+        items: list[dict[str, Any]] = []
+        while max_n is None or len(items) < max_n:
+            try:
+                items.append(self._ring.popleft())
+            except IndexError:
+                self._ready.clear()
+                # An event may have landed between the failed pop and the clear.
+                if self._ring:
+                    self._ready.set()
+                break
+        if items:
+            self.cursor = int(items[-1]["seq"])
+        return items
+
+    def wait(self, timeout: float | None = None) -> list[dict[str, Any]]:
+        """Block until at least one event is available (or ``timeout``) and return what is queued."""
+        if not self._ring:
+            self._ready.wait(timeout)
+        return self.poll()
+
+    async def next_batch(self, *, timeout: float | None = None, max_n: int | None = None) -> list[dict[str, Any]]:
+        """Await events without blocking the running loop; publishers may live on any thread."""
+        if not self._ring:
+            entry = (asyncio.get_running_loop(), asyncio.Event())
+            self._async_waiters.append(entry)
+            try:
+                if not self._ring:
+                    await asyncio.wait_for(entry[1].wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+            finally:
+                self._async_waiters.remove(entry)
+        return self.poll(max_n)
+
+    def close(self) -> None:
+        self._bus.unsubscribe(self)
+
+
+class EventBus:
+    """
+    In-process pub/sub with sequence numbers and resumable cursors.
+
+    ``publish`` stamps the next sequence number, appends to a bounded history
+    and fans out to every subscriber's bounded ring under one lock, so rings
+    and history are always in sequence order and a subscriber primed from
+    history with ``since`` neither misses nor repeats an event published while
+    it registers. Fan-out is a deque append per subscriber, which keeps the
+    lock short. Topics are matched by prefix, so
+    ``"gateway."`` receives every gateway topic. Stateless readers (remote
+    sessions that reconnect) call ``since(cursor)`` against the history and are
+    told when their cursor fell out of it so they can resync from a snapshot.
+    """
+
+    def __init__(self, *, history: int = 1024, subscriber_capacity: int = 256) -> None:
+        self._seq = 0
+        self._history: deque[dict[str, Any]] = deque(maxlen=max(1, int(history)))
+        self._subscribers: tuple[Subscription, ...] = ()
+        self._lock = threading.Lock()
+        self.subscriber_capacity = max(1, int(subscriber_capacity))
+        self.last_seq = 0
+
+    def publish(self, topic: str, payload: dict[str, Any]) -> dict[str, Any]:
+        with self._lock:
+            self._seq += 1
+            event = {"seq": self._seq, "topic": str(topic), "ts": time.time(), "payload": payload}
+            self._history.append(event)
+            self.last_seq = self._seq
+            for sub in self._subscribers:
+                if _matches(event["topic"], sub.prefixes):
+                    sub._push(event)
+        return event
+
+    def subscribe(
+        self,
+        topics: Iterable[str] | None = None,
+        *,
+        since: int | None = None,
+        capacity: int | None = None,
+    ) -> Subscription:
+        """New subscription; with ``since`` it is primed with retained history after that cursor."""
+        sub = Subscription(self, tuple(str(t) for t in (topics or ())), capacity or self.subscriber_capacity)
+        with self._lock:
+            if since is not None:
+                sub.cursor = int(since)
+                for event in list(self._history):
+                    if event["seq"] > sub.cursor and _matches(event["topic"], sub.prefixes):
+                        sub._push(event)
+            self._subscribers = self._subscribers + (sub,)
+        return sub
+
+    def unsubscribe(self, sub: Subscription) -> None:
+        with self._lock:
+            self._subscribers = tuple(item for item in self._subscribers if item is not sub)
+        sub.closed = True
+
+    def since(self, cursor: int, *, topics: Iterable[str] | None = None, limit: int | None = None) -> dict[str, Any]:
+        """
+        Retained events after ``cursor``.
+
+        ``gap`` is True when older events were already evicted, or when the
+        cursor is ahead of this bus (it came from a bus that has since been
+        replaced, e.g. before a restart).
+        """
+        prefixes = tuple(str(t) for t in (topics or ()))
+        with self._lock:
+            history = list(self._history)
+            seq = self._seq
+        cursor = max(0, int(cursor or 0))
+        gap = cursor > seq or (bool(history) and history[0]["seq"] > cursor + 1)
+        events = [event for event in history if event["seq"] > cursor and _matches(event["topic"], prefixes)]
+        next_cursor = seq if cursor > seq else max(cursor, history[-1]["seq"] if history else cursor)
+        if limit is not None and len(events) > max(0, int(limit)):
+            events = events[: max(0, int(limit))]
+            next_cursor = events[-1]["seq"] if events else cursor
+        return {"events": events, "cursor": next_cursor, "gap": gap}
+
+    @property
+    def subscriber_count(self) -> int:
+        return len(self._subscribers)
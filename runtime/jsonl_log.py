@@ -0,0 +1,336 @@
+from __future__ import annotations
+
+import gzip
+import json
+import os
+import shutil
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Iterator
+
+BLOCK_SIZE = 64 * 1024
+INDEX_STRIDE = 256
+SEGMENT_SUFFIX = ".jsonl.gz"
+DETACHED_SUFFIX = ".rotating"
+
+_ROTATE_LOCKS: dict[str, threading.Lock] = {}
+_ROTATE_LOCKS_GUARD = threading.Lock()
+
+
+@dataclass(frozen=True)
+class JsonlRotation:
+    """Roll the active file into a gzip segment once it reaches ``max_bytes`` or ``max_age_seconds`` (0 disables either)."""
+
+    max_bytes: int = 0
+    max_age_seconds: float = 0.0
+    keep_segments: int = 8
+
+
+def _decode(raw: bytes) -> dict[str, Any] | None:
+    text = raw.decode("utf-8", errors="ignore").strip()
+    if not text:
+        return None
+    try:
+        payload = json.loads(text)
+    except Exception:
+        return None
+    return payload if isinstance(payload, dict) else None
+
+
+def _reverse_lines(handle: Any, *, block_size: int = BLOCK_SIZE) -> Iterator[bytes]:
+    handle.seek(0, os.SEEK_END)
+    pos = handle.tell()
+    carry = b""
+    while pos > 0:
+        step = min(block_size, pos)
+        pos -= step
+        handle.seek(pos)
+        lines = (handle.read(step) + carry).split(b"\n")
+        carry = lines[0]
+        for line in reversed(lines[1:]):
+            yield line
+    if carry:
+        yield carry
+
+
+def _log_stem(path: Path) -> str:
+    return path.name[: -len(".jsonl")] if path.name.endswith(".jsonl") else path.name
+
+
+def rotated_segments(path: str | Path) -> list[Path]:
+    """Gzip segments rolled out of ``path``, oldest first."""
+    path = Path(path)
+    if not path.parent.exists():
+        return []
+    return sorted(path.parent.glob(f"{_log_stem(path)}.*{SEGMENT_SUFFIX}"))
+
+
+def _detached_files(path: Path) -> list[Path]:
+    """Files renamed away by a rotation that has not finished compressing them (or crashed doing so)."""
+    if not path.parent.exists():
+        return []
+    return sorted(path.parent.glob(f"{_log_stem(path)}.*{DETACHED_SUFFIX}"))
+
+
+def _segment_for(detached: Path) -> Path:
+    return detached.with_name(detached.name[: -len(DETACHED_SUFFIX)] + SEGMENT_SUFFIX)
+
+
+def _read_archived(piece: Path) -> list[dict[str, Any]]:
+    opener = gzip.open if piece.name.endswith(SEGMENT_SUFFIX) else open
+    try:
+        with opener(piece, "rb") as handle:
+            return [row for row in (_decode(line) for line in handle) if row is not None]
+    except (OSError, EOFError):
+        return []
+
+
+def iter_jsonl_reverse(path: str | Path, *, include_rotated: bool = True) -> Iterator[dict[str, Any]]:
+    """
+    Yield the dict rows of a JSONL log newest first.
+
+    The active file is read backwards in fixed-size blocks, so the cost follows
+    the number of rows consumed rather than the file size. Rotated segments are
+    only opened once the active file is exhausted; a detached file whose
+    compression never finished is read in its place.
+    """
+    path = Path(path)
+    try:
+        with path.open("rb") as handle:
+            for line in _reverse_lines(handle):
+                row = _decode(line)
+                if row is not None:
+                    yield row
+    except FileNotFoundError:
+        pass
+    except OSError:
+        return
+    if not include_rotated:
+        return
+    pieces = rotated_segments(path) + [item for item in _detached_files(path) if not _segment_for(item).exists()]
+    # Both kinds are named <stem>.<utc stamp>.<suffix>, so name order is rotation order.
+    for piece in sorted(pieces, key=lambda item: item.name, reverse=True):
+        yield from reversed(_read_archived(piece))
+
+
+def tail_jsonl(path: str | Path, *, limit: int = 20, include_rotated: bool = True) -> list[dict[str, Any]]:
+    """The last ``limit`` dict rows, oldest first, like ``rows[-limit:]`` over the whole log."""
+    wanted = max(0, int(limit))
+    if not wanted:
+        return []
+    rows: deque[dict[str, Any]] = deque()
+    for row in iter_jsonl_reverse(path, include_rotated=include_rotated):
+        rows.appendleft(row)
+        if len(rows) >= wanted:
+            break
+    return list(rows)
+
+
+def read_last_jsonl(path: str | Path, *, include_rotated: bool = True) -> dict[str, Any] | None:
+    for row in iter_jsonl_reverse(path, include_rotated=include_rotated):
+        return row
+    return None
+
+
+class JsonlOffsetIndex:
+    """
+    Sidecar ``<file>.idx`` holding the row count and the byte offset of every
+    ``INDEX_STRIDE``-th row of an append-only JSONL file.
+
+    ``refresh`` only scans bytes appended since the last call; a file that
+    shrank or was replaced (rotation) is re-indexed from the start. Only
+    newline-terminated rows are counted. ``started_at`` is when the current
+    file was first indexed and drives age-based rotation.
+    """
+
+    def __init__(self, path: str | Path, *, stride: int = INDEX_STRIDE) -> None:
+        self.path = Path(path)
+        self.sidecar = self.path.with_name(self.path.name + ".idx")
+        self.stride = max(1, int(stride))
+        self.size = 0
+        self.rows = 0
+        self.inode = 0
+        self.started_at = 0.0
+        self.offsets: list[int] = []
+        self._load()
+
+    def _load(self) -> None:
+        try:
+            raw = json.loads(self.sidecar.read_text(encoding="utf-8"))
+        except Exception:
+            return
+        if not isinstance(raw, dict) or int(raw.get("stride") or 0) != self.stride:
+            return
+        self.size = int(raw.get("size") or 0)
+        self.rows = int(raw.get("rows") or 0)
+        self.inode = int(raw.get("inode") or 0)
+        self.started_at = float(raw.get("started_at") or 0.0)
+        self.offsets = [int(value) for value in list(raw.get("offsets") or [])]
+
+    def _save(self) -> None:
+        payload = {
+            "stride": self.stride,
+            "size": self.size,
+            "rows": self.rows,
+            "inode": self.inode,
+            "started_at": self.started_at,
+            "offsets": self.offsets,
+        }
+        tmp = self.sidecar.with_name(self.sidecar.name + ".tmp")
+        tmp.write_text(json.dumps(payload), encoding="utf-8")
+        os.replace(tmp, self.sidecar)
+
+    def reset(self) -> None:
+        self.size = 0
+        self.rows = 0
+        self.inode = 0
+        self.started_at = 0.0
+        self.offsets = []
+        try:
+            self.sidecar.unlink()
+        except FileNotFoundError:
+            pass
+
+    def refresh(self) -> "JsonlOffsetIndex":
+        try:
+            stat = self.path.stat()
+        except FileNotFoundError:
+            if self.size or self.rows:
+                self.reset()
+            return self
+        if stat.st_ino != self.inode or stat.st_size < self.size:
+            self.size, self.rows, self.offsets = 0, 0, []
+            self.inode = int(stat.st_ino)
+            self.started_at = time.time()
+        if stat.st_size == self.size:
+            if not self.sidecar.exists():
+                self._save()
+            return self
+        with self.path.open("rb") as handle:
+            handle.seek(self.size)
+            pos = self.size
+            for line in handle:
+                if not line.endswith(b"\n"):
+                    break
+                if self.rows % self.stride == 0:
+                    self.offsets.append(pos)
+                pos += len(line)
+                self.rows += 1
+        self.size = pos
+        self._save()
+        return self
+
+    def offset_for(self, row: int) -> tuple[int, int]:
+        """Nearest indexed ``(offset, row)`` at or before ``row``."""
+        slot = min(max(0, int(row)) // self.stride, len(self.offsets) - 1)
+        if slot < 0:
+            return 0, 0
+        return self.offsets[slot], slot * self.stride
+
+    def read_rows(self, start: int, limit: int) -> list[dict[str, Any]]:
+        """Rows ``start .. start+limit`` (0-based, counting every line), decoded."""
+        self.refresh()
+        start = max(0, int(start))
+        if start >= self.rows or limit <= 0:
+            return []
+        end = min(self.rows, start + int(limit))
+        offset, row = self.offset_for(start)
+        out: list[dict[str, Any]] = []
+        with self.path.open("rb") as handle:
+            handle.seek(offset)
+            for line in handle:
+                if row >= end:
+                    break
+                if row >= start:
+                    payload = _decode(line)
+                    if payload is not None:
+                        out.append(payload)
+                row += 1
+        return out
+
+
+def count_jsonl_rows(path: str | Path) -> int:
+    return JsonlOffsetIndex(path).refresh().rows
+
+
+def _rotate_lock(path: Path) -> threading.Lock:
+    with _ROTATE_LOCKS_GUARD:
+        return _ROTATE_LOCKS.setdefault(str(path.resolve()), threading.Lock())
+
+
+def _finish_detached(detached: Path) -> Path:
+    segment = _segment_for(detached)
+    if not segment.exists():
+        tmp = segment.with_name(segment.name + ".tmp")
+        with detached.open("rb") as src, gzip.open(tmp, "wb") as dst:
+            shutil.copyfileobj(src, dst)
+        os.replace(tmp, segment)
+    detached.unlink()
+    return segment
+
+
+def _rotate(path: Path, keep_segments: int) -> Path | None:
+    # A crash between the rename and the compression leaves detached files behind; finish those first.
+    for leftover in _detached_files(path):
+        _finish_detached(leftover)
+    segment = None
+    if path.exists() and path.stat().st_size > 0:
+        stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S%fZ")
+        # Rename first so appenders immediately start a fresh file; compress the detached copy afterwards.
+        detached = path.with_name(f"{_log_stem(path)}.{stamp}{DETACHED_SUFFIX}")
+        os.replace(path, detached)
+        JsonlOffsetIndex(path).reset()
+        segment = _finish_detached(detached)
+    for stale in rotated_segments(path)[: -max(1, int(keep_segments))]:
+        try:
+            stale.unlink()
+        except FileNotFoundError:
+            pass
+    return segment
+
+
+def rotate_jsonl(path: str | Path, *, keep_segments: int = 8) -> Path | None:
+    """Compress the active file into a timestamped segment and prune the oldest beyond ``keep_segments``."""
+    path = Path(path)
+    with _rotate_lock(path):
+        return _rotate(path, keep_segments)
+
+
+def _due_for_rotation(path: Path, rotation: JsonlRotation) -> bool:
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return False
+    if stat.st_size == 0:
+        return False
+    if rotation.max_bytes and stat.st_size >= rotation.max_bytes:
+        return True
+    if rotation.max_age_seconds:
+        index = JsonlOffsetIndex(path)
+        # The sidecar already dates the current file; only a new file needs indexing to start its clock.
+        if index.inode != stat.st_ino or not index.started_at:
+            index.refresh()
+        return (time.time() - index.started_at) >= rotation.max_age_seconds
+    return False
+
+
+def append_jsonl(
+    path: str | Path,
+    payload: dict[str, Any],
+    *,
+    rotation: JsonlRotation | None = None,
+    sort_keys: bool = True,
+) -> dict[str, Any]:
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if rotation is not None and (rotation.max_bytes or rotation.max_age_seconds):
+        with _rotate_lock(path):
+            if _due_for_rotation(path, rotation):
+                _rotate(path, rotation.keep_segments)
+    with path.open("a", encoding="utf-8") as handle:
+        handle.write(json.dumps(payload, ensure_ascii=False, sort_keys=sort_keys) + "\n")
+    return payload
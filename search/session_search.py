@@ -2,12 +2,12 @@ from __future__ import annotations
 
 import json
 import re
-from collections import deque
 from dataclasses import asdict, dataclass
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Any
 
+from runtime.jsonl_log import tail_jsonl
 from state import SessionEventStore
 
 
@@ -128,22 +128,7 @@ class SessionSearchService:
         return files[:12]
 
     def _iter_recent_jsonl_rows(self, path: Path, *, max_rows: int) -> list[dict[str, Any]]:
-        rows: deque[dict[str, Any]] = deque(maxlen=max_rows)
-        try:
-            with path.open("r", encoding="utf-8") as handle:
-                for line in handle:
-                    raw = line.strip()
-                    if not raw:
-                        continue
-                    try:
-                        data = json.loads(raw)
-                    except Exception:
-                        continue
-                    if isinstance(data, dict):
-                        rows.append(data)
-        except Exception:
-            return []
-        return list(rows)
+        return tail_jsonl(path, limit=max_rows)
 
     def _search_artifacts(
         self,
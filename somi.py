@@ -77,6 +77,7 @@ def build_parser() -> argparse.ArgumentParser:
     observability_snapshot_parser = observability_subparsers.add_parser("snapshot", help="Inspect runtime hotspots and recovery pressure.")
     observability_snapshot_parser.add_argument("--json", action="store_true", help="Emit JSON output.")
     observability_snapshot_parser.add_argument("--root", default=".", help="Project root to inspect.")
+    observability_snapshot_parser.add_argument("--window-hours", type=float, default=24.0, help="Metric rollup window in hours.")
 
     context_parser = subparsers.add_parser("context", help="Context-budget and compaction helpers.")
     context_subparsers = context_parser.add_subparsers(dest="context_command")
@@ -107,10 +108,17 @@ def build_parser() -> argparse.ArgumentParser:
         default="",
         help="Optional backup root. Defaults to audit/backups under the project root.",
     )
+    backup_create_parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Hard-link unchanged files from a shared content-addressed pool and write a manifest.",
+    )
+    backup_create_parser.add_argument("--workers", type=int, default=4, help="Parallel copy workers for --incremental.")
 
     backup_verify_parser = backup_subparsers.add_parser("verify", help="Verify recent backups.")
     backup_verify_parser.add_argument("--json", action="store_true", help="Emit JSON output.")
     backup_verify_parser.add_argument("--root", default=".", help="Project root to inspect.")
+    backup_verify_parser.add_argument("--deep", action="store_true", help="Rehash every manifest entry.")
 
     replay_parser = subparsers.add_parser("replay", help="Replay a persisted session timeline.")
     replay_subparsers = replay_parser.add_subparsers(dest="replay_command")
@@ -212,7 +220,7 @@ def main(argv: list[str] | None = None) -> int:
         return 0 if bool(report.get("ok", False)) else 1
 
     if args.command == "observability" and args.observability_command == "snapshot":
-        report = run_observability_snapshot(Path(args.root))
+        report = run_observability_snapshot(Path(args.root), window_seconds=float(args.window_hours) * 3600.0)
         print(format_observability_snapshot(report) if not args.json else _json_text(report))
         return 0 if bool(report.get("ok", False)) else 1
 
@@ -233,12 +241,14 @@ def main(argv: list[str] | None = None) -> int:
             label=str(args.label or ""),
             include_paths=include_paths or None,
             output_root=(str(args.output_root or "") or None),
+            incremental=bool(args.incremental),
+            workers=int(args.workers or 4),
         )
         print(format_backup_creation(report) if not args.json else _json_text(report))
         return 0 if bool(report.get("ok", False)) else 1
 
     if args.command == "backup" and args.backup_command == "verify":
-        report = verify_recent_backups(Path(args.root) / "backups", limit=5)
+        report = verify_recent_backups(Path(args.root) / "backups", limit=5, deep=bool(args.deep))
         if args.json:
             print(_json_text(report))
         else:
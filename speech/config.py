@@ -30,6 +30,16 @@ TTS_BACKEND = str(_SETTINGS.tts_provider)
 TTS_SAMPLE_RATE = 24000
 TTS_ALLOW_FALLBACK_TONE = True
 TTS_MAX_CHARS_PER_CHUNK = 220
+TTS_LOOKAHEAD_CHUNKS = 3
+TTS_PHRASE_CACHE_ENABLED = True
+TTS_PHRASE_CACHE_DIR = "sessions/tts_cache"
+TTS_PHRASE_CACHE_MAX_BYTES = 64 * 1024 * 1024
+TTS_PHRASE_CACHE_MAX_CHARS = 240
+TTS_FALLBACK_PHRASES = {
+    "empty_response": "I heard you, but I don't have a response yet. Please try again.",
+    "timeout": "I'm taking too long right now. Please ask again.",
+    "agent_error": "I hit an internal error. Please try that again.",
+}
 POCKET_TTS_SERVER_URL = str(_SETTINGS.pocket_server_url)
 POCKET_TTS_VOICE = "nova"
 POCKET_TTS_RESPONSE_FORMAT = "wav"
@@ -1,3 +1,4 @@
+import threading
 from typing import Optional
 
 import numpy as np
@@ -7,6 +8,48 @@ from speech.io.devices import resolve_device
 from speech.metrics.log import logger
 
 
+class LinearResampler:
+    """Linear resampler that keeps its interpolation scratch buffers between calls.
+
+    Only the index/weight grids are reused; every call returns a fresh output array
+    because ``sounddevice`` keeps reading the previous buffer while it plays.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._ramp = np.empty(0, dtype=np.float64)
+        self._pos = np.empty(0, dtype=np.float64)
+        self._idx = np.empty(0, dtype=np.int64)
+        self._frac = np.empty(0, dtype=np.float32)
+
+    def _scratch(self, size: int) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        if self._pos.size < size:
+            capacity = max(size, self._pos.size * 2)
+            self._ramp = np.arange(capacity, dtype=np.float64)
+            self._pos = np.empty(capacity, dtype=np.float64)
+            self._idx = np.empty(capacity, dtype=np.int64)
+            self._frac = np.empty(capacity, dtype=np.float32)
+        return self._pos[:size], self._idx[:size], self._frac[:size]
+
+    def resample(self, pcm: np.ndarray, src_sr: int, dst_sr: int) -> np.ndarray:
+        data = np.asarray(pcm, dtype=np.float32).reshape(-1)
+        if src_sr == dst_sr or data.size <= 1:
+            return data
+
+        out_len = max(1, int(round(data.size * float(dst_sr) / float(src_sr))))
+        with self._lock:
+            pos, idx, frac = self._scratch(out_len)
+            step = float(data.size - 1) / float(max(out_len - 1, 1))
+            np.multiply(self._ramp[:out_len], step, out=pos)
+            idx[:] = pos
+            np.minimum(idx, data.size - 2, out=idx)
+            np.subtract(pos, idx, out=frac)
+            out = data[idx + 1] - data[idx]
+            out *= frac
+            out += data[idx]
+        return out
+
+
 class AudioOut:
     def __init__(self, device: Optional[int | str] = None, os_profile: str = "auto"):
         self._current_sr: Optional[int] = None
@@ -14,6 +57,7 @@ class AudioOut:
         self.os_profile = os_profile
         self._resolved_device: Optional[int] = None
         self._preferred_output_sr: Optional[int] = None
+        self._resampler = LinearResampler()
 
     @staticmethod
     def _resample_linear(pcm: np.ndarray, src_sr: int, dst_sr: int) -> np.ndarray:
@@ -37,7 +81,7 @@ class AudioOut:
         if self._preferred_output_sr is not None:
             try:
                 sd.check_output_settings(device=self._resolved_device, samplerate=self._preferred_output_sr, channels=1, dtype="float32")
-                return self._resample_linear(pcm, sr, self._preferred_output_sr), self._preferred_output_sr
+                return self._resampler.resample(pcm, sr, self._preferred_output_sr), self._preferred_output_sr
             except Exception:
                 self._preferred_output_sr = None
 
@@ -55,12 +99,20 @@ class AudioOut:
                 sd.check_output_settings(device=self._resolved_device, samplerate=candidate_sr, channels=1, dtype="float32")
                 self._preferred_output_sr = candidate_sr
                 logger.warning("Output device does not support %sHz; resampling playback to %sHz", sr, candidate_sr)
-                return self._resample_linear(pcm, sr, candidate_sr), candidate_sr
+                return self._resampler.resample(pcm, sr, candidate_sr), candidate_sr
             except Exception:
                 continue
 
         return np.asarray(pcm, dtype=np.float32), sr
 
+    def prepare(self, pcm: np.ndarray, sr: int) -> tuple[np.ndarray, int]:
+        """Convert PCM to the device rate ahead of time (safe to call off the event loop)."""
+        try:
+            return self._resolve_supported_sr(pcm, int(sr))
+        except Exception as exc:
+            logger.warning("Audio prepare failed; deferring to play(): %s", exc)
+            return np.asarray(pcm, dtype=np.float32), int(sr)
+
     def play(self, pcm: np.ndarray, sr: int) -> None:
         self._current_sr = sr
         try:
@@ -6,10 +6,11 @@ from typing import Optional
 
 from speech.brain.agent_bridge import ask_agent_stream
 from speech.brain.text_clean import clean_tts_text
-from speech.config import AGENT_TIMEOUT_S, BACKCHANNEL_AFTER_MS, PLAYBACK_SLEEP_SLICE_MS
+from speech.config import AGENT_TIMEOUT_S, BACKCHANNEL_AFTER_MS, PLAYBACK_SLEEP_SLICE_MS, TTS_FALLBACK_PHRASES
 from speech.events import SPEAK_CHUNK, TRANSCRIPT_FINAL, TURN_CANCELLED, EventBus, SpeechEvent
 from speech.metrics.log import logger
 from speech.metrics.timings import MetricsWriter, TurnTimings
+from speech.tts.pipeline import SynthesisPipeline
 from speech.tts.text_chunker import StreamingChunker
 
 
@@ -27,6 +28,7 @@ class SomiState:
 
         self.audio_out = audio_out
         self.tts_engine = tts_engine
+        self.synthesis = SynthesisPipeline(tts_engine, prepare=getattr(audio_out, "prepare", None))
         self.backchannel_cb = backchannel_cb
 
         self.event_bus = EventBus()
@@ -75,6 +77,7 @@ class SomiState:
             self.agent_task.cancel()
         if self.backchannel_task and not self.backchannel_task.done():
             self.backchannel_task.cancel()
+        self.synthesis.cancel()
         self.audio_out.stop()
 
         tm = self.turn_metrics.get(cancelled_tid)
@@ -197,19 +200,19 @@ class SomiState:
 
             if not first_chunk_sent and turn_id == self.turn_id:
                 logger.warning("Agent produced no chunks: turn_id=%s", turn_id)
-                await self._emit_fallback_chunk(turn_id, "I heard you, but I don't have a response yet. Please try again.")
+                await self._emit_fallback_chunk(turn_id, TTS_FALLBACK_PHRASES["empty_response"])
                 self._close_turn_metrics(turn_id, extra={"empty_response": True, "fallback_spoken": True})
         except asyncio.TimeoutError:
             if turn_id == self.turn_id:
                 logger.warning("Agent timed out for turn_id=%s", turn_id)
-                await self._emit_fallback_chunk(turn_id, "I'm taking too long right now. Please ask again.")
+                await self._emit_fallback_chunk(turn_id, TTS_FALLBACK_PHRASES["timeout"])
                 self._close_turn_metrics(turn_id, extra={"timeout": True, "fallback_spoken": True})
         except asyncio.CancelledError:
             return
         except Exception as exc:
             if turn_id == self.turn_id:
                 logger.exception("Agent task failed for turn_id=%s: %s", turn_id, exc)
-                await self._emit_fallback_chunk(turn_id, "I hit an internal error. Please try that again.")
+                await self._emit_fallback_chunk(turn_id, TTS_FALLBACK_PHRASES["agent_error"])
                 self._close_turn_metrics(turn_id, extra={"agent_error": str(exc), "fallback_spoken": True})
         finally:
             if turn_id == self.turn_id:
@@ -219,21 +222,19 @@ class SomiState:
             if self.backchannel_task and not self.backchannel_task.done():
                 self.backchannel_task.cancel()
 
-    async def playback_loop(self):
+    async def _feed_synthesis(self) -> None:
         queue = self.playback_queue
         while True:
             event = await queue.get()
+            submitted = False
             try:
                 if event.type == TURN_CANCELLED:
                     if event.turn_id == self.turn_id:
+                        self.synthesis.cancel()
                         self.audio_out.stop()
                         self.state = self.LISTENING
                     continue
-                if event.type != SPEAK_CHUNK:
-                    continue
-
-                tid = event.turn_id
-                if tid != self.turn_id:
+                if event.type != SPEAK_CHUNK or event.turn_id != self.turn_id:
                     continue
 
                 chunk = (event.payload.get("chunk") or "").strip()
@@ -241,38 +242,59 @@ class SomiState:
                     continue
 
                 self.state = self.SPEAKING
-                tm = self.turn_metrics.get(tid)
-                try:
-                    pcm, sr = self.tts_engine.synthesize(chunk)
-                except Exception as exc:
-                    logger.exception("TTS synthesis failed for turn_id=%s: %s", tid, exc)
-                    self._close_turn_metrics(tid, extra={"tts_error": str(exc)})
-                    continue
-
-                if tm and "tts_first_synth_done" not in tm.marks:
-                    tm.mark("tts_first_synth_done")
-                if tid != self.turn_id:
-                    continue
+                self.synthesis.submit(event.turn_id, chunk)
+                submitted = True
+            finally:
+                if event.type == SPEAK_CHUNK and not submitted:
+                    self._release_chunk(event.turn_id)
+                queue.task_done()
 
-                self.audio_out.play(pcm, sr)
-                if tm and "first_audio" not in tm.marks:
-                    tm.mark("first_audio")
+    def _release_chunk(self, tid: int) -> None:
+        self.pending_chunks_by_turn[tid] = max(0, self.pending_chunks_by_turn.get(tid, 0) - 1)
+        self._maybe_finish_turn(tid)
 
-                remaining = len(pcm) / max(sr, 1)
-                sleep_slice = max(PLAYBACK_SLEEP_SLICE_MS / 1000.0, 0.01)
-                while remaining > 0:
+    async def playback_loop(self):
+        self.synthesis.start()
+        feeder = asyncio.create_task(self._feed_synthesis())
+        try:
+            while True:
+                item = await self.synthesis.get()
+                tid = item.turn_id
+                try:
                     if tid != self.turn_id:
-                        self.audio_out.stop()
-                        break
-                    step = min(sleep_slice, remaining)
-                    await asyncio.sleep(step)
-                    remaining -= step
-            finally:
-                if event.type == SPEAK_CHUNK:
-                    tid = event.turn_id
-                    self.pending_chunks_by_turn[tid] = max(0, self.pending_chunks_by_turn.get(tid, 0) - 1)
-                    self._maybe_finish_turn(tid)
-                queue.task_done()
+                        continue
+                    if item.error is not None:
+                        self._close_turn_metrics(tid, extra={"tts_error": str(item.error)})
+                        continue
+
+                    tm = self.turn_metrics.get(tid)
+                    if tm and "tts_first_synth_done" not in tm.marks:
+                        tm.mark("tts_first_synth_done")
+
+                    pcm, sr = item.pcm, item.sample_rate
+                    self.state = self.SPEAKING
+                    self.audio_out.play(pcm, sr)
+                    if tm and "first_audio" not in tm.marks:
+                        tm.mark("first_audio")
+
+                    remaining = len(pcm) / max(sr, 1)
+                    sleep_slice = max(PLAYBACK_SLEEP_SLICE_MS / 1000.0, 0.01)
+                    while remaining > 0:
+                        if tid != self.turn_id:
+                            self.audio_out.stop()
+                            break
+                        step = min(sleep_slice, remaining)
+                        await asyncio.sleep(step)
+                        remaining -= step
+                finally:
+                    self._release_chunk(tid)
+        finally:
+            feeder.cancel()
+            try:
+                await feeder
+            except asyncio.CancelledError:
+                pass
+            await self.synthesis.close()
 
     async def on_transcript_final(self, text: str, user_id: str, stt_ms: float | None = None) -> None:
         tid = self.allocate_turn_id(text)
@@ -4,6 +4,7 @@ import argparse
 import asyncio
 import json
 import os
+import threading
 
 import numpy as np
 
@@ -25,6 +26,7 @@ from speech.somistate import SomiState
 from speech.doctor import run_speech_doctor
 from speech.stt.factory import build_stt
 from speech.tts.factory import build_tts
+from speech.tts.phrase_cache import default_warm_phrases
 
 
 def _ack(audio_out: AudioOut) -> None:
@@ -44,7 +46,10 @@ async def _main(args):
     init_agent_bridge(agent_name=args.agent_name, use_studies=args.use_studies, user_id=args.user_id)
 
     audio_out = AudioOut(device=args.output_device, os_profile=args.os_profile)
-    state = SomiState(audio_out=audio_out, tts_engine=build_tts(), backchannel_cb=lambda: _ack(audio_out))
+    tts = build_tts()
+    if hasattr(tts, "warm"):
+        threading.Thread(target=tts.warm, args=(default_warm_phrases(),), name="tts-phrase-warmup", daemon=True).start()
+    state = SomiState(audio_out=audio_out, tts_engine=tts, backchannel_cb=lambda: _ack(audio_out))
     orchestrator = Orchestrator(
         audio_in=AudioIn(sample_rate=SAMPLE_RATE, frame_ms=FRAME_MS, device=args.input_device, os_profile=args.os_profile),
         stt_engine=build_stt(),
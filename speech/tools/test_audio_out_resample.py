@@ -11,3 +11,16 @@ def test_linear_resample_changes_length() -> None:
     out = AudioOut._resample_linear(pcm, 24000, 48000)
     assert out.dtype == np.float32
     assert out.shape[0] == 48000
+
+
+def test_reusable_resampler_matches_linear_resample() -> None:
+    from speech.io.audio_out import LinearResampler
+
+    resampler = LinearResampler()
+    for size, src_sr, dst_sr in [(24000, 24000, 48000), (22050, 22050, 44100), (4800, 24000, 16000)]:
+        pcm = np.random.default_rng(size).uniform(-1.0, 1.0, size).astype(np.float32)
+        expected = AudioOut._resample_linear(pcm, src_sr, dst_sr)
+        out = resampler.resample(pcm, src_sr, dst_sr)
+        assert out.dtype == np.float32
+        assert out.shape == expected.shape
+        assert np.allclose(out, expected, atol=5e-3)
@@ -0,0 +1,97 @@
+"""Phrase cache hit/miss, persistence and eviction checks."""
+
+from __future__ import annotations
+
+import pytest
+
+np = pytest.importorskip("numpy", reason="numpy unavailable in environment")
+
+from speech.tts.phrase_cache import CachedTTS, PhraseCache, normalize_phrase
+
+
+class CountingTTS:
+    provider_key = "counting"
+    voice_key = "test-voice"
+
+    def __init__(self):
+        self.calls = 0
+
+    def healthcheck(self):
+        return {"available": True, "provider": self.provider_key}
+
+    def synthesize(self, text):
+        self.calls += 1
+        return np.linspace(-0.5, 0.5, 2400, dtype=np.float32), 24000
+
+
+def test_repeated_phrase_is_served_from_cache(tmp_path) -> None:
+    inner = CountingTTS()
+    tts = CachedTTS(inner, PhraseCache(tmp_path), sample_rate=16000)
+
+    pcm1, sr1 = tts.synthesize("I’m taking too long right now.")
+    pcm2, sr2 = tts.synthesize("I'm  taking too long right now.")
+
+    assert inner.calls == 1
+    assert sr1 == sr2 == 24000
+    assert pcm2.dtype == np.float32
+    assert np.allclose(pcm1, pcm2, atol=1e-4)
+    assert tts.active_provider_key == "tts_cache"
+
+    reloaded = CachedTTS(inner, PhraseCache(tmp_path), sample_rate=16000)
+    reloaded.synthesize("I'm taking too long right now.")
+    assert inner.calls == 1, "cache should survive a restart"
+
+
+def test_long_text_and_other_voices_bypass_cache(tmp_path) -> None:
+    inner = CountingTTS()
+    cache = PhraseCache(tmp_path, max_chars=20)
+    tts = CachedTTS(inner, cache, sample_rate=16000)
+
+    tts.synthesize("This sentence is clearly longer than twenty characters.")
+    tts.synthesize("This sentence is clearly longer than twenty characters.")
+    assert inner.calls == 2
+
+    tts.synthesize("hello")
+    inner.voice_key = "other-voice"
+    tts.synthesize("hello")
+    assert inner.calls == 4
+
+
+def test_byte_budget_evicts_least_recently_used(tmp_path) -> None:
+    pcm = np.zeros(1000, dtype=np.float32)
+    cache = PhraseCache(tmp_path, max_bytes=4500)
+    for phrase in ["one", "two"]:
+        cache.put("e", "v", 16000, phrase, pcm, 16000)
+    assert cache.get("e", "v", 16000, "one") is not None
+    cache.put("e", "v", 16000, "three", pcm, 16000)
+
+    assert cache.contains("e", "v", 16000, "one")
+    assert not cache.contains("e", "v", 16000, "two")
+    assert cache.total_bytes() <= 4500
+
+
+def test_warm_stores_missing_phrases_once(tmp_path) -> None:
+    inner = CountingTTS()
+    tts = CachedTTS(inner, PhraseCache(tmp_path), sample_rate=16000)
+    phrases = ["Hi there!", "Please try again.", normalize_phrase("Hi   there!")]
+
+    assert tts.warm(phrases) == 2
+    assert tts.warm(phrases) == 0
+    assert inner.calls == 2
+
+
+def test_index_writes_are_batched_and_keep_lru_order(tmp_path) -> None:
+    pcm = np.zeros(1000, dtype=np.float32)
+    cache = PhraseCache(tmp_path, max_bytes=4500, flush_interval_s=3600.0)
+    for phrase in ["one", "two"]:
+        cache.put("e", "v", 16000, phrase, pcm, 16000)
+    assert not cache.index_path.exists()
+
+    cache.flush()
+    cache.get("e", "v", 16000, "one")
+    cache.flush()
+
+    reloaded = PhraseCache(tmp_path, max_bytes=4500)
+    reloaded.put("e", "v", 16000, "three", pcm, 16000)
+    assert reloaded.contains("e", "v", 16000, "one")
+    assert not reloaded.contains("e", "v", 16000, "two")
@@ -0,0 +1,92 @@
+"""Look-ahead synthesis pipeline ordering and cancellation checks."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+
+from speech.tts.pipeline import SynthesisPipeline
+
+
+class SlowTTS:
+    def __init__(self, delay_s: float = 0.02):
+        self.delay_s = delay_s
+        self.calls: list[str] = []
+        self.threads: set[int] = set()
+
+    def synthesize(self, text):
+        self.calls.append(text)
+        self.threads.add(threading.get_ident())
+        time.sleep(self.delay_s)
+        return [0.0] * len(text), 8000
+
+
+async def _ordered_lookahead():
+    tts = SlowTTS()
+    pipeline = SynthesisPipeline(tts, lookahead=2)
+    pipeline.start()
+    for idx in range(4):
+        pipeline.submit(1, f"chunk {idx}")
+
+    ticks = 0
+
+    async def _ticker():
+        nonlocal ticks
+        while True:
+            await asyncio.sleep(0.005)
+            ticks += 1
+
+    ticker = asyncio.create_task(_ticker())
+    first = await pipeline.get()
+    await asyncio.sleep(0.1)
+    assert len(tts.calls) >= 3, "pipeline should synthesize ahead while the first chunk plays"
+    rest = [await pipeline.get() for _ in range(3)]
+    ticker.cancel()
+    await pipeline.close()
+
+    assert [item.text for item in [first, *rest]] == [f"chunk {idx}" for idx in range(4)]
+    assert all(item.error is None and item.sample_rate == 8000 for item in [first, *rest])
+    assert ticks > 0, "synthesis must not block the event loop"
+    assert threading.get_ident() not in tts.threads
+
+
+async def _cancel_drops_stale_chunks():
+    tts = SlowTTS()
+    pipeline = SynthesisPipeline(tts, lookahead=2)
+    pipeline.start()
+    for idx in range(3):
+        pipeline.submit(1, f"old {idx}")
+    await asyncio.sleep(0.01)
+    pipeline.cancel()
+    pipeline.submit(2, "fresh")
+    item = await asyncio.wait_for(pipeline.get(), timeout=1.0)
+    await pipeline.close()
+
+    assert (item.turn_id, item.text) == (2, "fresh")
+    assert "old 2" not in tts.calls
+
+
+async def _errors_are_reported():
+    class BrokenTTS:
+        def synthesize(self, text):
+            raise RuntimeError("engine down")
+
+    pipeline = SynthesisPipeline(BrokenTTS())
+    pipeline.start()
+    pipeline.submit(1, "hello")
+    item = await asyncio.wait_for(pipeline.get(), timeout=1.0)
+    await pipeline.close()
+    assert isinstance(item.error, RuntimeError)
+
+
+def test_pipeline_synthesizes_ahead_in_order():
+    asyncio.run(_ordered_lookahead())
+
+
+def test_pipeline_cancel_drops_stale_chunks():
+    asyncio.run(_cancel_drops_stale_chunks())
+
+
+def test_pipeline_reports_engine_errors():
+    asyncio.run(_errors_are_reported())
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+from speech.config import TTS_PHRASE_CACHE_ENABLED
 from speech.runtime_settings import SpeechRuntimeSettings, load_speech_runtime_settings
+from speech.tts.phrase_cache import CachedTTS, PhraseCache
 from speech.tts.tts_pocket_server import PocketTTSServerTTS
 from speech.tts.tts_pyttsx3 import Pyttsx3TTS
 from speech.tts.tts_tone import ToneTTS
@@ -12,6 +14,7 @@ class FallbackTTS:
     def __init__(self, providers: list) -> None:
         self.providers = list(providers)
         self.active_provider_key = getattr(self.providers[0], "provider_key", "none") if self.providers else "none"
+        self.last_degraded = False
 
     def healthcheck(self) -> dict:
         rows = []
@@ -29,6 +32,7 @@ class FallbackTTS:
             try:
                 pcm, sr = provider.synthesize(text)
                 self.active_provider_key = getattr(provider, "provider_key", type(provider).__name__)
+                self.last_degraded = bool(getattr(provider, "last_degraded", False))
                 return pcm, sr
             except Exception as exc:
                 last_error = exc
@@ -66,7 +70,7 @@ def _build_provider(provider: str, runtime: SpeechRuntimeSettings):
     return None
 
 
-def build_tts(settings: SpeechRuntimeSettings | None = None):
+def build_tts(settings: SpeechRuntimeSettings | None = None, *, phrase_cache: bool = TTS_PHRASE_CACHE_ENABLED):
     runtime = settings or load_speech_runtime_settings()
     providers = []
     for provider_name in _provider_candidates(runtime):
@@ -80,4 +84,7 @@ def build_tts(settings: SpeechRuntimeSettings | None = None):
         providers.append(ToneTTS())
     elif getattr(providers[-1], "provider_key", "") != "tone":
         providers.append(ToneTTS())
-    return FallbackTTS(providers)
+    chain = FallbackTTS(providers)
+    if phrase_cache:
+        return CachedTTS(chain, PhraseCache(), sample_rate=int(runtime.sample_rate))
+    return chain
@@ -0,0 +1,329 @@
+from __future__ import annotations
+
+import atexit
+import hashlib
+import json
+import os
+import threading
+import time
+import unicodedata
+import weakref
+from collections import OrderedDict
+from pathlib import Path
+from typing import Iterable, Optional
+
+import numpy as np
+
+from speech.config import (
+    TTS_FALLBACK_PHRASES,
+    TTS_PHRASE_CACHE_DIR,
+    TTS_PHRASE_CACHE_MAX_BYTES,
+    TTS_PHRASE_CACHE_MAX_CHARS,
+)
+from speech.metrics.log import logger
+
+_INDEX_NAME = "index.json"
+_DTYPES = {"int16": np.int16, "float32": np.float32}
+# index.json is rewritten at most this often; puts and LRU touches in between only mark it dirty.
+_FLUSH_INTERVAL_S = 5.0
+_OPEN_CACHES: "weakref.WeakSet[PhraseCache]" = weakref.WeakSet()
+
+
+def _flush_open_caches() -> None:
+    for cache in list(_OPEN_CACHES):
+        try:
+            cache.flush()
+        except Exception as exc:
+            logger.warning("Phrase cache index flush at exit failed: %s", exc)
+
+
+atexit.register(_flush_open_caches)
+
+
+def normalize_phrase(text: str) -> str:
+    clean = unicodedata.normalize("NFKC", str(text or ""))
+    clean = clean.replace("’", "'").replace("‘", "'").replace("“", '"').replace("”", '"')
+    return " ".join(clean.split())
+
+
+def phrase_key(engine: str, voice: str, sample_rate: int, text: str) -> str:
+    raw = "\x1f".join([str(engine or ""), str(voice or ""), str(int(sample_rate or 0)), normalize_phrase(text)])
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()[:32]
+
+
+class PhraseCache:
+    """Content-addressed PCM cache for short, frequently repeated utterances.
+
+    Each entry is a raw int16 (or float32) file that is memory-mapped on read.
+    ``index.json`` keeps per-entry metadata and a ``last_used`` time that
+    restores LRU order on load; the cache evicts the least recently used
+    entries once ``max_bytes`` is exceeded. Index writes are batched: at most
+    one per ``flush_interval_s``, plus one at interpreter exit.
+    """
+
+    def __init__(
+        self,
+        root: str | Path = TTS_PHRASE_CACHE_DIR,
+        *,
+        max_bytes: int = TTS_PHRASE_CACHE_MAX_BYTES,
+        max_chars: int = TTS_PHRASE_CACHE_MAX_CHARS,
+        dtype: str = "int16",
+        flush_interval_s: float = _FLUSH_INTERVAL_S,
+    ) -> None:
+        if dtype not in _DTYPES:
+            raise ValueError(f"Unsupported phrase cache dtype: {dtype}")
+        self.root = Path(root)
+        self.max_bytes = max(0, int(max_bytes))
+        self.max_chars = max(1, int(max_chars))
+        self.dtype = dtype
+        self.flush_interval_s = max(0.0, float(flush_interval_s))
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.RLock()
+        self._entries: OrderedDict[str, dict] = OrderedDict()
+        self._maps: dict[str, np.ndarray] = {}
+        self._dirty = False
+        self._last_flush = time.monotonic()
+        for other in list(_OPEN_CACHES):
+            # Another cache over this directory may still hold an unwritten index.
+            if other.root.resolve() == self.root.resolve():
+                other.flush()
+        self._load_index()
+        _OPEN_CACHES.add(self)
+
+    @property
+    def index_path(self) -> Path:
+        return self.root / _INDEX_NAME
+
+    def _entry_path(self, key: str) -> Path:
+        return self.root / key[:2] / f"{key}.pcm"
+
+    def _load_index(self) -> None:
+        try:
+            payload = json.loads(self.index_path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return
+        except Exception as exc:
+            logger.warning("Phrase cache index unreadable, starting empty: %s", exc)
+            return
+        rows = payload.get("entries") if isinstance(payload, dict) else None
+        if not isinstance(rows, list):
+            return
+        rows.sort(key=lambda row: float(row.get("last_used") or 0.0))
+        for row in rows:
+            key = str(row.get("key") or "")
+            if key and self._entry_path(key).exists():
+                self._entries[key] = dict(row)
+
+    def flush(self) -> None:
+        with self._lock:
+            if not self._dirty:
+                return
+            self.root.mkdir(parents=True, exist_ok=True)
+            tmp = self.index_path.with_suffix(".json.tmp")
+            payload = {"version": 1, "entries": list(self._entries.values())}
+            tmp.write_text(json.dumps(payload, ensure_ascii=False), encoding="utf-8")
+            os.replace(tmp, self.index_path)
+            self._dirty = False
+            self._last_flush = time.monotonic()
+
+    def _maybe_flush(self) -> None:
+        if self._dirty and time.monotonic() - self._last_flush >= self.flush_interval_s:
+            self.flush()
+
+    def cacheable(self, text: str) -> bool:
+        clean = normalize_phrase(text)
+        return bool(clean) and len(clean) <= self.max_chars and self.max_bytes > 0
+
+    def total_bytes(self) -> int:
+        with self._lock:
+            return sum(int(row.get("bytes") or 0) for row in self._entries.values())
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self.total_bytes(),
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+    def contains(self, engine: str, voice: str, sample_rate: int, text: str) -> bool:
+        with self._lock:
+            return phrase_key(engine, voice, sample_rate, text) in self._entries
+
+    def get(self, engine: str, voice: str, sample_rate: int, text: str) -> Optional[tuple[np.ndarray, int]]:
+        key = phrase_key(engine, voice, sample_rate, text)
+        with self._lock:
+            row = self._entries.get(key)
+            if row is None:
+                self.misses += 1
+                return None
+            data = self._maps.get(key)
+            if data is None:
+                try:
+                    data = np.memmap(self._entry_path(key), dtype=_DTYPES[row["dtype"]], mode="r")
+                except Exception as exc:
+                    logger.warning("Phrase cache entry unreadable key=%s: %s", key, exc)
+                    self._drop(key)
+                    self.misses += 1
+                    return None
+                self._maps[key] = data
+            self._entries.move_to_end(key)
+            row["last_used"] = time.time()
+            self._dirty = True
+            self.hits += 1
+            self._maybe_flush()
+        if data.dtype == np.int16:
+            pcm = data.astype(np.float32)
+            pcm *= 1.0 / 32767.0
+        else:
+            pcm = np.array(data, dtype=np.float32)
+        return pcm, int(row["sample_rate"])
+
+    def put(self, engine: str, voice: str, sample_rate: int, text: str, pcm, sr: int) -> bool:
+        if not self.cacheable(text):
+            return False
+        data = np.clip(np.asarray(pcm, dtype=np.float32).reshape(-1), -1.0, 1.0)
+        if data.size == 0:
+            return False
+        if self.dtype == "int16":
+            data = np.round(data * 32767.0).astype(np.int16)
+        size = int(data.nbytes)
+        if size > self.max_bytes:
+            return False
+
+        key = phrase_key(engine, voice, sample_rate, text)
+        path = self._entry_path(key)
+        with self._lock:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_suffix(".pcm.tmp")
+            data.tofile(tmp)
+            self._maps.pop(key, None)
+            os.replace(tmp, path)
+            self._entries[key] = {
+                "key": key,
+                "engine": str(engine or ""),
+                "voice": str(voice or ""),
+                "text": normalize_phrase(text),
+                "dtype": self.dtype,
+                "sample_rate": int(sr),
+                "samples": int(data.size),
+                "bytes": size,
+                "last_used": time.time(),
+            }
+            self._entries.move_to_end(key)
+            self._dirty = True
+            self._evict()
+            self._maybe_flush()
+        return True
+
+    def _drop(self, key: str) -> None:
+        self._entries.pop(key, None)
+        self._maps.pop(key, None)
+        self._dirty = True
+        try:
+            self._entry_path(key).unlink()
+        except FileNotFoundError:
+            pass
+        except OSError as exc:
+            logger.warning("Phrase cache could not delete key=%s: %s", key, exc)
+
+    def _evict(self) -> None:
+        total = self.total_bytes()
+        while total > self.max_bytes and self._entries:
+            key, row = next(iter(self._entries.items()))
+            total -= int(row.get("bytes") or 0)
+            self._drop(key)
+
+
+class CachedTTS:
+    """TTS provider wrapper that serves repeated short phrases from :class:`PhraseCache`."""
+
+    provider_key = "tts_cache"
+
+    def __init__(self, inner, cache: PhraseCache, sample_rate: int) -> None:
+        self.inner = inner
+        self.cache = cache
+        self.sample_rate = int(sample_rate)
+        self.active_provider_key = getattr(inner, "active_provider_key", getattr(inner, "provider_key", "none"))
+        self._synth_lock = threading.Lock()
+
+    def _primary(self):
+        providers = getattr(self.inner, "providers", None)
+        return providers[0] if providers else self.inner
+
+    def _signature(self) -> tuple[str, str]:
+        primary = self._primary()
+        engine = str(getattr(primary, "provider_key", type(primary).__name__))
+        return engine, str(getattr(primary, "voice_key", "") or "")
+
+    def healthcheck(self) -> dict:
+        payload = dict(self.inner.healthcheck() or {})
+        payload["phrase_cache"] = self.cache.stats()
+        return payload
+
+    def synthesize(self, text: str):
+        if not self.cache.cacheable(text):
+            with self._synth_lock:
+                pcm, sr = self.inner.synthesize(text)
+            self.active_provider_key = getattr(self.inner, "active_provider_key", self.active_provider_key)
+            return pcm, sr
+
+        engine, voice = self._signature()
+        hit = self.cache.get(engine, voice, self.sample_rate, text)
+        if hit is not None:
+            self.active_provider_key = self.provider_key
+            return hit
+
+        with self._synth_lock:
+            pcm, sr = self.inner.synthesize(text)
+            active = getattr(self.inner, "active_provider_key", engine)
+            degraded = bool(getattr(self.inner, "last_degraded", False))
+        self.active_provider_key = active
+        if active == engine and not degraded:
+            try:
+                self.cache.put(engine, voice, self.sample_rate, text, pcm, sr)
+            except Exception as exc:
+                logger.warning("Phrase cache store failed: %s", exc)
+        return pcm, sr
+
+    def warm(self, phrases: Iterable[str]) -> int:
+        """Synthesize and store any known phrase that is not cached yet."""
+        engine, voice = self._signature()
+        stored = 0
+        for phrase in phrases:
+            if not self.cache.cacheable(phrase):
+                continue
+            if self.cache.contains(engine, voice, self.sample_rate, phrase):
+                continue
+            try:
+                self.synthesize(phrase)
+            except Exception as exc:
+                logger.warning("Phrase cache warm-up failed for %r: %s", phrase, exc)
+                continue
+            stored += int(self.cache.contains(engine, voice, self.sample_rate, phrase))
+        self.cache.flush()
+        return stored
+
+
+def default_warm_phrases() -> list[str]:
+    phrases: list[str] = list(TTS_FALLBACK_PHRASES.values())
+    try:
+        from config.audio_texts import AUDIO_RESPONSES
+    except Exception:
+        AUDIO_RESPONSES = {}
+    for value in AUDIO_RESPONSES.values():
+        if isinstance(value, str):
+            phrases.append(value)
+        elif isinstance(value, (list, tuple)):
+            phrases.extend(str(item) for item in value)
+    seen: set[str] = set()
+    out: list[str] = []
+    for phrase in phrases:
+        clean = normalize_phrase(phrase)
+        if clean and clean not in seen:
+            seen.add(clean)
+            out.append(clean)
+    return out
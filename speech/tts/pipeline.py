@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Optional
+
+from speech.config import TTS_LOOKAHEAD_CHUNKS
+from speech.metrics.log import logger
+
+
+@dataclass(slots=True)
+class SynthesizedChunk:
+    turn_id: int
+    text: str
+    pcm: Any = None
+    sample_rate: int = 0
+    error: Optional[BaseException] = None
+    synth_ms: float = 0.0
+    generation: int = 0
+
+
+class SynthesisPipeline:
+    """Look-ahead TTS worker that synthesizes upcoming chunks while earlier ones play.
+
+    Chunks are synthesized in submission order on a worker thread so the event loop
+    never blocks on the TTS engine. At most ``lookahead`` finished chunks wait in the
+    ready queue; ``cancel()`` discards everything queued or in flight.
+    """
+
+    def __init__(
+        self,
+        tts_engine,
+        lookahead: int = TTS_LOOKAHEAD_CHUNKS,
+        prepare: Optional[Callable[[Any, int], tuple[Any, int]]] = None,
+    ) -> None:
+        self.tts_engine = tts_engine
+        self.lookahead = max(1, int(lookahead or 1))
+        self.prepare = prepare
+        self._generation = 0
+        self._pending: Optional[asyncio.Queue[tuple[int, str, int]]] = None
+        self._ready: Optional[asyncio.Queue[SynthesizedChunk]] = None
+        self._worker: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        if self._worker is not None and not self._worker.done():
+            return
+        self._pending = asyncio.Queue()
+        self._ready = asyncio.Queue(maxsize=self.lookahead)
+        self._worker = asyncio.create_task(self._run())
+
+    async def close(self) -> None:
+        self.cancel()
+        worker, self._worker = self._worker, None
+        if worker is not None and not worker.done():
+            worker.cancel()
+            try:
+                await worker
+            except asyncio.CancelledError:
+                pass
+
+    def submit(self, turn_id: int, text: str) -> None:
+        if self._pending is None:
+            raise RuntimeError("SynthesisPipeline.start() must be called before submit()")
+        self._pending.put_nowait((int(turn_id), str(text or ""), self._generation))
+
+    def cancel(self) -> int:
+        """Drop queued and in-flight chunks. Returns how many queued chunks were discarded."""
+        self._generation += 1
+        dropped = 0
+        for queue in (self._pending, self._ready):
+            if queue is None:
+                continue
+            while True:
+                try:
+                    queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    break
+                dropped += 1
+        return dropped
+
+    async def get(self) -> SynthesizedChunk:
+        if self._ready is None:
+            raise RuntimeError("SynthesisPipeline.start() must be called before get()")
+        while True:
+            item = await self._ready.get()
+            if item.generation == self._generation:
+                return item
+
+    def _synthesize(self, text: str) -> tuple[Any, int]:
+        pcm, sr = self.tts_engine.synthesize(text)
+        if self.prepare is not None:
+            pcm, sr = self.prepare(pcm, int(sr))
+        return pcm, int(sr)
+
+    async def _run(self) -> None:
+        assert self._pending is not None and self._ready is not None
+        while True:
+            turn_id, text, generation = await self._pending.get()
+            if generation != self._generation:
+                continue
+            started = time.perf_counter()
+            item = SynthesizedChunk(turn_id=turn_id, text=text, generation=generation)
+            try:
+                item.pcm, item.sample_rate = await asyncio.to_thread(self._synthesize, text)
+            except Exception as exc:
+                logger.exception("TTS synthesis failed for turn_id=%s: %s", turn_id, exc)
+                item.error = exc
+            item.synth_ms = (time.perf_counter() - started) * 1000.0
+            if generation != self._generation:
+                continue
+            await self._ready.put(item)
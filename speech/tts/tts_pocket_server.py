@@ -21,6 +21,10 @@ from speech.metrics.log import logger
 
 class PocketTTSServerTTS:
     provider_key = "pocket_server"
+    voice_key = f"{POCKET_TTS_VOICE}|speed={POCKET_TTS_SPEED}|{POCKET_TTS_RESPONSE_FORMAT}"
+
+    def __init__(self) -> None:
+        self.last_degraded = False
 
     def healthcheck(self) -> dict:
         try:
@@ -52,11 +56,13 @@ class PocketTTSServerTTS:
         try:
             wav_bytes = self._request_tts(payload)
             pcm, sr = self._decode_wav(wav_bytes)
+            self.last_degraded = False
             return pcm, sr
         except Exception as exc:
             logger.error("PocketTTSServerTTS synth failed err=%r", exc)
             if not TTS_ALLOW_FALLBACK_TONE:
                 raise RuntimeError("PocketTTSServerTTS unavailable and fallback tone disabled") from exc
+            self.last_degraded = True
             return self._fallback_tone(text)
 
     def _request_tts(self, payload: dict) -> bytes:
@@ -14,6 +14,10 @@ class Pyttsx3TTS:
     def __init__(self, settings: SpeechRuntimeSettings | None = None) -> None:
         self.settings = settings or load_speech_runtime_settings()
 
+    @property
+    def voice_key(self) -> str:
+        return f"{self.settings.tts_voice_hint}|rate={self.settings.tts_rate}|volume={self.settings.tts_volume}"
+
     def _voice_id(self, engine) -> str | None:
         hint = str(self.settings.tts_voice_hint or "").strip().lower()
         if not hint:
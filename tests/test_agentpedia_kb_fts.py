@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import json
+import shutil
+import sqlite3
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from workshop.toolbox.stacks.research_core import agentpedia_kb
+from workshop.toolbox.stacks.research_core.agentpedia_kb import AgentpediaKB
+
+
+def _fact(claim: str, *, topic: str = "python releases", confidence: float = 0.6, tags: list[str] | None = None, **extra):
+    row = {
+        "claim": claim,
+        "topic": topic,
+        "summary": claim[:80],
+        "source_url": f"https://example.org/{abs(hash(claim))}",
+        "source_title": "Example",
+        "confidence": confidence,
+        "tags": tags or [],
+    }
+    row.update(extra)
+    return row
+
+
+class AgentpediaKBFtsTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.temp_dir = Path(tempfile.mkdtemp(prefix="somi_agentpedia_kb_"))
+        base = self.temp_dir / "agentpedia"
+        self._patches = [
+            patch.object(agentpedia_kb, "AGENTPEDIA_DIR", base),
+            patch.object(agentpedia_kb, "AGENTPEDIA_DB", base / "agentpedia.sqlite"),
+            patch.object(agentpedia_kb, "AGENTPEDIA_PAGES_DIR", base / "pages"),
+            patch.object(agentpedia_kb, "AGENTPEDIA_STATE", base / "state.json"),
+        ]
+        for item in self._patches:
+            item.start()
+
+    def tearDown(self) -> None:
+        for item in reversed(self._patches):
+            item.stop()
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_search_ranks_terms_and_confidence(self) -> None:
+        kb = AgentpediaKB()
+        self.assertTrue(kb._fts_enabled)
+        kb.add_facts(
+            [
+                _fact("Python 3.13 ships a new interactive REPL.", confidence=0.4),
+                _fact("Python 3.13 adds an experimental free-threaded build.", confidence=0.9),
+                _fact("Rust 1.80 stabilises lazy cell types.", topic="rust releases"),
+            ]
+        )
+        rows = kb.search("what changed in python 3.13", k=5)
+        self.assertEqual(len(rows), 2)
+        self.assertIn("free-threaded", rows[0]["claim"])
+        self.assertIsInstance(rows[0]["tags"], list)
+
+    def test_tag_filter_runs_before_limit(self) -> None:
+        kb = AgentpediaKB()
+        facts = [_fact(f"Water filter note number {i}.", topic="water", confidence=0.9) for i in range(6)]
+        facts.append(_fact("Water filter note for field kits.", topic="water", confidence=0.2, tags=["Domain:Survival"]))
+        kb.add_facts(facts)
+        rows = kb.search("water filter", k=2, tags=["domain:survival"])
+        self.assertEqual([row["claim"] for row in rows], ["Water filter note for field kits."])
+
+    def test_replaced_fact_stays_in_sync(self) -> None:
+        kb = AgentpediaKB()
+        kb.add_facts([_fact("Solar panels lose output when shaded.", fact_id="f1", tags=["energy"])])
+        kb.add_facts([_fact("Solar panels lose output in heat.", fact_id="f1", confidence=0.95, tags=["climate"])])
+        self.assertEqual(len(kb.search("shaded", k=5)), 0)
+        self.assertEqual(len(kb.search("heat", k=5)), 1)
+        self.assertEqual(kb.search("solar", k=5, tags=["energy"]), [])
+        self.assertEqual(len(kb.search("solar", k=5, tags=["climate"])), 1)
+
+    def test_existing_database_is_migrated(self) -> None:
+        agentpedia_kb.AGENTPEDIA_DIR.mkdir(parents=True, exist_ok=True)
+        with sqlite3.connect(agentpedia_kb.AGENTPEDIA_DB) as c:
+            c.execute(
+                """
+                CREATE TABLE facts (
+                    fact_id TEXT PRIMARY KEY, claim TEXT NOT NULL, summary TEXT, topic TEXT NOT NULL, tags TEXT,
+                    source_url TEXT NOT NULL, source_title TEXT NOT NULL, source_date TEXT, retrieved_at TEXT NOT NULL,
+                    confidence REAL NOT NULL, status TEXT NOT NULL, evidence_snippet TEXT, citation_key TEXT,
+                    dedupe_key TEXT NOT NULL, version INTEGER NOT NULL DEFAULT 1, supersedes_fact_id TEXT, created_ts REAL NOT NULL
+                )
+                """
+            )
+            c.execute(
+                "INSERT INTO facts VALUES ('old1','Boil water for one minute.','','water safety',?, 'https://x.org','X',NULL,'2026-01-01',0.7,'committed','','','k1',1,NULL,1.0)",
+                (json.dumps(["Survival"]),),
+            )
+        kb = AgentpediaKB()
+        rows = kb.search("boil water", k=3, tags=["survival"])
+        self.assertEqual([row["fact_id"] for row in rows], ["old1"])
+
+
+if __name__ == "__main__":
+    unittest.main()
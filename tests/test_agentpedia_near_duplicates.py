@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import random
+import shutil
+import tempfile
+import time
+import unittest
+from pathlib import Path
+
+from workshop.toolbox.stacks.research_core.near_duplicates import NearDuplicateIndex
+from workshop.toolbox.stacks.research_core.science_stores import (
+    AgentpediaManager,
+    ResearchedScienceStore,
+    TextbookFactsStore,
+    VerifiedScienceStore,
+)
+
+
+class NearDuplicateIndexTests(unittest.TestCase):
+    def test_candidates_find_rephrasings_not_unrelated_text(self) -> None:
+        index = NearDuplicateIndex()
+        index.add("a", "Metformin lowers hepatic glucose production in type 2 diabetes.")
+        index.add("b", "The Eiffel Tower is repainted roughly every seven years.")
+        hits = index.candidates("Metformin lowers hepatic glucose production in type-2 diabetes patients.")
+        self.assertEqual([key for key, _ in hits], ["a"])
+        index.remove("a")
+        self.assertEqual(index.candidates("Metformin lowers hepatic glucose production in type 2 diabetes."), [])
+
+    def test_query_latency_stays_sub_millisecond(self) -> None:
+        rng = random.Random(11)
+        words = [f"{a}{b}{c}" for a in "bcdfgklmnprst" for b in "aeiou" for c in "lmnrstx"]
+        facts = [" ".join(rng.choice(words) for _ in range(12)) for _ in range(3000)]
+        index = NearDuplicateIndex()
+        for i, fact in enumerate(facts):
+            index.add(i, fact)
+        sig = index.signature(facts[1234] + " again")
+        started = time.perf_counter()
+        for _ in range(200):
+            hits = index.candidates(signature=sig)
+        per_query_ms = (time.perf_counter() - started) * 1000.0 / 200
+        self.assertIn(1234, [key for key, _ in hits])
+        self.assertLess(per_query_ms, 1.0)
+
+
+class AgentpediaManagerNearDuplicateTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.temp_dir = Path(tempfile.mkdtemp(prefix="somi_agentpedia_dups_"))
+        db = self.temp_dir / "agentpedia.sqlite"
+        self.verified = VerifiedScienceStore(db)
+        self.researched = ResearchedScienceStore(db)
+        self.textbook = TextbookFactsStore(db)
+        self.manager = AgentpediaManager(verified=self.verified, researched=self.researched, textbook=self.textbook)
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_detect_conflicts_sees_facts_older_than_recent_window(self) -> None:
+        self.researched.add_facts(
+            [{"topic": "vitamin d", "fact": "Vitamin D supports calcium absorption in the gut.", "source": "https://a.org", "confidence": "high"}]
+        )
+        self.researched.add_facts(
+            [{"topic": f"filler {i}", "fact": f"Unrelated filler statement {i}.", "source": f"https://f{i}.org"} for i in range(250)]
+        )
+        conflicts = self.manager.detect_conflicts("vitamin d", "Vitamin D supports calcium absorption in the gut")
+        self.assertEqual([(c.store, c.source) for c in conflicts], [("researched", "https://a.org")])
+
+        self.manager.deprecate_fact("researched", conflicts[0].id)
+        self.assertEqual(self.manager.detect_conflicts("vitamin d", "Vitamin D supports calcium absorption in the gut"), [])
+
+    def test_bulk_detection_reports_batch_duplicates(self) -> None:
+        batch = [
+            {"topic": "sleep", "fact": "Adults need seven to nine hours of sleep per night.", "source": "https://s.org"},
+            {"topic": "sleep", "fact": "Adults need seven to nine hours of sleep each night.", "source": "https://t.org"},
+            {"topic": "hydration", "fact": "Thirst is a late signal of dehydration.", "source": "https://h.org"},
+        ]
+        results = self.manager.detect_conflicts_bulk(batch)
+        self.assertEqual(results[0], [])
+        self.assertEqual([(c.store, c.id) for c in results[1]], [("batch", 0)])
+        self.assertEqual(results[2], [])
+
+    def test_promotion_skips_verified_near_duplicates(self) -> None:
+        self.verified.add_fact(topic="aspirin", fact="Aspirin irreversibly inhibits COX-1.", source="https://v.org")
+        self.researched.add_facts(
+            [
+                {"topic": "aspirin", "fact": "Aspirin irreversibly inhibits COX 1.", "source": "https://r1.org", "confidence": "high"},
+                {"topic": "ibuprofen", "fact": "Ibuprofen is a reversible COX inhibitor.", "source": "https://r2.org", "confidence": "high"},
+            ]
+        )
+        self.assertEqual(self.manager.promote_researched_to_verified(dry_run=True, min_age_days=0), 1)
+
+    def test_promotion_skips_topics_already_verified(self) -> None:
+        self.verified.add_fact(topic="aspirin dosing", fact="Low-dose aspirin is 75 to 100 mg daily.", source="https://v.org")
+        self.researched.add_facts(
+            [{"topic": "aspirin dosing", "fact": "Typical analgesic doses range from 300 to 1000 mg.", "source": "https://r.org", "confidence": "high"}]
+        )
+        self.assertEqual(self.manager.promote_researched_to_verified(dry_run=True, min_age_days=0), 0)
+
+    def test_textbook_chunks_are_indexed_only_on_request(self) -> None:
+        chunk = "Mitochondria produce most of the ATP in eukaryotic cells through oxidative phosphorylation on the inner membrane."
+        self.textbook.add_chunks(book_id="bio", title="Cell Biology", page=1, chunks=[chunk])
+        self.assertEqual(self.manager.detect_conflicts("cell biology", chunk), [])
+        self.assertEqual(self.manager._dup_cursor["textbook"], 0)
+        self.assertEqual([key[0] for key in self.manager.near_duplicates(chunk, stores=("textbook",))], ["textbook"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import os
+import shutil
+import sqlite3
+import tempfile
+import unittest
+from pathlib import Path
+
+from ops.backup_creator import _snapshot_sqlite, create_phase_backup, gc_backup_objects
+from ops.backup_verifier import list_recent_backups, verify_backup_manifest
+
+
+class IncrementalBackupTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.temp_dir = Path(tempfile.mkdtemp(prefix="somi_backup_incremental_"))
+        self.root = self.temp_dir / "project"
+        self.out = self.temp_dir / "backups"
+        (self.root / "ops").mkdir(parents=True)
+        (self.root / "state").mkdir()
+        (self.root / "ops" / "tool.py").write_text("print('ok')\n", encoding="utf-8")
+        (self.root / "ops" / "copy_of_tool.py").write_text("print('ok')\n", encoding="utf-8")
+        (self.root / "README.md").write_text("# project\n", encoding="utf-8")
+        self.db = sqlite3.connect(self.root / "state" / "live.sqlite3")
+        self.db.execute("PRAGMA journal_mode = WAL")
+        self.db.execute("CREATE TABLE rows (value TEXT)")
+        self.db.executemany("INSERT INTO rows VALUES (?)", [(f"row-{idx}",) for idx in range(50)])
+        self.db.commit()
+
+    def tearDown(self) -> None:
+        self.db.close()
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _backup(self, label: str) -> dict:
+        return create_phase_backup(self.root, label=label, include_paths=["ops", "state", "README.md"], output_root=self.out, incremental=True)
+
+    def test_live_sqlite_is_snapshotted_and_unchanged_files_are_linked(self) -> None:
+        self.assertTrue((self.root / "state" / "live.sqlite3-wal").exists())
+        first = self._backup("nightly_a")
+        self.assertTrue(first["ok"], first)
+        self.assertEqual(first["stats"]["stored_files"], 3)
+        self.assertEqual(first["stats"]["deduplicated_files"], 1)
+        self.assertEqual(first["stats"]["sqlite_snapshots"], 1)
+        first_dir = Path(first["backup_dir"])
+        self.assertFalse((first_dir / "state" / "live.sqlite3-wal").exists())
+        with sqlite3.connect(first_dir / "state" / "live.sqlite3") as snap:
+            self.assertEqual(snap.execute("SELECT COUNT(*) FROM rows").fetchone()[0], 50)
+        self.assertTrue(verify_backup_manifest(first_dir)["ok"])
+
+        os.utime(self.out / first_dir.name, (1, 1))
+        second = self._backup("nightly_b")
+        second_dir = Path(second["backup_dir"])
+        self.assertEqual(second["stats"]["reused_files"], 4)
+        self.assertEqual(second["stats"]["stored_files"], 0)
+        self.assertTrue(os.path.samefile(first_dir / "ops" / "tool.py", second_dir / "ops" / "tool.py"))
+        self.assertNotIn(".objects", [row["name"] for row in list_recent_backups(self.out)])
+
+        self.db.execute("INSERT INTO rows VALUES ('late')")
+        self.db.commit()
+        third = self._backup("nightly_c")
+        self.assertEqual(third["stats"]["stored_files"], 1)
+        with sqlite3.connect(Path(third["backup_dir"]) / "state" / "live.sqlite3") as snap:
+            self.assertEqual(snap.execute("SELECT COUNT(*) FROM rows").fetchone()[0], 51)
+
+        shutil.rmtree(first_dir)
+        shutil.rmtree(second_dir)
+        self.assertEqual(gc_backup_objects(self.out)["removed"], 1)
+        self.assertTrue(verify_backup_manifest(third["backup_dir"], deep=True)["ok"])
+
+    def test_snapshot_opens_source_read_only(self) -> None:
+        odd = self.root / "state" / "odd #1?.sqlite3"
+        with sqlite3.connect(odd) as conn:
+            conn.execute("CREATE TABLE rows (value TEXT)")
+            conn.execute("INSERT INTO rows VALUES ('kept')")
+        before = odd.read_bytes()
+        _snapshot_sqlite(odd, self.temp_dir / "snap.sqlite3")
+        with sqlite3.connect(self.temp_dir / "snap.sqlite3") as snap:
+            self.assertEqual(snap.execute("SELECT value FROM rows").fetchall(), [("kept",)])
+        self.assertEqual(odd.read_bytes(), before)
+        with self.assertRaises(sqlite3.OperationalError):
+            _snapshot_sqlite(self.root / "state" / "missing.sqlite3", self.temp_dir / "missing.sqlite3")
+        self.assertFalse((self.root / "state" / "missing.sqlite3").exists())
+
+    def test_manifest_verification_catches_missing_and_altered_files(self) -> None:
+        backup_dir = Path(self._backup("nightly")["backup_dir"])
+        readme = backup_dir / "README.md"
+        readme.unlink()
+        readme.write_text("# pr0ject\n", encoding="utf-8")
+        (backup_dir / "ops" / "tool.py").unlink()
+        report = verify_backup_manifest(backup_dir)
+        self.assertFalse(report["ok"])
+        reasons = {row["path"]: row["reason"] for row in report["mismatched"]}
+        self.assertEqual(reasons, {"README.md": "sha256", "ops/tool.py": "missing"})
+
+
+if __name__ == "__main__":
+    unittest.main()
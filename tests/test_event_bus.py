@@ -0,0 +1,161 @@
+from __future__ import annotations
+
+import asyncio
+import shutil
+import tempfile
+import threading
+import types
+import unittest
+from pathlib import Path
+
+from gateway.service import GatewayService
+from heartbeat.integrations.gui_bridge import HeartbeatGUIBridge
+from heartbeat.service import HeartbeatService
+from runtime.event_bus import EventBus
+
+
+class EventBusTests(unittest.TestCase):
+    def test_rings_are_bounded_per_subscriber_and_filtered_by_prefix(self) -> None:
+        bus = EventBus(history=8, subscriber_capacity=3)
+        small = bus.subscribe(["gateway."])
+        nodes = bus.subscribe(["gateway.node"], capacity=10)
+        for idx in range(5):
+            bus.publish("gateway.node", {"n": idx})
+        bus.publish("heartbeat.ui", {"n": 99})
+
+        self.assertEqual([e["payload"]["n"] for e in small.poll()], [2, 3, 4])
+        self.assertEqual(small.dropped, 2)
+        self.assertEqual(small.cursor, 5)
+        self.assertEqual(len(nodes.poll()), 5)
+        self.assertEqual(small.poll(), [])
+
+        nodes.close()
+        bus.publish("gateway.node", {"n": 5})
+        self.assertEqual(nodes.poll(), [])
+        self.assertEqual(bus.subscriber_count, 1)
+
+    def test_since_resumes_from_cursor_and_reports_gaps(self) -> None:
+        bus = EventBus(history=4)
+        for idx in range(3):
+            bus.publish("t", {"n": idx})
+        page = bus.since(1, limit=1)
+        self.assertEqual(([e["seq"] for e in page["events"]], page["cursor"], page["gap"]), ([2], 2, False))
+        self.assertEqual([e["seq"] for e in bus.since(page["cursor"])["events"]], [3])
+        resumed = bus.subscribe(since=2)
+        self.assertEqual([e["seq"] for e in resumed.poll()], [3])
+
+        for idx in range(6):
+            bus.publish("t", {"n": idx})
+        self.assertTrue(bus.since(2)["gap"])
+        self.assertEqual(bus.since(bus.last_seq), {"events": [], "cursor": bus.last_seq, "gap": False})
+
+    def test_async_consumer_wakes_on_publish_from_another_thread(self) -> None:
+        bus = EventBus()
+        sub = bus.subscribe(["job."])
+
+        async def consume() -> list[dict]:
+            threading.Timer(0.05, lambda: bus.publish("job.done", {"ok": True})).start()
+            return await sub.next_batch(timeout=2.0)
+
+        batch = asyncio.run(consume())
+        self.assertEqual([e["topic"] for e in batch], ["job.done"])
+        self.assertEqual(asyncio.run(sub.next_batch(timeout=0.01)), [])
+
+    def test_concurrent_publishers_and_late_subscribers_see_contiguous_sequences(self) -> None:
+        bus = EventBus(history=20000, subscriber_capacity=20000)
+        early = bus.subscribe()
+        late: list = []
+
+        def publish_many() -> None:
+            for idx in range(2000):
+                bus.publish("t", {"n": idx})
+
+        def join_midway() -> None:
+            late.append(bus.subscribe(since=0))
+
+        threads = [threading.Thread(target=publish_many) for _ in range(4)] + [threading.Thread(target=join_midway)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual([e["seq"] for e in early.poll()], list(range(1, 8001)))
+        self.assertEqual([e["seq"] for e in late[0].poll()], list(range(1, 8001)))
+        self.assertEqual(bus.last_seq, 8000)
+
+
+class EventBusIntegrationTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.temp_dir = Path(tempfile.mkdtemp(prefix="somi_event_bus_"))
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_heartbeat_ui_events_fan_out_to_subscribers(self) -> None:
+        settings = types.SimpleNamespace(SYSTEM_TIMEZONE="UTC", HB_MAX_EVENTS_BUFFER=16, HB_LOG_PATH=str(self.temp_dir / "hb.log"))
+        service = HeartbeatService(settings_module=settings)
+        self.addCleanup(lambda: [h.close() for h in list(service._logger.handlers)])
+        panel = service.subscribe_events()
+        debug = service.subscribe_events(ui_only=False)
+        service._emit_lifecycle("Heartbeat test boot")
+
+        self.assertEqual([e["payload"]["title"] for e in panel.poll()], ["Heartbeat test boot"])
+        self.assertEqual(len(debug.poll()), 1)
+        self.assertEqual([e["title"] for e in service.drain_events(10)], ["Heartbeat test boot"])
+
+    def test_gui_bridge_polls_its_own_subscription(self) -> None:
+        settings = types.SimpleNamespace(SYSTEM_TIMEZONE="UTC", HB_MAX_EVENTS_BUFFER=16, HB_LOG_PATH=str(self.temp_dir / "hb.log"))
+        service = HeartbeatService(settings_module=settings)
+        self.addCleanup(lambda: [h.close() for h in list(service._logger.handlers)])
+        service._emit_lifecycle("Heartbeat test boot")
+        bridge = HeartbeatGUIBridge(service)
+        service._emit_lifecycle("Heartbeat resumed")
+
+        self.assertEqual([e["title"] for e in bridge.poll_events()], ["Heartbeat test boot", "Heartbeat resumed"])
+        self.assertEqual(bridge.poll_events(), [])
+        self.assertEqual(len(service.drain_events(10)), 2)
+
+    def test_gateway_status_deltas_follow_writes(self) -> None:
+        service = GatewayService(root_dir=self.temp_dir / "gateway")
+        panel = service.subscribe_status(kinds=["health"])
+        first = service.status_deltas()
+        self.assertTrue(first["resync"])
+
+        service.record_health(service_id="telegram-bot", surface="telegram", status="healthy", summary="Polling")
+        service.publish_event(event_type="note", surface="gui", title="Hello")
+        delta = service.status_deltas(cursor=first["cursor"])
+        self.assertFalse(delta["resync"])
+        self.assertEqual([row["kind"] for row in delta["rows"]], ["event", "health"])
+        self.assertEqual(service.status_deltas(cursor=delta["cursor"])["rows"], [])
+        self.assertEqual([e["payload"]["title"] for e in panel.poll()], ["telegram-bot"])
+        self.assertIn(delta["rows"][1], service.status_feed(limit=10))
+
+    def test_snapshot_status_feed_sees_writes_from_other_services(self) -> None:
+        service = GatewayService(root_dir=self.temp_dir / "gateway")
+        self.assertEqual(service.snapshot(limit=8)["status_feed"], [])
+
+        other = GatewayService(root_dir=self.temp_dir / "gateway")
+        other.record_health(service_id="telegram-bot", surface="telegram", status="healthy", summary="Polling")
+        other.store.flush()
+        feed = service.snapshot(limit=8)["status_feed"]
+        self.assertEqual([row["title"] for row in feed], ["telegram-bot"])
+        self.assertEqual(feed, service.status_feed(limit=8))
+
+    def test_cursor_from_before_a_restart_forces_a_resync(self) -> None:
+        service = GatewayService(root_dir=self.temp_dir / "gateway")
+        service.record_health(service_id="telegram-bot", surface="telegram", status="healthy", summary="Polling")
+        service.publish_event(event_type="note", surface="gui", title="Hello")
+        cursor = service.status_deltas()["cursor"]
+        service.store.flush()
+
+        restarted = GatewayService(root_dir=self.temp_dir / "gateway")
+        restarted.publish_event(event_type="note", surface="gui", title="After restart")
+        delta = restarted.status_deltas(cursor=cursor)
+        self.assertTrue(delta["resync"])
+        self.assertEqual(delta["cursor"], restarted.bus.last_seq)
+        self.assertIn("After restart", [row["title"] for row in delta["rows"]])
+        self.assertTrue(EventBus().since(5)["gap"])
+
+
+if __name__ == "__main__":
+    unittest.main()
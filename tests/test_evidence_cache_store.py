@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import json
+import shutil
+import tempfile
+import unittest
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+from workshop.toolbox.stacks.research_core.evidence_cache import EvidenceCacheStore, query_signature
+
+
+class EvidenceCacheStoreTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.temp_dir = Path(tempfile.mkdtemp(prefix="somi_evidence_cache_"))
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_reordered_and_near_queries_resume_the_same_bundle(self) -> None:
+        store = EvidenceCacheStore(self.temp_dir)
+        store.save("latest hypertension guidelines", {"rows": [{"url": "https://who.int/a"}]}, mode="deep")
+        self.assertEqual(query_signature("What are the latest hypertension guidelines?"), "guidelines hypertension latest")
+
+        exact = store.load("Latest  hypertension guidelines", mode="deep")
+        self.assertEqual(exact["cache_match"], "exact")
+        reordered = store.load("hypertension guidelines latest", mode="deep")
+        self.assertEqual(reordered["cache_match"], "signature")
+        self.assertEqual(reordered["rows"][0]["url"], "https://who.int/a")
+
+        store.save("adult hypertension treatment guidelines 2025 update", {"rows": []}, mode="deep")
+        near = store.load("adult hypertension treatment guidelines 2025 update summary", mode="deep")
+        self.assertEqual(near["cache_match"], "near")
+        self.assertIsNone(store.load("adult hypertension treatment guidelines 2024 update summary", mode="deep"))
+        self.assertIsNone(store.load("adult hypertension treatment guidelines 2025", mode="deep"))
+        self.assertIsNone(store.load("hypertension guidelines latest", mode="quick"))
+        self.assertAlmostEqual(store.hit_rate(), 3 / 6)
+
+    def test_expired_bundles_miss_and_are_pruned_by_index(self) -> None:
+        store = EvidenceCacheStore(self.temp_dir, max_records=32, prune_every=4)
+        past = datetime.now(timezone.utc) - timedelta(hours=2)
+        store.save("old solar storm news", {"saved_at": past.isoformat(), "expires_at": (past + timedelta(minutes=30)).isoformat()}, mode="deep")
+        self.assertIsNone(store.load("old solar storm news", mode="deep"))
+        self.assertEqual(store.stats["expired"], 1)
+
+        for i in range(40):
+            store.save(f"query number {i} about topic {i}", {"rows": []}, mode="deep")
+        self.assertLessEqual(store.count(), 32 + store.prune_every)
+        store._prune()
+        self.assertEqual(store.count(), 32)
+        self.assertEqual(len(list(self.temp_dir.glob("*.json"))), 32)
+        self.assertIsNotNone(store.load("query number 39 about topic 39", mode="deep"))
+
+    def test_existing_bundle_files_are_indexed(self) -> None:
+        (self.temp_dir / "legacy.json").write_text(json.dumps({"query": "water filter maintenance", "mode": "deep"}), encoding="utf-8")
+        store = EvidenceCacheStore(self.temp_dir)
+        payload = store.load("maintenance water filter", mode="deep")
+        self.assertEqual(payload["query"], "water filter maintenance")
+
+
+if __name__ == "__main__":
+    unittest.main()
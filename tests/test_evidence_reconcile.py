@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import copy
+import unittest
+
+from audit.evidence_benchmark import QUESTION, build_synthetic_bundle, run_benchmark
+from workshop.toolbox.stacks.research_core.evidence_claims import ClaimCandidate
+from workshop.toolbox.stacks.research_core.evidence_reconcile import reconcile_claims
+from workshop.toolbox.stacks.research_core.evidence_schema import EvidenceItem
+from workshop.toolbox.stacks.research_core.evidence_scoring import score_item, score_items
+
+
+def _item(item_id: str, domain: str, **extra) -> EvidenceItem:
+    row = {"title": "Study", "url": f"https://{domain}/{item_id}", "source_type": "academic", "published_date": None, "retrieved_at": "2026-01-01"}
+    row.update(extra)
+    return EvidenceItem(id=item_id, domain=domain, **row)
+
+
+class EvidenceReconcileTests(unittest.TestCase):
+    def test_opposing_and_numeric_conflicts_are_reported(self) -> None:
+        items = {"a": _item("a", "a.org"), "b": _item("b", "b.org"), "c": _item("c", "c.org")}
+        candidates = [
+            ClaimCandidate(text="Metformin will reduce cardiovascular mortality in elderly adults", item_id="a"),
+            ClaimCandidate(text="Metformin makes cardiovascular mortality worse among elderly adults", item_id="b"),
+            ClaimCandidate(
+                text="Metformin lowers fasting glucose by 30 percent within twelve weeks",
+                item_id="c",
+                numbers={"values": [{"value": 30.0}]},
+            ),
+            ClaimCandidate(
+                text="Metformin lowers fasting glucose by 10 percent within twelve weeks overall",
+                item_id="a",
+                numbers={"values": [{"value": 10.0}]},
+            ),
+            ClaimCandidate(text="Unrelated remark about hospital parking", item_id="b", numbers={"values": []}),
+        ]
+        claims, conflicts = reconcile_claims(candidates, items_by_id=items)
+        kinds = sorted(row["type"] for row in conflicts if row["claim_a"])
+        self.assertEqual(kinds, ["directional", "numeric"])
+        by_text = {claim.text: claim for claim in claims}
+        self.assertEqual(by_text[candidates[0].text].contradicting_item_ids, ["b"])
+
+    def test_indexed_pass_matches_all_pairs_baseline(self) -> None:
+        rows = run_benchmark([150])
+        self.assertTrue(rows[0]["conflicts_match"])
+        self.assertGreater(rows[0]["conflicts"], 0)
+
+
+class EvidenceScoringTests(unittest.TestCase):
+    def test_batch_scores_match_single_item_scoring(self) -> None:
+        _, items = build_synthetic_bundle(300)
+        batch = list(items.values())
+        batch[0].title = "Metformin-reduce: MORTALITY!! adults123"
+        for question in (QUESTION, "", "C++ vs c# and .net"):
+            scored = score_items(copy.deepcopy(batch), question=question, needs_recency=True)
+            looped = copy.deepcopy(batch)
+            for item in looped:
+                item.score, item.score_breakdown = score_item(item, question=question, needs_recency=True)
+            looped.sort(key=lambda x: x.score, reverse=True)
+            self.assertEqual(
+                [(x.id, x.score, x.score_breakdown) for x in scored],
+                [(x.id, x.score, x.score_breakdown) for x in looped],
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import shutil
+import sqlite3
+import tempfile
+import time
+import unittest
+from pathlib import Path
+
+from gateway.service import GatewayService
+from gateway.store import GatewayStore
+
+
+def _presence(node: int, beat: int) -> dict:
+    return {
+        "session_id": f"sess-{node}",
+        "client_id": f"node-{node}",
+        "user_id": "u",
+        "surface": "node",
+        "status": "online",
+        "activity": "heartbeat",
+        "detail": f"beat {beat}",
+        "updated_at": f"2026-01-01T00:00:{beat:02d}+00:00",
+        "metadata": {"beat": beat},
+    }
+
+
+class GatewayStorePoolTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.temp_dir = Path(tempfile.mkdtemp(prefix="somi_gateway_pool_"))
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _raw_count(self, store: GatewayStore, table: str) -> int:
+        with sqlite3.connect(store.db_path) as conn:
+            return int(conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0])
+
+    def test_heartbeats_coalesce_into_one_transaction_and_reads_see_them(self) -> None:
+        store = GatewayStore(root_dir=self.temp_dir, coalesce_seconds=60.0)
+        self.addCleanup(store.close)
+        for beat in range(5):
+            for node in range(20):
+                returned = store.upsert_presence(_presence(node, beat))
+                store.record_health({"service_id": f"node-{node}", "surface": "Node", "status": "healthy", "updated_at": returned["updated_at"]})
+        self.assertEqual(returned["metadata"], {"beat": 4})
+        self.assertEqual(self._raw_count(store, "gateway_presence"), 0)
+
+        self.assertEqual(store.get_presence("sess-3")["detail"], "beat 4")
+        self.assertEqual(store.flush_count, 1)
+        self.assertEqual(self._raw_count(store, "gateway_presence"), 20)
+        self.assertEqual(len(store.list_health(limit=50)), 20)
+        self.assertEqual(store.get_health(service_id="node-3", surface="node")["status"], "healthy")
+        self.assertLessEqual(store._pool.opened, 2)
+
+    def test_timer_and_batch_size_trigger_flushes(self) -> None:
+        store = GatewayStore(root_dir=self.temp_dir, coalesce_seconds=0.05, coalesce_max=10)
+        self.addCleanup(store.close)
+        for node in range(10):
+            store.upsert_presence(_presence(node, 1))
+        self.assertEqual(self._raw_count(store, "gateway_presence"), 10)
+
+        store.upsert_presence(_presence(99, 1))
+        deadline = time.time() + 2.0
+        while self._raw_count(store, "gateway_presence") < 11 and time.time() < deadline:
+            time.sleep(0.02)
+        self.assertEqual(self._raw_count(store, "gateway_presence"), 11)
+
+    def test_write_through_mode_and_service_events(self) -> None:
+        store = GatewayStore(root_dir=self.temp_dir / "direct", pool_size=0, coalesce_seconds=0.0)
+        store.upsert_presence(_presence(1, 1))
+        self.assertEqual(self._raw_count(store, "gateway_presence"), 1)
+        self.assertEqual(store.flush_count, 0)
+
+        service = GatewayService(root_dir=self.temp_dir / "svc")
+        self.addCleanup(service.store.close)
+        event = service.publish_event(event_type="note", surface="gui", title="Hello", metadata={"k": 1})
+        self.assertEqual(service.store.get_event(event["event_id"])["metadata"], {"k": 1})
+        self.assertEqual([row["title"] for row in service.store.list_events(limit=5)], ["Hello"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import os
+import shutil
+import subprocess
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from workshop.toolbox.stacks.research_core import github_local
+from workshop.toolbox.stacks.research_core.github_cache import RepoInspectionCache, RepoMirrorPool
+
+_REPO_URL = "https://github.com/example/widget"
+
+
+def _git(args: list[str], cwd: Path) -> str:
+    env = dict(os.environ, GIT_AUTHOR_NAME="t", GIT_AUTHOR_EMAIL="t@e", GIT_COMMITTER_NAME="t", GIT_COMMITTER_EMAIL="t@e")
+    return subprocess.run(["git", *args], cwd=cwd, env=env, check=True, capture_output=True, text=True).stdout.strip()
+
+
+class GitHubInspectionCacheTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.temp_dir = Path(tempfile.mkdtemp(prefix="somi_github_cache_"))
+        self.work = self.temp_dir / "widget"
+        self.work.mkdir()
+        _git(["init", "-q", "-b", "main"], self.work)
+        (self.work / "README.md").write_text("# Widget\n\nWidget is a small library that renders dashboards quickly.\n", encoding="utf-8")
+        (self.work / "pyproject.toml").write_text('[project]\nname = "widget"\n', encoding="utf-8")
+        _git(["add", "."], self.work)
+        _git(["commit", "-q", "-m", "initial import"], self.work)
+        _git(["tag", "v1.0"], self.work)
+        self.git_url = self.work.resolve().as_uri()
+        self.cache = RepoInspectionCache(self.temp_dir / "cache")
+        self.git_calls: list[list[str]] = []
+        real_run_git = github_local._run_git
+
+        def spy(args, **kwargs):
+            self.git_calls.append(list(args))
+            return real_run_git(args, **kwargs)
+
+        self._patches = [
+            patch.object(github_local, "_run_git", spy),
+            patch.object(github_local, "_fetch_text", lambda *_a, **_k: ""),
+        ]
+        for item in self._patches:
+            item.start()
+
+    def tearDown(self) -> None:
+        for item in reversed(self._patches):
+            item.stop()
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _inspect(self, **kwargs) -> github_local.GitHubInspection:
+        self.git_calls.clear()
+        return github_local.inspect_github_repository(_REPO_URL, git_url=self.git_url, cache=self.cache, **kwargs)
+
+    def test_mirror_inspection_is_reused_until_head_moves(self) -> None:
+        mirrors = RepoMirrorPool(self.temp_dir / "mirrors", run_git=lambda *a, **k: github_local._run_git(*a, **k))
+        first = self._inspect(mirrors=mirrors)
+        self.assertEqual(first.inspection_method, "mirror")
+        self.assertEqual(first.default_branch, "main")
+        self.assertEqual(first.tags, ["v1.0"])
+        self.assertEqual(first.head_sha, _git(["rev-parse", "HEAD"], self.work))
+        self.assertIn("pyproject.toml", first.manifests)
+        self.assertIn("renders dashboards", first.readme_excerpt)
+        self.assertFalse(first.from_cache)
+
+        second = self._inspect(mirrors=mirrors)
+        self.assertTrue(second.from_cache)
+        self.assertEqual([call[0] for call in self.git_calls], ["ls-remote"])
+        self.assertEqual(second.summary, first.summary)
+
+        (self.work / "README.md").write_text("# Widget\n\nWidget now streams dashboards over websockets.\n", encoding="utf-8")
+        _git(["commit", "-qam", "streaming"], self.work)
+        third = self._inspect(mirrors=mirrors)
+        self.assertFalse(third.from_cache)
+        self.assertIn("fetch", [call[0] for call in self.git_calls])
+        self.assertNotIn("clone", [call[0] for call in self.git_calls])
+        self.assertIn("streams dashboards", third.readme_excerpt)
+        self.assertIn("streaming", third.latest_commit)
+
+    def test_clone_fallback_result_is_cached(self) -> None:
+        first = self._inspect(use_cache=True)
+        self.assertEqual(first.inspection_method, "clone")
+        self.assertIn("pyproject.toml", first.manifests)
+        second = self._inspect()
+        self.assertTrue(second.from_cache)
+        self.assertEqual(len(self.git_calls), 1)
+        uncached = self._inspect(use_cache=False)
+        self.assertFalse(uncached.from_cache)
+        self.assertIn("clone", [call[0] for call in self.git_calls])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+import gzip
+import json
+import shutil
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from ops import OpsControlPlane
+from runtime.jsonl_log import (
+    JsonlOffsetIndex,
+    JsonlRotation,
+    append_jsonl,
+    iter_jsonl_reverse,
+    rotate_jsonl,
+    rotated_segments,
+    tail_jsonl,
+)
+
+
+class JsonlLogTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.temp_dir = Path(tempfile.mkdtemp(prefix="somi_jsonl_log_"))
+        self.path = self.temp_dir / "events.jsonl"
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_tail_reads_backwards_across_blocks_and_skips_noise(self) -> None:
+        lines = [json.dumps({"n": idx, "pad": "x" * (idx % 97)}) for idx in range(3000)]
+        lines.insert(1500, "not json")
+        lines.insert(10, "[1, 2]")
+        self.path.write_text("\n".join(lines) + "\n" + '{"n": "partial', encoding="utf-8")
+
+        self.assertEqual([row["n"] for row in tail_jsonl(self.path, limit=3)], [2997, 2998, 2999])
+        everything = tail_jsonl(self.path, limit=10000)
+        self.assertEqual([row["n"] for row in everything], list(range(3000)))
+        self.assertEqual(tail_jsonl(self.temp_dir / "missing.jsonl", limit=5), [])
+        self.assertEqual(tail_jsonl(self.path, limit=0), [])
+
+    def test_rotation_keeps_tail_continuous_and_prunes_segments(self) -> None:
+        rotation = JsonlRotation(max_bytes=100, keep_segments=2)
+        for idx in range(60):
+            append_jsonl(self.path, {"n": idx}, rotation=rotation)
+        segments = rotated_segments(self.path)
+        self.assertEqual(len(segments), 2)
+        with gzip.open(segments[-1], "rt", encoding="utf-8") as handle:
+            self.assertTrue(all(json.loads(line)["n"] < 60 for line in handle))
+
+        newest = [row["n"] for row in iter_jsonl_reverse(self.path)]
+        self.assertEqual(newest[:5], [59, 58, 57, 56, 55])
+        self.assertEqual(newest, sorted(newest, reverse=True))
+        self.assertEqual(newest, list(range(59, 59 - len(newest), -1)))
+        self.assertGreater(len(newest), len(tail_jsonl(self.path, limit=1000, include_rotated=False)))
+
+    def test_offset_index_is_incremental_and_reset_by_rotation(self) -> None:
+        for idx in range(10):
+            append_jsonl(self.path, {"n": idx})
+        index = JsonlOffsetIndex(self.path, stride=4).refresh()
+        self.assertEqual(index.rows, 10)
+        self.assertEqual(len(index.offsets), 3)
+        for idx in range(10, 13):
+            append_jsonl(self.path, {"n": idx})
+        reopened = JsonlOffsetIndex(self.path, stride=4)
+        self.assertEqual(reopened.rows, 10)
+        self.assertEqual([row["n"] for row in reopened.read_rows(9, 3)], [9, 10, 11])
+        self.assertEqual(reopened.rows, 13)
+
+        append_jsonl(self.path, {"n": 13}, rotation=JsonlRotation(max_bytes=1))
+        self.assertEqual(JsonlOffsetIndex(self.path, stride=4).refresh().rows, 1)
+
+    def test_age_rotation_counts_from_the_first_indexed_append(self) -> None:
+        rotation = JsonlRotation(max_age_seconds=3600.0)
+        for idx in range(3):
+            append_jsonl(self.path, {"n": idx}, rotation=rotation)
+        self.assertEqual(rotated_segments(self.path), [])
+
+        with mock.patch("runtime.jsonl_log.time.time", return_value=time.time() + 3601.0):
+            append_jsonl(self.path, {"n": 3}, rotation=rotation)
+        self.assertEqual(len(rotated_segments(self.path)), 1)
+        self.assertEqual([row["n"] for row in tail_jsonl(self.path, limit=10, include_rotated=False)], [3])
+        self.assertEqual([row["n"] for row in tail_jsonl(self.path, limit=10)], [0, 1, 2, 3])
+
+    def test_crashed_rotation_stays_readable_and_is_finished_next_time(self) -> None:
+        for idx in range(5):
+            append_jsonl(self.path, {"n": idx})
+        self.path.rename(self.temp_dir / "events.20260101T000000000000Z.rotating")
+        for idx in range(5, 8):
+            append_jsonl(self.path, {"n": idx})
+
+        self.assertEqual([row["n"] for row in tail_jsonl(self.path, limit=100)], list(range(8)))
+        segment = rotate_jsonl(self.path)
+        self.assertEqual([item.name for item in rotated_segments(self.path)], ["events.20260101T000000000000Z.jsonl.gz", segment.name])
+        self.assertEqual(list(self.temp_dir.glob("*.rotating")), [])
+        self.assertEqual([row["n"] for row in tail_jsonl(self.path, limit=100)], list(range(8)))
+
+    def test_control_plane_snapshot_reads_latest_rows(self) -> None:
+        plane = OpsControlPlane(root_dir=self.temp_dir / "ops")
+        for idx in range(50):
+            plane.record_event("probe", {"idx": idx})
+        events = plane.snapshot(event_limit=5)["recent_events"]
+        self.assertEqual([row["payload"]["idx"] for row in events], [45, 46, 47, 48, 49])
+
+
+if __name__ == "__main__":
+    unittest.main()
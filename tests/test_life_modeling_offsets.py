@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+import json
+from datetime import datetime, timedelta, timezone
+
+from executive.life_modeling.artifact_store import ArtifactStore
+from executive.life_modeling.indexer import Indexer
+
+
+def _iso(days: float) -> str:
+    return (datetime.now(timezone.utc) + timedelta(days=days)).isoformat()
+
+
+def test_read_latest_follows_appends_and_rewrites(tmp_path):
+    store = ArtifactStore(root_dir=str(tmp_path / "artifacts"))
+    assert store.read_latest("heartbeat_v2") is None
+    for idx, age in enumerate([40, 3, 10, 1]):
+        store.write("heartbeat_v2", {"summary": f"hb{idx}", "updated_at": _iso(-age)})
+    assert store.read_latest("heartbeat_v2")["summary"] == "hb3"
+
+    store.write("heartbeat_v2", {"summary": "hb4", "updated_at": _iso(-2)})
+    assert store.read_latest("heartbeat_v2")["summary"] == "hb4"
+
+    path = tmp_path / "artifacts" / "heartbeat_v2.jsonl"
+    with path.open("a", encoding="utf-8") as f:
+        f.write(json.dumps({"summary": "unterminated", "updated_at": _iso(0)}))
+    assert store.read_latest("heartbeat_v2")["summary"] == "unterminated"
+
+    path.write_text(json.dumps({"summary": "fresh", "updated_at": _iso(0)}) + "\n", encoding="utf-8")
+    assert store.read_latest("heartbeat_v2")["summary"] == "fresh"
+
+
+def test_indexer_recent_lookup_uses_cached_time_index(tmp_path):
+    art = tmp_path / "artifacts"
+    art.mkdir()
+    (art / "old.jsonl").write_text(json.dumps({"artifact_type": "task_state", "timestamp": _iso(-20)}) + "\n", encoding="utf-8")
+    (art / "new.jsonl").write_text(json.dumps({"artifact_type": "thread_summary", "timestamp": _iso(-1)}) + "\n", encoding="utf-8")
+    idx = Indexer(artifacts_dir=str(art), index_dir=str(tmp_path / "idx"))
+    idx.build_or_update_index()
+    mtime = idx.index_path.stat().st_mtime_ns
+
+    assert [m["artifact_type"] for m in idx.iter_recent_artifacts(7)] == ["thread_summary"]
+    assert [m["artifact_type"] for m in idx.iter_recent_artifacts(30)] == ["task_state", "thread_summary"]
+    assert list(idx.iter_recent_artifacts(30, types=["task_state"]))[0]["path"].endswith("old.jsonl")
+
+    idx.build_or_update_index()
+    assert idx.index_path.stat().st_mtime_ns == mtime
+
+    # Another writer replacing the index file is picked up on the next lookup.
+    other = Indexer(artifacts_dir=str(art), index_dir=str(tmp_path / "idx"))
+    (art / "old.jsonl").unlink()
+    other.build_or_update_index()
+    assert [m["artifact_type"] for m in idx.iter_recent_artifacts(30)] == ["thread_summary"]
@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import json
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+
+from audit.local_pack_benchmark import run_benchmark
+from workshop.toolbox.stacks.research_core.local_pack_index import LocalPackIndex, chunk_text
+from workshop.toolbox.stacks.research_core.local_packs import resolve_local_pack_url, search_local_pack_rows
+
+
+class LocalPackIndexTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.temp_dir = Path(tempfile.mkdtemp(prefix="somi_pack_index_"))
+        self._seed_pack("water_basics", "survival", ["water"], "Water safety.", "purify.md", "# Purify water\nBoil water before drinking.\n")
+        self._seed_pack("radio_basics", "infrastructure", ["radio"], "Radio relay.", "relay.md", "# Radio relay\nUse a repeater.\n")
+        self.index = LocalPackIndex(self.temp_dir, refresh_interval_s=0.0)
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _seed_pack(self, pack_id: str, category: str, tags: list[str], summary: str, doc_name: str, doc_text: str) -> None:
+        pack_dir = self.temp_dir / "knowledge_packs" / pack_id
+        pack_dir.mkdir(parents=True, exist_ok=True)
+        manifest = {"id": pack_id, "category": category, "summary": summary, "tags": tags, "variant": "compact"}
+        (pack_dir / "manifest.json").write_text(json.dumps(manifest), encoding="utf-8")
+        (pack_dir / doc_name).write_text(doc_text, encoding="utf-8")
+
+    def test_refresh_rebuilds_only_changed_packs(self) -> None:
+        self.assertEqual(self.index.refresh(force=True)["rebuilt"], 2)
+        self.assertEqual(self.index.refresh(force=True)["unchanged"], 2)
+
+        doc = self.temp_dir / "knowledge_packs" / "radio_basics" / "relay.md"
+        doc.write_text(doc.read_text(encoding="utf-8") + "Log every contact.\n", encoding="utf-8")
+        stats = self.index.refresh(force=True)
+        self.assertEqual((stats["rebuilt"], stats["unchanged"]), (1, 1))
+
+        shutil.rmtree(self.temp_dir / "knowledge_packs" / "water_basics")
+        stats = self.index.refresh(force=True)
+        self.assertEqual(stats["removed"], 1)
+        self.assertEqual(self.index.stats()["packs"], 1)
+
+    def test_search_uses_index_and_keeps_row_shape(self) -> None:
+        rows = search_local_pack_rows(self.temp_dir, "how do i purify water", limit=2)
+        self.assertTrue(rows)
+        self.assertEqual(rows[0]["pack_id"], "water_basics")
+        self.assertEqual(rows[0]["knowledge_origin"], "bundled_local_pack")
+        self.assertTrue((self.temp_dir / "sessions" / "knowledge_pack_index" / "pack_index.sqlite3").exists())
+
+        resolved = resolve_local_pack_url(self.temp_dir, rows[0]["url"])
+        self.assertIn("Boil water", resolved["content"])
+        self.assertEqual(len(resolved["sha256"]), 64)
+
+    def test_search_sees_new_documents_after_refresh(self) -> None:
+        self.assertEqual(self.index.search("quagga"), [])
+        self._seed_pack("zoo_basics", "survival", [], "", "zoo.md", "# Zoo\nThe quagga is extinct.\n")
+        rows = self.index.search("quagga")
+        self.assertEqual([row["pack_id"] for row in rows], ["zoo_basics"])
+
+    def test_partial_words_still_match(self) -> None:
+        self._seed_pack("bp_basics", "medical", [], "", "bp.md", "# Blood pressure\nHypertension needs follow-up.\n")
+        self.assertEqual([row["pack_id"] for row in self.index.search("hyperten")], ["bp_basics"])
+        self.assertEqual(self.index.search("pertens"), [])
+        rows = search_local_pack_rows(self.temp_dir, "pertens", limit=2)
+        self.assertEqual([row["pack_id"] for row in rows], ["bp_basics"])
+
+    def test_chunk_text_respects_limit(self) -> None:
+        chunks = chunk_text("alpha " * 50 + "\n\n" + "beta " * 50, max_chars=120)
+        self.assertTrue(len(chunks) >= 3)
+        self.assertTrue(all(len(chunk) <= 120 for chunk in chunks))
+
+    def test_benchmark_reports_latency_per_size(self) -> None:
+        results = run_benchmark([2], docs_per_pack=2, repeat=1)
+        self.assertEqual(results[0]["documents"], 4)
+        self.assertEqual(results[0]["packs_rebuilt_incremental"], 1)
+        self.assertIn("p95_ms", results[0]["indexed"])
+        self.assertIn("p95_ms", results[0]["scan"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+import shutil
+import sqlite3
+import tempfile
+import unittest
+from pathlib import Path
+
+from ops.control_plane import OpsControlPlane
+from ops.metrics_store import MetricsRollupStore, resolution_for_window
+from ops.observability import build_observability_digest
+
+_NOW = 1_800_000_000.0
+
+
+class MetricsRollupTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.temp_dir = Path(tempfile.mkdtemp(prefix="somi_metrics_rollup_"))
+        self.store = MetricsRollupStore(self.temp_dir / "rollup.sqlite3")
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_summary_reports_counts_errors_and_percentiles(self) -> None:
+        for idx in range(100):
+            self.store.record(
+                metric_type="tool",
+                name="browser_fetch",
+                latency_ms=4000 if idx >= 90 else 80,
+                channel="chat" if idx % 2 else "telegram",
+                status="failed" if idx % 10 == 0 else "ok",
+                ts=_NOW - idx,
+            )
+        (row,) = self.store.summarize(window_seconds=3600, now=_NOW)
+        self.assertEqual(row["count"], 100)
+        self.assertEqual(row["error_count"], 10)
+        self.assertEqual(row["channels"], ["chat", "telegram"])
+        self.assertEqual(row["max_latency_ms"], 4000)
+        self.assertLessEqual(row["p50_latency_ms"], 100)
+        self.assertGreater(row["p95_latency_ms"], 2500)
+        self.assertLessEqual(row["p99_latency_ms"], 4000)
+        self.assertEqual(row["resolution"], "minute")
+
+    def test_windows_pick_resolution_and_old_buckets_are_pruned(self) -> None:
+        self.assertEqual(resolution_for_window(3600), "minute")
+        self.assertEqual(resolution_for_window(7 * 86400), "hour")
+        self.assertEqual(resolution_for_window(90 * 86400), "day")
+
+        self.store.record(metric_type="model", name="somi-main", latency_ms=900, channel="chat", status="completed", ts=_NOW - 10 * 86400)
+        self.store.record(metric_type="model", name="somi-main", latency_ms=1500, channel="research", status="error", ts=_NOW)
+        self.assertEqual(self.store.summarize(window_seconds=3600, now=_NOW)[0]["count"], 1)
+        week = self.store.summarize(window_seconds=30 * 86400, now=_NOW)[0]
+        self.assertEqual((week["count"], week["error_count"], week["resolution"]), (2, 1, "hour"))
+        self.assertEqual(week["statuses"], ["completed", "error"])
+
+        with sqlite3.connect(self.temp_dir / "rollup.sqlite3") as conn:
+            minute_rows = conn.execute("SELECT COUNT(*) FROM rollups WHERE resolution = 'minute'").fetchone()[0]
+            hour_rows = conn.execute("SELECT COUNT(*) FROM rollups WHERE resolution = 'hour'").fetchone()[0]
+        self.assertEqual(minute_rows, 1)
+        self.assertEqual(hour_rows, 2)
+
+    def test_snapshot_digest_uses_rollups_beyond_the_raw_tail(self) -> None:
+        ops = OpsControlPlane(root_dir=self.temp_dir / "ops")
+        for _ in range(5):
+            ops.record_tool_metric(
+                tool_name="browser_fetch", success=False, elapsed_ms=5200, backend="local", channel="chat", risk_tier="LOW", approved=True
+            )
+        for _ in range(80):
+            ops.record_tool_metric(
+                tool_name="local_pack_search", success=True, elapsed_ms=120, backend="local", channel="chat", risk_tier="LOW", approved=True
+            )
+        snapshot = ops.snapshot(event_limit=5, metric_limit=10, metric_window_seconds=3600)
+        self.assertEqual(len(snapshot["recent_metrics"]), 10)
+        self.assertEqual(snapshot["tool_metrics"]["total"], 85)
+        self.assertEqual(snapshot["tool_metrics"]["failures"], 5)
+
+        digest = build_observability_digest(snapshot)
+        top = digest["tool_hotspots"][0]
+        self.assertEqual((top["tool_name"], top["failure_count"]), ("browser_fetch", 5))
+        self.assertIn("p95_latency_ms", top)
+        self.assertEqual(digest["failure_hotspots"][0]["count"], 5)
+        self.assertEqual(digest["window_seconds"], 3600.0)
+
+    def test_digest_drops_tools_marked_synthetic_only_in_meta(self) -> None:
+        ops = OpsControlPlane(root_dir=self.temp_dir / "ops")
+        for _ in range(3):
+            ops.record_tool_metric(
+                tool_name="browser_fetch",
+                success=False,
+                elapsed_ms=9000,
+                backend="local",
+                channel="chat",
+                risk_tier="LOW",
+                approved=True,
+                meta={"source": "fixture"},
+            )
+        ops.record_tool_metric(
+            tool_name="browser_fetch", success=True, elapsed_ms=90, backend="local", channel="chat", risk_tier="LOW", approved=True
+        )
+        snapshot = ops.snapshot(metric_window_seconds=3600)
+        self.assertEqual(snapshot["tool_metrics"]["total"], 4)
+        self.assertEqual([row["synthetic"] for row in snapshot["metric_rollups"]["tools"]], [False, True])
+
+        digest = build_observability_digest(snapshot)
+        top = digest["tool_hotspots"][0]
+        self.assertEqual((top["total"], top["failure_count"]), (1, 0))
+        self.assertEqual(digest["failure_hotspots"], [])
+
+    def test_unflagged_buckets_are_carried_into_the_new_key(self) -> None:
+        path = self.temp_dir / "old.sqlite3"
+        with sqlite3.connect(path) as conn:
+            conn.execute(
+                "CREATE TABLE rollups (resolution TEXT, bucket_start INTEGER, metric_type TEXT, name TEXT, channel TEXT, "
+                "status TEXT, count INTEGER, latency_sum INTEGER, latency_max INTEGER, "
+                "PRIMARY KEY(resolution, bucket_start, metric_type, name, channel, status))"
+            )
+            conn.execute("INSERT INTO rollups VALUES ('minute', ?, 'tool', 'web_search', 'chat', 'ok', 2, 100, 60)", (int(_NOW // 60) * 60,))
+        store = MetricsRollupStore(path)
+        store.record(metric_type="tool", name="web_search", latency_ms=40, channel="chat", ts=_NOW)
+        (row,) = store.summarize(window_seconds=3600, now=_NOW)
+        self.assertEqual((row["count"], row["synthetic"]), (3, False))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import json
+import sqlite3
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from workshop.toolbox.stacks.ocr_core import pipeline
+from workshop.toolbox.stacks.ocr_core.contracts import OcrRequest, OcrResult
+from workshop.toolbox.stacks.ocr_core.cache import OcrResultCache, phash_distance
+from workshop.toolbox.stacks.ocr_core.utils import perceptual_hash
+
+try:
+    from PIL import Image, ImageDraw
+except Exception:  # pragma: no cover
+    Image = None
+
+
+class OcrCacheIndexTests(unittest.TestCase):
+    def test_round_trip_stores_compressed_payload(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            cache = OcrResultCache(tmp)
+            payload = {"raw_text": "Invoice 42 " * 200, "provenance": {"model": "m"}}
+            cache.put("k1", payload, ttl_days=1)
+            self.assertEqual(cache.get("k1"), payload)
+            with sqlite3.connect(cache.db_path) as conn:
+                size = conn.execute("SELECT size_bytes FROM ocr_cache WHERE cache_key='k1'").fetchone()[0]
+            self.assertLess(size, len(json.dumps(payload)))
+
+    def test_expired_entry_is_deleted_on_read(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            cache = OcrResultCache(tmp)
+            cache.put("old", {"raw_text": "x"}, ttl_days=0)
+            time.sleep(0.01)
+            self.assertIsNone(cache.get("old"))
+            self.assertEqual(len(cache), 0)
+
+    def test_prune_is_amortized_and_keeps_recent_entries(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            cache = OcrResultCache(tmp)
+            for idx in range(20):
+                cache.put(f"k{idx}", {"raw_text": str(idx)}, ttl_days=1)
+            cache.get("k0")
+            self.assertEqual(cache.prune(19), 0, "small overshoot should not trigger an eviction pass")
+            self.assertEqual(cache.prune(10), 10)
+            self.assertEqual(len(cache), 10)
+            self.assertIsNotNone(cache.get("k0"))
+            self.assertIsNone(cache.get("k1"))
+
+    def test_legacy_json_entries_are_imported(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            doc = {"created_at": time.time(), "expires_at": time.time() + 60, "payload": {"raw_text": "legacy"}}
+            Path(tmp, "abc.json").write_text(json.dumps(doc), encoding="utf-8")
+            cache = OcrResultCache(tmp)
+            self.assertEqual(cache.get("abc"), {"raw_text": "legacy"})
+            self.assertFalse(Path(tmp, "abc.json").exists())
+
+    @unittest.skipIf(Image is None, "Pillow unavailable")
+    def test_rescan_at_other_resolution_hits_perceptual_lookup(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            page = Image.new("RGB", (1200, 1600), "white")
+            draw = ImageDraw.Draw(page)
+            for row in range(12):
+                draw.rectangle((100, 100 + row * 120, 200 + row * 70, 150 + row * 120), fill="black")
+            full = Path(tmp, "full.png")
+            small = Path(tmp, "small.jpg")
+            page.save(full)
+            page.resize((600, 800)).save(small, quality=70)
+
+            other = Image.new("RGB", (1200, 1600), "white")
+            ImageDraw.Draw(other).ellipse((200, 200, 1000, 1400), fill="black")
+            other_path = Path(tmp, "other.png")
+            other.save(other_path)
+
+            hashes_full = [perceptual_hash(str(full))]
+            hashes_small = [perceptual_hash(str(small))]
+            self.assertLessEqual(phash_distance(hashes_full, hashes_small), 4)
+
+            cache = OcrResultCache(Path(tmp, "cache"))
+            cache.put("full", {"raw_text": "page"}, ttl_days=1, variant_key="v", phashes=hashes_full)
+            self.assertEqual(cache.get_similar("v", hashes_small, 4), {"raw_text": "page"})
+            self.assertIsNone(cache.get_similar("other-variant", hashes_small, 4))
+            self.assertIsNone(cache.get_similar("v", [perceptual_hash(str(other_path))], 4))
+
+    def test_run_ocr_does_not_serve_perceptual_matches_by_default(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            image = Path(tmp, "invoice.png")
+            image.write_bytes(b"not really an image")
+            other_doc = {"raw_text": "Invoice total 100.00", "provenance": {}}
+            with mock.patch.object(pipeline, "match_template", return_value=None), \
+                mock.patch.object(pipeline, "ensure_default_schema_migrated"), \
+                mock.patch.object(pipeline, "cache_get", return_value=None), \
+                mock.patch.object(pipeline, "cache_put"), \
+                mock.patch.object(pipeline, "prune_cache"), \
+                mock.patch.object(pipeline, "cache_get_similar", return_value=other_doc) as similar, \
+                mock.patch.object(pipeline, "general_ocr", return_value=OcrResult(raw_text="Invoice total 250.00")):
+                result = pipeline.run_ocr(OcrRequest(image_paths=[str(image)], mode="general"))
+            similar.assert_not_called()
+            self.assertEqual(result.raw_text, "Invoice total 250.00")
+            self.assertNotIn("cache_match", result.provenance)
+
+
+if __name__ == "__main__":
+    unittest.main()
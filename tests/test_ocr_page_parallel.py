@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from workshop.toolbox.stacks.contracts_core.pipelines import stream_doc_extract
+from workshop.toolbox.stacks.ocr_core import cache as ocr_cache
+from workshop.toolbox.stacks.ocr_core import extract_general
+from workshop.toolbox.stacks.ocr_core.contracts import OcrRequest
+from workshop.toolbox.stacks.ocr_core.document_intel import iter_scanned_pages
+from workshop.toolbox.stacks.ocr_core.pages import iter_ocr_pages, run_ocr_pages
+
+
+class _FakeVision:
+    def __init__(self, delay: float = 0.05) -> None:
+        self.delay = delay
+        self.calls: list[str] = []
+        self.active = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, model, prompt, image_paths, timeout_sec, options=None):
+        with self._lock:
+            self.calls.append(Path(image_paths[0]).name)
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(self.delay)
+        with self._lock:
+            self.active -= 1
+        return f"Text of {Path(image_paths[0]).stem} with enough readable characters."
+
+
+class OcrPageParallelTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self._tmp.name)
+        self.pages = []
+        for idx in range(4):
+            path = self.root / f"page{idx + 1}.png"
+            path.write_bytes(f"fake image {idx}".encode("utf-8"))
+            self.pages.append(str(path))
+        self.vision = _FakeVision()
+        patches = [
+            mock.patch.object(extract_general, "ollama_vision_chat", self.vision),
+            mock.patch.object(ocr_cache, "CACHE_DIR", self.root / "cache"),
+            mock.patch.dict(ocr_cache._CACHES, {}, clear=True),
+            mock.patch("workshop.toolbox.stacks.ocr_core.pages.compute_image_metrics", lambda p: {"brightness": 0.5, "blur_score": 0.5}),
+            mock.patch("workshop.toolbox.stacks.ocr_core.extract_general.get_output_folder", lambda: str(self.root)),
+            mock.patch("workshop.toolbox.stacks.ocr_core.extract_general.export_general_excel", lambda text, name: ""),
+        ]
+        for patcher in patches:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.addCleanup(self._tmp.cleanup)
+
+    def _req(self, paths: list[str]) -> OcrRequest:
+        return OcrRequest(image_paths=paths, mode="general", options={"preprocess_policy": "off"})
+
+    def test_pages_run_concurrently_and_keep_page_order(self) -> None:
+        result = run_ocr_pages(self._req(self.pages), max_concurrency=2)
+        self.assertEqual(self.vision.peak, 2)
+        self.assertEqual(len(self.vision.calls), 4)
+        positions = [result.raw_text.index(f"=== IMAGE {idx} ===") for idx in range(1, 5)]
+        self.assertEqual(positions, sorted(positions))
+        self.assertIn("Text of page3", result.raw_text)
+        self.assertEqual(result.debug["cached_pages"], 0)
+
+    def test_adding_a_page_only_ocrs_the_new_page(self) -> None:
+        run_ocr_pages(self._req(self.pages[:3]))
+        self.vision.calls.clear()
+        result = run_ocr_pages(self._req(self.pages))
+        self.assertEqual(self.vision.calls, ["page4.png"])
+        self.assertEqual(result.debug["cached_pages"], 3)
+
+    def test_generator_yields_pages_as_they_finish(self) -> None:
+        seen = []
+        started = time.perf_counter()
+        for row in iter_ocr_pages(self._req(self.pages), max_concurrency=4):
+            seen.append((row.page, time.perf_counter() - started))
+        self.assertEqual(sorted(page for page, _ in seen), [1, 2, 3, 4])
+        self.assertLess(seen[0][1], 0.2)
+
+    def test_scanned_pages_stream_into_doc_extract(self) -> None:
+        rows = iter_scanned_pages(self.pages[:2], max_concurrency=1)
+        artifacts = list(stream_doc_extract(query="summarize", route="doc", pages=rows))
+        self.assertEqual(len(artifacts), 2)
+        final = artifacts[-1]
+        self.assertEqual(final["content"]["page_refs"], ["p1", "p2"])
+        self.assertEqual(final["metadata"]["pages_received"], 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+import base64
+import io
+import json
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from workshop.toolbox.stacks.ocr_core import vision_backend
+from workshop.toolbox.stacks.ocr_core.vision_backend import ollama_vision_chat, prepare_transport_image, transport_stats
+
+try:
+    from PIL import Image
+except Exception:  # pragma: no cover
+    Image = None
+
+
+class _FakeResponse:
+    status = 200
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def read(self):
+        return json.dumps({"message": {"content": "ok"}}).encode("utf-8")
+
+
+@unittest.skipIf(Image is None, "Pillow unavailable")
+class OcrVisionTransportTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        patcher = mock.patch.object(vision_backend, "_TRANSPORT", vision_backend._TransportCache())
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.root = Path(self._tmp.name)
+
+    def _photo(self, name: str, size: tuple[int, int]) -> Path:
+        path = self.root / name
+        Image.effect_noise(size, 64).convert("RGB").save(path, format="PNG")
+        return path
+
+    def test_large_photo_is_downscaled_and_reencoded_once(self) -> None:
+        path = self._photo("phone.png", (2200, 1600))
+        first = prepare_transport_image(str(path))
+        second = prepare_transport_image(str(path))
+
+        self.assertTrue(first.reencoded)
+        self.assertLess(first.sent_bytes, first.original_bytes)
+        with Image.open(io.BytesIO(base64.b64decode(first.b64))) as img:
+            self.assertLessEqual(max(img.size), 2048)
+            self.assertEqual(img.format, "JPEG")
+        self.assertIs(second, first)
+        stats = transport_stats()
+        self.assertEqual((stats["images"], stats["cache_hits"]), (2, 1))
+        self.assertEqual(stats["sent_bytes"], 2 * first.sent_bytes)
+
+    def test_transparent_areas_are_flattened_onto_white(self) -> None:
+        img = Image.new("RGBA", (40, 40), (0, 0, 0, 0))
+        img.paste((200, 0, 0, 255), (0, 0, 20, 40))
+        raw = io.BytesIO()
+        img.save(raw, format="PNG")
+        out = vision_backend._reencode(raw.getvalue(), 2048, "JPEG", 85)
+        with Image.open(io.BytesIO(out)) as flat:
+            self.assertEqual(flat.mode, "RGB")
+            self.assertTrue(all(channel > 240 for channel in flat.getpixel((35, 20))))
+            self.assertGreater(flat.getpixel((5, 20))[0], 150)
+
+    def test_digest_memo_is_bounded(self) -> None:
+        cache = vision_backend._TransportCache(max_digests=2)
+        paths = []
+        for idx in range(3):
+            path = self.root / f"f{idx}.bin"
+            path.write_bytes(bytes([idx]) * 16)
+            paths.append(path)
+            cache.digest(path)
+        cache.digest(paths[1])
+        cache.digest(paths[0])
+        self.assertEqual([marker[0] for marker in cache._digests], [str(paths[1].resolve()), str(paths[0].resolve())])
+
+    def test_small_image_is_sent_unchanged(self) -> None:
+        path = self.root / "tiny.png"
+        Image.new("RGB", (64, 64), "white").save(path)
+        item = prepare_transport_image(str(path))
+        self.assertFalse(item.reencoded)
+        self.assertEqual(base64.b64decode(item.b64), path.read_bytes())
+
+    def test_vision_chat_ships_the_transport_payload(self) -> None:
+        path = self._photo("scan.png", (2100, 1200))
+        captured = {}
+
+        def _urlopen(req, timeout=None):
+            captured["body"] = json.loads(req.data.decode("utf-8"))
+            return _FakeResponse()
+
+        with mock.patch.object(vision_backend.urllib.request, "urlopen", _urlopen):
+            self.assertEqual(ollama_vision_chat("m", "read", [str(path)], timeout_sec=5), "ok")
+        sent = captured["body"]["messages"][0]["images"][0]
+        self.assertEqual(sent, prepare_transport_image(str(path)).b64)
+        self.assertLess(len(base64.b64decode(sent)), path.stat().st_size)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+
+from executive.memory.store import SQLiteMemoryStore
+from ontology.schema import OntologyLink
+from ontology.service import SomiOntology
+from ontology.store import OntologyStore
+from runtime.task_graph import save_task_graph
+from state import SessionEventStore
+
+
+class OntologyProjectionTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.temp_dir = Path(tempfile.mkdtemp(prefix="somi_ontology_projection_"))
+        self.graph_root = str(self.temp_dir / "task_graph")
+        self.store = OntologyStore(self.temp_dir / "ontology.sqlite3")
+        self.ontology = SomiOntology(
+            store=self.store,
+            state_store=SessionEventStore(db_path=self.temp_dir / "state.sqlite3"),
+            memory_store=SQLiteMemoryStore(db_path=str(self.temp_dir / "memory.sqlite3")),
+            task_graph_root=self.graph_root,
+            artifacts_root=self.temp_dir / "artifacts",
+            jobs_root=self.temp_dir / "jobs",
+            refresh_ttl_seconds=0.0,
+        )
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _save_tasks(self, thread_id: str, *tasks: tuple[str, str, str]) -> None:
+        save_task_graph(
+            "alice",
+            thread_id,
+            {"tasks": [{"task_id": task_id, "title": title, "status": status} for task_id, title, status in tasks]},
+            root_dir=self.graph_root,
+        )
+
+    def test_unchanged_refresh_writes_nothing(self) -> None:
+        self._save_tasks("t1", ("a", "Draft quarterly budget", "open"), ("b", "Book venue", "open"))
+        self.ontology.refresh_thread(user_id="alice", thread_id="t1", force=True)
+        first = dict(self.ontology.last_refresh_stats)
+        self.assertGreater(first["inserted"], 0)
+        before = {row["object_id"]: row["updated_at"] for row in self.store.list_objects(owner_user_id="alice", limit=200)}
+
+        self.ontology.refresh_thread(user_id="alice", thread_id="t1", force=True)
+        stats = self.ontology.last_refresh_stats
+        self.assertEqual((stats["inserted"], stats["updated"], stats["deleted"]), (0, 0, 0))
+        self.assertEqual((stats["links_written"], stats["links_deleted"]), (0, 0))
+        self.assertEqual(stats["unchanged"], first["inserted"])
+        after = {row["object_id"]: row["updated_at"] for row in self.store.list_objects(owner_user_id="alice", limit=200)}
+        self.assertEqual(after, before)
+
+    def test_changed_and_removed_tasks_keep_fts_and_links_consistent(self) -> None:
+        self._save_tasks("t1", ("a", "Draft quarterly budget", "open"), ("b", "Book venue", "open"))
+        self._save_tasks("t2", ("c", "Renew passport", "open"))
+        self.ontology.refresh_thread(user_id="alice", thread_id="t2", force=True)
+        self.ontology.refresh_thread(user_id="alice", thread_id="t1", force=True)
+
+        self._save_tasks("t1", ("a", "Draft annual budget", "open"))
+        self.ontology.refresh_thread(user_id="alice", thread_id="t1", force=True)
+        stats = self.ontology.last_refresh_stats
+        self.assertEqual(stats["updated"], 1)
+        self.assertEqual(stats["inserted"], 0)
+        # task:b plus its two runbook actions.
+        self.assertEqual(stats["deleted"], 3)
+
+        self.assertEqual([row["object_id"] for row in self.store.search("annual", owner_user_id="alice")], ["task:a"])
+        self.assertEqual(self.store.search("quarterly", owner_user_id="alice"), [])
+        self.assertEqual(self.store.search("venue", owner_user_id="alice"), [])
+        self.assertIsNone(self.store.get_object("task:b"))
+        self.assertIsNone(self.store.get_object("action:task:b:task_review"))
+        self.assertEqual(self.store.list_links(object_id="task:b"), [])
+        self.assertEqual(len(self.store.list_links(object_id="task:a", relation="can_run_action")), 2)
+
+        other = self.store.list_links(owner_user_id="alice", thread_id="t2", limit=200)
+        self.assertIn(("conversation:alice:t2", "has_task", "task:c"), {(r["from_id"], r["relation"], r["to_id"]) for r in other})
+
+    def test_sync_projection_leaves_links_outside_scope(self) -> None:
+        self.store.upsert_link(OntologyLink(from_id="user:alice", relation="owns_automation", to_id="automation:x", owner_user_id="alice"))
+        self._save_tasks("t1", ("a", "Draft quarterly budget", "open"))
+        self.ontology.refresh_thread(user_id="alice", thread_id="t1", force=True)
+        self.assertEqual(len(self.store.list_links(relation="owns_automation", owner_user_id="alice", thread_id="")), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
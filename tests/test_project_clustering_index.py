@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+
+import executive.life_modeling.project_clustering as clustering
+from executive.life_modeling.project_clustering import cluster_projects
+
+
+def _now_minus(days: int) -> str:
+    return (datetime.now(timezone.utc) - timedelta(days=days)).isoformat()
+
+
+def _item(i: int, tags: list[str], thread: str | None = None) -> dict:
+    return {"id": f"i{i:03d}", "type": "task", "title": f"Item {i}", "tags": tags, "status": "open", "updated_at": _now_minus(1), "thread_ref": thread}
+
+
+def test_only_clusters_sharing_tags_or_threads_are_scored(tmp_path, monkeypatch):
+    prev = [
+        {"project_id": f"p{i}", "tags": [f"topic{i}"], "linked_item_ids": [f"old{i}a", f"old{i}b"], "linked_thread_ids": [f"thr{i}"], "updated_at": _now_minus(1)}
+        for i in range(50)
+    ]
+    scored: list[str] = []
+    real_score = clustering._score
+
+    def counting_score(item, cluster, **kwargs):
+        scored.append(str(cluster.get("project_id")))
+        return real_score(item, cluster, **kwargs)
+
+    monkeypatch.setattr(clustering, "_score", counting_score)
+    clusters, state = cluster_projects(
+        [_item(1, ["topic7"]), _item(2, ["unrelated"], thread="thr9")],
+        prev_clusters=prev,
+        state_path=str(tmp_path / "state.json"),
+        min_items_per_project=1,
+        max_active_projects=100,
+    )
+    # Each item scores its postings plus one recency-only stand-in (p0).
+    assert sorted(scored) == sorted(["p7", "p0", "p9", "p0"])
+    assert state["item_assignments"]["i001"]["project_id"] == "p7"
+    assert any(c["project_id"] == "p7" and "i001" in c["linked_item_ids"] for c in clusters)
+
+
+def test_incremental_run_skips_known_items_and_leaves_state_untouched(tmp_path, monkeypatch):
+    sp = tmp_path / "state.json"
+    items = [_item(i, ["ops", f"batch{i % 3}"], thread=f"thr{i % 2}") for i in range(8)]
+    c1, s1 = cluster_projects(items, state_path=str(sp), min_items_per_project=1)
+    mtime = sp.stat().st_mtime_ns
+
+    calls: list[str] = []
+    monkeypatch.setattr(clustering, "_score", lambda item, cluster, **kw: calls.append(item["id"]) or (0.0, [], 0.0, 0.0, 0.0))
+    c2, s2 = cluster_projects(items, state_path=str(sp), prev_clusters=c1, min_items_per_project=1, incremental=True)
+    assert calls == []
+    assert sp.stat().st_mtime_ns == mtime
+    assert s2["item_assignments"] == s1["item_assignments"]
+    assert [c["project_id"] for c in c2] == [c["project_id"] for c in c1]
+
+    fresh = _item(99, ["ops", "batch0"], thread="thr1")
+    cluster_projects([*items, fresh], state_path=str(sp), prev_clusters=c2, min_items_per_project=1, incremental=True)
+    assert set(calls) == {"i099"}
+    assert sp.stat().st_mtime_ns != mtime
+
+
+def test_incremental_cooldown_counts_from_last_rescore(tmp_path):
+    sp = tmp_path / "state.json"
+    items = [_item(i, ["ops"]) for i in range(3)]
+    c1, s1 = cluster_projects(items, state_path=str(sp), min_items_per_project=1)
+    stamped = s1["item_assignments"]["i000"]["last_switch_at"]
+
+    _, incremental = cluster_projects(items, state_path=str(sp), prev_clusters=c1, min_items_per_project=1, incremental=True)
+    assert incremental["item_assignments"]["i000"]["last_switch_at"] == stamped
+    _, full = cluster_projects(items, state_path=str(sp), prev_clusters=c1, min_items_per_project=1)
+    assert full["item_assignments"]["i000"]["last_switch_at"] > stamped
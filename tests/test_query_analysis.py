@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import unittest
+
+from routing.planner import build_query_plan
+from routing.query_analysis import REGEX_WORD_CHARS, QueryAnalysis, TermMatcher, analyze_query, clear_query_analysis_cache
+from workshop.toolbox.stacks.research_core.browse_planner import build_browse_plan, infer_official_domains, is_trip_planning_query
+
+
+class QueryAnalysisTests(unittest.TestCase):
+    def setUp(self) -> None:
+        clear_query_analysis_cache()
+
+    def test_matcher_reports_overlapping_terms(self) -> None:
+        matcher = TermMatcher(["review", "systematic review", "reviews", "he", "she", "hers"])
+        hits = matcher.scan("ushers read systematic reviews")
+        self.assertEqual(hits["she"], [1])
+        self.assertEqual(hits["he"], [2])
+        self.assertEqual(hits["hers"], [2])
+        self.assertEqual(hits["systematic review"], [12])
+        self.assertEqual(hits["review"], [23])
+        self.assertEqual(hits["reviews"], [23])
+
+    def test_word_and_substring_matching(self) -> None:
+        qa = QueryAnalysis("Compare  Pixel 9 VS iPhone 16 prices")
+        self.assertEqual(qa.text, "compare pixel 9 vs iphone 16 prices")
+        self.assertTrue(qa.has("price"))
+        self.assertFalse(qa.has_word("price"))
+        self.assertTrue(qa.has_word("prices"))
+        self.assertTrue(qa.has_word("pixel 9"))
+        self.assertTrue(qa.has_any_word((" vs ", "versus")))
+        self.assertTrue(qa.has_word("iphone 16"))
+        self.assertFalse(qa.has_any_word(["iphone 1", "unregistered phrase"]))
+        self.assertTrue(qa.has_any(["unregistered phrase", "ixel"]))
+
+    def test_underscores_glue_words_only_for_regex_word_chars(self) -> None:
+        self.assertTrue(QueryAnalysis("stock_price").has_word("stock"))
+        self.assertTrue(QueryAnalysis("news_feed today").has_any_word(("news",)))
+        self.assertFalse(QueryAnalysis("stock_price").has_word("stock", word_chars=REGEX_WORD_CHARS))
+        self.assertFalse(QueryAnalysis("news_feed today").has_any_word(("news",), word_chars=REGEX_WORD_CHARS))
+        self.assertTrue(QueryAnalysis("news_feed today").has_word("today", word_chars=REGEX_WORD_CHARS))
+        self.assertTrue(QueryAnalysis("unregistered_phrase").has_word("unregistered"))
+        self.assertFalse(QueryAnalysis("unregistered_phrase").has_word("unregistered", word_chars=REGEX_WORD_CHARS))
+        self.assertEqual(build_query_plan("stock_price").mode, "LLM_ONLY")
+
+    def test_analysis_is_shared_across_routing_and_search(self) -> None:
+        first = analyze_query("Latest  hypertension guidelines")
+        self.assertIs(analyze_query("latest hypertension guidelines "), first)
+        calls = []
+        self.assertEqual(first.memo("probe", lambda: calls.append(1) or "x"), "x")
+        self.assertEqual(first.memo("probe", lambda: calls.append(1) or "y"), "x")
+        self.assertEqual(len(calls), 1)
+
+        plan = build_query_plan("Latest hypertension guidelines", analysis=first)
+        browse = build_browse_plan("Latest hypertension guidelines", analysis=first)
+        self.assertEqual(plan.mode, "SEARCH_ONLY")
+        self.assertTrue(browse.needs_recency)
+        self.assertIn("heart.org", infer_official_domains("latest hypertension guidelines"))
+        self.assertIn("browse.official_domains", first._memo)
+        self.assertFalse(is_trip_planning_query("latest hypertension guidelines"))
+
+
+if __name__ == "__main__":
+    unittest.main()
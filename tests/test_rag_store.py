@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+
+import faiss
+import numpy as np
+
+from workshop.toolbox.stacks.research_core.rag_store import (
+    MIN_POINTS_PER_CENTROID,
+    RagTextStore,
+    VectorJournal,
+    build_index,
+    fitted_nlist,
+    needs_retrain,
+    read_manifest,
+    write_index_atomic,
+    write_manifest,
+)
+
+
+class RagStoreTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.temp_dir = Path(tempfile.mkdtemp(prefix="somi_rag_store_"))
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_text_store_appends_and_fetches_in_order(self) -> None:
+        store = RagTextStore(self.temp_dir / "texts.sqlite3")
+        self.assertEqual(list(store.append([("alpha", "a.pdf"), ("beta", "b.pdf")])), [0, 1])
+        self.assertEqual(list(store.append([("gamma", "c.pdf")])), [2])
+        self.assertEqual([row["content"] for row in store.get_many([2, 0, 9])], ["gamma", "alpha"])
+
+        reopened = RagTextStore(self.temp_dir / "texts.sqlite3")
+        self.assertEqual(len(reopened), 3)
+        reopened.truncate(1)
+        self.assertEqual(len(reopened), 1)
+        self.assertEqual(reopened[0]["source"], "a.pdf")
+
+    def test_journal_append_read_and_truncate(self) -> None:
+        journal = VectorJournal(self.temp_dir / "vectors.f32", 4)
+        first = np.arange(8, dtype=np.float32).reshape(2, 4)
+        journal.append(first)
+        journal.append(first + 100)
+        self.assertEqual(len(journal), 4)
+        np.testing.assert_array_equal(journal.read(2, 3), first[:1] + 100)
+        journal.truncate(1)
+        self.assertEqual(len(journal), 1)
+        self.assertEqual(journal.sample(10).shape, (1, 4))
+
+    def test_build_index_switches_to_ivf_and_retrains_as_corpus_grows(self) -> None:
+        journal = VectorJournal(self.temp_dir / "vectors.f32", 8)
+        rng = np.random.default_rng(3)
+        journal.append(rng.random((20, 8), dtype=np.float32))
+        flat = build_index(journal, nlist=2)
+        self.assertIsInstance(flat, faiss.IndexFlatL2)
+        self.assertFalse(needs_retrain(flat, 20, 2))
+
+        journal.append(rng.random((MIN_POINTS_PER_CENTROID * 4, 8), dtype=np.float32))
+        count = len(journal)
+        self.assertTrue(needs_retrain(flat, count, 2))
+        ivf = build_index(journal, nlist=2)
+        self.assertIsInstance(ivf, faiss.IndexIVFFlat)
+        self.assertEqual(ivf.ntotal, count)
+        self.assertEqual(ivf.nlist, fitted_nlist(count, 2))
+        self.assertFalse(needs_retrain(ivf, count, 2))
+        self.assertTrue(needs_retrain(ivf, count * 16, 2))
+
+        path = self.temp_dir / "index.faiss"
+        write_index_atomic(ivf, path)
+        self.assertEqual(faiss.read_index(str(path)).ntotal, count)
+
+    def test_manifest_round_trip_and_mmap_checkpoint(self) -> None:
+        manifest_path = self.temp_dir / "rag_manifest.json"
+        self.assertEqual(read_manifest(manifest_path), {})
+        index = faiss.IndexFlatL2(4)
+        index.add(np.ones((3, 4), dtype=np.float32))
+        write_index_atomic(index, self.temp_dir / "index.faiss")
+        write_manifest(manifest_path, model="demo-model", dim=4, index=index)
+        manifest = read_manifest(manifest_path)
+        self.assertEqual((manifest["model"], manifest["dim"], manifest["ntotal"]), ("demo-model", 4, 3))
+
+        mapped = faiss.read_index(str(self.temp_dir / "index.faiss"), faiss.IO_FLAG_MMAP | faiss.IO_FLAG_READ_ONLY)
+        self.assertEqual(mapped.ntotal, 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import shutil
+import sqlite3
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from workshop.toolbox.stacks.research_core import science_ingest
+from workshop.toolbox.stacks.research_core.science_stores import TextbookFactsStore
+
+
+def _write_text_pdf(path: Path, pages: list[list[str]]) -> None:
+    """Minimal uncompressed PDF with one Helvetica text line per entry."""
+    objects: list[bytes] = []
+    page_ids = [4 + 2 * i for i in range(len(pages))]
+    objects.append(b"<< /Type /Catalog /Pages 2 0 R >>")
+    objects.append(f"<< /Type /Pages /Kids [{' '.join(f'{pid} 0 R' for pid in page_ids)}] /Count {len(pages)} >>".encode())
+    objects.append(b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>")
+    for pid, lines in zip(page_ids, pages):
+        ops = ["BT /F1 9 Tf 40 800 Td 11 TL"] + [f"({line}) Tj T*" for line in lines] + ["ET"]
+        stream = "\n".join(ops).encode()
+        objects.append(
+            f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 595 842] /Resources << /Font << /F1 3 0 R >> >> /Contents {pid + 1} 0 R >>".encode()
+        )
+        objects.append(b"<< /Length %d >>\nstream\n" % len(stream) + stream + b"\nendstream")
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(out))
+        out += f"{number} 0 obj\n".encode() + body + b"\nendobj\n"
+    xref = len(out)
+    out += f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n".encode()
+    out += b"".join(f"{offset:010d} 00000 n \n".encode() for offset in offsets)
+    out += f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\nstartxref\n{xref}\n%%EOF\n".encode()
+    path.write_bytes(bytes(out))
+
+
+def _page_lines(page: int) -> list[str]:
+    return [
+        f"Drug {page} treatment uses a dose of {page * 10} mg given orally twice daily for adults.",
+        f"Diagnosis {page} is defined by a fever above 38 degrees lasting more than {page + 2} days.",
+        f"Risk {page} of complication rises when management is delayed beyond {page + 5} hours.",
+    ]
+
+
+class ScienceIngestPipelineTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.temp_dir = Path(tempfile.mkdtemp(prefix="somi_science_ingest_"))
+        self.folder = self.temp_dir / "textbooks"
+        self.folder.mkdir()
+        _write_text_pdf(self.folder / "pharm.pdf", [_page_lines(page) for page in range(1, 6)])
+        self.db = self.temp_dir / "agentpedia.sqlite"
+        self.md_dir = self.folder / "ingested"
+        self._patches = [
+            patch.object(science_ingest, "TextbookFactsStore", lambda: TextbookFactsStore(self.db)),
+            patch.object(science_ingest, "DEFAULT_INGESTED_MD_DIR", self.md_dir),
+        ]
+        for item in self._patches:
+            item.start()
+
+    def tearDown(self) -> None:
+        for item in reversed(self._patches):
+            item.stop()
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _pages_stored(self) -> list[int]:
+        with sqlite3.connect(self.db) as c:
+            return [row[0] for row in c.execute("SELECT page FROM textbook_facts ORDER BY page, id")]
+
+    def test_windows_are_ingested_once_with_throughput(self) -> None:
+        stats = science_ingest.ingest_folder_stats(self.folder, workers=1, window_pages=2)
+        self.assertEqual((stats.books_added, stats.pages), (1, 5))
+        self.assertEqual(self._pages_stored(), [1, 2, 3, 4, 5])
+        self.assertGreater(stats.pages_per_second, 0.0)
+        self.assertIn("### Page 5", (self.md_dir / "pharm.md").read_text(encoding="utf-8"))
+        self.assertEqual(science_ingest.ingest_folder(self.folder, workers=1), (0, 0))
+
+    def test_failed_window_resumes_without_duplicates(self) -> None:
+        real_extract = science_ingest._extract_window
+
+        def flaky(pdf_path: str, start: int, stop: int):
+            if start == 2:
+                raise RuntimeError("worker died")
+            return real_extract(pdf_path, start, stop)
+
+        with patch.object(science_ingest, "_extract_window", flaky):
+            first = science_ingest.ingest_folder_stats(self.folder, workers=1, window_pages=2)
+        self.assertEqual(first.pages, 2)
+        self.assertEqual(self._pages_stored(), [1, 2])
+        self.assertFalse((self.md_dir / "pharm.md").exists())
+
+        second = science_ingest.ingest_folder_stats(self.folder, workers=1, window_pages=2)
+        self.assertEqual((second.books_resumed, second.pages), (1, 3))
+        self.assertEqual(self._pages_stored(), [1, 2, 3, 4, 5])
+        self.assertIn("### Page 1", (self.md_dir / "pharm.md").read_text(encoding="utf-8"))
+
+    def test_identical_pdfs_at_different_paths_are_ingested_once(self) -> None:
+        (self.folder / "copies").mkdir()
+        shutil.copyfile(self.folder / "pharm.pdf", self.folder / "copies" / "pharm_copy.pdf")
+        stats = science_ingest.ingest_folder_stats(self.folder, workers=1, window_pages=2)
+        self.assertEqual((stats.books_added, stats.pages), (1, 5))
+        self.assertEqual(self._pages_stored(), [1, 2, 3, 4, 5])
+
+    def test_process_pool_matches_inline_extraction(self) -> None:
+        stats = science_ingest.ingest_folder_stats(self.folder, workers=2, window_pages=2)
+        self.assertEqual(stats.pages, 5)
+        self.assertEqual(self._pages_stored(), [1, 2, 3, 4, 5])
+
+
+if __name__ == "__main__":
+    unittest.main()
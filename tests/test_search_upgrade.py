@@ -1,12 +1,14 @@
 from __future__ import annotations
 
 import asyncio
+import gc
 import io
 import subprocess
 import tempfile
 import unittest
 import contextlib
 from pathlib import Path
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, patch
 
 from audit.search_benchmark import _canonical_news_benchmark_query, _evaluate_case, _finalize_exit, _intent_hint_for_case, _render_summary_markdown, _run_case_isolated
@@ -17,6 +19,7 @@ from routing.planner import build_query_plan
 from routing.types import QueryPlan
 from workshop.toolbox.stacks.research_core.answer_adequacy import assess_answer_adequacy
 from workshop.toolbox.stacks.research_core.browse_planner import BrowsePlan, build_browse_plan, normalize_lookup_subject
+from workshop.toolbox.stacks.research_core.composer import assess_row_adequacy
 from workshop.toolbox.stacks.research_core.evidence_schema import Claim, EvidenceItem
 from workshop.toolbox.stacks.research_core.github_local import GitHubInspection, _clean_readme_excerpt, choose_best_repo, choose_repositories, extract_repo_urls, inspect_github_repository
 from workshop.toolbox.stacks.research_core.reader import _extract_excerpt
@@ -648,6 +651,13 @@ class AdequacyTests(unittest.TestCase):
         self.assertFalse(report.adequate)
         self.assertIn("missing_recent_source", report.missing)
 
+    def test_row_adequacy_uses_fetched_page_text(self) -> None:
+        question = "how much sodium per day for adults"
+        text = "Adults should limit sodium intake to less than 2000 mg per day according to the review. " * 3
+        rows = [{"title": "Sodium intake", "url": "https://example.org/sodium", "description": "Daily sodium limits."}]
+        self.assertIn("low_corroboration", assess_row_adequacy(question, rows).missing)
+        self.assertTrue(assess_row_adequacy(question, [dict(rows[0], content=text)]).adequate)
+
 
 class GitHubHelperTests(unittest.TestCase):
     def test_extract_repo_urls(self) -> None:
@@ -4602,6 +4612,82 @@ class WebSearchHandlerTests(unittest.IsolatedAsyncioTestCase):
         urls = {str((row or {}).get("url") or "") for row in rows}
         self.assertIn("https://docs.docker.com/compose/release-notes/", urls)
 
+    async def test_stream_fetch_yields_fast_rows_and_cancels_slow_host(self) -> None:
+        handler = WebSearchHandler()
+        delays = {"https://a.example/fast": 0.01, "https://b.example/slow": 5.0, "https://c.example/medium": 0.05}
+        cancelled: list[str] = []
+
+        async def fake_fetch(_client, url: str) -> None:
+            try:
+                await asyncio.sleep(delays[url])
+            except asyncio.CancelledError:
+                cancelled.append(url)
+                raise
+            handler.page_cache.set(url, f"page text for {url} " * 40)
+
+        rows = [{"title": f"Page {i}", "url": url, "description": "d"} for i, url in enumerate(delays)]
+        with patch.object(handler, "_bounded_fetch", fake_fetch):
+            started = asyncio.get_running_loop().time()
+            streamed = [
+                row
+                async for row in handler._stream_fetch_and_attach_content(
+                    rows,
+                    "general",
+                    top_n=3,
+                    is_adequate=lambda got: sum(1 for row in got if row.get("content")) >= 2,
+                )
+            ]
+            elapsed = asyncio.get_running_loop().time() - started
+        self.assertLess(elapsed, 1.0)
+        self.assertEqual([row["url"] for row in streamed], ["https://a.example/fast", "https://c.example/medium"])
+        self.assertTrue(all(row.get("content") for row in streamed))
+        self.assertEqual(cancelled, ["https://b.example/slow"])
+
+    async def test_stream_exit_retrieves_failed_fetches(self) -> None:
+        handler = WebSearchHandler()
+        reported: list[str] = []
+        asyncio.get_running_loop().set_exception_handler(lambda _loop, context: reported.append(str(context.get("message"))))
+
+        async def fake_fetch(_client, url: str) -> None:
+            await asyncio.sleep(0.01)
+            if "good" not in url:
+                raise RuntimeError("fetch failed")
+            handler.page_cache.set(url, f"page text for {url} " * 40)
+
+        rows = [{"title": f"Page {i}", "url": url, "description": "d"} for i, url in enumerate(["https://a.example/good", "https://b.example/bad"])]
+        with patch.object(handler, "_bounded_fetch", fake_fetch):
+            streamed = [
+                row
+                async for row in handler._stream_fetch_and_attach_content(
+                    rows, "general", top_n=2, is_adequate=lambda got: bool(got)
+                )
+            ]
+        gc.collect()
+        self.assertIn("https://a.example/good", [row["url"] for row in streamed])
+        self.assertEqual(reported, [])
+
+    async def test_until_adequate_attaches_cached_text_to_every_row(self) -> None:
+        handler = WebSearchHandler()
+        handler.page_cache.set("https://c.example/cached", "cached page text " * 40)
+        fetched: list[str] = []
+
+        async def fake_fetch(_client, url: str) -> None:
+            fetched.append(url)
+            handler.page_cache.set(url, f"page text for {url} " * 40)
+
+        rows = [
+            {"title": "Page A", "url": "https://a.example/one", "description": "d"},
+            {"title": "Page C", "url": "https://c.example/cached", "description": "d"},
+        ]
+        with patch.object(handler, "_bounded_fetch", fake_fetch), patch(
+            "workshop.toolbox.stacks.web_core.websearch.assess_row_adequacy",
+            lambda _question, got: SimpleNamespace(adequate=True),
+        ):
+            enriched = await handler._fetch_and_attach_content(rows, "general", top_n=1, max_n=1, question="q", until_adequate=True)
+        self.assertEqual(len(enriched), 2)
+        self.assertTrue(all(row.get("content") for row in enriched))
+        self.assertLessEqual(len(fetched), 1)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import shutil
+import sqlite3
+import tempfile
+import unittest
+from pathlib import Path
+
+from learning.scorecards import build_scorecard
+from learning.trajectories import TrajectoryStore
+from ops import OpsControlPlane
+
+
+def _turn(thread_id: str, idx: int, prompt: str, route: str = "websearch", response: str = "See https://example.org") -> dict:
+    return {
+        "user_id": "alice",
+        "thread_id": thread_id,
+        "session_id": "s1",
+        "turn_id": idx,
+        "turn_index": idx,
+        "prompt": prompt,
+        "response": response,
+        "route": route,
+        "model_name": "m",
+        "latency_ms": 100,
+    }
+
+
+class TrajectoryIndexTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.temp_dir = Path(tempfile.mkdtemp(prefix="somi_trajectory_index_"))
+        self.store = TrajectoryStore(self.temp_dir / "trajectories")
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_bulk_and_single_writes_keep_counters_in_step(self) -> None:
+        self.store.record_turns([_turn("t1", 1, "find the budget"), _turn("t1", 2, "actually, the 2024 one", route="command")])
+        self.store.record_turn(**_turn("t1", 3, "that is wrong, other file", response="Done."))
+        self.store.record_turns([_turn("t2", 1, "actually start here"), _turn("t1", 4, "thanks")])
+
+        totals = self.store.aggregate(user_id="alice")
+        self.assertEqual(totals["thread_count"], 2)
+        self.assertEqual(totals["turn_count"], 5)
+        self.assertEqual(totals["grounding_total"], 4)
+        self.assertEqual(totals["grounding_hits"], 3)
+        # A correction on a thread's first turn has no earlier answer to correct.
+        self.assertEqual(totals["correction_total"], 2)
+        self.assertEqual(len(self.store.load(user_id="alice", thread_id="t1")), 4)
+        threads = {row["thread_id"]: row["turn_count"] for row in self.store.list_threads(user_id="alice")}
+        self.assertEqual(threads, {"t1": 4, "t2": 1})
+        self.assertEqual(self.store.list_threads(user_id="bob"), [])
+
+    def test_missing_index_is_rebuilt_from_jsonl(self) -> None:
+        self.store.record_turns([_turn("t1", 1, "hi"), _turn("t1", 2, "incorrect, again"), _turn("t2", 1, "hello")])
+        before = self.store.aggregate()
+        with sqlite3.connect(self.store.index_path) as conn:
+            conn.execute("DELETE FROM thread_summaries")
+            conn.execute("PRAGMA user_version = 0")
+
+        reopened = TrajectoryStore(self.store.root_dir)
+        self.assertEqual(reopened.aggregate(), before)
+        self.assertEqual(reopened.rebuild_index(), {"files": 2, "threads": 2})
+
+    def test_scorecard_reads_aggregates(self) -> None:
+        self.store.record_turns([_turn("t1", 1, "hi"), _turn("t1", 2, "that's wrong"), _turn("t1", 3, "ok", response="Done.")])
+        card = build_scorecard(
+            trajectory_store=self.store,
+            ops_control=OpsControlPlane(root_dir=self.temp_dir / "ops"),
+            user_id="alice",
+        )
+        self.assertEqual((card["turn_count"], card["thread_count"]), (3, 1))
+        self.assertEqual(card["user_correction_rate"], round(1 / 3, 4))
+        self.assertEqual(card["factual_grounding_rate"], round(2 / 3, 4))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -46,6 +46,19 @@ def to_doc_envelope(answer_text: str, rag_block: str | None) -> DocEnvelope:
     return DocEnvelope(answer_text=answer_text or "", chunks=chunks, page_refs=[])
 
 
+def to_doc_envelope_from_pages(answer_text: str, pages: list[dict] | None) -> DocEnvelope:
+    """Build a DocEnvelope from OCR page rows (``page``/``text`` dicts), kept in page order."""
+    chunks: list[str] = []
+    page_refs: list[str] = []
+    for row in sorted((r for r in pages or [] if isinstance(r, dict)), key=lambda r: int(r.get("page") or 0)):
+        text = str(row.get("text") or "").strip()
+        if not text:
+            continue
+        page_refs.append(str(row.get("label") or f"p{row.get('page')}"))
+        chunks.extend(ln.strip() for ln in text.splitlines() if ln.strip())
+    return DocEnvelope(answer_text=answer_text or "", chunks=chunks, page_refs=page_refs)
+
+
 def to_llm_envelope(answer_text: str) -> LLMEnvelope:
     return LLMEnvelope(answer_text=answer_text or "")
 
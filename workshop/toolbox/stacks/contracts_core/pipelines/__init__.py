@@ -1,5 +1,5 @@
 ﻿from .research_triage import build_research_brief
-from .doc_intel import build_doc_extract
+from .doc_intel import build_doc_extract, stream_doc_extract
 from .planning import build_plan, build_plan_revision
 from .meeting_notes import build_meeting_summary
 from .decision import build_decision_matrix
@@ -8,6 +8,7 @@ from .action_status import build_action_items, build_status_update
 __all__ = [
     "build_research_brief",
     "build_doc_extract",
+    "stream_doc_extract",
     "build_plan",
     "build_plan_revision",
     "build_meeting_summary",
@@ -1,9 +1,9 @@
 ﻿from __future__ import annotations
 
-from typing import Any, Dict
+from typing import Any, Dict, Iterable, Iterator
 
 from workshop.toolbox.stacks.contracts_core.base import build_base
-from workshop.toolbox.stacks.contracts_core.envelopes import DocEnvelope
+from workshop.toolbox.stacks.contracts_core.envelopes import DocEnvelope, to_doc_envelope_from_pages
 
 
 def build_doc_extract(*, query: str, route: str, envelope: DocEnvelope, trigger_reason: Dict[str, Any] | None = None) -> Dict[str, Any]:
@@ -25,5 +25,21 @@ def build_doc_extract(*, query: str, route: str, envelope: DocEnvelope, trigger_
         metadata={"chunk_count": len(extracted)},
         trigger_reason=trigger_reason,
     )
-
-
+
+
+def stream_doc_extract(
+    *,
+    query: str,
+    route: str,
+    pages: Iterable[Dict[str, Any]],
+    answer_text: str = "",
+    trigger_reason: Dict[str, Any] | None = None,
+) -> Iterator[Dict[str, Any]]:
+    """Yield a refreshed doc_extract artifact each time another OCR page arrives."""
+    seen: list[Dict[str, Any]] = []
+    for row in pages:
+        seen.append(dict(row or {}))
+        envelope = to_doc_envelope_from_pages(answer_text, seen)
+        artifact = build_doc_extract(query=query, route=route, envelope=envelope, trigger_reason=trigger_reason)
+        artifact.setdefault("metadata", {})["pages_received"] = len(seen)
+        yield artifact
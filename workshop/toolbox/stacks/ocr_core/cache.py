@@ -2,58 +2,264 @@
 
 import hashlib
 import json
+import sqlite3
 import time
+import zlib
 from pathlib import Path
-from typing import Any, Dict, Optional
+from threading import RLock
+from typing import Any, Dict, List, Optional
 
 from workshop.toolbox.stacks.ocr_core.contracts import OcrRequest
 
 CACHE_DIR = Path("sessions/ocr_cache")
+CACHE_DB_NAME = "ocr_cache.sqlite3"
+# Let the table overshoot max_items by this fraction before evicting, so a
+# put only pays for an eviction pass every few dozen writes.
+EVICTION_SLACK = 0.05
+PHASH_SCAN_LIMIT = 200
+
+
+def _variant_fields(req: OcrRequest, provenance: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "model": provenance.get("model"),
+        "prompt_version": provenance.get("prompt_version"),
+        "preprocess_version": provenance.get("preprocess_version"),
+        "schema_id": req.schema_id,
+        "template_id": req.template_id,
+        "mode": req.mode,
+        "prompt": req.prompt,
+    }
 
 
 def compute_cache_key(req: OcrRequest, provenance: Dict[str, Any]) -> str:
     raw = json.dumps(
-        {
-            "images": provenance.get("image_hashes", []),
-            "model": provenance.get("model"),
-            "prompt_version": provenance.get("prompt_version"),
-            "preprocess_version": provenance.get("preprocess_version"),
-            "schema_id": req.schema_id,
-            "template_id": req.template_id,
-            "mode": req.mode,
-            "prompt": req.prompt,
-        },
+        {"images": provenance.get("image_hashes", []), **_variant_fields(req, provenance)},
         sort_keys=True,
     )
     return hashlib.sha256(raw.encode("utf-8")).hexdigest()
 
 
-def cache_get(key: str) -> Optional[Dict[str, Any]]:
-    path = CACHE_DIR / f"{key}.json"
-    if not path.exists():
+def compute_variant_key(req: OcrRequest, provenance: Dict[str, Any]) -> str:
+    """Key for everything except the image bytes; perceptual lookups stay inside one variant."""
+    raw = json.dumps(_variant_fields(req, provenance), sort_keys=True)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def _hamming(a: str, b: str) -> int:
+    return bin(int(a, 16) ^ int(b, 16)).count("1")
+
+
+def phash_distance(left: List[str], right: List[str]) -> Optional[int]:
+    """Worst per-image Hamming distance between two perceptual-hash lists, or None if incomparable."""
+    if not left or len(left) != len(right) or not all(left) or not all(right):
         return None
-    data = json.loads(path.read_text(encoding="utf-8"))
-    if time.time() > data.get("expires_at", 0):
+    try:
+        return max(_hamming(a, b) for a, b in zip(left, right))
+    except ValueError:
+        return None
+
+
+class OcrResultCache:
+    """SQLite-backed OCR result cache with LRU/expiry indexes and compressed payloads."""
+
+    def __init__(self, root_dir: str | Path = CACHE_DIR) -> None:
+        self.root_dir = Path(root_dir)
+        self.root_dir.mkdir(parents=True, exist_ok=True)
+        self.db_path = self.root_dir / CACHE_DB_NAME
+        self._lock = RLock()
+        self._init_db()
+        self._count = self._read_count()
+        self._import_legacy_json()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(str(self.db_path), timeout=30.0, check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    def _init_db(self) -> None:
+        with self._lock, self._connect() as conn:
+            conn.executescript(
+                """
+                CREATE TABLE IF NOT EXISTS ocr_cache (
+                    cache_key TEXT PRIMARY KEY,
+                    variant_key TEXT NOT NULL DEFAULT '',
+                    phash TEXT NOT NULL DEFAULT '',
+                    created_at REAL NOT NULL,
+                    expires_at REAL NOT NULL,
+                    last_access REAL NOT NULL,
+                    size_bytes INTEGER NOT NULL DEFAULT 0,
+                    payload BLOB NOT NULL
+                );
+                CREATE INDEX IF NOT EXISTS idx_ocr_cache_lru ON ocr_cache(last_access);
+                CREATE INDEX IF NOT EXISTS idx_ocr_cache_expiry ON ocr_cache(expires_at);
+                CREATE INDEX IF NOT EXISTS idx_ocr_cache_variant ON ocr_cache(variant_key, last_access DESC);
+                """
+            )
+
+    def _read_count(self) -> int:
+        with self._lock, self._connect() as conn:
+            row = conn.execute("SELECT COUNT(*) AS n FROM ocr_cache").fetchone()
+        return int(row["n"] if row else 0)
+
+    def _import_legacy_json(self) -> None:
+        legacy = list(self.root_dir.glob("*.json"))
+        if not legacy:
+            return
+        now = time.time()
+        with self._lock, self._connect() as conn:
+            for path in legacy:
+                try:
+                    doc = json.loads(path.read_text(encoding="utf-8"))
+                    expires_at = float(doc.get("expires_at", 0))
+                    if expires_at > now and isinstance(doc.get("payload"), dict):
+                        blob = zlib.compress(json.dumps(doc["payload"], ensure_ascii=False).encode("utf-8"))
+                        conn.execute(
+                            """
+                            INSERT OR IGNORE INTO ocr_cache(cache_key, created_at, expires_at, last_access, size_bytes, payload)
+                            VALUES (?, ?, ?, ?, ?, ?)
+                            """,
+                            (path.stem, float(doc.get("created_at", now)), expires_at, path.stat().st_mtime, len(blob), blob),
+                        )
+                except Exception:
+                    pass
+                path.unlink(missing_ok=True)
+        self._count = self._read_count()
+
+    @staticmethod
+    def _decode(blob: bytes) -> Optional[Dict[str, Any]]:
+        try:
+            payload = json.loads(zlib.decompress(blob).decode("utf-8"))
+        except Exception:
+            return None
+        return payload if isinstance(payload, dict) else None
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        now = time.time()
+        with self._lock, self._connect() as conn:
+            row = conn.execute("SELECT expires_at, payload FROM ocr_cache WHERE cache_key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            if now > float(row["expires_at"]):
+                conn.execute("DELETE FROM ocr_cache WHERE cache_key = ?", (key,))
+                self._count = max(0, self._count - 1)
+                return None
+            conn.execute("UPDATE ocr_cache SET last_access = ? WHERE cache_key = ?", (now, key))
+        return self._decode(row["payload"])
+
+    def get_similar(self, variant_key: str, phashes: List[str], max_distance: int) -> Optional[Dict[str, Any]]:
+        """Return a cached payload whose images are perceptually near-identical (e.g. re-scans at another size)."""
+        if not variant_key or not phashes or not all(phashes):
+            return None
+        now = time.time()
+        joined = ",".join(phashes)
+        with self._lock, self._connect() as conn:
+            rows = conn.execute(
+                """
+                SELECT cache_key, phash, payload FROM ocr_cache
+                WHERE variant_key = ? AND expires_at > ? AND phash != ''
+                ORDER BY (phash = ?) DESC, last_access DESC
+                LIMIT ?
+                """,
+                (variant_key, now, joined, PHASH_SCAN_LIMIT),
+            ).fetchall()
+            for row in rows:
+                distance = phash_distance(phashes, str(row["phash"]).split(","))
+                if distance is None or distance > max_distance:
+                    continue
+                conn.execute("UPDATE ocr_cache SET last_access = ? WHERE cache_key = ?", (now, row["cache_key"]))
+                return self._decode(row["payload"])
         return None
-    return data.get("payload")
 
+    def put(
+        self,
+        key: str,
+        payload: Dict[str, Any],
+        *,
+        ttl_days: int,
+        variant_key: str = "",
+        phashes: Optional[List[str]] = None,
+    ) -> None:
+        now = time.time()
+        blob = zlib.compress(json.dumps(payload, ensure_ascii=False, default=str).encode("utf-8"))
+        with self._lock, self._connect() as conn:
+            exists = conn.execute("SELECT 1 FROM ocr_cache WHERE cache_key = ?", (key,)).fetchone() is not None
+            conn.execute(
+                """
+                INSERT OR REPLACE INTO ocr_cache(cache_key, variant_key, phash, created_at, expires_at, last_access, size_bytes, payload)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                (key, variant_key, ",".join(phashes or []), now, now + ttl_days * 86400, now, len(blob), blob),
+            )
+            if not exists:
+                self._count += 1
+
+    def prune(self, max_items: int, *, force: bool = False) -> int:
+        """Evict expired rows, then least-recently-used rows beyond ``max_items``.
+
+        Unless ``force`` is set this is a no-op until the table overshoots the
+        limit by ``EVICTION_SLACK``, which keeps the per-put cost O(1) amortized.
+        """
+        limit = max(0, int(max_items))
+        threshold = limit + max(1, int(limit * EVICTION_SLACK))
+        if not force and self._count <= threshold:
+            return 0
+        with self._lock, self._connect() as conn:
+            removed = conn.execute("DELETE FROM ocr_cache WHERE expires_at < ?", (time.time(),)).rowcount
+            removed += conn.execute(
+                """
+                DELETE FROM ocr_cache WHERE cache_key IN (
+                    SELECT cache_key FROM ocr_cache ORDER BY last_access DESC LIMIT -1 OFFSET ?
+                )
+                """,
+                (limit,),
+            ).rowcount
+        self._count = self._read_count()
+        return int(removed)
+
+    def __len__(self) -> int:
+        return self._count
+
+
+_CACHES: Dict[str, OcrResultCache] = {}
+_CACHES_LOCK = RLock()
+
+
+def get_cache(root_dir: str | Path | None = None) -> OcrResultCache:
+    root = Path(root_dir or CACHE_DIR)
+    key = str(root.resolve())
+    with _CACHES_LOCK:
+        cache = _CACHES.get(key)
+        if cache is None:
+            cache = OcrResultCache(root)
+            _CACHES[key] = cache
+        return cache
 
-def cache_put(key: str, payload: Dict[str, Any]) -> None:
+
+def cache_get(key: str) -> Optional[Dict[str, Any]]:
+    return get_cache().get(key)
+
+
+def cache_get_similar(variant_key: str, phashes: List[str]) -> Optional[Dict[str, Any]]:
+    from config import settings
+
+    max_distance = int(getattr(settings, "OCR_CACHE_PHASH_MAX_DISTANCE", 4))
+    return get_cache().get_similar(variant_key, phashes, max_distance)
+
+
+def cache_put(
+    key: str,
+    payload: Dict[str, Any],
+    *,
+    variant_key: str = "",
+    phashes: Optional[List[str]] = None,
+) -> None:
     from config import settings
 
-    CACHE_DIR.mkdir(parents=True, exist_ok=True)
     ttl_days = int(getattr(settings, "OCR_CACHE_TTL_DAYS", 30))
-    doc = {
-        "created_at": time.time(),
-        "expires_at": time.time() + ttl_days * 86400,
-        "payload": payload,
-    }
-    (CACHE_DIR / f"{key}.json").write_text(json.dumps(doc, ensure_ascii=False), encoding="utf-8")
+    get_cache().put(key, payload, ttl_days=ttl_days, variant_key=variant_key, phashes=phashes)
 
 
 def prune_cache(max_items: int) -> None:
-    CACHE_DIR.mkdir(parents=True, exist_ok=True)
-    files = sorted(CACHE_DIR.glob("*.json"), key=lambda p: p.stat().st_mtime, reverse=True)
-    for old in files[max_items:]:
-        old.unlink(missing_ok=True)
-
+    get_cache().prune(max_items)
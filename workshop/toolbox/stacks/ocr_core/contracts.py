@@ -34,6 +34,21 @@ class OcrQualityReport:
     manual_review_message: str = ""
 
 
+@dataclass
+class OcrPageResult:
+    page: int
+    image_path: str
+    text: str = ""
+    model: str = ""
+    score: float = 0.0
+    reasons: List[str] = field(default_factory=list)
+    image_metrics: Dict[str, Any] = field(default_factory=dict)
+    preprocessed: bool = False
+    cached: bool = False
+    error: str = ""
+    latency_sec: float = 0.0
+
+
 @dataclass
 class OcrResult:
     raw_text: str
@@ -4,7 +4,7 @@ import csv
 import json
 import re
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterator
 
 import pdfplumber
 
@@ -172,6 +172,33 @@ def extract_document_payload(
     }
 
 
+def iter_scanned_pages(
+    image_paths: list[str],
+    *,
+    prompt: str = "",
+    max_chars: int = 5000,
+    max_concurrency: int | None = None,
+) -> Iterator[dict[str, Any]]:
+    """OCR page images in parallel and yield one cleaned page row as each finishes."""
+    from workshop.toolbox.stacks.ocr_core.contracts import OcrRequest
+    from workshop.toolbox.stacks.ocr_core.pages import iter_ocr_pages
+
+    req = OcrRequest(image_paths=[str(p) for p in image_paths], prompt=prompt, mode="general")
+    for row in iter_ocr_pages(req, max_concurrency=max_concurrency):
+        text = clean_document_text(row.text, limit=max_chars)
+        first_line = text.splitlines()[0] if text else ""
+        yield {
+            "page": row.page,
+            "label": f"p{row.page}",
+            "file_name": Path(row.image_path).name,
+            "text": text,
+            "snippet": _clip(first_line, limit=110),
+            "cached": row.cached,
+            "error": row.error,
+            "manual_review_required": bool(row.error or row.reasons),
+        }
+
+
 def build_document_note(payload: dict[str, Any] | None) -> str:
     data = dict(payload or {})
     if not data:
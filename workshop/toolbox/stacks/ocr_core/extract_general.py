@@ -10,7 +10,13 @@ from workshop.toolbox.stacks.ocr_core.exports import export_general_excel, expor
 from workshop.toolbox.stacks.ocr_core.preprocess import compute_image_metrics, preprocess_image, should_preprocess
 from workshop.toolbox.stacks.ocr_core.prompts import general_ocr_prompt, vision_analysis_prompt, vision_fallback_prompt
 from workshop.toolbox.stacks.ocr_core.quality import score_general, should_escalate_general, unk_ratio
-from workshop.toolbox.stacks.ocr_core.vision_backend import VisionBackendError, ollama_vision_chat
+from workshop.toolbox.stacks.ocr_core.utils import bounded_map
+from workshop.toolbox.stacks.ocr_core.vision_backend import (
+    VisionBackendError,
+    ollama_vision_chat,
+    transport_delta,
+    transport_stats,
+)
 
 
 LOW_SIGNAL_ANALYSIS_MARKERS = [
@@ -27,8 +33,16 @@ LOW_SIGNAL_ANALYSIS_MARKERS = [
 ]
 
 
+def _max_concurrency() -> int:
+    return max(1, int(getattr(settings, "OCR_MAX_CONCURRENCY", 2) or 1))
+
+
 def _aggregate_metrics(image_paths: list[str]) -> dict:
-    metrics_list = [compute_image_metrics(p) for p in image_paths]
+    metrics_list = bounded_map(compute_image_metrics, list(image_paths), _max_concurrency())
+    return summarize_metrics(metrics_list)
+
+
+def summarize_metrics(metrics_list: list[dict]) -> dict:
     if not metrics_list:
         return {}
 
@@ -102,25 +116,33 @@ def _resolve_vision_models(req: OcrRequest) -> list[str]:
     return ordered
 
 
+def run_vision_page(model: str, prompt: str, image_path: str, timeout: int) -> str:
+    return ollama_vision_chat(
+        model=model,
+        prompt=prompt,
+        image_paths=[image_path],
+        timeout_sec=timeout,
+        options={
+            "temperature": getattr(settings, "OCR_TEMPERATURE", 0.0),
+            "num_predict": getattr(settings, "OCR_NUM_PREDICT", 1024),
+        },
+    )
+
+
+def join_page_texts(texts: list[str]) -> str:
+    if len(texts) == 1:
+        return texts[0].strip()
+    return "\n\n".join(f"=== IMAGE {idx} ===\n{text}" for idx, text in enumerate(texts, start=1)).strip()
+
+
 def _run_vision_inference(model: str, prompt: str, image_paths: list[str], timeout: int) -> str:
-    chunks: list[str] = []
-    for idx, img in enumerate(image_paths, start=1):
-        text = ollama_vision_chat(
-            model=model,
-            prompt=prompt,
-            image_paths=[img],
-            timeout_sec=timeout,
-            options={
-                "temperature": getattr(settings, "OCR_TEMPERATURE", 0.0),
-                "num_predict": getattr(settings, "OCR_NUM_PREDICT", 1024),
-            },
-        )
-        chunks.append(f"=== IMAGE {idx} ===\n{text}" if len(image_paths) > 1 else text)
-    return "\n\n".join(chunks).strip()
+    texts = bounded_map(lambda img: run_vision_page(model, prompt, img, timeout), list(image_paths), _max_concurrency())
+    return join_page_texts(texts)
 
 
 def general_ocr(req: OcrRequest) -> OcrResult:
     t0 = time.time()
+    transport_before = transport_stats()
     requested_model = req.options.get("model") or settings.VISION_MODEL
     timeout = int(req.options.get("timeout_sec", getattr(settings, "OCR_TIMEOUT_SEC", 120)))
     policy = req.options.get("preprocess_policy", getattr(settings, "OCR_PREPROCESS_POLICY", "auto"))
@@ -131,7 +153,7 @@ def general_ocr(req: OcrRequest) -> OcrResult:
     active_images = list(req.image_paths)
     preprocessed = False
     if should_preprocess(metrics, policy):
-        active_images = [preprocess_image(p, metrics) for p in req.image_paths]
+        active_images = bounded_map(lambda p: preprocess_image(p, metrics), list(req.image_paths), _max_concurrency())
         preprocessed = True
 
     raw_text = ""
@@ -204,10 +226,37 @@ def general_ocr(req: OcrRequest) -> OcrResult:
             if not (getattr(settings, "OCR_SECOND_PASS", True) and escalate and max_passes > 1):
                 reasons = esc_reasons or reasons
                 break
-            active_images = [preprocess_image(p, metrics) for p in req.image_paths]
+            active_images = bounded_map(lambda p: preprocess_image(p, metrics), list(req.image_paths), _max_concurrency())
             preprocessed = True
             prompt = general_ocr_prompt("RETRY STRICTLY. Preserve text exactly.")
 
+    result = build_general_result(
+        req,
+        raw_text=raw_text,
+        metrics=metrics,
+        reasons=reasons,
+        score=score,
+        model_used=model_used,
+        preprocessed=preprocessed,
+        is_vision_mode=is_vision_mode,
+        started_at=t0,
+    )
+    result.debug["transport"] = transport_delta(transport_before)
+    return result
+
+
+def build_general_result(
+    req: OcrRequest,
+    *,
+    raw_text: str,
+    metrics: dict,
+    reasons: list[str],
+    score: float,
+    model_used: str,
+    preprocessed: bool,
+    is_vision_mode: bool,
+    started_at: float,
+) -> OcrResult:
     base_name = Path(req.image_paths[0]).stem
     suffix = "_vision" if is_vision_mode else ""
     txt_path = Path(get_output_folder()) / f"{base_name}{suffix}.txt"
@@ -247,6 +296,6 @@ def general_ocr(req: OcrRequest) -> OcrResult:
         exports={"txt_path": str(txt_path.resolve()), "excel_path": excel_path, "json_path": json_path},
         quality=quality,
         provenance={"model": model_used, "preprocessed": preprocessed},
-        debug={"latency_sec": round(time.time() - t0, 3)},
+        debug={"latency_sec": round(time.time() - started_at, 3)},
     )
 
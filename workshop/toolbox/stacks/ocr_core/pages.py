@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import replace
+from typing import Iterator, List, Optional
+
+from config import settings
+from workshop.toolbox.stacks.ocr_core.cache import cache_get, cache_put, compute_cache_key
+from workshop.toolbox.stacks.ocr_core.contracts import OcrPageResult, OcrRequest, OcrResult
+from workshop.toolbox.stacks.ocr_core.extract_general import (
+    run_vision_page,
+    build_general_result,
+    join_page_texts,
+    summarize_metrics,
+)
+from workshop.toolbox.stacks.ocr_core.preprocess import PREPROCESS_VERSION, compute_image_metrics, preprocess_image, should_preprocess
+from workshop.toolbox.stacks.ocr_core.prompts import PROMPT_VERSION, general_ocr_prompt
+from workshop.toolbox.stacks.ocr_core.quality import score_general, should_escalate_general, unk_ratio
+from workshop.toolbox.stacks.ocr_core.utils import sha256_file
+from workshop.toolbox.stacks.ocr_core.vision_backend import VisionBackendError, transport_delta, transport_stats
+
+PAGE_PROMPT_VERSION = f"{PROMPT_VERSION}:page"
+_PAGE_FIELDS = ("text", "model", "score", "reasons", "image_metrics", "preprocessed")
+
+
+def page_cache_key(req: OcrRequest, image_path: str, model: str, digest: Optional[str] = None) -> str:
+    page_req = replace(req, image_paths=[image_path], mode="general")
+    provenance = {
+        "image_hashes": [digest or sha256_file(image_path)],
+        "model": model,
+        "prompt_version": PAGE_PROMPT_VERSION,
+        "preprocess_version": PREPROCESS_VERSION,
+    }
+    return compute_cache_key(page_req, provenance)
+
+
+def _ocr_page(req: OcrRequest, page: int, image_path: str, use_cache: bool) -> OcrPageResult:
+    t0 = time.time()
+    model = str(req.options.get("model") or settings.VISION_MODEL)
+    key = page_cache_key(req, image_path, model) if use_cache else ""
+    if key:
+        cached = cache_get(key)
+        if cached:
+            fields = {name: cached[name] for name in _PAGE_FIELDS if name in cached}
+            return OcrPageResult(page=page, image_path=image_path, cached=True, latency_sec=round(time.time() - t0, 3), **fields)
+
+    timeout = int(req.options.get("timeout_sec", getattr(settings, "OCR_TIMEOUT_SEC", 120)))
+    policy = req.options.get("preprocess_policy", getattr(settings, "OCR_PREPROCESS_POLICY", "auto"))
+    max_passes = int(getattr(settings, "OCR_MAX_PASSES", 2))
+
+    metrics = compute_image_metrics(image_path)
+    preprocessed = should_preprocess(metrics, policy)
+    active = preprocess_image(image_path, metrics) if preprocessed else image_path
+    prompt = general_ocr_prompt(req.prompt)
+    result = OcrPageResult(page=page, image_path=image_path, model=model, image_metrics=metrics)
+    for _ in range(max(1, max_passes)):
+        try:
+            text = run_vision_page(model, prompt, active, timeout)
+        except VisionBackendError as exc:
+            result.error = str(exc)
+            result.reasons = ["vision_backend_error"]
+            break
+        score, reasons = score_general(text, metrics)
+        escalate, esc_reasons = should_escalate_general(
+            score,
+            unk_ratio(text),
+            metrics,
+            {"min_score": 0.65, "max_unk_ratio": getattr(settings, "OCR_MAX_UNK_RATIO", 0.05)},
+        )
+        result.text, result.score, result.reasons = text, score, esc_reasons or reasons
+        if not (getattr(settings, "OCR_SECOND_PASS", True) and escalate and max_passes > 1):
+            break
+        active = preprocess_image(image_path, metrics)
+        preprocessed = True
+        prompt = general_ocr_prompt("RETRY STRICTLY. Preserve text exactly.")
+
+    result.preprocessed = preprocessed
+    result.latency_sec = round(time.time() - t0, 3)
+    if key and not result.error:
+        cache_put(key, {name: getattr(result, name) for name in _PAGE_FIELDS})
+    return result
+
+
+def iter_ocr_pages(req: OcrRequest, *, max_concurrency: Optional[int] = None) -> Iterator[OcrPageResult]:
+    """Run general OCR page by page and yield each page as soon as it finishes.
+
+    At most ``max_concurrency`` pages (default ``OCR_MAX_CONCURRENCY``) are in
+    flight against the vision backend. Every page is cached on its own, so a
+    re-run after adding or replacing one page only sends that page. Results
+    arrive in completion order; use ``OcrPageResult.page`` to restore order.
+    """
+    paths = [str(p) for p in req.image_paths]
+    if not paths:
+        return
+    use_cache = bool(getattr(settings, "OCR_CACHE_ENABLED", True))
+    workers = max(1, int(max_concurrency or getattr(settings, "OCR_MAX_CONCURRENCY", 2) or 1))
+    pool = ThreadPoolExecutor(max_workers=min(workers, len(paths)), thread_name_prefix="somi-ocr-page")
+    futures = [pool.submit(_ocr_page, req, idx, path, use_cache) for idx, path in enumerate(paths, start=1)]
+    try:
+        for future in as_completed(futures):
+            yield future.result()
+    finally:
+        for future in futures:
+            future.cancel()
+        pool.shutdown(wait=False)
+
+
+def run_ocr_pages(req: OcrRequest, *, max_concurrency: Optional[int] = None) -> OcrResult:
+    """Page-parallel equivalent of ``general_ocr`` for multi-page scans."""
+    t0 = time.time()
+    transport_before = transport_stats()
+    pages: List[OcrPageResult] = sorted(iter_ocr_pages(req, max_concurrency=max_concurrency), key=lambda row: row.page)
+    raw_text = join_page_texts([row.text or (f"OCR error: {row.error}" if row.error else "") for row in pages])
+
+    reasons: List[str] = []
+    for row in pages:
+        for reason in row.reasons:
+            if reason not in reasons:
+                reasons.append(reason)
+    metrics = summarize_metrics([row.image_metrics for row in pages])
+    score = (sum(row.score for row in pages) / len(pages)) if pages else 0.0
+    result = build_general_result(
+        req,
+        raw_text=raw_text,
+        metrics=metrics,
+        reasons=reasons,
+        score=score,
+        model_used=pages[0].model if pages else str(req.options.get("model") or settings.VISION_MODEL),
+        preprocessed=any(row.preprocessed for row in pages),
+        is_vision_mode=False,
+        started_at=t0,
+    )
+    result.debug["pages"] = [
+        {"page": row.page, "cached": row.cached, "latency_sec": row.latency_sec, "error": row.error} for row in pages
+    ]
+    result.debug["cached_pages"] = sum(1 for row in pages if row.cached)
+    result.debug["transport"] = transport_delta(transport_before)
+    return result
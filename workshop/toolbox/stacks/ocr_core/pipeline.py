@@ -5,16 +5,24 @@ from pathlib import Path
 from typing import Any, Dict
 
 from config import settings
-from workshop.toolbox.stacks.ocr_core.cache import cache_get, cache_put, compute_cache_key, prune_cache
+from workshop.toolbox.stacks.ocr_core.cache import (
+    cache_get,
+    cache_get_similar,
+    cache_put,
+    compute_cache_key,
+    compute_variant_key,
+    prune_cache,
+)
 from workshop.toolbox.stacks.ocr_core.contracts import OcrQualityReport, OcrRequest, OcrResult
 from workshop.toolbox.stacks.ocr_core.extract_general import general_ocr
 from workshop.toolbox.stacks.ocr_core.extract_structured import structured_ocr
+from workshop.toolbox.stacks.ocr_core.pages import run_ocr_pages
 from workshop.toolbox.stacks.ocr_core.presets import apply_document_preset
 from workshop.toolbox.stacks.ocr_core.preprocess import PREPROCESS_VERSION
 from workshop.toolbox.stacks.ocr_core.prompts import PROMPT_VERSION
 from workshop.toolbox.stacks.ocr_core.schema import ensure_default_schema_migrated
 from workshop.toolbox.stacks.ocr_core.templates import match_template
-from workshop.toolbox.stacks.ocr_core.utils import image_hashes
+from workshop.toolbox.stacks.ocr_core.utils import image_hashes, perceptual_hashes
 
 
 def detect_mode(req: OcrRequest) -> str:
@@ -95,18 +103,33 @@ def run_ocr(req: OcrRequest) -> OcrResult:
 
     effective_req = OcrRequest(**{**asdict(req), "mode": mode})
 
-    if getattr(settings, "OCR_CACHE_ENABLED", True):
+    cache_enabled = bool(getattr(settings, "OCR_CACHE_ENABLED", True))
+    phash_enabled = cache_enabled and bool(getattr(settings, "OCR_CACHE_PHASH_ENABLED", False))
+    phashes: list[str] = []
+    if cache_enabled:
         key = compute_cache_key(effective_req, provenance)
+        variant_key = compute_variant_key(effective_req, provenance)
         cached = cache_get(key)
         if cached:
             return _result_from_payload(cached)
-
-    result = structured_ocr(effective_req) if mode == "structured" else general_ocr(effective_req)
+        if phash_enabled:
+            phashes = perceptual_hashes(req.image_paths)
+            cached = cache_get_similar(variant_key, phashes)
+            if cached:
+                result = _result_from_payload(cached)
+                result.provenance["cache_match"] = "perceptual"
+                return result
+
+    if mode == "structured":
+        result = structured_ocr(effective_req)
+    elif mode == "general" and len(req.image_paths) > 1 and bool(getattr(settings, "OCR_PAGE_PARALLEL", True)):
+        result = run_ocr_pages(effective_req)
+    else:
+        result = general_ocr(effective_req)
     result.provenance.update(provenance)
 
-    if getattr(settings, "OCR_CACHE_ENABLED", True):
-        cache_put(key, asdict(result))
+    if cache_enabled:
+        cache_put(key, asdict(result), variant_key=variant_key, phashes=phashes)
         prune_cache(int(getattr(settings, "OCR_CACHE_MAX_ITEMS", 2000)))
 
-    return result
-
+    return result
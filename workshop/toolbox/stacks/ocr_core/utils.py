@@ -1,8 +1,17 @@
 ﻿from __future__ import annotations
 
 import hashlib
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Iterable, List
+from typing import Callable, Iterable, List, Sequence, TypeVar
+
+try:
+    from PIL import Image
+except Exception:  # pragma: no cover
+    Image = None
+
+T = TypeVar("T")
+R = TypeVar("R")
 
 
 def sha256_file(path: str) -> str:
@@ -17,6 +26,37 @@ def image_hashes(paths: Iterable[str]) -> List[str]:
     return [sha256_file(p) for p in paths]
 
 
+def perceptual_hash(path: str, hash_size: int = 8) -> str:
+    """64-bit difference hash; stable across rescans, resizes and re-encodes of the same page."""
+    if Image is None:
+        return ""
+    try:
+        with Image.open(path) as img:
+            small = img.convert("L").resize((hash_size + 1, hash_size), Image.LANCZOS)
+            pixels = small.tobytes()
+    except Exception:
+        return ""
+    bits = 0
+    for row in range(hash_size):
+        offset = row * (hash_size + 1)
+        for col in range(hash_size):
+            bits = (bits << 1) | int(pixels[offset + col] > pixels[offset + col + 1])
+    return f"{bits:0{hash_size * hash_size // 4}x}"
+
+
+def perceptual_hashes(paths: Iterable[str]) -> List[str]:
+    return [perceptual_hash(p) for p in paths]
+
+
+def bounded_map(fn: Callable[[T], R], items: Sequence[T], max_workers: int) -> List[R]:
+    """Ordered map that runs at most ``max_workers`` calls at once (inline for a single item)."""
+    workers = min(max(1, int(max_workers or 1)), len(items))
+    if workers <= 1:
+        return [fn(item) for item in items]
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="somi-ocr") as pool:
+        return list(pool.map(fn, items))
+
+
 def safe_basename(path: str) -> str:
     return Path(path).stem.replace(" ", "_")
-
+
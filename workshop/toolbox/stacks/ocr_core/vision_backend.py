@@ -1,22 +1,179 @@
 ﻿from __future__ import annotations
 
 import base64
+import hashlib
+import io
 import json
+import threading
 import urllib.error
 import urllib.request
+from collections import OrderedDict
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
+
+try:
+    from PIL import Image, ImageOps
+except Exception:  # pragma: no cover
+    Image = None
+    ImageOps = None
+
+TRANSPORT_VERSION = "transport_v2"
 
 
 class VisionBackendError(Exception):
     pass
 
 
-def _encode_image(path: str) -> str:
+@dataclass(frozen=True)
+class TransportImage:
+    b64: str
+    original_bytes: int
+    sent_bytes: int
+    reencoded: bool
+
+
+class _TransportCache:
+    """
+    Byte-bounded LRU of encoded images keyed by content hash and transport settings.
+
+    File digests are memoized per (path, size, mtime) in a separate LRU of ``max_digests`` entries.
+    """
+
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024, max_digests: int = 4096) -> None:
+        self.max_bytes = max_bytes
+        self.max_digests = max(1, int(max_digests))
+        self._items: "OrderedDict[str, TransportImage]" = OrderedDict()
+        self._digests: "OrderedDict[Tuple[str, int, int], str]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.stats = {"images": 0, "cache_hits": 0, "original_bytes": 0, "sent_bytes": 0}
+
+    def digest(self, path: Path) -> str:
+        st = path.stat()
+        marker = (str(path.resolve()), int(st.st_size), int(st.st_mtime_ns))
+        with self._lock:
+            cached = self._digests.get(marker)
+            if cached:
+                self._digests.move_to_end(marker)
+        if cached:
+            return cached
+        h = hashlib.sha256()
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                h.update(chunk)
+        digest = h.hexdigest()
+        with self._lock:
+            self._digests[marker] = digest
+            while len(self._digests) > self.max_digests:
+                self._digests.popitem(last=False)
+        return digest
+
+    def get(self, key: str) -> Optional[TransportImage]:
+        with self._lock:
+            item = self._items.get(key)
+            if item is not None:
+                self._items.move_to_end(key)
+            return item
+
+    def put(self, key: str, item: TransportImage) -> None:
+        size = len(item.b64)
+        with self._lock:
+            if key in self._items or size > self.max_bytes:
+                return
+            self._items[key] = item
+            self._bytes += size
+            while self._bytes > self.max_bytes and self._items:
+                _, old = self._items.popitem(last=False)
+                self._bytes -= len(old.b64)
+
+    def record(self, item: TransportImage, *, hit: bool) -> None:
+        with self._lock:
+            self.stats["images"] += 1
+            self.stats["cache_hits"] += int(hit)
+            self.stats["original_bytes"] += item.original_bytes
+            self.stats["sent_bytes"] += item.sent_bytes
+
+
+_TRANSPORT = _TransportCache()
+
+
+def _transport_settings() -> Tuple[bool, int, str, int, int]:
+    from config import settings
+
+    return (
+        bool(getattr(settings, "OCR_TRANSPORT_ENABLED", True)),
+        int(getattr(settings, "OCR_TRANSPORT_MAX_DIM", 2048)),
+        str(getattr(settings, "OCR_TRANSPORT_FORMAT", "JPEG")).upper(),
+        int(getattr(settings, "OCR_TRANSPORT_QUALITY", 88)),
+        int(getattr(settings, "OCR_TRANSPORT_MIN_BYTES", 256 * 1024)),
+    )
+
+
+def _reencode(raw: bytes, max_dim: int, fmt: str, quality: int) -> Optional[bytes]:
+    if Image is None:
+        return None
+    try:
+        with Image.open(io.BytesIO(raw)) as img:
+            work = ImageOps.exif_transpose(img)
+            gray = work.mode in {"1", "L", "LA", "I;16"}
+            if work.mode in {"RGBA", "LA", "PA"} or (work.mode == "P" and "transparency" in work.info):
+                # Flatten onto white; a bare convert() turns transparent areas black.
+                rgba = work.convert("RGBA")
+                work = Image.new("RGB", rgba.size, (255, 255, 255))
+                work.paste(rgba, mask=rgba.getchannel("A"))
+            work = work.convert("L" if gray else "RGB")
+            if max(work.size) > max_dim:
+                work.thumbnail((max_dim, max_dim), Image.LANCZOS)
+            out = io.BytesIO()
+            work.save(out, format=fmt, quality=quality, **({"optimize": True} if fmt == "JPEG" else {"method": 4}))
+            return out.getvalue()
+    except Exception:
+        return None
+
+
+def prepare_transport_image(path: str) -> TransportImage:
+    """Return the payload actually sent for ``path``: bounded resolution, re-encoded once per content hash."""
     p = Path(path)
     if not p.exists():
         raise VisionBackendError(f"Image not found: {path}")
-    return base64.b64encode(p.read_bytes()).decode("utf-8")
+    enabled, max_dim, fmt, quality, min_bytes = _transport_settings()
+    key = f"{_TRANSPORT.digest(p)}:{TRANSPORT_VERSION}:{int(enabled)}:{max_dim}:{fmt}:{quality}:{min_bytes}"
+    item = _TRANSPORT.get(key)
+    if item is not None:
+        _TRANSPORT.record(item, hit=True)
+        return item
+
+    raw = p.read_bytes()
+    payload, reencoded = raw, False
+    if enabled and len(raw) >= min_bytes:
+        smaller = _reencode(raw, max_dim, fmt, quality)
+        if smaller is not None and len(smaller) < len(raw):
+            payload, reencoded = smaller, True
+    item = TransportImage(
+        b64=base64.b64encode(payload).decode("utf-8"),
+        original_bytes=len(raw),
+        sent_bytes=len(payload),
+        reencoded=reencoded,
+    )
+    _TRANSPORT.put(key, item)
+    _TRANSPORT.record(item, hit=False)
+    return item
+
+
+def transport_stats() -> Dict[str, int]:
+    with _TRANSPORT._lock:
+        return dict(_TRANSPORT.stats)
+
+
+def transport_delta(before: Dict[str, int]) -> Dict[str, int]:
+    """Transport counters accumulated since ``before`` (process-wide, so approximate under concurrency)."""
+    after = transport_stats()
+    return {name: int(after.get(name, 0)) - int(before.get(name, 0)) for name in after}
+
+
+def _encode_image(path: str) -> str:
+    return prepare_transport_image(path).b64
 
 
 def ollama_vision_chat(
@@ -72,4 +229,4 @@ def ollama_vision_chat(
     if not isinstance(content, str):
         raise VisionBackendError("Ollama response missing assistant content")
     return content.strip()
-
+
@@ -441,13 +441,21 @@ class Agentpedia:
             return
 
         try:
-            for f in to_store[:2]:
-                conflicts = self.manager.detect_conflicts(f["topic"], f["fact"], threshold=0.84)
+            # Same-source near-duplicates are re-phrasings of a stored row; cross-source ones are kept as corroboration.
+            kept: List[Dict[str, Any]] = []
+            for f, conflicts in zip(to_store, self.manager.detect_conflicts_bulk(to_store, threshold=0.84)):
+                if any(c.source and c.source == f.get("source") for c in conflicts):
+                    continue
                 if conflicts:
                     logger.debug(f"Agentpedia conflict candidates: {len(conflicts)} for topic='{f['topic'][:50]}'")
+                kept.append(f)
+            to_store = kept
         except Exception:
             pass
 
+        if not to_store:
+            return
+
         try:
             added = self.researched.add_facts(to_store, domain=domain_hint)
             try:
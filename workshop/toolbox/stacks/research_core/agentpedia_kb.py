@@ -60,6 +60,22 @@ def _hash(text: str) -> str:
     return hashlib.sha1(text.encode("utf-8", errors="ignore")).hexdigest()
 
 
+_FTS_STOPWORDS = {"a", "an", "and", "are", "for", "how", "in", "is", "of", "on", "or", "the", "to", "what", "with"}
+SCHEMA_VERSION = 1
+
+
+def _fts_query(text: str) -> str:
+    """OR-of-terms FTS5 query (plus the exact phrase) built only from safe alphanumeric tokens."""
+    tokens = re.findall(r"[a-z0-9]+", (text or "").lower())
+    if not tokens:
+        return ""
+    terms = [t for t in dict.fromkeys(tokens) if t not in _FTS_STOPWORDS] or list(dict.fromkeys(tokens))
+    parts = [f'"{t}"' for t in terms]
+    if len(tokens) > 1:
+        parts.insert(0, '"' + " ".join(tokens) + '"')
+    return " OR ".join(parts)
+
+
 @dataclass
 class AddResult:
     added_count: int
@@ -82,6 +98,7 @@ class AgentpediaKB:
         AGENTPEDIA_DIR.mkdir(parents=True, exist_ok=True)
         AGENTPEDIA_PAGES_DIR.mkdir(parents=True, exist_ok=True)
         self.path = AGENTPEDIA_DB
+        self._fts_enabled = False
         self._init_db()
 
     def _connect(self) -> sqlite3.Connection:
@@ -89,6 +106,8 @@ class AgentpediaKB:
         c.execute("PRAGMA journal_mode=WAL;")
         c.execute("PRAGMA synchronous=NORMAL;")
         c.execute("PRAGMA busy_timeout=2000;")
+        # INSERT OR REPLACE only fires the delete triggers that keep facts_fts/fact_tags in sync with this on.
+        c.execute("PRAGMA recursive_triggers=ON;")
         c.row_factory = sqlite3.Row
         return c
 
@@ -120,8 +139,83 @@ class AgentpediaKB:
             c.execute("CREATE INDEX IF NOT EXISTS idx_facts_topic ON facts(topic)")
             c.execute("CREATE INDEX IF NOT EXISTS idx_facts_dedupe ON facts(dedupe_key)")
             c.execute("CREATE INDEX IF NOT EXISTS idx_facts_status ON facts(status)")
+            c.execute("CREATE INDEX IF NOT EXISTS idx_facts_rank ON facts(status, confidence DESC, created_ts DESC)")
+            c.execute(
+                """
+                CREATE TABLE IF NOT EXISTS fact_tags (
+                    tag TEXT NOT NULL,
+                    fact_id TEXT NOT NULL,
+                    PRIMARY KEY(tag, fact_id)
+                )
+                """
+            )
+            c.execute("CREATE INDEX IF NOT EXISTS idx_fact_tags_fact ON fact_tags(fact_id)")
+            tag_rows = """
+                SELECT DISTINCT LOWER(TRIM(value)), new.fact_id
+                FROM json_each(CASE WHEN json_valid(new.tags) THEN new.tags ELSE '[]' END)
+                WHERE TRIM(value) != ''
+            """
+            c.executescript(
+                f"""
+                CREATE TRIGGER IF NOT EXISTS facts_tags_ai AFTER INSERT ON facts BEGIN
+                    INSERT OR IGNORE INTO fact_tags(tag, fact_id) {tag_rows};
+                END;
+                CREATE TRIGGER IF NOT EXISTS facts_tags_ad AFTER DELETE ON facts BEGIN
+                    DELETE FROM fact_tags WHERE fact_id = old.fact_id;
+                END;
+                CREATE TRIGGER IF NOT EXISTS facts_tags_au AFTER UPDATE OF tags, fact_id ON facts BEGIN
+                    DELETE FROM fact_tags WHERE fact_id = old.fact_id;
+                    INSERT OR IGNORE INTO fact_tags(tag, fact_id) {tag_rows};
+                END;
+                """
+            )
+            version = int(c.execute("PRAGMA user_version").fetchone()[0])
+            if version < 1:
+                # Existing DBs predate fact_tags; backfill it once from the JSON tag column.
+                c.execute(
+                    """
+                    INSERT OR IGNORE INTO fact_tags(tag, fact_id)
+                    SELECT DISTINCT LOWER(TRIM(j.value)), f.fact_id
+                    FROM facts f, json_each(CASE WHEN json_valid(f.tags) THEN f.tags ELSE '[]' END) j
+                    WHERE TRIM(j.value) != ''
+                    """
+                )
+                c.execute(f"PRAGMA user_version={SCHEMA_VERSION}")
+            self._init_fts(c)
             c.commit()
 
+    def _init_fts(self, c: sqlite3.Connection) -> None:
+        """External-content FTS5 mirror of facts, maintained by triggers; rebuilt when first created."""
+        existed = c.execute("SELECT 1 FROM sqlite_master WHERE type='table' AND name='facts_fts'").fetchone() is not None
+        try:
+            c.execute(
+                """
+                CREATE VIRTUAL TABLE IF NOT EXISTS facts_fts USING fts5(
+                    topic, claim, summary, content='facts', content_rowid='rowid', tokenize='porter unicode61'
+                )
+                """
+            )
+        except sqlite3.OperationalError:
+            self._fts_enabled = False
+            return
+        c.executescript(
+            """
+            CREATE TRIGGER IF NOT EXISTS facts_fts_ai AFTER INSERT ON facts BEGIN
+                INSERT INTO facts_fts(rowid, topic, claim, summary) VALUES (new.rowid, new.topic, new.claim, new.summary);
+            END;
+            CREATE TRIGGER IF NOT EXISTS facts_fts_ad AFTER DELETE ON facts BEGIN
+                INSERT INTO facts_fts(facts_fts, rowid, topic, claim, summary) VALUES ('delete', old.rowid, old.topic, old.claim, old.summary);
+            END;
+            CREATE TRIGGER IF NOT EXISTS facts_fts_au AFTER UPDATE ON facts BEGIN
+                INSERT INTO facts_fts(facts_fts, rowid, topic, claim, summary) VALUES ('delete', old.rowid, old.topic, old.claim, old.summary);
+                INSERT INTO facts_fts(rowid, topic, claim, summary) VALUES (new.rowid, new.topic, new.claim, new.summary);
+            END;
+            """
+        )
+        if not existed:
+            c.execute("INSERT INTO facts_fts(facts_fts) VALUES('rebuild')")
+        self._fts_enabled = True
+
     def _state(self) -> dict[str, Any]:
         if not AGENTPEDIA_STATE.exists():
             return {"last_topic_run": None, "last_run_ts": None, "per_topic_last_updated": {}, "run_count_week": 0, "week_start": None, "last_errors": []}
@@ -225,18 +319,34 @@ class AgentpediaKB:
         q = (query or "").strip().lower()
         if not q:
             return []
-        pattern = f"%{q}%"
+        tag_list = sorted({str(t).strip().lower() for t in (tags or []) if str(t).strip()})
+        tag_sql = ""
+        if tag_list:
+            tag_sql = f" AND f.fact_id IN (SELECT fact_id FROM fact_tags WHERE tag IN ({','.join('?' for _ in tag_list)}))"
+        match = _fts_query(q) if self._fts_enabled else ""
         with self._connect() as c:
-            rows = c.execute(
-                """
-                SELECT * FROM facts
-                WHERE status='committed'
-                  AND LOWER(topic || ' ' || claim || ' ' || COALESCE(summary,'')) LIKE ?
-                ORDER BY confidence DESC, created_ts DESC
-                LIMIT ?
-                """,
-                (pattern, int(k)),
-            ).fetchall()
+            if match:
+                # BM25 is negative (lower is better); scaling by 0.5..1.5 lets confidence reorder near-ties.
+                rows = c.execute(
+                    f"""
+                    SELECT f.* FROM facts_fts JOIN facts f ON f.rowid = facts_fts.rowid
+                    WHERE facts_fts MATCH ? AND f.status='committed'{tag_sql}
+                    ORDER BY bm25(facts_fts, 2.0, 1.0, 0.5) * (0.5 + f.confidence) ASC, f.created_ts DESC
+                    LIMIT ?
+                    """,
+                    (match, *tag_list, int(k)),
+                ).fetchall()
+            else:
+                rows = c.execute(
+                    f"""
+                    SELECT f.* FROM facts f
+                    WHERE f.status='committed'
+                      AND LOWER(f.topic || ' ' || f.claim || ' ' || COALESCE(f.summary,'')) LIKE ?{tag_sql}
+                    ORDER BY f.confidence DESC, f.created_ts DESC
+                    LIMIT ?
+                    """,
+                    (f"%{q}%", *tag_list, int(k)),
+                ).fetchall()
 
         out = []
         for r in rows:
@@ -245,8 +355,6 @@ class AgentpediaKB:
                 item["tags"] = json.loads(item.get("tags") or "[]")
             except Exception:
                 item["tags"] = []
-            if tags and not set(str(t).lower() for t in tags).intersection(set(str(t).lower() for t in item["tags"])):
-                continue
             out.append(item)
         return out
 
@@ -2,9 +2,10 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 import re
-from typing import List, Literal
+from typing import List, Literal, Optional
 from urllib.parse import urlparse
 
+from routing.query_analysis import QueryAnalysis, analyze_query, register_terms
 
 _URL_RE = re.compile(r"https?://[^\s)>\]]+", re.IGNORECASE)
 
@@ -130,6 +131,95 @@ _SOFTWARE_PROJECT_HINTS = {
     "pytest": ("pytest",),
     "tailwind css": ("tailwind css", "tailwindcss"),
 }
+_TRIP_COST_MARKERS = (
+    "budget for",
+    "food budget",
+    "travel cost",
+    "average daily cost",
+    "how much should i budget",
+    " cost of ",
+    " expensive",
+)
+_TRIP_TERMS = ("trip", "travel", "visit", "itinerary", "days in")
+_TRAVEL_LOOKUP_MARKERS = (
+    "best time to visit",
+    "what to do in",
+    "things to do in",
+    "top things to do in",
+    "how many days in",
+    "budget for",
+    "budget in",
+    "food budget",
+    "travel cost",
+    "average daily cost",
+    "how much should i budget",
+    " cost of ",
+    " expensive",
+)
+_COMPARE_MARKERS = ("compare", "versus", " vs ", "which is better", "should i buy", "difference between", "pros and cons")
+_GOVERNMENT_SUBJECT_TERMS = (
+    "passport",
+    "visa",
+    "immigration",
+    "uscis",
+    "green card",
+    "citizenship",
+    "naturalization",
+    "social security",
+    "ssa",
+    "irs",
+    "tax",
+    "medicare",
+    "medicaid",
+)
+_GOVERNMENT_ASK_TERMS = (
+    "requirement",
+    "requirements",
+    "renew",
+    "renewal",
+    "apply",
+    "application",
+    "document",
+    "documents",
+    "eligibility",
+    "processing time",
+    "fees",
+    "fee",
+    "deadline",
+)
+_PYTHON_DOCS_MARKERS = ("docs", "documentation", "release notes", "what's new", "whats new", "changelog")
+_MEDICAL_GUIDANCE_TERMS = (
+    "guideline",
+    "guidelines",
+    "guidance",
+    "recommendation",
+    "recommendations",
+    "treatment",
+    "management",
+    "therapy",
+    "care standard",
+    "standards of care",
+)
+register_terms(
+    _RECENCY_TERMS,
+    _CITATION_TERMS,
+    _DEEP_TERMS,
+    _SOFTWARE_CHANGE_TERMS,
+    _GITHUB_EXPLICIT_TERMS,
+    _GITHUB_CONTEXT_TERMS,
+    _SOFTWARE_TERMS,
+    *_SOFTWARE_PROJECT_HINTS.values(),
+    _TRIP_COST_MARKERS,
+    _TRIP_TERMS,
+    _TRAVEL_LOOKUP_MARKERS,
+    _COMPARE_MARKERS,
+    _GOVERNMENT_SUBJECT_TERMS,
+    _GOVERNMENT_ASK_TERMS,
+    _PYTHON_DOCS_MARKERS,
+    _MEDICAL_GUIDANCE_TERMS,
+    ("itinerary", "github", "python"),
+)
+
 _LEADING_ACTION_RE = re.compile(
     r"^(?:please\s+)?(?:can you\s+|could you\s+|would you\s+)?(?:check out|look into|look up|summarize|summarise|research|analyze|analyse|compare|tell me about|what is|what's|who is|who's)\s+",
     re.IGNORECASE,
@@ -204,40 +294,31 @@ def extract_urls(text: str) -> List[str]:
     return out
 
 
-def _contains_any(text: str, needles: tuple[str, ...]) -> bool:
-    haystack = str(text or "").lower()
-    for term in needles:
-        needle = str(term or "").lower()
-        if not needle:
-            continue
-        if needle != needle.strip():
-            if needle in haystack:
-                return True
-            continue
-        pattern = r"(?<![a-z0-9])" + re.escape(needle).replace(r"\ ", r"\s+") + r"(?![a-z0-9])"
-        if re.search(pattern, haystack) is not None:
-            return True
-    return False
+def _contains_any(text: str | QueryAnalysis, needles: tuple[str, ...]) -> bool:
+    qa = text if isinstance(text, QueryAnalysis) else analyze_query(text)
+    return qa.has_any_word(needles)
 
 
 def _software_project_labels(query: str) -> List[str]:
-    ql = " ".join(str(query or "").split()).strip().lower()
-    if not ql:
-        return []
-    labels: List[str] = []
-    for label, hints in _SOFTWARE_PROJECT_HINTS.items():
-        if any(hint in ql for hint in hints):
-            labels.append(label)
-    return labels
+    qa = analyze_query(query)
+    labels = qa.memo(
+        "browse.software_project_labels",
+        lambda: [label for label, hints in _SOFTWARE_PROJECT_HINTS.items() if qa.has_any(hints)],
+    )
+    return list(labels)
 
 
 def is_software_change_query(query: str) -> bool:
-    ql = " ".join(str(query or "").split()).strip().lower()
-    if not ql:
+    qa = analyze_query(query)
+    return qa.memo("browse.software_change", lambda: _is_software_change(qa))
+
+
+def _is_software_change(qa: QueryAnalysis) -> bool:
+    if not qa.text:
         return False
-    if not _contains_any(ql, _SOFTWARE_CHANGE_TERMS):
+    if not _contains_any(qa, _SOFTWARE_CHANGE_TERMS):
         return False
-    return bool(_software_project_labels(ql)) or _contains_any(ql, _SOFTWARE_TERMS)
+    return bool(_software_project_labels(qa.text)) or _contains_any(qa, _SOFTWARE_TERMS)
 
 
 def _is_github_repo_url(url: str) -> bool:
@@ -307,23 +388,17 @@ def comparison_subjects(text: str) -> List[str]:
 
 
 def is_trip_planning_query(query: str) -> bool:
-    ql = " ".join(str(query or "").split()).strip().lower()
+    qa = analyze_query(query)
+    return qa.memo("browse.trip_planning", lambda: _is_trip_planning(qa))
+
+
+def _is_trip_planning(qa: QueryAnalysis) -> bool:
+    ql = qa.text
     if not ql:
         return False
-    if "itinerary" in ql:
+    if qa.has("itinerary"):
         return True
-    if any(
-        marker in ql
-        for marker in (
-            "budget for",
-            "food budget",
-            "travel cost",
-            "average daily cost",
-            "how much should i budget",
-            " cost of ",
-            " expensive",
-        )
-    ):
+    if qa.has_any(_TRIP_COST_MARKERS):
         return False
     patterns = (
         r"\bplan a\b",
@@ -333,7 +408,7 @@ def is_trip_planning_query(query: str) -> bool:
         r"\bfood itinerary\b",
         r"\b\d+\s*day\b",
     )
-    return any(re.search(pattern, ql) is not None for pattern in patterns) and any(term in ql for term in ("trip", "travel", "visit", "itinerary", "days in"))
+    return any(re.search(pattern, ql) is not None for pattern in patterns) and qa.has_any(_TRIP_TERMS)
 
 
 def _travel_lookup_destination(query: str) -> str:
@@ -359,75 +434,38 @@ def _travel_lookup_destination(query: str) -> str:
 
 
 def is_travel_lookup_query(query: str) -> bool:
-    ql = " ".join(str(query or "").split()).strip().lower()
-    if not ql or is_trip_planning_query(ql):
+    qa = analyze_query(query)
+    return qa.memo("browse.travel_lookup", lambda: _is_travel_lookup(qa))
+
+
+def _is_travel_lookup(qa: QueryAnalysis) -> bool:
+    if not qa.text or is_trip_planning_query(qa.text):
         return False
-    if "github" in ql:
+    if qa.has("github"):
         return False
-    markers = (
-        "best time to visit",
-        "what to do in",
-        "things to do in",
-        "top things to do in",
-        "how many days in",
-        "budget for",
-        "budget in",
-        "food budget",
-        "travel cost",
-        "average daily cost",
-        "how much should i budget",
-        " cost of ",
-        " expensive",
-    )
-    return any(marker in ql for marker in markers) and bool(_travel_lookup_destination(query))
+    return qa.has_any(_TRAVEL_LOOKUP_MARKERS) and bool(_travel_lookup_destination(qa.text))
 
 
 def is_shopping_compare_query(query: str) -> bool:
-    ql = " ".join(str(query or "").split()).strip().lower()
-    if not ql:
+    qa = analyze_query(query)
+    return qa.memo("browse.shopping_compare", lambda: _is_shopping_compare(qa))
+
+
+def _is_shopping_compare(qa: QueryAnalysis) -> bool:
+    if not qa.text:
         return False
-    compare_like = any(marker in ql for marker in ("compare", "versus", " vs ", "which is better", "should i buy", "difference between", "pros and cons"))
-    subjects = comparison_subjects(normalize_lookup_subject(query))
+    subjects = comparison_subjects(normalize_lookup_subject(qa.text))
     if len(subjects) < 2:
         return False
-    return compare_like and "github" not in ql
+    return qa.has_any(_COMPARE_MARKERS) and not qa.has("github")
 
 
 def is_government_requirements_query(query: str) -> bool:
-    ql = " ".join(str(query or "").split()).strip().lower()
-    if not ql:
-        return False
-    subject_terms = (
-        "passport",
-        "visa",
-        "immigration",
-        "uscis",
-        "green card",
-        "citizenship",
-        "naturalization",
-        "social security",
-        "ssa",
-        "irs",
-        "tax",
-        "medicare",
-        "medicaid",
+    qa = analyze_query(query)
+    return qa.memo(
+        "browse.government_requirements",
+        lambda: qa.has_any(_GOVERNMENT_SUBJECT_TERMS) and qa.has_any(_GOVERNMENT_ASK_TERMS),
     )
-    ask_terms = (
-        "requirement",
-        "requirements",
-        "renew",
-        "renewal",
-        "apply",
-        "application",
-        "document",
-        "documents",
-        "eligibility",
-        "processing time",
-        "fees",
-        "fee",
-        "deadline",
-    )
-    return any(term in ql for term in subject_terms) and any(term in ql for term in ask_terms)
 
 
 def trip_planning_variants(query: str) -> List[str]:
@@ -523,31 +561,19 @@ def shopping_compare_variants(query: str) -> List[str]:
 
 
 def _is_python_docs_like_query(query: str) -> bool:
-    ql = " ".join(str(query or "").split()).strip().lower()
-    if "python" not in ql:
-        return False
-    markers = ("docs", "documentation", "release notes", "what's new", "whats new", "changelog")
-    return any(marker in ql for marker in markers)
+    qa = analyze_query(query)
+    return qa.has("python") and qa.has_any(_PYTHON_DOCS_MARKERS)
 
 
 def infer_official_domains(query: str) -> List[str]:
-    ql = str(query or "").lower()
+    qa = analyze_query(query)
+    return list(qa.memo("browse.official_domains", lambda: _infer_official_domains(qa)))
+
+
+def _infer_official_domains(qa: QueryAnalysis) -> List[str]:
+    ql = qa.text
     domains: List[str] = []
-    medical_guidance = _contains_any(ql, _RECENCY_TERMS) or any(
-        term in ql
-        for term in (
-            "guideline",
-            "guidelines",
-            "guidance",
-            "recommendation",
-            "recommendations",
-            "treatment",
-            "management",
-            "therapy",
-            "care standard",
-            "standards of care",
-        )
-    )
+    medical_guidance = _contains_any(qa, _RECENCY_TERMS) or qa.has_any(_MEDICAL_GUIDANCE_TERMS)
 
     def add(*items: str) -> None:
         for item in items:
@@ -759,9 +785,16 @@ def _software_change_variants(query: str) -> List[str]:
     return variants
 
 
-def build_browse_plan(query: str, *, intent_hint: str = "", route_hint: str = "") -> BrowsePlan:
+def build_browse_plan(
+    query: str,
+    *,
+    intent_hint: str = "",
+    route_hint: str = "",
+    analysis: Optional[QueryAnalysis] = None,
+) -> BrowsePlan:
     q = " ".join(str(query or "").split()).strip()
     ql = q.lower()
+    qa = analysis or analyze_query(q)
     urls = extract_urls(q)
     repo_urls = [url for url in urls if _is_github_repo_url(url)]
     ql_without_urls = _URL_RE.sub(" ", q).lower()
@@ -769,9 +802,9 @@ def build_browse_plan(query: str, *, intent_hint: str = "", route_hint: str = ""
     github_subject = _github_subject_from_urls(repo_urls)
     if github_subject:
         subject = github_subject
-    needs_recency = _contains_any(ql, _RECENCY_TERMS)
-    needs_citations = _contains_any(ql, _CITATION_TERMS)
-    wants_deep = _contains_any(ql, _DEEP_TERMS)
+    needs_recency = _contains_any(qa, _RECENCY_TERMS)
+    needs_citations = _contains_any(qa, _CITATION_TERMS)
+    wants_deep = _contains_any(qa, _DEEP_TERMS)
     trip_planning = is_trip_planning_query(q)
     travel_lookup = is_travel_lookup_query(q)
     shopping_compare = is_shopping_compare_query(q)
@@ -779,7 +812,7 @@ def build_browse_plan(query: str, *, intent_hint: str = "", route_hint: str = ""
     mentions_github = _contains_any(ql_without_urls, _GITHUB_EXPLICIT_TERMS) or bool(repo_urls)
     if not mentions_github and _contains_any(ql_without_urls, _GITHUB_CONTEXT_TERMS):
         mentions_github = " github " in f" {ql_without_urls} " or any(term in ql_without_urls for term in ("repo", "repository", "readme"))
-    software_lookup = _contains_any(ql, _SOFTWARE_TERMS)
+    software_lookup = _contains_any(qa, _SOFTWARE_TERMS)
     software_change = is_software_change_query(q)
     inferred_official_domains = infer_official_domains(ql)
     official_preferred = (
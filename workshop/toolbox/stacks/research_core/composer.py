@@ -11,7 +11,7 @@ from urllib.parse import parse_qsl, urlencode, urlparse, urlunparse
 import httpx
 
 from config.settings import SEARXNG_DOMAIN_PROFILES
-from workshop.toolbox.stacks.research_core.answer_adequacy import assess_answer_adequacy
+from workshop.toolbox.stacks.research_core.answer_adequacy import AdequacyReport, assess_answer_adequacy
 from workshop.toolbox.stacks.research_core.browse_planner import is_shopping_compare_query, is_trip_planning_query, shopping_compare_variants, trip_planning_variants
 from workshop.toolbox.stacks.research_core.evidence_claims import extract_claim_candidates
 from workshop.toolbox.stacks.research_core.evidence_reconcile import reconcile_claims
@@ -232,6 +232,49 @@ def dedupe_items(items: List[EvidenceItem]) -> List[EvidenceItem]:
     return list(kept.values())
 
 
+def assess_row_adequacy(
+    question: str,
+    rows: List[Dict[str, Any]],
+    *,
+    domain_key: str | None = None,
+    browse_mode: str = "deep",
+) -> AdequacyReport:
+    """
+    Run the answer adequacy checks over already-fetched search rows.
+
+    Page text in ``row["content"]`` stands in for the deep-read excerpt, so a
+    caller streaming fetches can ask after every arrival whether it has enough.
+    """
+    question = (question or "").strip()
+    now = _now_iso()
+    normalized: List[EvidenceItem] = []
+    for row in rows or []:
+        if not isinstance(row, dict):
+            continue
+        item = _normalize_result(row, retrieved_at=now)
+        if item is None:
+            continue
+        content = str(row.get("content") or "").strip()
+        if content:
+            item.content_excerpt = content[:2500]
+        normalized.append(item)
+    scored = score_items(dedupe_items(normalized), question=question, needs_recency=_needs_recency(question))
+    candidates = extract_claim_candidates(scored, max_claims_per_item=5)
+    claims, conflicts = reconcile_claims(
+        candidates,
+        items_by_id={item.id: item for item in scored},
+        risk_mode=_risk_mode(question, "auto"),
+    )
+    return assess_answer_adequacy(
+        question,
+        items=scored,
+        claims=claims,
+        conflicts=conflicts,
+        domain_key=str(domain_key or _infer_domain(question) or "general"),
+        browse_mode=browse_mode,
+    )
+
+
 def _claim_sources(claim, items_by_id: Dict[str, EvidenceItem]) -> List[str]:
     out: List[str] = []
     for item_id in claim.supporting_item_ids[:3]:
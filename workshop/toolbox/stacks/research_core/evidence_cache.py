@@ -2,9 +2,14 @@ from __future__ import annotations
 
 import hashlib
 import json
+import os
+import re
+import sqlite3
+import time
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Any, Dict, Optional
+from threading import RLock
+from typing import Any, Dict, List, Optional
 from urllib.parse import parse_qsl, urlencode, urlparse, urlunparse
 
 
@@ -24,6 +29,15 @@ _TRACKING_KEYS = {
     "ref_src",
 }
 
+_QUERY_TOKEN_RE = re.compile(r"[a-z0-9]+")
+# Filler that does not change what a research question is about.
+_QUERY_STOPWORDS = frozenset(
+    {
+        "a", "an", "and", "about", "are", "can", "could", "do", "does", "for", "give", "how", "i", "in", "is",
+        "me", "of", "on", "please", "show", "tell", "the", "to", "what", "whats", "which", "with", "you",
+    }
+)
+
 
 def utc_now_iso() -> str:
     return datetime.now(timezone.utc).replace(microsecond=0).isoformat()
@@ -76,41 +90,223 @@ def cache_identity(query: str, *, mode: str, domain: str) -> str:
     return hashlib.sha1(basis.encode("utf-8")).hexdigest()
 
 
+def query_tokens(query: str) -> List[str]:
+    """Sorted distinct content tokens of ``query``; word order and filler words do not matter."""
+    tokens = set(_QUERY_TOKEN_RE.findall(str(query or "").lower()))
+    content = tokens - _QUERY_STOPWORDS
+    return sorted(content or tokens)
+
+
+def query_signature(query: str) -> str:
+    return " ".join(query_tokens(query))
+
+
 class EvidenceCacheStore:
+    """
+    One compact JSON file per bundle plus a SQLite index beside them.
+
+    Lookups try the exact query identity, then the order-insensitive token
+    signature, then the closest stored query by token Jaccard. A near match
+    must not carry tokens the query lacks (its evidence would answer a
+    narrower question), and numbers such as years must agree. Expiry and the record cap run off indexed columns every
+    ``prune_every`` saves instead of globbing the directory on each save.
+    """
+
+    INDEX_NAME = "index.sqlite3"
+    SCHEMA_VERSION = 1
+
     def __init__(
         self,
         root: str | Path = "state/research_cache",
         *,
         ttl_seconds: int = 1800,
         max_records: int = 256,
+        near_match: float = 0.8,
+        prune_every: int = 16,
     ) -> None:
         self.root = Path(root)
         self.root.mkdir(parents=True, exist_ok=True)
         self.ttl_seconds = max(60, int(ttl_seconds or 1800))
         self.max_records = max(32, int(max_records or 256))
+        self.near_match = min(1.0, max(0.5, float(near_match)))
+        self.prune_every = max(1, int(prune_every or 16))
+        self.index_path = self.root / self.INDEX_NAME
+        self.stats: Dict[str, int] = {"lookups": 0, "exact": 0, "signature": 0, "near": 0, "misses": 0, "expired": 0}
+        self._saves_since_prune = 0
+        self._lock = RLock()
+        self._init_db()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(str(self.index_path), timeout=30.0, check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    def _init_db(self) -> None:
+        with self._lock, self._connect() as conn:
+            conn.executescript(
+                """
+                CREATE TABLE IF NOT EXISTS evidence_cache (
+                    identity TEXT PRIMARY KEY,
+                    filename TEXT NOT NULL,
+                    mode TEXT NOT NULL,
+                    domain TEXT NOT NULL,
+                    query TEXT NOT NULL,
+                    signature TEXT NOT NULL,
+                    token_count INTEGER NOT NULL,
+                    saved_at REAL NOT NULL,
+                    expires_at REAL NOT NULL
+                );
+                CREATE INDEX IF NOT EXISTS idx_evidence_cache_signature ON evidence_cache(mode, domain, signature);
+                CREATE INDEX IF NOT EXISTS idx_evidence_cache_expires ON evidence_cache(expires_at);
+                CREATE INDEX IF NOT EXISTS idx_evidence_cache_saved ON evidence_cache(saved_at);
+                CREATE TABLE IF NOT EXISTS evidence_cache_tokens (
+                    token TEXT NOT NULL,
+                    identity TEXT NOT NULL,
+                    PRIMARY KEY (token, identity)
+                ) WITHOUT ROWID;
+                CREATE INDEX IF NOT EXISTS idx_evidence_cache_tokens_identity ON evidence_cache_tokens(identity);
+                """
+            )
+            if int(conn.execute("PRAGMA user_version").fetchone()[0]) < self.SCHEMA_VERSION:
+                self._backfill(conn)
+                conn.execute(f"PRAGMA user_version={self.SCHEMA_VERSION}")
+
+    def _backfill(self, conn: sqlite3.Connection) -> None:
+        """Index bundle files written before the index existed."""
+        for path in self.root.glob("*.json"):
+            try:
+                payload = json.loads(path.read_text(encoding="utf-8"))
+            except Exception:
+                continue
+            if isinstance(payload, dict):
+                self._index_record(conn, path.stem, path.name, payload)
+
+    def _index_record(self, conn: sqlite3.Connection, identity: str, filename: str, record: Dict[str, Any]) -> None:
+        query = str(record.get("query") or "").strip()
+        tokens = query_tokens(query)
+        saved_at = parse_utc_iso(str(record.get("saved_at") or ""))
+        expires_at = parse_utc_iso(str(record.get("expires_at") or ""))
+        saved_ts = saved_at.timestamp() if saved_at else time.time()
+        expires_ts = expires_at.timestamp() if expires_at else saved_ts + self.ttl_seconds
+        conn.execute("DELETE FROM evidence_cache_tokens WHERE identity = ?", (identity,))
+        conn.execute(
+            """
+            INSERT OR REPLACE INTO evidence_cache
+                (identity, filename, mode, domain, query, signature, token_count, saved_at, expires_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            (
+                identity,
+                filename,
+                str(record.get("mode") or "deep").strip().lower(),
+                str(record.get("domain") or "general").strip().lower(),
+                query,
+                " ".join(tokens),
+                len(tokens),
+                saved_ts,
+                expires_ts,
+            ),
+        )
+        conn.executemany("INSERT OR IGNORE INTO evidence_cache_tokens (token, identity) VALUES (?, ?)", [(tok, identity) for tok in tokens])
+
+    def _drop(self, conn: sqlite3.Connection, identity: str, filename: str) -> None:
+        conn.execute("DELETE FROM evidence_cache WHERE identity = ?", (identity,))
+        conn.execute("DELETE FROM evidence_cache_tokens WHERE identity = ?", (identity,))
+        try:
+            (self.root / filename).unlink()
+        except OSError:
+            pass
 
     def _path_for(self, query: str, *, mode: str, domain: str) -> Path:
         return self.root / f"{cache_identity(query, mode=mode, domain=domain)}.json"
 
-    def load(self, query: str, *, mode: str, domain: str = "general") -> Optional[Dict[str, Any]]:
-        path = self._path_for(query, mode=mode, domain=domain)
-        if not path.exists():
-            return None
-        try:
-            payload = json.loads(path.read_text(encoding="utf-8"))
-        except Exception:
+    def _near_row(self, conn: sqlite3.Connection, tokens: List[str], *, mode: str, domain: str, now: float) -> Optional[sqlite3.Row]:
+        if not tokens:
             return None
-        expires_at = parse_utc_iso(str((payload or {}).get("expires_at") or ""))
-        if expires_at and datetime.now(timezone.utc) > expires_at:
+        marks = ",".join("?" for _ in tokens)
+        rows = conn.execute(
+            f"""
+            SELECT e.identity, e.filename, e.signature, e.token_count, COUNT(*) AS shared
+            FROM evidence_cache_tokens t JOIN evidence_cache e ON e.identity = t.identity
+            WHERE t.token IN ({marks}) AND e.mode = ? AND e.domain = ? AND e.expires_at > ?
+            GROUP BY e.identity
+            ORDER BY shared DESC, e.saved_at DESC
+            LIMIT 8
+            """,
+            (*tokens, mode, domain, now),
+        ).fetchall()
+        numbers = {tok for tok in tokens if tok.isdigit()}
+        for row in rows:
+            shared = int(row["shared"])
+            if int(row["token_count"]) > shared:
+                continue
+            jaccard = shared / float(len(tokens) + int(row["token_count"]) - shared)
+            if jaccard < self.near_match:
+                continue
+            if {tok for tok in str(row["signature"]).split() if tok.isdigit()} != numbers:
+                continue
+            return row
+        return None
+
+    def _find(self, query: str, *, mode: str, domain: str) -> tuple[Optional[sqlite3.Row], str]:
+        mode = str(mode or "deep").strip().lower()
+        domain = str(domain or "general").strip().lower()
+        identity = cache_identity(query, mode=mode, domain=domain)
+        tokens = query_tokens(query)
+        now = time.time()
+        with self._lock, self._connect() as conn:
+            row = conn.execute("SELECT identity, filename, expires_at FROM evidence_cache WHERE identity = ?", (identity,)).fetchone()
+            if row is None and (self.root / f"{identity}.json").exists():
+                # Written by an older build or another process; index it now.
+                try:
+                    payload = json.loads((self.root / f"{identity}.json").read_text(encoding="utf-8"))
+                    self._index_record(conn, identity, f"{identity}.json", payload if isinstance(payload, dict) else {})
+                    row = conn.execute("SELECT identity, filename, expires_at FROM evidence_cache WHERE identity = ?", (identity,)).fetchone()
+                except Exception:
+                    row = None
+            if row is not None:
+                if float(row["expires_at"]) < now:
+                    self._drop(conn, row["identity"], row["filename"])
+                    self.stats["expired"] += 1
+                else:
+                    return row, "exact"
+            row = conn.execute(
+                """
+                SELECT identity, filename FROM evidence_cache
+                WHERE mode = ? AND domain = ? AND signature = ? AND expires_at > ?
+                ORDER BY saved_at DESC LIMIT 1
+                """,
+                (mode, domain, " ".join(tokens), now),
+            ).fetchone()
+            if row is not None:
+                return row, "signature"
+            row = self._near_row(conn, tokens, mode=mode, domain=domain, now=now)
+            if row is not None:
+                return row, "near"
+        return None, ""
+
+    def load(self, query: str, *, mode: str, domain: str = "general") -> Optional[Dict[str, Any]]:
+        self.stats["lookups"] += 1
+        row, match = self._find(query, mode=mode, domain=domain)
+        payload = None
+        if row is not None:
             try:
-                path.unlink()
-            except OSError:
-                pass
+                payload = json.loads((self.root / row["filename"]).read_text(encoding="utf-8"))
+            except Exception:
+                with self._lock, self._connect() as conn:
+                    self._drop(conn, row["identity"], row["filename"])
+        if not isinstance(payload, dict):
+            self.stats["misses"] += 1
             return None
-        return payload if isinstance(payload, dict) else None
+        self.stats[match] += 1
+        payload["cache_match"] = match
+        return payload
 
     def save(self, query: str, payload: Dict[str, Any], *, mode: str, domain: str = "general") -> Path:
         record = dict(payload or {})
+        record.pop("cache_match", None)
         now = datetime.now(timezone.utc).replace(microsecond=0)
         saved_at = parse_utc_iso(str(record.get("saved_at") or "")) or now
         expires_at = parse_utc_iso(str(record.get("expires_at") or "")) or (saved_at + timedelta(seconds=self.ttl_seconds))
@@ -120,8 +316,14 @@ class EvidenceCacheStore:
         record["saved_at"] = saved_at.isoformat()
         record["expires_at"] = expires_at.isoformat()
         path = self._path_for(query, mode=mode, domain=domain)
-        path.write_text(json.dumps(record, ensure_ascii=False, indent=2, sort_keys=True), encoding="utf-8")
-        self._prune()
+        tmp = path.with_suffix(".json.tmp")
+        tmp.write_text(json.dumps(record, ensure_ascii=False, separators=(",", ":"), sort_keys=True), encoding="utf-8")
+        os.replace(tmp, path)
+        with self._lock, self._connect() as conn:
+            self._index_record(conn, path.stem, path.name, record)
+        self._saves_since_prune += 1
+        if self._saves_since_prune >= self.prune_every:
+            self._prune()
         return path
 
     def age_seconds(self, payload: Dict[str, Any]) -> Optional[float]:
@@ -130,10 +332,21 @@ class EvidenceCacheStore:
             return None
         return max(0.0, (datetime.now(timezone.utc) - saved_at).total_seconds())
 
+    def hit_rate(self) -> float:
+        lookups = int(self.stats.get("lookups") or 0)
+        hits = sum(int(self.stats.get(key) or 0) for key in ("exact", "signature", "near"))
+        return hits / lookups if lookups else 0.0
+
+    def count(self) -> int:
+        with self._lock, self._connect() as conn:
+            return int(conn.execute("SELECT COUNT(*) FROM evidence_cache").fetchone()[0])
+
     def _prune(self) -> None:
-        paths = sorted(self.root.glob("*.json"), key=lambda item: item.stat().st_mtime, reverse=True)
-        for stale in paths[self.max_records :]:
-            try:
-                stale.unlink()
-            except OSError:
-                pass
+        self._saves_since_prune = 0
+        with self._lock, self._connect() as conn:
+            stale = conn.execute("SELECT identity, filename FROM evidence_cache WHERE expires_at < ?", (time.time(),)).fetchall()
+            stale += conn.execute(
+                "SELECT identity, filename FROM evidence_cache ORDER BY saved_at DESC LIMIT -1 OFFSET ?", (self.max_records,)
+            ).fetchall()
+            for row in stale:
+                self._drop(conn, row["identity"], row["filename"])
@@ -1,14 +1,17 @@
 ﻿from __future__ import annotations
 
 import re
-from collections import defaultdict
+from bisect import bisect_right
+from collections import Counter, defaultdict
 from hashlib import sha1
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
 
 from workshop.toolbox.stacks.research_core.evidence_claims import ClaimCandidate
 from workshop.toolbox.stacks.research_core.evidence_schema import Claim, EvidenceItem
 
 _WORD_RE = re.compile(r"[a-z0-9]+")
+# Claims must share at least this many normalised tokens before they are compared.
+_MIN_SHARED_TOKENS = 3
 
 
 def _norm_tokens(text: str) -> set[str]:
@@ -31,6 +34,63 @@ def _has_opposition(text: str) -> int:
     return 0
 
 
+def _lead_value(claim: Claim) -> Optional[float]:
+    values = (claim.numbers or {}).get("values") or [{}]
+    value = values[0].get("value") if isinstance(values[0], dict) else None
+    return value if isinstance(value, (int, float)) else None
+
+
+def _cross_claim_conflicts(claims: List[Claim]) -> List[Dict[str, str]]:
+    """
+    Directional/numeric conflicts between claims sharing enough tokens.
+
+    Only claims that can take part in a conflict (directional language or a
+    leading numeric value) are indexed; a token -> claim inverted index then
+    yields the pairs sharing >= _MIN_SHARED_TOKENS tokens without comparing
+    every pair. Pairs are visited in the same (i, j) order as a full scan.
+    """
+    tokens: List[set[str]] = []
+    dirs: List[int] = []
+    values: List[Optional[float]] = []
+    postings: Dict[str, List[int]] = defaultdict(list)
+    for idx, claim in enumerate(claims):
+        toks = _norm_tokens(claim.text)
+        direction = _has_opposition(claim.text)
+        value = _lead_value(claim)
+        tokens.append(toks)
+        dirs.append(direction)
+        values.append(value)
+        if len(toks) < _MIN_SHARED_TOKENS or (direction == 0 and value is None):
+            continue
+        for tok in toks:
+            postings[tok].append(idx)
+
+    conflicts: List[Dict[str, str]] = []
+    for i, a in enumerate(claims):
+        if dirs[i] == 0 and values[i] is None:
+            continue
+        shared: Counter[int] = Counter()
+        for tok in tokens[i]:
+            posting = postings.get(tok)
+            if posting:
+                shared.update(posting[bisect_right(posting, i) :])
+        for j in sorted(j for j, n in shared.items() if n >= _MIN_SHARED_TOKENS):
+            b = claims[j]
+            ad, bd = dirs[i], dirs[j]
+            if ad != 0 and bd != 0 and ad != bd:
+                a.contradicting_item_ids = sorted(set(a.contradicting_item_ids + b.supporting_item_ids))
+                b.contradicting_item_ids = sorted(set(b.contradicting_item_ids + a.supporting_item_ids))
+                conflicts.append({"type": "directional", "claim_a": a.id, "claim_b": b.id, "reason": "Opposing directional language detected."})
+                continue
+
+            av, bv = values[i], values[j]
+            if av is not None and bv is not None and min(abs(av), abs(bv)) > 0:
+                delta = abs(av - bv) / min(abs(av), abs(bv))
+                if delta > 0.2:
+                    conflicts.append({"type": "numeric", "claim_a": a.id, "claim_b": b.id, "reason": f"Numeric disagreement ({delta:.1%}) exceeds threshold."})
+    return conflicts
+
+
 def reconcile_claims(
     candidates: List[ClaimCandidate],
     *,
@@ -78,26 +138,7 @@ def reconcile_claims(
         claims.append(claim)
 
     # lightweight conflict detection across resulting claims
-    for i in range(len(claims)):
-        for j in range(i + 1, len(claims)):
-            a, b = claims[i], claims[j]
-            overlap = len(_norm_tokens(a.text) & _norm_tokens(b.text))
-            if overlap < 3:
-                continue
-            ad, bd = _has_opposition(a.text), _has_opposition(b.text)
-            if ad != 0 and bd != 0 and ad != bd:
-                a.contradicting_item_ids = sorted(set(a.contradicting_item_ids + b.supporting_item_ids))
-                b.contradicting_item_ids = sorted(set(b.contradicting_item_ids + a.supporting_item_ids))
-                conflicts.append({"type": "directional", "claim_a": a.id, "claim_b": b.id, "reason": "Opposing directional language detected."})
-                continue
-
-            if a.numbers and b.numbers:
-                av = a.numbers.get("values", [{}])[0].get("value")
-                bv = b.numbers.get("values", [{}])[0].get("value")
-                if isinstance(av, (int, float)) and isinstance(bv, (int, float)) and min(abs(av), abs(bv)) > 0:
-                    delta = abs(av - bv) / min(abs(av), abs(bv))
-                    if delta > 0.2:
-                        conflicts.append({"type": "numeric", "claim_a": a.id, "claim_b": b.id, "reason": f"Numeric disagreement ({delta:.1%}) exceeds threshold."})
+    conflicts.extend(_cross_claim_conflicts(claims))
 
     return claims, conflicts
 
@@ -2,7 +2,7 @@
 
 import re
 from datetime import datetime, timezone
-from typing import Dict, Iterable, Tuple
+from typing import Dict, Iterable, Optional, Tuple
 from urllib.parse import urlparse
 
 from workshop.toolbox.stacks.research_core.evidence_schema import EvidenceItem
@@ -17,6 +17,10 @@ _SOURCE_WEIGHTS = {
     "forum": 0.2,
     "unknown": 0.25,
 }
+_MISSING_TEXT_PENALTY = 0.12
+_SHORT_EXCERPT_PENALTY = 0.08
+_WEAK_SOURCE_PENALTY = 0.06
+_WEAK_SOURCE_TYPES = {"blog", "forum", "unknown"}
 
 
 def _tokenize(text: str) -> set[str]:
@@ -47,7 +51,7 @@ def classify_source_type(url: str, *, provider_hint: str = "") -> str:
     return "unknown"
 
 
-def _recency_bonus(published_date: str | None, needs_recency: bool) -> float:
+def _recency_bonus(published_date: str | None, needs_recency: bool, *, now: Optional[datetime] = None) -> float:
     if not needs_recency:
         return 0.0
     if not published_date:
@@ -56,7 +60,7 @@ def _recency_bonus(published_date: str | None, needs_recency: bool) -> float:
         dt = datetime.fromisoformat(published_date.replace("Z", "+00:00"))
     except Exception:
         return -0.1
-    now = datetime.now(timezone.utc)
+    now = now or datetime.now(timezone.utc)
     days = max(0.0, (now - dt.astimezone(timezone.utc)).days)
     if days <= 30:
         return 0.25
@@ -66,20 +70,29 @@ def _recency_bonus(published_date: str | None, needs_recency: bool) -> float:
 
 
 def score_item(item: EvidenceItem, *, question: str, needs_recency: bool) -> Tuple[float, Dict[str, float]]:
+    return _score(item, q_toks=_tokenize(question), needs_recency=needs_recency)
+
+
+def _score(
+    item: EvidenceItem,
+    *,
+    q_toks: set[str],
+    needs_recency: bool,
+    now: Optional[datetime] = None,
+) -> Tuple[float, Dict[str, float]]:
     base_trust = _SOURCE_WEIGHTS.get(item.source_type, _SOURCE_WEIGHTS["unknown"])
-    q_toks = _tokenize(question)
     txt = " ".join(filter(None, [item.title, item.snippet or "", item.content_excerpt or ""]))
     d_toks = _tokenize(txt)
     overlap = len(q_toks & d_toks)
     relevance = min(0.7, overlap / max(1, len(q_toks)))
-    recency = _recency_bonus(item.published_date, needs_recency)
+    recency = _recency_bonus(item.published_date, needs_recency, now=now)
     penalties = 0.0
     if not (item.content_excerpt or "") and not (item.snippet or ""):
-        penalties += 0.12
+        penalties += _MISSING_TEXT_PENALTY
     if len((item.content_excerpt or "").strip()) < 140:
-        penalties += 0.08
-    if item.source_type in {"blog", "forum", "unknown"}:
-        penalties += 0.06
+        penalties += _SHORT_EXCERPT_PENALTY
+    if item.source_type in _WEAK_SOURCE_TYPES:
+        penalties += _WEAK_SOURCE_PENALTY
 
     score = max(0.0, min(1.0, base_trust + relevance + recency - penalties))
     breakdown = {
@@ -92,10 +105,12 @@ def score_item(item: EvidenceItem, *, question: str, needs_recency: bool) -> Tup
 
 
 def score_items(items: Iterable[EvidenceItem], *, question: str, needs_recency: bool) -> list[EvidenceItem]:
+    """Score a batch with ``score_item``; the question is tokenised and the clock read once per batch."""
+    q_toks = _tokenize(question)
+    now = datetime.now(timezone.utc)
     out = []
     for item in items:
-        item.score, item.score_breakdown = score_item(item, question=question, needs_recency=needs_recency)
+        item.score, item.score_breakdown = _score(item, q_toks=q_toks, needs_recency=needs_recency, now=now)
         out.append(item)
     out.sort(key=lambda x: x.score, reverse=True)
     return out
-
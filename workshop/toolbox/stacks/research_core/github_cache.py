@@ -0,0 +1,163 @@
+from __future__ import annotations
+
+import json
+import os
+import re
+import shutil
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+DEFAULT_CACHE_ROOT = Path("state") / "github_cache"
+DEFAULT_MIRROR_ROOT = Path("state") / "github_mirrors"
+# Blobs above this size (binaries, datasets) stay on the server; READMEs and manifests come down with the fetch.
+MIRROR_BLOB_LIMIT = "256k"
+
+
+def _slug_filename(slug: str) -> str:
+    return re.sub(r"[^a-z0-9._-]+", "__", str(slug or "").strip().lower()) or "_"
+
+
+class RepoInspectionCache:
+    """
+    Repository inspections on disk, one JSON file per slug.
+
+    An entry is only served while the remote still reports the same HEAD sha
+    (and tag list) it was built from, so revalidation is one ``ls-remote``.
+    """
+
+    def __init__(self, root: str | Path = DEFAULT_CACHE_ROOT) -> None:
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.stats: Dict[str, int] = {"hits": 0, "misses": 0, "stores": 0}
+
+    def _path(self, slug: str) -> Path:
+        return self.root / f"{_slug_filename(slug)}.json"
+
+    def get(self, slug: str, head_sha: str, *, tags: Optional[List[str]] = None) -> Optional[Dict[str, Any]]:
+        path = self._path(slug)
+        try:
+            entry = json.loads(path.read_text(encoding="utf-8"))
+        except Exception:
+            entry = None
+        valid = (
+            isinstance(entry, dict)
+            and head_sha
+            and entry.get("head_sha") == head_sha
+            and (tags is None or list(entry.get("tags") or []) == list(tags))
+            and isinstance(entry.get("inspection"), dict)
+        )
+        if not valid:
+            self.stats["misses"] += 1
+            return None
+        self.stats["hits"] += 1
+        return dict(entry["inspection"])
+
+    def put(self, slug: str, head_sha: str, inspection: Dict[str, Any], *, tags: Optional[List[str]] = None) -> None:
+        if not head_sha:
+            return
+        entry = {
+            "slug": str(slug or "").lower(),
+            "head_sha": head_sha,
+            "tags": list(tags or []),
+            "stored_at": time.time(),
+            "inspection": inspection,
+        }
+        path = self._path(slug)
+        tmp = path.with_suffix(".json.tmp")
+        tmp.write_text(json.dumps(entry, ensure_ascii=False), encoding="utf-8")
+        os.replace(tmp, path)
+        self.stats["stores"] += 1
+
+
+class RepoMirrorPool:
+    """
+    Long-lived bare, shallow, blob-filtered clones keyed by repository slug.
+
+    ``ensure`` clones on first use and afterwards refreshes the default branch
+    with a single depth-1 fetch. The least recently used mirrors beyond
+    ``max_mirrors`` are removed.
+    """
+
+    def __init__(
+        self,
+        root: str | Path = DEFAULT_MIRROR_ROOT,
+        *,
+        max_mirrors: int = 8,
+        run_git: Optional[Callable[..., str]] = None,
+    ) -> None:
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.max_mirrors = max(1, int(max_mirrors))
+        self._run_git = run_git
+        self._lock = threading.Lock()
+        self._slug_locks: Dict[str, threading.Lock] = {}
+
+    def path_for(self, slug: str) -> Path:
+        return self.root / f"{_slug_filename(slug)}.git"
+
+    def _slug_lock(self, slug: str) -> threading.Lock:
+        with self._lock:
+            return self._slug_locks.setdefault(_slug_filename(slug), threading.Lock())
+
+    def ensure(self, slug: str, git_url: str, branch: str) -> Path:
+        if self._run_git is None:
+            raise RuntimeError("RepoMirrorPool needs a git runner")
+        if not branch:
+            raise ValueError("branch is required to refresh a mirror")
+        path = self.path_for(slug)
+        refspec = f"+refs/heads/{branch}:refs/heads/{branch}"
+        with self._slug_lock(slug):
+            if path.exists():
+                self._run_git(
+                    ["fetch", "--depth", "1", f"--filter=blob:limit={MIRROR_BLOB_LIMIT}", "--no-tags", "origin", refspec],
+                    cwd=str(path),
+                    timeout_s=60.0,
+                )
+            else:
+                staging = path.with_name(path.name + ".partial")
+                shutil.rmtree(staging, ignore_errors=True)
+                self._run_git(
+                    [
+                        "clone",
+                        "--bare",
+                        "--depth",
+                        "1",
+                        f"--filter=blob:limit={MIRROR_BLOB_LIMIT}",
+                        "--no-tags",
+                        "--branch",
+                        branch,
+                        git_url,
+                        str(staging),
+                    ],
+                    timeout_s=120.0,
+                )
+                os.replace(staging, path)
+            os.utime(path, None)
+        self._evict(keep=path)
+        return path
+
+    def _evict(self, *, keep: Path) -> None:
+        with self._lock:
+            mirrors = sorted(
+                (p for p in self.root.glob("*.git") if p.is_dir() and p != keep),
+                key=lambda p: p.stat().st_mtime,
+                reverse=True,
+            )
+            for stale in mirrors[self.max_mirrors - 1 :]:
+                shutil.rmtree(stale, ignore_errors=True)
+
+
+_DEFAULT_CACHE: Optional[RepoInspectionCache] = None
+
+
+def get_repo_inspection_cache() -> RepoInspectionCache:
+    global _DEFAULT_CACHE
+    if _DEFAULT_CACHE is None:
+        _DEFAULT_CACHE = RepoInspectionCache()
+    return _DEFAULT_CACHE
+
+
+def mirrors_enabled() -> bool:
+    return str(os.getenv("SOMI_GITHUB_MIRRORS", "") or "").strip().lower() in {"1", "true", "yes", "on"}
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+from dataclasses import asdict, dataclass, field
 import html
 import json
 import os
@@ -14,6 +14,13 @@ from urllib import error as urllib_error
 from urllib import request as urllib_request
 from urllib.parse import urlparse
 
+from workshop.toolbox.stacks.research_core.github_cache import (
+    RepoInspectionCache,
+    RepoMirrorPool,
+    get_repo_inspection_cache,
+    mirrors_enabled,
+)
+
 
 _REPO_URL_RE = re.compile(r"https?://github\.com/([A-Za-z0-9_.-]+)/([A-Za-z0-9_.-]+)", re.IGNORECASE)
 _LEADING_COMPARE_RE = re.compile(
@@ -99,6 +106,8 @@ class GitHubInspection:
     sources: List[str] = field(default_factory=list)
     summary: str = ""
     inspection_method: str = "remote"
+    head_sha: str = ""
+    from_cache: bool = False
 
 
 def _run_git(args: List[str], *, cwd: str | None = None, timeout_s: float = 20.0) -> str:
@@ -283,6 +292,10 @@ def _read_text(path: Path, max_chars: int = 5000, *, preserve_lines: bool = Fals
         data = path.read_text(encoding="utf-8", errors="ignore")
     except Exception:
         return ""
+    return _normalize_text(data, max_chars, preserve_lines=preserve_lines)
+
+
+def _normalize_text(data: str, max_chars: int = 5000, *, preserve_lines: bool = False) -> str:
     if preserve_lines:
         lines = [re.sub(r"[ \t]+", " ", line).rstrip() for line in str(data or "").splitlines()]
         return "\n".join(lines)[:max_chars]
@@ -622,69 +635,145 @@ def _inspect_repository_via_remote(repo_url: str, repo_slug: str, branch: str, t
     )
 
 
-def inspect_github_repository(
+_SPARSE_PATHS = (
+    "README.md",
+    "README.rst",
+    "README.txt",
+    "docs",
+    "src",
+    *_MANIFEST_NAMES,
+)
+_DEFAULT_MIRRORS: Optional[RepoMirrorPool] = None
+
+
+def _default_mirror_pool() -> Optional[RepoMirrorPool]:
+    global _DEFAULT_MIRRORS
+    if not mirrors_enabled():
+        return None
+    if _DEFAULT_MIRRORS is None:
+        _DEFAULT_MIRRORS = RepoMirrorPool(run_git=lambda *args, **kwargs: _run_git(*args, **kwargs))
+    return _DEFAULT_MIRRORS
+
+
+def _ls_remote_head(git_url: str, *, with_tags: bool) -> tuple[str, str, List[str]]:
+    """Default branch, HEAD sha and up to five tags from a single ``ls-remote``."""
+    patterns = ["HEAD", "refs/tags/*"] if with_tags else ["HEAD"]
+    output = _run_git(["ls-remote", "--symref", git_url, *patterns], timeout_s=20.0)
+    branch = ""
+    head_sha = ""
+    tags: List[str] = []
+    for line in output.splitlines():
+        if line.startswith("ref: ") and "\tHEAD" in line:
+            branch = line.split("ref: ", 1)[1].split("\tHEAD", 1)[0].strip().rsplit("/", 1)[-1]
+        elif line.endswith("\tHEAD"):
+            head_sha = line.split("\t", 1)[0].strip()
+        elif "\trefs/tags/" in line and not line.endswith("^{}"):
+            tags.append(line.rsplit("/", 1)[-1])
+    return branch, head_sha, tags[:5]
+
+
+def _local_inspection(
     repo_url: str,
+    repo_slug: str,
+    branch: str,
+    tags: List[str],
     *,
-    cleanup: bool = True,
-    temp_root: str | None = None,
-    remote_only: bool = False,
+    latest_commit: str,
+    top_level_entries: List[str],
+    readme_text: str,
+    manifests: Dict[str, str],
+    inspection_method: str,
 ) -> GitHubInspection:
-    repo_url = str(repo_url or "").strip().rstrip("/")
-    matches = extract_repo_urls(repo_url)
-    if not matches:
-        raise ValueError("repo_url must be a GitHub repository URL")
-    repo_url = matches[0]
-    slug = repo_url.replace("https://github.com/", "", 1)
-    git_url = repo_url + ".git"
-    slug_key = slug.lower()
+    clean_readme_excerpt = _clean_readme_excerpt(readme_text, max_chars=420)
+    summary_parts = [f"{repo_slug} is a GitHub repository."]
+    if branch:
+        summary_parts.append(f"Default branch: {branch}.")
+    if latest_commit:
+        summary_parts.append(f"Latest visible commit: {latest_commit}.")
+    if top_level_entries:
+        summary_parts.append(f"Top-level entries: {', '.join(top_level_entries[:8])}.")
+    if manifests:
+        summary_parts.append(f"Detected manifests: {', '.join(manifests.keys())}.")
+    if clean_readme_excerpt:
+        summary_parts.append(_readme_excerpt_clause(clean_readme_excerpt))
+    if tags:
+        summary_parts.append(f"Recent tags: {', '.join(tags[:4])}.")
 
-    branch = _KNOWN_DEFAULT_BRANCHES.get(slug_key, "") if remote_only else ""
-    latest_commit = ""
-    tags: List[str] = []
-    if not remote_only:
+    sources = [repo_url]
+    if branch:
+        sources.append(f"{repo_url}/tree/{branch}")
+    return GitHubInspection(
+        repo_url=repo_url,
+        repo_slug=repo_slug,
+        default_branch=branch,
+        latest_commit=latest_commit,
+        readme_excerpt=_clean_readme_excerpt(readme_text, max_chars=1200),
+        top_level_entries=top_level_entries,
+        manifests=manifests,
+        tags=tags,
+        sources=sources,
+        summary=" ".join(summary_parts).strip(),
+        inspection_method=inspection_method,
+    )
+
+
+def _inspect_repository_via_mirror(repo_url: str, repo_slug: str, branch: str, tags: List[str], mirror_dir: Path) -> GitHubInspection:
+    cwd = str(mirror_dir)
+    ref = f"refs/heads/{branch}"
+
+    def _show(relative_path: str) -> str:
         try:
-            ls_remote = _run_git(["ls-remote", "--symref", git_url, "HEAD"], timeout_s=20.0)
-            for line in ls_remote.splitlines():
-                if line.startswith("ref: ") and "\tHEAD" in line:
-                    branch = line.split("ref: ", 1)[1].split("\tHEAD", 1)[0].strip().rsplit("/", 1)[-1]
-                    break
+            return _run_git(["show", f"{ref}:{relative_path}"], cwd=cwd, timeout_s=20.0)
         except Exception:
-            branch = ""
-    if not branch:
-        branch = _KNOWN_DEFAULT_BRANCHES.get(slug_key, "")
+            return ""
 
     try:
-        if not remote_only and _should_fetch_tags(slug):
-            tag_rows = _run_git(["ls-remote", "--tags", "--refs", git_url], timeout_s=8.0)
-            tags = [line.rsplit("/", 1)[-1] for line in tag_rows.splitlines()[:5] if line.strip()]
+        latest_commit = _run_git(["log", "-1", "--date=short", "--format=%cd | %h | %s", ref], cwd=cwd, timeout_s=20.0)
+    except Exception:
+        latest_commit = ""
+    try:
+        names = _run_git(["ls-tree", "--name-only", ref], cwd=cwd, timeout_s=20.0).splitlines()
     except Exception:
-        tags = []
+        names = []
+    present = set(names)
+    readme_text = ""
+    for name in ("README.md", "README.rst", "README.txt"):
+        if name in present:
+            readme_text = _normalize_text(_show(name), 4000, preserve_lines=True)
+            if readme_text:
+                break
+    manifests: Dict[str, str] = {}
+    for manifest_name in _MANIFEST_NAMES:
+        if manifest_name in present:
+            manifests[manifest_name] = _parse_manifest_text(manifest_name, _show(manifest_name))[:500]
+    return _local_inspection(
+        repo_url,
+        repo_slug,
+        branch,
+        tags,
+        latest_commit=latest_commit,
+        top_level_entries=sorted(names)[:12],
+        readme_text=readme_text,
+        manifests=manifests,
+        inspection_method="mirror",
+    )
 
-    remote_inspection = _inspect_repository_via_remote(repo_url, slug, branch, tags)
-    if remote_only or remote_inspection.readme_excerpt or remote_inspection.manifests:
-        return remote_inspection
 
+def _inspect_repository_via_clone(
+    repo_url: str,
+    repo_slug: str,
+    git_url: str,
+    branch: str,
+    tags: List[str],
+    *,
+    cleanup: bool,
+    temp_root: str | None,
+) -> GitHubInspection:
     scratch_dir = tempfile.mkdtemp(prefix="somi_repo_", dir=temp_root)
     try:
         _run_git(["clone", "--depth", "1", "--filter=blob:none", "--no-checkout", git_url, scratch_dir], timeout_s=60.0)
         _run_git(["sparse-checkout", "init", "--cone"], cwd=scratch_dir, timeout_s=20.0)
-        sparse_paths = [
-            "README.md",
-            "README.rst",
-            "README.txt",
-            "docs",
-            "src",
-            "package.json",
-            "pyproject.toml",
-            "requirements.txt",
-            "setup.py",
-            "setup.cfg",
-            "Cargo.toml",
-            "go.mod",
-            "pom.xml",
-            "build.gradle",
-        ]
-        _run_git(["sparse-checkout", "set", *sparse_paths], cwd=scratch_dir, timeout_s=20.0)
+        _run_git(["sparse-checkout", "set", *_SPARSE_PATHS], cwd=scratch_dir, timeout_s=20.0)
         _run_git(["checkout"], cwd=scratch_dir, timeout_s=30.0)
 
         try:
@@ -702,7 +791,6 @@ def inspect_github_repository(
                 readme_text = _read_text(candidate, max_chars=4000, preserve_lines=True)
                 if readme_text:
                     break
-        clean_readme_excerpt = _clean_readme_excerpt(readme_text, max_chars=420)
 
         manifests: Dict[str, str] = {}
         for manifest_name in _MANIFEST_NAMES:
@@ -711,36 +799,89 @@ def inspect_github_repository(
                 parsed = _parse_manifest(candidate)
                 manifests[manifest_name] = parsed[:500]
 
-        summary_parts = [f"{slug} is a GitHub repository."]
-        if branch:
-            summary_parts.append(f"Default branch: {branch}.")
-        if latest_commit:
-            summary_parts.append(f"Latest visible commit: {latest_commit}.")
-        if top_level_entries:
-            summary_parts.append(f"Top-level entries: {', '.join(top_level_entries[:8])}.")
-        if manifests:
-            summary_parts.append(f"Detected manifests: {', '.join(manifests.keys())}.")
-        if clean_readme_excerpt:
-            summary_parts.append(_readme_excerpt_clause(clean_readme_excerpt))
-        if tags:
-            summary_parts.append(f"Recent tags: {', '.join(tags[:4])}.")
-
-        sources = [repo_url]
-        if branch:
-            sources.append(f"{repo_url}/tree/{branch}")
-        return GitHubInspection(
-            repo_url=repo_url,
-            repo_slug=slug,
-            default_branch=branch,
+        return _local_inspection(
+            repo_url,
+            repo_slug,
+            branch,
+            tags,
             latest_commit=latest_commit,
-            readme_excerpt=_clean_readme_excerpt(readme_text, max_chars=1200),
             top_level_entries=top_level_entries,
+            readme_text=readme_text,
             manifests=manifests,
-            tags=tags,
-            sources=sources,
-            summary=" ".join(summary_parts).strip(),
             inspection_method="clone",
         )
     finally:
         if cleanup:
             shutil.rmtree(scratch_dir, ignore_errors=True)
+
+
+def inspect_github_repository(
+    repo_url: str,
+    *,
+    cleanup: bool = True,
+    temp_root: str | None = None,
+    remote_only: bool = False,
+    git_url: str | None = None,
+    cache: RepoInspectionCache | None = None,
+    use_cache: bool = True,
+    mirrors: RepoMirrorPool | None = None,
+) -> GitHubInspection:
+    """
+    Inspect a GitHub repository, reusing the on-disk inspection while HEAD is unchanged.
+
+    Outside ``remote_only`` mode one ``ls-remote`` yields branch, HEAD sha and
+    tags; a cached inspection for that sha is returned as-is. Otherwise the
+    repo is read from a mirror (``mirrors`` or, with SOMI_GITHUB_MIRRORS set,
+    the shared pool), then raw remote files, then a throwaway sparse clone.
+    ``git_url`` overrides the clone/ls-remote URL (e.g. a local file:// repo).
+    """
+    repo_url = str(repo_url or "").strip().rstrip("/")
+    matches = extract_repo_urls(repo_url)
+    if not matches:
+        raise ValueError("repo_url must be a GitHub repository URL")
+    repo_url = matches[0]
+    slug = repo_url.replace("https://github.com/", "", 1)
+    git_url = str(git_url or "").strip() or repo_url + ".git"
+    slug_key = slug.lower()
+
+    if remote_only:
+        branch = _KNOWN_DEFAULT_BRANCHES.get(slug_key, "")
+        return _inspect_repository_via_remote(repo_url, slug, branch, [])
+
+    try:
+        branch, head_sha, tags = _ls_remote_head(git_url, with_tags=_should_fetch_tags(slug))
+    except Exception:
+        branch, head_sha, tags = "", "", []
+    if not branch:
+        branch = _KNOWN_DEFAULT_BRANCHES.get(slug_key, "")
+
+    store = (cache or get_repo_inspection_cache()) if use_cache else None
+    if store is not None and head_sha:
+        cached = store.get(slug, head_sha, tags=tags)
+        if cached:
+            try:
+                inspection = GitHubInspection(**cached)
+            except TypeError:
+                inspection = None
+            if inspection is not None:
+                inspection.from_cache = True
+                return inspection
+
+    inspection = None
+    pool = mirrors if mirrors is not None else _default_mirror_pool()
+    if pool is not None and branch:
+        try:
+            inspection = _inspect_repository_via_mirror(repo_url, slug, branch, tags, pool.ensure(slug, git_url, branch))
+        except Exception:
+            inspection = None
+        if inspection is not None and not (inspection.readme_excerpt or inspection.manifests or inspection.top_level_entries):
+            inspection = None
+    if inspection is None:
+        inspection = _inspect_repository_via_remote(repo_url, slug, branch, tags)
+        if not (inspection.readme_excerpt or inspection.manifests):
+            inspection = _inspect_repository_via_clone(repo_url, slug, git_url, branch, tags, cleanup=cleanup, temp_root=temp_root)
+
+    inspection.head_sha = head_sha
+    if store is not None and head_sha:
+        store.put(slug, head_sha, asdict(inspection), tags=tags)
+    return inspection
@@ -0,0 +1,325 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import re
+import sqlite3
+import time
+from pathlib import Path
+from threading import RLock
+from typing import Any, Dict, List, Optional
+
+from workshop.toolbox.stacks.research_core.local_packs import (
+    _DOC_SUFFIXES,
+    _document_blob,
+    _pack_directories,
+    _pack_row,
+    _query_tokens,
+    _scan_pack,
+    _score_document,
+    _slug,
+    knowledge_pack_root,
+)
+
+INDEX_DIR = Path("sessions") / "knowledge_pack_index"
+INDEX_DB_NAME = "pack_index.sqlite3"
+CHUNK_CHARS = 900
+# Pack directories are re-stat'ed at most this often; searches in between trust the index.
+REFRESH_INTERVAL_S = 2.0
+CANDIDATE_MULTIPLIER = 16
+MIN_CANDIDATES = 64
+
+
+def chunk_text(text: str, *, max_chars: int = CHUNK_CHARS) -> List[str]:
+    """Split a document into paragraph-aligned chunks of roughly ``max_chars`` characters."""
+    chunks: List[str] = []
+    current: List[str] = []
+    size = 0
+    for paragraph in re.split(r"\n\s*\n", str(text or "")):
+        clean = " ".join(paragraph.split())
+        if not clean:
+            continue
+        while len(clean) > max_chars:
+            if current:
+                chunks.append(" ".join(current))
+                current, size = [], 0
+            chunks.append(clean[:max_chars])
+            clean = clean[max_chars:]
+        if current and size + len(clean) + 1 > max_chars:
+            chunks.append(" ".join(current))
+            current, size = [], 0
+        current.append(clean)
+        size += len(clean) + 1
+    if current:
+        chunks.append(" ".join(current))
+    return chunks
+
+
+def pack_fingerprint(pack_dir: Path) -> str:
+    """Cheap change detector: manifest and document names, sizes, and mtimes (no content reads)."""
+    parts: List[str] = []
+    for path in sorted(pack_dir.iterdir()):
+        if not path.is_file() or (path.name != "manifest.json" and path.suffix.lower() not in _DOC_SUFFIXES):
+            continue
+        try:
+            stat = path.stat()
+        except OSError:
+            continue
+        parts.append(f"{path.name}:{stat.st_size}:{stat.st_mtime_ns}")
+    return hashlib.sha256("|".join(parts).encode("utf-8")).hexdigest()
+
+
+class LocalPackIndex:
+    """Persisted FTS5/BM25 index over bundled knowledge packs.
+
+    Each pack is stored with its manifest integrity hash and a stat fingerprint.
+    ``refresh()`` only re-reads packs whose fingerprint moved, and only rewrites
+    the rows of packs whose integrity hash actually changed.
+    """
+
+    def __init__(
+        self,
+        root_dir: str | Path = ".",
+        *,
+        db_path: str | Path | None = None,
+        refresh_interval_s: float = REFRESH_INTERVAL_S,
+    ) -> None:
+        self.root_dir = Path(root_dir)
+        self.db_path = Path(db_path) if db_path else self.root_dir / INDEX_DIR / INDEX_DB_NAME
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.refresh_interval_s = max(0.0, float(refresh_interval_s))
+        self._lock = RLock()
+        self._last_refresh = 0.0
+        self.available = True
+        try:
+            self._init_db()
+        except sqlite3.OperationalError:
+            # SQLite builds without FTS5 fall back to the scanning search.
+            self.available = False
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(str(self.db_path), timeout=30.0, check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    def _init_db(self) -> None:
+        with self._lock, self._connect() as conn:
+            conn.executescript(
+                """
+                CREATE TABLE IF NOT EXISTS packs (
+                    pack_dir TEXT PRIMARY KEY,
+                    pack_id TEXT NOT NULL,
+                    fingerprint TEXT NOT NULL,
+                    integrity TEXT NOT NULL,
+                    pack_json TEXT NOT NULL,
+                    indexed_at REAL NOT NULL
+                );
+                CREATE INDEX IF NOT EXISTS idx_packs_pack_id ON packs(pack_id);
+                CREATE TABLE IF NOT EXISTS documents (
+                    doc_id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    pack_dir TEXT NOT NULL,
+                    pack_id TEXT NOT NULL,
+                    slug TEXT NOT NULL,
+                    doc_json TEXT NOT NULL,
+                    content TEXT NOT NULL,
+                    chunk_lo INTEGER NOT NULL DEFAULT 0,
+                    chunk_hi INTEGER NOT NULL DEFAULT -1
+                );
+                CREATE INDEX IF NOT EXISTS idx_documents_pack ON documents(pack_dir);
+                CREATE INDEX IF NOT EXISTS idx_documents_slug ON documents(pack_id, slug);
+                CREATE VIRTUAL TABLE IF NOT EXISTS chunks USING fts5(
+                    title, meta, body, doc_id UNINDEXED, tokenize = 'porter unicode61'
+                );
+                """
+            )
+
+    def _delete_pack(self, conn: sqlite3.Connection, pack_dir: str) -> None:
+        # Chunk rowids are allocated in contiguous per-document ranges, so deletes stay rowid lookups.
+        for row in conn.execute("SELECT chunk_lo, chunk_hi FROM documents WHERE pack_dir = ?", (pack_dir,)).fetchall():
+            conn.execute("DELETE FROM chunks WHERE rowid BETWEEN ? AND ?", (int(row["chunk_lo"]), int(row["chunk_hi"])))
+        conn.execute("DELETE FROM documents WHERE pack_dir = ?", (pack_dir,))
+        conn.execute("DELETE FROM packs WHERE pack_dir = ?", (pack_dir,))
+
+    def _write_pack(self, conn: sqlite3.Connection, key: str, fingerprint: str, pack: Dict[str, Any], texts: Dict[str, str]) -> None:
+        self._delete_pack(conn, key)
+        pack_meta = {name: value for name, value in pack.items() if name not in {"documents", "manifest_ok"}}
+        conn.execute(
+            "INSERT INTO packs(pack_dir, pack_id, fingerprint, integrity, pack_json, indexed_at) VALUES (?, ?, ?, ?, ?, ?)",
+            (key, str(pack.get("id") or ""), fingerprint, str(pack.get("integrity") or ""), json.dumps(pack_meta, ensure_ascii=False), time.time()),
+        )
+        meta = " ".join(
+            [str(pack.get("name") or ""), str(pack.get("category") or ""), " ".join(pack.get("tags") or []), str(pack.get("summary") or "")]
+        )
+        next_rowid = int(conn.execute("SELECT COALESCE(MAX(rowid), 0) AS n FROM chunks").fetchone()["n"]) + 1
+        for doc in list(pack.get("documents") or []):
+            text = texts.get(str(doc.get("name") or ""), "")
+            chunks = chunk_text(text) or [""]
+            lo, hi = next_rowid, next_rowid + len(chunks) - 1
+            next_rowid = hi + 1
+            cursor = conn.execute(
+                "INSERT INTO documents(pack_dir, pack_id, slug, doc_json, content, chunk_lo, chunk_hi) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (key, str(pack.get("id") or ""), _slug(Path(str(doc.get("path") or "")).stem), json.dumps(doc, ensure_ascii=False), text, lo, hi),
+            )
+            title = str(doc.get("title") or "")
+            conn.executemany(
+                "INSERT INTO chunks(rowid, title, meta, body, doc_id) VALUES (?, ?, ?, ?, ?)",
+                [(lo + offset, title, meta, chunk, cursor.lastrowid) for offset, chunk in enumerate(chunks)],
+            )
+
+    def refresh(self, *, force: bool = False) -> Dict[str, int]:
+        """Bring the index in line with ``knowledge_packs/``; returns per-outcome pack counts."""
+        stats = {"checked": 0, "unchanged": 0, "touched": 0, "rebuilt": 0, "removed": 0}
+        with self._lock:
+            now = time.monotonic()
+            if not force and self._last_refresh and now - self._last_refresh < self.refresh_interval_s:
+                return stats
+            with self._connect() as conn:
+                stored = {
+                    str(row["pack_dir"]): (str(row["fingerprint"]), str(row["integrity"]))
+                    for row in conn.execute("SELECT pack_dir, fingerprint, integrity FROM packs")
+                }
+                seen: set[str] = set()
+                for pack_dir in _pack_directories(self.root_dir):
+                    key = pack_dir.name
+                    seen.add(key)
+                    stats["checked"] += 1
+                    fingerprint = pack_fingerprint(pack_dir)
+                    previous = stored.get(key)
+                    if previous is not None and previous[0] == fingerprint:
+                        stats["unchanged"] += 1
+                        continue
+                    texts: Dict[str, str] = {}
+                    pack = _scan_pack(pack_dir, texts=texts)
+                    if previous is not None and previous[1] == str(pack.get("integrity") or ""):
+                        conn.execute("UPDATE packs SET fingerprint = ? WHERE pack_dir = ?", (fingerprint, key))
+                        stats["touched"] += 1
+                        continue
+                    self._write_pack(conn, key, fingerprint, pack, texts)
+                    stats["rebuilt"] += 1
+                for key in set(stored) - seen:
+                    self._delete_pack(conn, key)
+                    stats["removed"] += 1
+            self._last_refresh = time.monotonic()
+        return stats
+
+    def _load_packs(self, conn: sqlite3.Connection, keys: List[str]) -> Dict[str, Dict[str, Any]]:
+        if not keys:
+            return {}
+        marks = ",".join("?" for _ in keys)
+        return {
+            str(row["pack_dir"]): json.loads(row["pack_json"])
+            for row in conn.execute(f"SELECT pack_dir, pack_json FROM packs WHERE pack_dir IN ({marks})", keys)
+        }
+
+    def search(self, query: str, *, limit: int = 4) -> List[Dict[str, Any]]:
+        """
+        BM25 candidate retrieval, then the same metadata-aware scoring as the scanning search.
+
+        Terms are prefix queries, so a partial word such as "hyperten" still
+        finds "hypertension"; infixes are left to the scanning search.
+        """
+        self.refresh()
+        query_text = " ".join(str(query or "").split()).strip()
+        query_lower = query_text.lower()
+        terms = _query_tokens(query_text) or re.findall(r"[a-z0-9]+", query_lower)
+        if not terms:
+            return []
+        limit = max(1, int(limit or 4))
+        match = " OR ".join(f'"{term}"*' for term in terms)
+        with self._lock, self._connect() as conn:
+            ranked = self._candidates(conn, match, max(MIN_CANDIDATES, limit * CANDIDATE_MULTIPLIER))
+            if not ranked:
+                return []
+            marks = ",".join("?" for _ in ranked)
+            docs = conn.execute(
+                f"SELECT doc_id, pack_dir, doc_json, content FROM documents WHERE doc_id IN ({marks})",
+                list(ranked),
+            ).fetchall()
+            packs = self._load_packs(conn, sorted({str(row["pack_dir"]) for row in docs}))
+        tokens = _query_tokens(query_text)
+        scored: List[tuple[int, float, Dict[str, Any]]] = []
+        for row in docs:
+            pack = packs.get(str(row["pack_dir"]))
+            if pack is None:
+                continue
+            doc = json.loads(row["doc_json"])
+            text = str(row["content"] or "")
+            title = str(doc.get("title") or "")
+            score = _score_document(query_lower, tokens, pack, title, _document_blob(pack, title, text))
+            if score <= 0:
+                continue
+            scored.append((score, ranked[int(row["doc_id"])], _pack_row(pack, doc, text, score)))
+        scored.sort(key=lambda item: (-item[0], item[1], str(item[2].get("title") or "")))
+        return [row for _, _, row in scored[:limit]]
+
+    @staticmethod
+    def _candidates(conn: sqlite3.Connection, match: str, limit: int) -> Dict[int, float]:
+        best: Dict[int, float] = {}
+        rows = conn.execute(
+            "SELECT doc_id, bm25(chunks, 5.0, 2.0, 1.0) AS rank FROM chunks WHERE chunks MATCH ? ORDER BY rank LIMIT ?",
+            (match, limit),
+        )
+        for row in rows:
+            doc_id = int(row["doc_id"])
+            rank = float(row["rank"])
+            if doc_id not in best or rank < best[doc_id]:
+                best[doc_id] = rank
+        return best
+
+    def resolve(self, pack_id: str, doc_slug: str) -> Dict[str, Any]:
+        self.refresh()
+        with self._lock, self._connect() as conn:
+            row = conn.execute(
+                """
+                SELECT documents.doc_json, documents.content, packs.pack_json
+                FROM documents JOIN packs ON packs.pack_dir = documents.pack_dir
+                WHERE documents.pack_id = ? AND documents.slug = ?
+                ORDER BY documents.doc_id LIMIT 1
+                """,
+                (str(pack_id or ""), str(doc_slug or "")),
+            ).fetchone()
+        if row is None:
+            return {}
+        doc = json.loads(row["doc_json"])
+        pack = json.loads(row["pack_json"])
+        path = Path(str(doc.get("path") or ""))
+        return {
+            "pack_id": str(pack.get("id") or pack_id),
+            "title": str(doc.get("title") or path.stem.replace("_", " ").title()).strip(),
+            "path": str(path),
+            "content": str(row["content"] or ""),
+            "integrity": str(pack.get("integrity") or ""),
+            "sha256": str(doc.get("sha256") or ""),
+            "variant": str(pack.get("variant") or "compact"),
+            "trust": str(pack.get("trust") or "bundled_local"),
+        }
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock, self._connect() as conn:
+            packs = conn.execute("SELECT COUNT(*) AS n FROM packs").fetchone()
+            docs = conn.execute("SELECT COUNT(*) AS n FROM documents").fetchone()
+            chunks = conn.execute("SELECT COUNT(*) AS n FROM chunks").fetchone()
+        return {
+            "db_path": str(self.db_path),
+            "pack_root": str(knowledge_pack_root(self.root_dir)),
+            "packs": int(packs["n"] if packs else 0),
+            "documents": int(docs["n"] if docs else 0),
+            "chunks": int(chunks["n"] if chunks else 0),
+        }
+
+
+_INDEXES: Dict[str, LocalPackIndex] = {}
+_INDEXES_LOCK = RLock()
+
+
+def get_pack_index(root_dir: str | Path = ".", *, db_path: Optional[str | Path] = None) -> LocalPackIndex:
+    root = Path(root_dir)
+    key = str(Path(db_path).resolve() if db_path else (root / INDEX_DIR / INDEX_DB_NAME).resolve())
+    with _INDEXES_LOCK:
+        index = _INDEXES.get(key)
+        if index is None:
+            index = LocalPackIndex(root, db_path=db_path)
+            _INDEXES[key] = index
+        return index
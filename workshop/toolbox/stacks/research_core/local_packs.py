@@ -110,6 +110,50 @@ def _normalized_manifest(pack_dir: Path, manifest: Dict[str, Any]) -> Dict[str,
     }
 
 
+def _scan_pack(pack_dir: Path, *, texts: Dict[str, str] | None = None) -> Dict[str, Any]:
+    """Describe one pack directory; when ``texts`` is given, document bodies are collected into it by name."""
+    manifest_path = pack_dir / "manifest.json"
+    manifest = _read_manifest(manifest_path)
+    normalized = _normalized_manifest(pack_dir, manifest)
+    pack_id = str(normalized.get("id") or pack_dir.name).strip() or pack_dir.name
+    docs = [path for path in sorted(pack_dir.iterdir()) if path.is_file() and path.suffix.lower() in _DOC_SUFFIXES]
+    doc_rows: List[Dict[str, Any]] = []
+    for doc in docs:
+        text = _read_text(doc)
+        if texts is not None:
+            texts[doc.name] = text
+        doc_rows.append(
+            {
+                "name": doc.name,
+                "path": str(doc),
+                "title": _heading(text) or doc.stem.replace("_", " ").title(),
+                "excerpt": _excerpt(text, limit=180),
+                "bytes": doc.stat().st_size if doc.exists() else 0,
+                "sha256": _sha256_text(text),
+            }
+        )
+    pack_integrity = _sha256_text(
+        json.dumps(normalized, sort_keys=True, ensure_ascii=False) + "|" + "|".join(str(doc.get("sha256") or "") for doc in doc_rows)
+    )
+    return {
+        "id": pack_id,
+        "name": str(normalized.get("name") or pack_id.replace("_", " ").title()).strip(),
+        "category": str(normalized.get("category") or pack_id).strip().lower(),
+        "summary": str(normalized.get("summary") or "").strip(),
+        "tags": [str(item).strip() for item in list(normalized.get("tags") or []) if str(item).strip()],
+        "status": str(normalized.get("status") or ("ready" if docs else "empty")).strip().lower(),
+        "manifest_path": str(manifest_path),
+        "manifest_ok": bool(manifest),
+        "schema_version": int(normalized.get("schema_version") or 1),
+        "variant": str(normalized.get("variant") or "compact").strip().lower(),
+        "trust": str(normalized.get("trust") or "bundled_local"),
+        "updated_at": str(normalized.get("updated_at") or ""),
+        "integrity": pack_integrity,
+        "doc_count": len(doc_rows),
+        "documents": doc_rows,
+    }
+
+
 def scan_local_packs(
     root_dir: str | Path = ".",
     *,
@@ -124,61 +168,21 @@ def scan_local_packs(
     schema_versions: List[int] = []
     variants_present: List[str] = []
     for pack_dir in _pack_directories(root_dir):
-        manifest_path = pack_dir / "manifest.json"
-        manifest = _read_manifest(manifest_path)
-        if not manifest:
-            broken_manifests.append(str(manifest_path))
-        normalized = _normalized_manifest(pack_dir, manifest)
-        pack_id = str(normalized.get("id") or pack_dir.name).strip() or pack_dir.name
-        name = str(normalized.get("name") or pack_id.replace("_", " ").title()).strip()
-        category = str(normalized.get("category") or pack_id).strip().lower()
-        summary = str(normalized.get("summary") or "").strip()
-        tags = [str(item).strip() for item in list(normalized.get("tags") or []) if str(item).strip()]
-        docs = [path for path in sorted(pack_dir.iterdir()) if path.is_file() and path.suffix.lower() in _DOC_SUFFIXES]
-        doc_rows: List[Dict[str, Any]] = []
-        for doc in docs:
-            text = _read_text(doc)
-            total_bytes += doc.stat().st_size if doc.exists() else 0
-            total_docs += 1
-            doc_rows.append(
-                {
-                    "name": doc.name,
-                    "path": str(doc),
-                    "title": _heading(text) or doc.stem.replace("_", " ").title(),
-                    "excerpt": _excerpt(text, limit=180),
-                    "bytes": doc.stat().st_size if doc.exists() else 0,
-                    "sha256": _sha256_text(text),
-                }
-            )
+        pack = _scan_pack(pack_dir)
+        if not pack.pop("manifest_ok"):
+            broken_manifests.append(str(pack.get("manifest_path") or ""))
+        total_docs += int(pack.get("doc_count") or 0)
+        total_bytes += sum(int(doc.get("bytes") or 0) for doc in list(pack.get("documents") or []))
+        category = str(pack.get("category") or "")
         if category and category not in categories_present:
             categories_present.append(category)
-        schema_version = int(normalized.get("schema_version") or 1)
-        variant = str(normalized.get("variant") or "compact").strip().lower()
+        schema_version = int(pack.get("schema_version") or 1)
+        variant = str(pack.get("variant") or "")
         if schema_version not in schema_versions:
             schema_versions.append(schema_version)
         if variant and variant not in variants_present:
             variants_present.append(variant)
-        pack_integrity = _sha256_text(
-            json.dumps(normalized, sort_keys=True, ensure_ascii=False) + "|" + "|".join(str(doc.get("sha256") or "") for doc in doc_rows)
-        )
-        packs.append(
-            {
-                "id": pack_id,
-                "name": name,
-                "category": category,
-                "summary": summary,
-                "tags": tags,
-                "status": str(normalized.get("status") or ("ready" if docs else "empty")).strip().lower(),
-                "manifest_path": str(manifest_path),
-                "schema_version": schema_version,
-                "variant": variant,
-                "trust": str(normalized.get("trust") or "bundled_local"),
-                "updated_at": str(normalized.get("updated_at") or ""),
-                "integrity": pack_integrity,
-                "doc_count": len(doc_rows),
-                "documents": doc_rows,
-            }
-        )
+        packs.append(pack)
     missing = [str(item).strip().lower() for item in required_categories if str(item).strip().lower() not in categories_present]
     readiness = "ready" if packs and not missing else ("partial" if packs else "blocked")
     recommendations: List[str] = []
@@ -205,72 +209,106 @@ def scan_local_packs(
     }
 
 
-def search_local_pack_rows(root_dir: str | Path, query: str, *, limit: int = 4) -> List[Dict[str, Any]]:
-    root = knowledge_pack_root(root_dir)
-    if not root.exists():
-        return []
+def _document_blob(pack: Dict[str, Any], title: str, text: str) -> str:
+    tags = [str(item).strip().lower() for item in list(pack.get("tags") or []) if str(item).strip()]
+    return " ".join(
+        item
+        for item in (
+            str(pack.get("name") or ""),
+            str(pack.get("category") or ""),
+            " ".join(tags),
+            str(pack.get("summary") or ""),
+            title,
+            text,
+        )
+        if str(item or "").strip()
+    ).lower()
+
 
+def _score_document(query_lower: str, tokens: List[str], pack: Dict[str, Any], title: str, blob: str) -> int:
+    pack_name = str(pack.get("name") or pack.get("id") or "").strip().lower()
+    pack_category = str(pack.get("category") or "").strip()
+    tags = [str(item).strip().lower() for item in list(pack.get("tags") or []) if str(item).strip()]
+    title_lower = str(title or "").lower()
+    score = 0
+    if query_lower and query_lower in blob:
+        score += 8
+    for token in tokens:
+        if token in title_lower:
+            score += 3
+        if token in pack_name or token in pack_category:
+            score += 2
+        if token in tags:
+            score += 2
+        if token in blob:
+            score += 1
+    return score
+
+
+def _pack_row(pack: Dict[str, Any], doc: Dict[str, Any], text: str, score: int) -> Dict[str, Any]:
+    pack_id = str(pack.get("id") or "").strip()
+    doc_path = Path(str(doc.get("path") or ""))
+    return {
+        "title": str(doc.get("title") or doc_path.stem.replace("_", " ").title()).strip(),
+        "url": f"local://knowledge-pack/{pack_id}/{_slug(doc_path.stem)}",
+        "description": _excerpt(str(doc.get("excerpt") or pack.get("summary") or ""), limit=320),
+        "content": _excerpt(text, limit=760),
+        "source": "local_pack",
+        "provider": "bundled_local_pack",
+        "knowledge_origin": "bundled_local_pack",
+        "pack_id": pack_id,
+        "pack_category": str(pack.get("category") or "").strip(),
+        "pack_variant": str(pack.get("variant") or "compact"),
+        "local_path": str(doc_path),
+        "score": score,
+        "category": "general",
+        "volatile": False,
+    }
+
+
+def _scan_search_rows(root_dir: str | Path, query: str, *, limit: int = 4) -> List[Dict[str, Any]]:
     query_text = " ".join(str(query or "").split()).strip()
     query_lower = query_text.lower()
     tokens = _query_tokens(query_text)
     rows: List[Dict[str, Any]] = []
     for pack in list(scan_local_packs(root_dir).get("packs") or []):
-        pack_id = str(pack.get("id") or "").strip()
-        pack_name = str(pack.get("name") or pack_id).strip()
-        pack_category = str(pack.get("category") or "").strip()
-        tags = [str(item).strip().lower() for item in list(pack.get("tags") or []) if str(item).strip()]
         for doc in list(pack.get("documents") or []):
-            doc_path = Path(str(doc.get("path") or ""))
-            text = _read_text(doc_path)
-            blob = " ".join(
-                item
-                for item in (
-                    pack_name,
-                    pack_category,
-                    " ".join(tags),
-                    str(pack.get("summary") or ""),
-                    str(doc.get("title") or ""),
-                    text,
-                )
-                if str(item or "").strip()
-            ).lower()
-            score = 0
-            if query_lower and query_lower in blob:
-                score += 8
-            for token in tokens:
-                if token in str(doc.get("title") or "").lower():
-                    score += 3
-                if token in pack_name.lower() or token in pack_category:
-                    score += 2
-                if token in tags:
-                    score += 2
-                if token in blob:
-                    score += 1
+            text = _read_text(Path(str(doc.get("path") or "")))
+            title = str(doc.get("title") or "")
+            score = _score_document(query_lower, tokens, pack, title, _document_blob(pack, title, text))
             if score <= 0:
                 continue
-            doc_slug = _slug(doc_path.stem)
-            rows.append(
-                {
-                    "title": str(doc.get("title") or doc_path.stem.replace("_", " ").title()).strip(),
-                    "url": f"local://knowledge-pack/{pack_id}/{doc_slug}",
-                    "description": _excerpt(str(doc.get("excerpt") or pack.get("summary") or ""), limit=320),
-                    "content": _excerpt(text, limit=760),
-                    "source": "local_pack",
-                    "provider": "bundled_local_pack",
-                    "knowledge_origin": "bundled_local_pack",
-                    "pack_id": pack_id,
-                    "pack_category": pack_category,
-                    "pack_variant": str(pack.get("variant") or "compact"),
-                    "local_path": str(doc_path),
-                    "score": score,
-                    "category": "general",
-                    "volatile": False,
-                }
-            )
+            rows.append(_pack_row(pack, doc, text, score))
     rows.sort(key=lambda item: (-int(item.get("score") or 0), str(item.get("title") or "")))
     return rows[: max(1, int(limit or 4))]
 
 
+def _pack_index(root_dir: str | Path):
+    try:
+        from workshop.toolbox.stacks.research_core.local_pack_index import get_pack_index
+
+        index = get_pack_index(root_dir)
+    except Exception:
+        return None
+    return index if index.available else None
+
+
+def search_local_pack_rows(root_dir: str | Path, query: str, *, limit: int = 4) -> List[Dict[str, Any]]:
+    root = knowledge_pack_root(root_dir)
+    if not root.exists():
+        return []
+    index = _pack_index(root_dir)
+    if index is not None:
+        try:
+            rows = index.search(query, limit=limit)
+        except Exception:
+            rows = []
+        # FTS matches whole tokens and token prefixes; a short answer may be missing substring hits the scan finds.
+        if len(rows) >= max(1, int(limit or 4)):
+            return rows
+    return _scan_search_rows(root_dir, query, limit=limit)
+
+
 def resolve_local_pack_url(root_dir: str | Path, url: str) -> Dict[str, Any]:
     raw = str(url or "").strip()
     if not raw.startswith("local://knowledge-pack/"):
@@ -279,6 +317,14 @@ def resolve_local_pack_url(root_dir: str | Path, url: str) -> Dict[str, Any]:
     if len(parts) < 2:
         return {}
     pack_id, doc_slug = parts[0], parts[1]
+    index = _pack_index(root_dir)
+    if index is not None:
+        try:
+            resolved = index.resolve(pack_id, doc_slug)
+        except Exception:
+            resolved = {}
+        if resolved:
+            return resolved
     for pack in list(scan_local_packs(root_dir).get("packs") or []):
         if str(pack.get("id") or "") != pack_id:
             continue
@@ -8,28 +8,68 @@ import faiss
 import numpy as np
 import json
 from config.settings import RAG_WEBSITES
+from workshop.toolbox.stacks.research_core.rag_store import (
+    MANIFEST_NAME,
+    TEXT_DB_NAME,
+    VECTOR_JOURNAL_NAME,
+    RagTextStore,
+    VectorJournal,
+    build_index,
+    needs_retrain,
+    read_manifest,
+    write_index_atomic,
+    write_manifest,
+)
 
 # Suppress pdfplumber warnings by adjusting logging
 logging.getLogger("pdfplumber").setLevel(logging.ERROR)
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+EMBEDDING_MODEL_NAME = 'all-MiniLM-L12-v2'
+
 class RAGHandler:
-    def __init__(self, storage_path="database/rag_data", nlist=100):
+    def __init__(self, storage_path="database/rag_data", nlist=100, batch_size=128, encode_batch_size=64, checkpoint_every=2000):
         self.storage_path = Path(storage_path)
         self.storage_path.mkdir(exist_ok=True)
         self.vector_file = self.storage_path / "rag_vectors.faiss"
-        self.text_file = self.storage_path / "rag_texts.json"
+        self.text_file = self.storage_path / "rag_texts.json"  # Legacy store, migrated on load
+        self.text_db_file = self.storage_path / TEXT_DB_NAME
+        self.vector_journal_file = self.storage_path / VECTOR_JOURNAL_NAME
         self.precomputed_query_file = self.storage_path / "precomputed_queries.json"
-        self.model = self._load_embedding_model()  # Optimized model
-        self.index = None
-        self.texts = []
+        self.manifest_file = self.storage_path / MANIFEST_NAME
+        self.model_name = EMBEDDING_MODEL_NAME
+        # Model and index load on first use so turns that never touch RAG pay nothing.
+        self._model = None
+        self._index = None
+        self._index_mmapped = False
+        self._loaded = False
+        self.texts = RagTextStore(self.text_db_file)  # Append-only; row id == FAISS id
+        self.journal = None
         self.pdf_folder = Path("research") / "textbooks"
-        self.nlist = nlist  # Number of clusters for IndexIVFFlat
+        self.nlist = nlist  # Minimum clusters for IndexIVFFlat; grows with the corpus
+        self.batch_size = max(1, int(batch_size))  # Buffered chunks per encode/append
+        self.encode_batch_size = max(1, int(encode_batch_size))
+        self.checkpoint_every = max(1, int(checkpoint_every))  # Vectors added between index checkpoints
         self.query_cache = {}  # In-memory cache for query embeddings
         self.precomputed_queries = self._load_precomputed_queries()
-        self.embedding_buffer = []  # Buffer for batching embeddings
-        self._load_indices()
+        self.text_buffer = []  # (content, source) pairs awaiting one batched encode
+        self._unsaved = 0
+
+    @property
+    def model(self):
+        if self._model is None:
+            self._model = self._load_embedding_model()
+        return self._model
+
+    @property
+    def index(self):
+        self._ensure_loaded()
+        return self._index
+
+    def _ensure_loaded(self):
+        if not self._loaded:
+            self._load_indices()
 
     def _load_embedding_model(self):
         """Load sentence-transformers lazily so non-RAG features can still boot."""
@@ -45,7 +85,7 @@ class RAGHandler:
                 ) from exc
             raise
 
-        return SentenceTransformer('all-MiniLM-L12-v2')
+        return SentenceTransformer(self.model_name)
 
     def _load_precomputed_queries(self):
         """Load precomputed query embeddings from a JSON file."""
@@ -58,70 +98,166 @@ class RAGHandler:
                 logger.warning(f"Failed to load precomputed queries: {str(e)}")
         return {}
 
+    def _embedding_dim(self, manifest):
+        """Embedding size from the manifest when it matches this model, otherwise from the model itself."""
+        if manifest.get("model") == self.model_name and int(manifest.get("dim") or 0) > 0:
+            return int(manifest["dim"])
+        dim = self.model.get_sentence_embedding_dimension()
+        if not dim:
+            dim = self.model.encode(["test"])[0].shape[0]
+        return int(dim)
+
+    def _encode(self, contents):
+        embeddings = self.model.encode(
+            list(contents),
+            batch_size=self.encode_batch_size,
+            convert_to_numpy=True,
+            show_progress_bar=False,
+        )
+        return np.asarray(embeddings, dtype=np.float32).reshape(len(contents), -1)
+
+    def _import_legacy_texts(self, index):
+        """Move rag_texts.json into the append-only store, seeding the vector journal from the index."""
+        if not self.text_file.exists() or len(self.texts) > 0:
+            return
+        try:
+            with open(self.text_file, "r") as f:
+                rows = json.load(f)
+            if index is None or index.ntotal != len(rows):
+                raise ValueError(f"index has {0 if index is None else index.ntotal} vectors for {len(rows)} texts")
+            index = faiss.read_index(str(self.vector_file))  # Full copy: mmapped lists are read-only
+            ivf = faiss.try_extract_index_ivf(index)
+            if ivf is not None:
+                ivf.make_direct_map()
+            vectors = index.reconstruct_n(0, index.ntotal)
+        except Exception as e:
+            logger.warning(f"Could not migrate legacy RAG texts, re-study sources to rebuild: {str(e)}")
+            return
+        self.journal.truncate(0)
+        self.journal.append(vectors)
+        self.texts.append((row.get("content", ""), row.get("source", "")) for row in rows)
+        self.text_file.rename(self.text_file.with_name(self.text_file.name + ".migrated"))
+        logger.info(f"Migrated {len(rows)} legacy RAG entries to {self.text_db_file.name}")
+
+    def _read_checkpoint(self):
+        """Memory-map the index checkpoint; pages are faulted in by searches instead of read up front."""
+        if not self.vector_file.exists():
+            return None
+        try:
+            index = faiss.read_index(str(self.vector_file), faiss.IO_FLAG_MMAP | faiss.IO_FLAG_READ_ONLY)
+        except Exception as e:
+            logger.warning(f"Failed to load index checkpoint: {str(e)}")
+            return None
+        self._index_mmapped = True
+        return index
+
+    def _writable_index(self):
+        """Swap a memory-mapped checkpoint for an in-RAM copy before it is modified."""
+        if self._index is not None and self._index_mmapped:
+            self._index = faiss.read_index(str(self.vector_file))
+            self._index_mmapped = False
+        return self._index
+
     def _load_indices(self):
-        """Load existing FAISS index and text metadata."""
-        if self.vector_file.exists() and self.text_file.exists() and self.text_file.stat().st_size > 0:
-            try:
-                self.index = faiss.read_index(str(self.vector_file))
-                sample_embedding = self.model.encode(["test"])[0]
-                if self.index.d != sample_embedding.shape[0]:
-                    logger.warning("Embedding dimension mismatch. Rebuilding index.")
-                    self.index = None
-                    self.texts = []
-                else:
-                    with open(self.text_file, "r") as f:
-                        self.texts = json.load(f)
-                    logger.info(f"Loaded studied data: {len(self.texts)} entries")
-            except Exception as e:
-                logger.warning(f"Failed to load studied data: {str(e)}")
-                self.index = None
-                self.texts = []
+        """Load the last index checkpoint and replay journal rows appended after it."""
+        self._loaded = True
+        self.text_buffer = []
+        self._index_mmapped = False
+        self.texts = RagTextStore(self.text_db_file)
+        manifest = read_manifest(self.manifest_file)
+        dim = self._embedding_dim(manifest)
+        self.journal = VectorJournal(self.vector_journal_file, dim)
+        index = self._read_checkpoint()
+        if manifest and manifest.get("model") != self.model_name:
+            logger.warning(f"RAG index was built with {manifest.get('model')}; rebuilding for {self.model_name}.")
+            index = None
+            self.texts.truncate(0)
+            self.journal.truncate(0)
+        elif index is not None and index.d != dim:
+            logger.warning("Embedding dimension mismatch. Rebuilding index.")
+            index = None
+            self.texts.truncate(0)
+            self.journal.truncate(0)
+        self._import_legacy_texts(index)
+
+        # Texts are appended after vectors, so the shorter of the two is what was committed.
+        committed = min(len(self.texts), len(self.journal))
+        if len(self.texts) > committed:
+            self.texts.truncate(committed)
+        if len(self.journal) > committed:
+            self.journal.truncate(committed)
+
+        self._index = index
+        if committed == 0:
+            self._index = None
+            self._index_mmapped = False
+        elif index is None or index.ntotal > committed:
+            self._index = build_index(self.journal, self.nlist, count=committed)
+            self._index_mmapped = False
+            self._checkpoint()
+        else:
+            replay = committed - int(index.ntotal)
+            if replay > 0:
+                self._writable_index().add(self.journal.read(int(index.ntotal), committed))
+                logger.info(f"Replayed {replay} journal vectors into index")
+            self._unsaved = max(0, replay)
+            if not manifest:
+                write_manifest(self.manifest_file, model=self.model_name, dim=dim, index=self._index)
+        if self._index is not None:
+            logger.info(f"Loaded studied data: {len(self.texts)} entries")
 
     def store(self, content, source):
-        """Buffer content and its embedding for batch processing."""
-        embedding = self.model.encode([content])[0]
-        self.embedding_buffer.append((embedding, content, source))
-        if len(self.embedding_buffer) >= self.nlist:
+        """Buffer content for a batched encode."""
+        self.text_buffer.append((content, source))
+        if len(self.text_buffer) >= self.batch_size:
+            self._flush_buffer()
+
+    def store_many(self, contents, source):
+        """Buffer many chunks from one source (e.g. every page of a PDF) for a single encode call."""
+        self.text_buffer.extend((content, source) for content in contents)
+        if len(self.text_buffer) >= self.batch_size:
             self._flush_buffer()
 
-    def _flush_buffer(self):
-        """Process buffered embeddings and store in FAISS and JSON."""
-        if not self.embedding_buffer:
+    def _checkpoint(self):
+        """Persist the in-memory index; the journal already holds every vector durably."""
+        if self._index is None or self._index_mmapped:
             return
+        write_index_atomic(self._index, self.vector_file)
+        write_manifest(self.manifest_file, model=self.model_name, dim=self.journal.dim, index=self._index)
+        self._unsaved = 0
+        logger.info(f"Checkpointed FAISS index with {self._index.ntotal} vectors")
 
-        embeddings = np.array([item[0] for item in self.embedding_buffer], dtype=np.float32)
-        contents = [item[1] for item in self.embedding_buffer]
-        sources = [item[2] for item in self.embedding_buffer]
+    def _flush_buffer(self, checkpoint=False):
+        """Encode buffered content in one batch, append it to the journal/text store and the index."""
+        self._ensure_loaded()
+        if not self.text_buffer:
+            if checkpoint and self._unsaved:
+                self._checkpoint()
+            return
 
-        if self.index is None:
-            dim = embeddings.shape[1]
-            if len(embeddings) >= self.nlist:
-                # Use IndexIVFFlat if enough vectors
-                quantizer = faiss.IndexFlatL2(dim)
-                self.index = faiss.IndexIVFFlat(quantizer, dim, self.nlist)
-                try:
-                    self.index.train(embeddings)
-                    logger.info(f"Trained IndexIVFFlat with {len(embeddings)} vectors")
-                except Exception as e:
-                    logger.warning(f"Failed to train IndexIVFFlat: {str(e)}. Falling back to IndexFlatL2")
-                    self.index = faiss.IndexFlatL2(dim)
-            else:
-                # Fall back to IndexFlatL2 if insufficient vectors
-                logger.warning(f"Insufficient vectors ({len(embeddings)} < {self.nlist}). Using IndexFlatL2")
-                self.index = faiss.IndexFlatL2(dim)
-            self.texts = []
-
-        self.index.add(embeddings)
-        self.texts.extend({"content": content, "source": source} for content, source in zip(contents, sources))
-        faiss.write_index(self.index, str(self.vector_file))
-        with open(self.text_file, "w") as f:
-            json.dump(self.texts, f)
-        self.embedding_buffer = []
+        contents = [item[0] for item in self.text_buffer]
+        sources = [item[1] for item in self.text_buffer]
+        embeddings = self._encode(contents)
+
+        self.journal.append(embeddings)
+        self.texts.append(zip(contents, sources))
+        self.text_buffer = []
+        count = len(self.texts)
+
+        if self._index is None or needs_retrain(self._index, count, self.nlist):
+            self._index = build_index(self.journal, self.nlist, count=count)
+            self._index_mmapped = False
+            self._unsaved = self.checkpoint_every
+        else:
+            self._writable_index().add(embeddings)
+            self._unsaved += len(embeddings)
+        if checkpoint or self._unsaved >= self.checkpoint_every:
+            self._checkpoint()
         logger.info(f"Stored {len(embeddings)} items in FAISS index")
 
     def retrieve(self, query, k=3):
         """Retrieve top-k relevant content using cached or precomputed embeddings."""
-        if not self.index or not self.texts:
+        if self.index is None or len(self.texts) == 0:
             logger.warning("No studied data available.")
             return []
 
@@ -136,10 +272,11 @@ class RAGHandler:
             self.query_cache[query] = query_embedding
             logger.info(f"Encoded and cached new query: {query}")
 
-        if isinstance(self.index, faiss.IndexIVFFlat):
-            self.index.nprobe = 10
-        distances, indices = self.index.search(np.array([query_embedding], dtype=np.float32), k)
-        return [self.texts[idx] for idx in indices[0] if idx < len(self.texts)]
+        index = self.index
+        if isinstance(index, faiss.IndexIVFFlat):
+            index.nprobe = 10
+        distances, indices = index.search(np.array([query_embedding], dtype=np.float32), k)
+        return self.texts.get_many([int(idx) for idx in indices[0] if idx >= 0])
 
     def get_embedding_model(self):
         """Return the SentenceTransformer model."""
@@ -163,14 +300,12 @@ class RAGHandler:
                 continue
             try:
                 with pdfplumber.open(pdf_path) as pdf:
-                    for page in pdf.pages:
-                        text = page.extract_text() or ""
-                        if text.strip():
-                            self.store(text, str(pdf_path))
+                    pages = [page.extract_text() or "" for page in pdf.pages]
+                self.store_many([text for text in pages if text.strip()], str(pdf_path))
                 logger.info(f"Studied PDF: {pdf_path}")
             except Exception as e:
                 logger.error(f"Error studying PDF {pdf_path}: {str(e)}")
-        self._flush_buffer()  # Ensure remaining buffered embeddings are stored
+        self._flush_buffer(checkpoint=True)  # Store the remainder and checkpoint the index
 
     async def study_websites(self):
         """Scrape and store content from websites."""
@@ -186,7 +321,7 @@ class RAGHandler:
                 except Exception as e:
                     logger.error(f"Error studying website {url}: {str(e)}")
             await browser.close()
-        self._flush_buffer()  # Ensure remaining buffered embeddings are stored
+        self._flush_buffer(checkpoint=True)  # Store the remainder and checkpoint the index
 
     async def ingest_pdfs(self):
         """Unified textbook ingestion path + vector study."""
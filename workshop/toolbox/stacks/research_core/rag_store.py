@@ -0,0 +1,232 @@
+from __future__ import annotations
+
+import json
+import logging
+import math
+import os
+import sqlite3
+import time
+from pathlib import Path
+from threading import RLock
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+import faiss
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+TEXT_DB_NAME = "rag_texts.sqlite3"
+VECTOR_JOURNAL_NAME = "rag_vectors.f32"
+MANIFEST_NAME = "rag_manifest.json"
+# faiss warns below ~39 training points per centroid; retrain once there are enough.
+MIN_POINTS_PER_CENTROID = 39
+MAX_TRAINING_POINTS_PER_CENTROID = 256
+# Grow the IVF partition count once the corpus wants twice as many lists as it has.
+RETRAIN_GROWTH = 2.0
+
+
+class RagTextStore:
+    """Append-only SQLite store for RAG chunk text; ``vector_id`` matches the FAISS row."""
+
+    def __init__(self, db_path: str | Path) -> None:
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = RLock()
+        self._init_db()
+        self._count = self._read_count()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(str(self.db_path), timeout=30.0, check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    def _init_db(self) -> None:
+        with self._lock, self._connect() as conn:
+            conn.executescript(
+                """
+                CREATE TABLE IF NOT EXISTS rag_texts (
+                    vector_id INTEGER PRIMARY KEY,
+                    content TEXT NOT NULL,
+                    source TEXT NOT NULL DEFAULT '',
+                    created_at REAL NOT NULL
+                );
+                CREATE INDEX IF NOT EXISTS idx_rag_texts_source ON rag_texts(source);
+                """
+            )
+
+    def _read_count(self) -> int:
+        with self._lock, self._connect() as conn:
+            row = conn.execute("SELECT COALESCE(MAX(vector_id) + 1, 0) AS n FROM rag_texts").fetchone()
+        return int(row["n"] if row else 0)
+
+    def append(self, rows: Iterable[tuple[str, str]]) -> range:
+        """Append ``(content, source)`` rows; returns the vector ids they were assigned."""
+        items = [(str(content or ""), str(source or "")) for content, source in rows]
+        now = time.time()
+        with self._lock, self._connect() as conn:
+            start = self._count
+            conn.executemany(
+                "INSERT INTO rag_texts(vector_id, content, source, created_at) VALUES (?, ?, ?, ?)",
+                [(start + offset, content, source, now) for offset, (content, source) in enumerate(items)],
+            )
+            self._count = start + len(items)
+        return range(start, start + len(items))
+
+    def truncate(self, count: int) -> None:
+        with self._lock, self._connect() as conn:
+            conn.execute("DELETE FROM rag_texts WHERE vector_id >= ?", (max(0, int(count)),))
+        self._count = self._read_count()
+
+    def get_many(self, vector_ids: Sequence[int]) -> List[Dict[str, Any]]:
+        """Fetch rows for ``vector_ids`` in the order given, skipping unknown ids."""
+        ids = [int(item) for item in vector_ids if 0 <= int(item) < self._count]
+        if not ids:
+            return []
+        marks = ",".join("?" for _ in ids)
+        with self._lock, self._connect() as conn:
+            rows = {
+                int(row["vector_id"]): {"content": row["content"], "source": row["source"]}
+                for row in conn.execute(f"SELECT vector_id, content, source FROM rag_texts WHERE vector_id IN ({marks})", ids)
+            }
+        return [rows[item] for item in ids if item in rows]
+
+    def __getitem__(self, vector_id: int) -> Dict[str, Any]:
+        rows = self.get_many([vector_id])
+        if not rows:
+            raise IndexError(vector_id)
+        return rows[0]
+
+    def __len__(self) -> int:
+        return self._count
+
+
+class VectorJournal:
+    """Append-only float32 file holding every embedding in FAISS row order.
+
+    The journal is the durable copy of the vectors: index checkpoints can lag
+    behind it, and IVF retraining reads its training sample from it.
+    """
+
+    def __init__(self, path: str | Path, dim: int) -> None:
+        self.path = Path(path)
+        self.dim = int(dim)
+        self._lock = RLock()
+
+    @property
+    def row_bytes(self) -> int:
+        return self.dim * 4
+
+    def __len__(self) -> int:
+        try:
+            return self.path.stat().st_size // self.row_bytes
+        except FileNotFoundError:
+            return 0
+
+    def append(self, vectors: np.ndarray) -> None:
+        data = np.ascontiguousarray(vectors, dtype=np.float32).reshape(-1, self.dim)
+        with self._lock, open(self.path, "ab") as handle:
+            data.tofile(handle)
+            handle.flush()
+            os.fsync(handle.fileno())
+
+    def truncate(self, count: int) -> None:
+        with self._lock:
+            if self.path.exists():
+                os.truncate(self.path, max(0, int(count)) * self.row_bytes)
+
+    def read(self, start: int = 0, stop: Optional[int] = None) -> np.ndarray:
+        total = len(self)
+        stop = total if stop is None else min(int(stop), total)
+        if total == 0 or start >= stop:
+            return np.empty((0, self.dim), dtype=np.float32)
+        data = np.memmap(self.path, dtype=np.float32, mode="r", shape=(total, self.dim))
+        return np.array(data[start:stop])
+
+    def sample(self, count: int, *, seed: int = 0) -> np.ndarray:
+        total = len(self)
+        if total <= count:
+            return self.read()
+        data = np.memmap(self.path, dtype=np.float32, mode="r", shape=(total, self.dim))
+        picks = np.sort(np.random.default_rng(seed).choice(total, size=int(count), replace=False))
+        return np.array(data[picks])
+
+
+def target_nlist(count: int, *, minimum: int = 1) -> int:
+    """IVF partition count for ``count`` vectors (the usual ~4*sqrt(N) heuristic)."""
+    return max(int(minimum), int(4 * math.sqrt(max(0, int(count)))))
+
+
+def fitted_nlist(count: int, nlist: int) -> int:
+    """Partition count to train for ``count`` vectors, or 0 while a flat index is the better fit."""
+    count = max(0, int(count))
+    base = max(1, int(nlist))
+    if count < MIN_POINTS_PER_CENTROID * base:
+        return 0
+    return min(max(base, target_nlist(count)), count // MIN_POINTS_PER_CENTROID)
+
+
+def needs_retrain(index, count: int, nlist: int) -> bool:
+    """True when a flat index has enough points for IVF, or an IVF index has outgrown its lists."""
+    if index is None:
+        return False
+    lists = fitted_nlist(count, nlist)
+    if isinstance(index, faiss.IndexIVF):
+        return lists >= RETRAIN_GROWTH * index.nlist
+    return lists > 0
+
+
+def build_index(journal: VectorJournal, nlist: int, *, count: Optional[int] = None):
+    """Build a FAISS index over the first ``count`` journal rows, training IVF when there is enough data."""
+    total = len(journal) if count is None else min(int(count), len(journal))
+    dim = journal.dim
+    lists = fitted_nlist(total, nlist)
+    if lists:
+        quantizer = faiss.IndexFlatL2(dim)
+        index = faiss.IndexIVFFlat(quantizer, dim, lists)
+        try:
+            index.train(journal.sample(min(total, lists * MAX_TRAINING_POINTS_PER_CENTROID)))
+            logger.info(f"Trained IndexIVFFlat nlist={lists} on {total} vectors")
+        except Exception as e:
+            logger.warning(f"Failed to train IndexIVFFlat: {str(e)}. Falling back to IndexFlatL2")
+            index = faiss.IndexFlatL2(dim)
+    else:
+        index = faiss.IndexFlatL2(dim)
+    step = 65536
+    for start in range(0, total, step):
+        index.add(journal.read(start, min(total, start + step)))
+    return index
+
+
+def write_index_atomic(index, path: str | Path) -> None:
+    target = Path(path)
+    tmp = target.with_suffix(target.suffix + ".tmp")
+    faiss.write_index(index, str(tmp))
+    os.replace(tmp, target)
+
+
+def read_manifest(path: str | Path) -> Dict[str, Any]:
+    """Load the index manifest (embedding model, dimension, checkpoint size), or ``{}``."""
+    try:
+        payload = json.loads(Path(path).read_text(encoding="utf-8"))
+    except Exception:
+        return {}
+    return payload if isinstance(payload, dict) else {}
+
+
+def write_manifest(path: str | Path, *, model: str, dim: int, index=None) -> Dict[str, Any]:
+    payload = {
+        "version": 1,
+        "model": str(model),
+        "dim": int(dim),
+        "index_type": type(index).__name__ if index is not None else "",
+        "nlist": int(getattr(index, "nlist", 0) or 0),
+        "ntotal": int(index.ntotal) if index is not None else 0,
+        "updated_at": time.time(),
+    }
+    target = Path(path)
+    tmp = target.with_suffix(target.suffix + ".tmp")
+    tmp.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+    os.replace(tmp, target)
+    return payload
@@ -17,6 +17,7 @@ import asyncio
 import logging
 from typing import Any, Dict, List, Sequence, Tuple
 
+from routing.query_analysis import analyze_query, register_terms
 from workshop.toolbox.stacks.research_core.base import (
     id_type_and_value,
     normalize_query,
@@ -121,10 +122,19 @@ JOURNALISM_TRIGGERS = [
     "sentiment", "public opinion",
 ]
 
+register_terms(
+    BIOMED_TRIGGERS,
+    ENGINEERING_TRIGGERS,
+    NUTRITION_TRIGGERS,
+    RELIGION_TRIGGERS,
+    ENTERTAINMENT_TRIGGERS,
+    BUSINESS_TRIGGERS,
+    JOURNALISM_TRIGGERS,
+)
+
 
 def _contains_any(q: str, needles: Sequence[str]) -> bool:
-    ql = (q or "").lower()
-    return any(n in ql for n in needles)
+    return analyze_query(q).has_any(needles)
 
 
 def _is_sentinel(r: Dict[str, Any]) -> bool:
@@ -1,13 +1,15 @@
 ﻿"""
-Textbook ingestion v2.3 (one-time, idempotent)
+Textbook ingestion v2.4 (one-time, idempotent, resumable)
 - Scan a folder of PDFs, hash each file, skip if already ingested
-- Extract text by page with pdfplumber
-- Chunk into compact "study notes" chunks
+- Extract + chunk page windows with pdfplumber in a process pool
+- Stream each window into one TextbookFactsStore transaction that also
+  advances the book's resume cursor (a crash mid-book resumes, not restarts)
 - Store into TextbookFactsStore + registry (book_id)
 - Emit sidecar markdown for quick local browsing
+- Report throughput in pages/second
 
 Run:
-  python -m workshop.toolbox.stacks.research_core.science_ingest
+  python -m workshop.toolbox.stacks.research_core.science_ingest [--workers N]
 
 Folder default:
   research/textbooks
@@ -15,15 +17,25 @@ Folder default:
 
 from __future__ import annotations
 
+import argparse
 import hashlib
+import logging
+import os
 import re
+import time
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
-from typing import List, Tuple
+from typing import Callable, Deque, List, Optional, Tuple
 
 from .science_stores import TextbookFactsStore, _norm_space
 
 DEFAULT_TEXTBOOKS_DIR = Path("research") / "textbooks"
 DEFAULT_INGESTED_MD_DIR = DEFAULT_TEXTBOOKS_DIR / "ingested"
+DEFAULT_WINDOW_PAGES = 16
+
+logger = logging.getLogger(__name__)
 
 
 def _sha256_file(path: Path, chunk_size: int = 1 << 20) -> str:
@@ -105,24 +117,87 @@ def _discover_pdfs(folder: Path) -> List[Path]:
     return sorted([p for p in folder.rglob("*.pdf") if p.is_file() and "ingested" not in p.parts])
 
 
-def ingest_folder(folder: Path = DEFAULT_TEXTBOOKS_DIR) -> Tuple[int, int]:
-    folder = Path(folder)
-    folder.mkdir(parents=True, exist_ok=True)
+@dataclass
+class IngestStats:
+    books_added: int = 0
+    books_resumed: int = 0
+    chunks_added: int = 0
+    pages: int = 0
+    seconds: float = 0.0
 
-    ingested_dir = DEFAULT_INGESTED_MD_DIR
-    ingested_dir.mkdir(parents=True, exist_ok=True)
+    @property
+    def pages_per_second(self) -> float:
+        return self.pages / self.seconds if self.seconds > 0 else 0.0
 
-    store = TextbookFactsStore()
-    pdfs = _discover_pdfs(folder)
 
-    books_added = 0
-    chunks_added = 0
+@dataclass
+class _BookJob:
+    pdf_path: Path
+    book_id: str
+    title: str
+    page_count: int
+    start_page: int
 
-    if not pdfs:
-        return (0, 0)
 
+def _extract_window(pdf_path: str, start: int, stop: int) -> List[Tuple[int, List[str]]]:
+    """Worker: extract and chunk pages [start, stop) of one PDF; returns (1-based page, chunks) rows."""
     import pdfplumber
 
+    rows: List[Tuple[int, List[str]]] = []
+    with pdfplumber.open(pdf_path) as pdf:
+        for i in range(start, min(stop, len(pdf.pages))):
+            page = pdf.pages[i]
+            try:
+                txt = page.extract_text() or ""
+            except Exception:
+                txt = ""
+            finally:
+                page.close()
+            if not txt or len(txt.strip()) < 120:
+                continue
+            chunks = _chunk_text(txt, max_len=900)
+            if chunks:
+                rows.append((i + 1, chunks))
+    return rows
+
+
+def _page_count(pdf_path: Path) -> int:
+    import pdfplumber
+
+    with pdfplumber.open(str(pdf_path)) as pdf:
+        return len(pdf.pages)
+
+
+def _write_sidecar(path: Path, lines: List[str]) -> None:
+    path.write_text("\n".join(lines), encoding="utf-8")
+
+
+def _write_book_sidecar(store: TextbookFactsStore, job: _BookJob, md_sidecar: Path) -> None:
+    md_lines: List[str] = [
+        f"# {job.title}",
+        "",
+        f"Source: {job.pdf_path}",
+        f"Book ID: {job.book_id}",
+        "",
+        "## Extracted Notes",
+        "",
+    ]
+    current_page = None
+    for page, chunk in store.book_chunks(job.book_id, per_page=6):
+        if page != current_page:
+            if current_page is not None:
+                md_lines.append("")
+            md_lines.append(f"### Page {page}")
+            current_page = page
+        md_lines.append(f"- {chunk}")
+    if current_page is not None:
+        md_lines.append("")
+        _write_sidecar(md_sidecar, md_lines)
+
+
+def _plan_books(store: TextbookFactsStore, pdfs: List[Path], ingested_dir: Path, stats: IngestStats) -> List[_BookJob]:
+    jobs: List[_BookJob] = []
+    planned: set[str] = set()
     for pdf_path in pdfs:
         try:
             file_hash = _sha256_file(pdf_path)
@@ -130,76 +205,155 @@ def ingest_folder(folder: Path = DEFAULT_TEXTBOOKS_DIR) -> Tuple[int, int]:
             continue
 
         md_sidecar = ingested_dir / f"{pdf_path.stem}.md"
-        if store.book_exists(file_hash):
+        # Copies of one PDF under different paths share a book_id; only the first is queued.
+        if file_hash in planned or store.book_exists(file_hash):
             if not md_sidecar.exists():
-                md_sidecar.write_text(
-                    "\n".join(
-                        [
-                            f"# {pdf_path.stem}",
-                            "",
-                            f"Source: {pdf_path}",
-                            "",
-                            "Already ingested (hash match).",
-                        ]
-                    ),
-                    encoding="utf-8",
+                _write_sidecar(
+                    md_sidecar,
+                    [
+                        f"# {pdf_path.stem}",
+                        "",
+                        f"Source: {pdf_path}",
+                        "",
+                        "Already ingested (hash match).",
+                    ],
                 )
             continue
 
+        try:
+            page_count = _page_count(pdf_path)
+        except Exception as e:
+            logger.warning(f"Skipping unreadable PDF {pdf_path}: {e}")
+            continue
+
         title = pdf_path.stem
         book_id = file_hash[:12]
-
-        store.register_book(
+        start_page = store.begin_book(
             book_id=book_id,
             title=title,
             file_path=str(pdf_path),
             file_hash=file_hash,
+            page_count=page_count,
         )
-        books_added += 1
-
-        md_lines: List[str] = [
-            f"# {title}",
-            "",
-            f"Source: {pdf_path}",
-            f"Book ID: {book_id}",
-            "",
-            "## Extracted Notes",
-            "",
-        ]
-
-        with pdfplumber.open(str(pdf_path)) as pdf:
-            for i, page in enumerate(pdf.pages):
-                try:
-                    txt = page.extract_text() or ""
-                except Exception:
-                    txt = ""
-                if not txt or len(txt.strip()) < 120:
-                    continue
-
-                chunks = _chunk_text(txt, max_len=900)
-                if not chunks:
-                    continue
-
-                chunks_added += store.add_chunks(
-                    book_id=book_id,
-                    title=title,
-                    page=i + 1,
-                    chunks=chunks,
-                    tags="textbook",
-                )
+        if start_page > 0:
+            stats.books_resumed += 1
+        stats.books_added += 1
+        planned.add(file_hash)
+        jobs.append(_BookJob(pdf_path=pdf_path, book_id=book_id, title=title, page_count=page_count, start_page=start_page))
+    return jobs
+
+
+def ingest_folder_stats(
+    folder: Path = DEFAULT_TEXTBOOKS_DIR,
+    *,
+    workers: Optional[int] = None,
+    window_pages: int = DEFAULT_WINDOW_PAGES,
+    progress: Optional[Callable[[IngestStats], None]] = None,
+) -> IngestStats:
+    """
+    Ingest every new PDF under ``folder``.
 
-                md_lines.append(f"### Page {i + 1}")
-                for ch in chunks[:6]:
-                    md_lines.append(f"- {ch}")
-                md_lines.append("")
+    Page windows of ``window_pages`` are extracted by up to ``workers`` processes
+    (``workers <= 1`` extracts inline) and committed strictly in order, one
+    transaction per window, so at most ``2 * workers`` windows are in flight.
+    """
+    folder = Path(folder)
+    folder.mkdir(parents=True, exist_ok=True)
 
-        if len(md_lines) > 7:
-            md_sidecar.write_text("\n".join(md_lines), encoding="utf-8")
+    ingested_dir = DEFAULT_INGESTED_MD_DIR
+    ingested_dir.mkdir(parents=True, exist_ok=True)
 
-    return books_added, chunks_added
+    store = TextbookFactsStore()
+    pdfs = _discover_pdfs(folder)
+    stats = IngestStats()
+    if not pdfs:
+        return stats
+
+    started = time.perf_counter()
+    jobs = _plan_books(store, pdfs, ingested_dir, stats)
+    windows = [
+        (job, start, min(job.page_count, start + max(1, int(window_pages))))
+        for job in jobs
+        for start in range(job.start_page, job.page_count, max(1, int(window_pages)))
+    ]
+    worker_count = max(1, int(workers if workers is not None else min(4, os.cpu_count() or 1)))
+    pool = ProcessPoolExecutor(max_workers=worker_count) if worker_count > 1 and len(windows) > 1 else None
+    pending: Deque[Tuple[_BookJob, int, int, Future]] = deque()
+    queued = iter(windows)
+    failed: set[str] = set()
+
+    def _submit_next() -> bool:
+        nxt = next(queued, None)
+        if nxt is None:
+            return False
+        job, start, stop = nxt
+        if pool is None:
+            future: Future = Future()
+            try:
+                future.set_result(_extract_window(str(job.pdf_path), start, stop))
+            except Exception as e:
+                future.set_exception(e)
+        else:
+            future = pool.submit(_extract_window, str(job.pdf_path), start, stop)
+        pending.append((job, start, stop, future))
+        return True
+
+    try:
+        while len(pending) < worker_count * 2 and _submit_next():
+            pass
+        while pending:
+            job, start, stop, future = pending.popleft()
+            _submit_next()
+            if job.book_id in failed:
+                continue
+            try:
+                rows = future.result()
+            except Exception as e:
+                # Leave the cursor before this window (and drop the book's later windows) so the next run retries it.
+                logger.warning(f"Page extraction failed for {job.pdf_path} pages {start + 1}-{stop}: {e}")
+                failed.add(job.book_id)
+                continue
+            stats.chunks_added += store.add_page_batch(
+                book_id=job.book_id,
+                title=job.title,
+                pages=rows,
+                next_page=stop,
+                tags="textbook",
+            )
+            stats.pages += stop - start
+            stats.seconds = time.perf_counter() - started
+            if progress is not None:
+                progress(stats)
+    finally:
+        if pool is not None:
+            pool.shutdown(cancel_futures=True)
+
+    for job in jobs:
+        if job.book_id not in failed:
+            store.finish_book(job.book_id)
+            _write_book_sidecar(store, job, ingested_dir / f"{job.pdf_path.stem}.md")
+    stats.seconds = time.perf_counter() - started
+    logger.info(
+        f"Textbook ingest: books={stats.books_added} (resumed {stats.books_resumed}) pages={stats.pages} "
+        f"chunks={stats.chunks_added} in {stats.seconds:.1f}s ({stats.pages_per_second:.1f} pages/s)"
+    )
+    return stats
+
+
+def ingest_folder(folder: Path = DEFAULT_TEXTBOOKS_DIR, *, workers: Optional[int] = None) -> Tuple[int, int]:
+    stats = ingest_folder_stats(folder, workers=workers)
+    return stats.books_added, stats.chunks_added
 
 
 if __name__ == "__main__":
-    b, c = ingest_folder(DEFAULT_TEXTBOOKS_DIR)
-    print(f"[science_ingest] books_added={b}, chunks_added={c}")
+    parser = argparse.ArgumentParser(description="Ingest textbook PDFs into the Agentpedia textbook store.")
+    parser.add_argument("folder", nargs="?", default=str(DEFAULT_TEXTBOOKS_DIR))
+    parser.add_argument("--workers", type=int, default=None, help="Extraction processes (default: min(4, CPUs)).")
+    parser.add_argument("--window-pages", type=int, default=DEFAULT_WINDOW_PAGES, help="Pages per extraction task/transaction.")
+    args = parser.parse_args()
+    result = ingest_folder_stats(Path(args.folder), workers=args.workers, window_pages=args.window_pages)
+    print(
+        f"[science_ingest] books_added={result.books_added}, chunks_added={result.chunks_added}, "
+        f"pages={result.pages}, pages_per_second={result.pages_per_second:.1f}"
+    )
 
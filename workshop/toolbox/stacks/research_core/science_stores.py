@@ -2,6 +2,7 @@
 Science Stores v2.2
 - SQLite stores for: verified facts, researched facts, textbook facts (+ book registry)
 - AgentpediaManager for conflicts/dedupe/promotion (no network calls)
+- Near-duplicate candidates come from a MinHash/LSH index over all three stores
 - No imports from handlers/science.py (prevents circular imports)
 
 Fixes:
@@ -18,7 +19,9 @@ import time
 from dataclasses import dataclass
 from difflib import SequenceMatcher
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from workshop.toolbox.stacks.research_core.near_duplicates import NearDuplicateIndex
 
 # ----------------------------
 # Paths
@@ -349,6 +352,15 @@ class TextbookFactsStore(_SQLiteBase):
             c.execute("CREATE INDEX IF NOT EXISTS idx_tb_book ON textbook_facts(book_id)")
             c.execute("CREATE INDEX IF NOT EXISTS idx_tb_page ON textbook_facts(page)")
             c.execute("CREATE INDEX IF NOT EXISTS idx_tb_created ON textbook_facts(created_at)")
+            # Resumable ingestion: next_page advances in the same transaction as each page batch.
+            c.execute("""
+            CREATE TABLE IF NOT EXISTS textbook_ingest_progress (
+                book_id TEXT PRIMARY KEY,
+                page_count INTEGER NOT NULL,
+                next_page INTEGER NOT NULL DEFAULT 0,
+                updated_at REAL NOT NULL
+            )
+            """)
             c.commit()
 
             # Optional FTS5 (safe attempt)
@@ -362,7 +374,9 @@ class TextbookFactsStore(_SQLiteBase):
         if not file_hash:
             return False
         with self._connect() as c:
-            row = c.execute("SELECT 1 FROM textbook_books WHERE file_hash=? LIMIT 1", (file_hash,)).fetchone()
+            row = c.execute(
+                "SELECT 1 FROM textbook_books WHERE file_hash=? AND processed_at IS NOT NULL LIMIT 1", (file_hash,)
+            ).fetchone()
             return bool(row)
 
     def register_book(self, *, book_id: str, title: str, file_path: str, file_hash: str) -> None:
@@ -373,31 +387,87 @@ class TextbookFactsStore(_SQLiteBase):
             """, (book_id, title, file_path, file_hash, _now(), _now()))
             c.commit()
 
+    def begin_book(self, *, book_id: str, title: str, file_path: str, file_hash: str, page_count: int) -> int:
+        """
+        Register a book for (possibly resumed) ingestion; returns the 0-based page to continue from.
+        The book only counts as ingested once finish_book() stamps processed_at.
+        """
+        with self._connect() as c:
+            c.execute("""
+            INSERT OR IGNORE INTO textbook_books (book_id, title, file_path, file_hash, processed_at, created_at)
+            VALUES (?, ?, ?, ?, NULL, ?)
+            """, (book_id, title, file_path, file_hash, _now()))
+            c.execute("""
+            INSERT OR IGNORE INTO textbook_ingest_progress (book_id, page_count, next_page, updated_at)
+            VALUES (?, ?, 0, ?)
+            """, (book_id, int(page_count), _now()))
+            row = c.execute("SELECT next_page FROM textbook_ingest_progress WHERE book_id=?", (book_id,)).fetchone()
+            c.commit()
+        return int(row[0]) if row else 0
+
+    def finish_book(self, book_id: str) -> None:
+        with self._connect() as c:
+            c.execute("UPDATE textbook_books SET processed_at=? WHERE book_id=?", (_now(), book_id))
+            c.execute("DELETE FROM textbook_ingest_progress WHERE book_id=?", (book_id,))
+            c.commit()
+
+    def _insert_chunks(self, c: sqlite3.Connection, *, book_id: str, title: str, page: int, chunks: List[str], tags: str) -> int:
+        rows = [ch for ch in (_norm_space(ch) for ch in chunks) if len(ch) >= 80]
+        if not rows:
+            return 0
+        now = _now()
+        c.executemany("""
+        INSERT INTO textbook_facts (book_id, title, page, chunk, tags, created_at)
+        VALUES (?, ?, ?, ?, ?, ?)
+        """, [(book_id, title, int(page), ch, tags, now) for ch in rows])
+
+        # FTS mirror
+        try:
+            c.executemany("INSERT INTO textbook_facts_fts (chunk, tags, title, book_id) VALUES (?, ?, ?, ?)",
+                          [(ch, tags, title, book_id) for ch in rows])
+        except Exception:
+            pass
+        return len(rows)
+
     def add_chunks(self, *, book_id: str, title: str, page: int, chunks: List[str], tags: str = "") -> int:
         book_id = _norm_space(book_id)
         if not book_id or not chunks:
             return 0
+        with self._connect() as c:
+            inserted = self._insert_chunks(c, book_id=book_id, title=title, page=page, chunks=chunks, tags=tags)
+            c.commit()
+        return inserted
+
+    def add_page_batch(self, *, book_id: str, title: str, pages: Sequence[Tuple[int, List[str]]],
+                       next_page: int, tags: str = "") -> int:
+        """
+        Insert chunks for several pages and advance the book's resume cursor in one transaction,
+        so an interrupted ingest never stores a page twice or skips one.
+        """
+        book_id = _norm_space(book_id)
+        if not book_id:
+            return 0
         inserted = 0
         with self._connect() as c:
-            for ch in chunks:
-                ch = _norm_space(ch)
-                if len(ch) < 80:
-                    continue
-                c.execute("""
-                INSERT INTO textbook_facts (book_id, title, page, chunk, tags, created_at)
-                VALUES (?, ?, ?, ?, ?, ?)
-                """, (book_id, title, int(page), ch, tags, _now()))
-                inserted += 1
-
-                # FTS mirror
-                try:
-                    c.execute("INSERT INTO textbook_facts_fts (chunk, tags, title, book_id) VALUES (?, ?, ?, ?)",
-                              (ch, tags, title, book_id))
-                except Exception:
-                    pass
+            for page, chunks in pages:
+                inserted += self._insert_chunks(c, book_id=book_id, title=title, page=page, chunks=chunks, tags=tags)
+            c.execute("UPDATE textbook_ingest_progress SET next_page=?, updated_at=? WHERE book_id=?",
+                      (int(next_page), _now(), book_id))
             c.commit()
         return inserted
 
+    def book_chunks(self, book_id: str, *, per_page: int = 6) -> List[Tuple[int, str]]:
+        """(page, chunk) rows for a book in page order, at most ``per_page`` per page."""
+        out: List[Tuple[int, str]] = []
+        counts: Dict[int, int] = {}
+        with self._connect() as c:
+            for page, chunk in c.execute("SELECT page, chunk FROM textbook_facts WHERE book_id=? ORDER BY page, id", (book_id,)):
+                if counts.get(page, 0) >= per_page:
+                    continue
+                counts[page] = counts.get(page, 0) + 1
+                out.append((int(page), chunk))
+        return out
+
     def lookup(self, query: str, *, limit: int = 5) -> List[Dict[str, Any]]:
         q_raw = _norm_space(query)
         q = q_raw.lower()
@@ -476,6 +546,16 @@ class AgentpediaConflict:
     source: str
 
 
+# store -> (table, topic column, fact column, confidence expr, source expr)
+_DUP_SOURCES: Dict[str, Tuple[str, str, str, str, str]] = {
+    "verified": ("verified_facts", "topic", "fact", "confidence", "source"),
+    "researched": ("researched_facts", "topic", "fact", "confidence", "source"),
+    "textbook": ("textbook_facts", "title", "chunk", "'foundational'", "''"),
+}
+# Textbook chunks outnumber facts by orders of magnitude; they are only indexed when asked for by name.
+_DEFAULT_DUP_STORES: Tuple[str, ...] = ("verified", "researched")
+
+
 class AgentpediaManager:
     """
     Conflict handling + dedupe + promotion.
@@ -488,41 +568,124 @@ class AgentpediaManager:
         self.verified = verified or VerifiedScienceStore()
         self.textbook = textbook or TextbookFactsStore()
         self.researched = researched or ResearchedScienceStore()
+        self._dup_index: Optional[NearDuplicateIndex] = None
+        self._dup_cursor: Dict[str, int] = {name: 0 for name in _DUP_SOURCES}
+
+    def _store_path(self, store: str) -> Path:
+        return {"verified": self.verified, "researched": self.researched, "textbook": self.textbook}[store].path
+
+    def _near_duplicate_index(self, stores: Sequence[str] = _DEFAULT_DUP_STORES) -> NearDuplicateIndex:
+        """Lazily build the LSH index, then fold in ``stores`` rows added since the last call (ids only grow)."""
+        if self._dup_index is None:
+            self._dup_index = NearDuplicateIndex()
+        for store in stores:
+            table, _topic, fact_col, _conf, _src = _DUP_SOURCES[store]
+            with sqlite3.connect(self._store_path(store), timeout=5) as c:
+                rows = c.execute(
+                    f"SELECT id, {fact_col} FROM {table} WHERE id > ? ORDER BY id",
+                    (self._dup_cursor[store],),
+                ).fetchall()
+            for rid, fact in rows:
+                self._dup_index.add((store, int(rid)), str(fact or ""))
+                self._dup_cursor[store] = int(rid)
+        return self._dup_index
+
+    def _fetch_candidates(self, keys: Sequence[Tuple[str, int]]) -> Dict[Tuple[str, int], Dict[str, Any]]:
+        by_store: Dict[str, List[int]] = {}
+        for store, rid in keys:
+            by_store.setdefault(store, []).append(int(rid))
+        out: Dict[Tuple[str, int], Dict[str, Any]] = {}
+        for store, ids in by_store.items():
+            table, topic_col, fact_col, conf_expr, src_expr = _DUP_SOURCES[store]
+            marks = ",".join("?" for _ in ids)
+            with sqlite3.connect(self._store_path(store), timeout=5) as c:
+                rows = c.execute(
+                    f"SELECT id, {topic_col}, {fact_col}, {conf_expr}, {src_expr} FROM {table} WHERE id IN ({marks})",
+                    ids,
+                ).fetchall()
+            for rid, topic, fact, confidence, source in rows:
+                out[(store, int(rid))] = {
+                    "topic": str(topic or ""),
+                    "fact": str(fact or ""),
+                    "confidence": str(confidence or "medium"),
+                    "source": str(source or ""),
+                }
+        return out
 
-    def detect_conflicts(self, topic: str, new_fact: str, *, threshold: float = 0.82) -> List[AgentpediaConflict]:
-        topic_n = _norm_space(topic).lower()
-        fact_n = _norm_space(new_fact).lower()
-        if not topic_n or not fact_n:
-            return []
-
-        conflicts: List[AgentpediaConflict] = []
-
-        candidates: List[Dict[str, Any]] = []
-        candidates.extend(self.verified.lookup(topic, min_confidence="high", limit=30))
-        candidates.extend(self.researched.list_recent(limit=200))
-
-        for c in candidates:
-            ctopic = _norm_space(str(c.get("title") or "")).lower()
-            cfact = _norm_space(str(c.get("description") or "")).lower()
-            if not ctopic or not cfact:
-                continue
-
-            topic_sim = SequenceMatcher(None, topic_n, ctopic).ratio()
-            if topic_sim < 0.72:
-                continue
+    @staticmethod
+    def _is_conflict(topic_n: str, fact_n: str, store: str, row: Dict[str, Any], threshold: float) -> bool:
+        ctopic = _norm_space(row.get("topic") or "").lower()
+        cfact = _norm_space(row.get("fact") or "").lower()
+        if not cfact:
+            return False
+        # Textbook "topics" are book titles, so only the fact text is compared there.
+        if store != "textbook":
+            if not ctopic or SequenceMatcher(None, topic_n, ctopic).ratio() < 0.72:
+                return False
+        return SequenceMatcher(None, fact_n, cfact).ratio() >= threshold
+
+    def near_duplicates(self, fact: str, *, stores: Optional[Sequence[str]] = None, limit: int = 20) -> List[Tuple[str, int, float]]:
+        """LSH candidates ``(store, id, estimated_jaccard)`` for ``fact`` across the Agentpedia stores."""
+        allowed = tuple(stores or _DEFAULT_DUP_STORES)
+        hits = self._near_duplicate_index(allowed).candidates(fact, limit=max(limit, 1) * 4)
+        return [(key[0], key[1], est) for key, est in hits if key[0] in allowed][: max(1, int(limit))]
 
-            sim = SequenceMatcher(None, fact_n, cfact).ratio()
-            if sim >= threshold:
+    def detect_conflicts(self, topic: str, new_fact: str, *, threshold: float = 0.82) -> List[AgentpediaConflict]:
+        return self.detect_conflicts_bulk([{"topic": topic, "fact": new_fact}], threshold=threshold)[0]
+
+    def detect_conflicts_bulk(
+        self,
+        facts: Sequence[Dict[str, Any]],
+        *,
+        threshold: float = 0.82,
+        stores: Optional[Sequence[str]] = None,
+    ) -> List[List[AgentpediaConflict]]:
+        """
+        Conflicts for each of ``facts`` (dicts with topic/fact) against the stores and against
+        earlier items of the same batch (reported with store="batch" and id=batch position).
+        """
+        allowed = tuple(stores or _DEFAULT_DUP_STORES)
+        index = self._near_duplicate_index(allowed)
+        batch = NearDuplicateIndex()
+        prepared: List[Tuple[str, str, Any, List[Tuple[str, int]]]] = []
+        wanted: List[Tuple[str, int]] = []
+        for pos, item in enumerate(facts or []):
+            topic_n = _norm_space(str(item.get("topic") or "")).lower()
+            fact_n = _norm_space(str(item.get("fact") or "")).lower()
+            sig = index.signature(fact_n) if topic_n and fact_n else None
+            keys: List[Tuple[str, int]] = []
+            if sig is not None:
+                keys = [key for key, _ in index.candidates(signature=sig) if key[0] in allowed]
+                keys += [("batch", int(key)) for key, _ in batch.candidates(signature=sig)]
+                batch.add(pos, signature=sig)
+            wanted.extend(key for key in keys if key[0] != "batch")
+            prepared.append((topic_n, fact_n, sig, keys))
+
+        rows = self._fetch_candidates(sorted(set(wanted)))
+        results: List[List[AgentpediaConflict]] = []
+        for topic_n, fact_n, sig, keys in prepared:
+            conflicts: List[AgentpediaConflict] = []
+            for store, rid in keys:
+                if store == "batch":
+                    other = facts[rid]
+                    row = {"topic": str(other.get("topic") or ""), "fact": str(other.get("fact") or ""),
+                           "confidence": str(other.get("confidence") or "medium"), "source": str(other.get("source") or "")}
+                else:
+                    row = rows.get((store, rid))
+                    if row is None:
+                        continue
+                if not self._is_conflict(topic_n, fact_n, store, row, threshold):
+                    continue
                 conflicts.append(AgentpediaConflict(
-                    store=str(c.get("store") or c.get("source") or "researched"),
-                    id=int(c.get("id") or 0),
-                    topic=str(c.get("title") or ""),
-                    fact=str(c.get("description") or ""),
-                    confidence=str(c.get("confidence") or "medium"),
-                    source=str(c.get("url") or ""),
+                    store=store,
+                    id=rid,
+                    topic=row["topic"],
+                    fact=row["fact"],
+                    confidence=row["confidence"],
+                    source=row["source"],
                 ))
-
-        return conflicts
+            results.append(conflicts)
+        return results
 
     def deprecate_fact(self, store: str, fact_id: int) -> bool:
         store = (store or "").lower().strip()
@@ -542,31 +705,36 @@ class AgentpediaManager:
             c.execute("PRAGMA busy_timeout=2000;")
             c.execute(f"DELETE FROM {table} WHERE id=?", (fact_id,))
             c.commit()
-            return True
+        if self._dup_index is not None:
+            self._dup_index.remove(("verified" if table == "verified_facts" else "researched", int(fact_id)))
+        return True
 
     def promote_researched_to_verified(self, *, dry_run: bool = True, min_age_days: int = 7) -> int:
-        promoted = 0
         min_age = _now() - (min_age_days * 86400)
 
+        eligible: List[Dict[str, Any]] = []
         for rf in self.researched.list_recent(limit=500):
             if (rf.get("confidence") or "") != "high":
                 continue
             if float(rf.get("created_at") or 0) > min_age:
                 continue
-
             topic = str(rf.get("title") or "").strip()
             fact = str(rf.get("description") or "").strip()
             url = str(rf.get("url") or "").strip()
-            tags = str(rf.get("tags") or "").strip()
-
             if not topic or not fact or not url:
                 continue
             if self.verified.lookup(topic, min_confidence="high", limit=1):
                 continue
+            eligible.append({"topic": topic, "fact": fact, "source": url, "tags": str(rf.get("tags") or "").strip()})
 
+        # One bulk pass over what is left: skip near-duplicates of verified facts or of earlier items in this batch.
+        promoted = 0
+        conflicts = self.detect_conflicts_bulk(eligible, stores=("verified",))
+        for rf, hits in zip(eligible, conflicts):
+            if hits:
+                continue
             if not dry_run:
-                self.verified.add_fact(topic=topic, fact=fact, source=url, confidence="high", tags=tags)
+                self.verified.add_fact(topic=rf["topic"], fact=rf["fact"], source=rf["source"], confidence="high", tags=rf["tags"])
             promoted += 1
 
         return promoted
-
@@ -11,7 +11,7 @@ import socket
 import ipaddress
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Tuple
 from urllib.parse import urljoin, urlparse, urlunparse, parse_qsl, urlencode
 
 import httpx
@@ -83,11 +83,12 @@ try:
 except Exception:
     bundle_from_results = None
 
-from workshop.toolbox.stacks.research_core.composer import research_compose
+from workshop.toolbox.stacks.research_core.composer import assess_row_adequacy, research_compose
 from workshop.toolbox.stacks.research_core.browse_planner import BrowsePlan, build_browse_plan, comparison_subjects, infer_official_domains, is_shopping_compare_query, is_software_change_query, is_travel_lookup_query, is_trip_planning_query
-from workshop.toolbox.stacks.research_core.evidence_cache import EvidenceCacheStore, canonicalize_url
+from workshop.toolbox.stacks.research_core.evidence_cache import EvidenceCacheStore, canonicalize_url, query_signature
 from workshop.toolbox.stacks.research_core.github_local import choose_repositories, extract_repo_urls, inspect_github_repository
 from workshop.toolbox.stacks.research_core.local_packs import search_local_pack_rows
+from routing.query_analysis import analyze_query, register_terms
 from runtime.ollama_options import build_ollama_chat_options
 
 
@@ -554,7 +555,15 @@ def _fetch_url_text_requests(
         return (url, "")
 
 
+def _consume_task_outcomes(tasks: List[asyncio.Task[Any]]) -> None:
+    # Finished tasks nobody awaited would otherwise log "Task exception was never retrieved".
+    for task in tasks:
+        if task and task.done() and not task.cancelled():
+            task.exception()
+
+
 async def _cancel_tasks_silently(tasks: List[asyncio.Task[Any]], *, grace_s: float = 0.25) -> None:
+    _consume_task_outcomes(list(tasks or []))
     pending = [task for task in list(tasks or []) if task and not task.done()]
     if not pending:
         return
@@ -563,6 +572,7 @@ async def _cancel_tasks_silently(tasks: List[asyncio.Task[Any]], *, grace_s: flo
             task.cancel()
     with contextlib.suppress(Exception):
         await asyncio.wait(pending, timeout=max(0.0, float(grace_s)))
+    _consume_task_outcomes(pending)
     leftovers = [task for task in pending if not task.done()]
     if not leftovers:
         return
@@ -571,6 +581,45 @@ async def _cancel_tasks_silently(tasks: List[asyncio.Task[Any]], *, grace_s: flo
             asyncio.gather(*leftovers, return_exceptions=True),
             timeout=max(0.0, float(grace_s)),
         )
+
+
+_STRONG_RESEARCH_TERMS = (
+    "guideline",
+    "guidelines",
+    "consensus",
+    "practice guideline",
+    "practice guidelines",
+    "recommendation",
+    "recommendations",
+    "protocol",
+    "protocols",
+    "standard of care",
+    "best practice",
+    "best practices",
+    "trial",
+    "trials",
+    "randomized",
+    "randomised",
+    "rct",
+    "rcts",
+    "systematic review",
+    "systematic reviews",
+    "meta-analysis",
+    "meta-analyses",
+    "meta analysis",
+    "meta analyses",
+    "study",
+    "studies",
+    "paper",
+    "papers",
+    "evidence",
+    "literature",
+    "clinical evidence",
+    "pubmed",
+    "europepmc",
+    "crossref",
+)
+_STOCK_KEYWORDS = ("stock", "stocks", "share price", "shares", "ticker", "price of", "market cap", "quote")
 
 
 class WebSearchHandler:
@@ -654,6 +703,7 @@ class WebSearchHandler:
         self.page_cache = TTLCache(ttl_seconds=600, max_items=256)
         self.research_bundle_cache = TTLCache(ttl_seconds=1800, max_items=96)
         self.evidence_store = EvidenceCacheStore(root=evidence_cache_dir or "state/research_cache", ttl_seconds=1800, max_records=256)
+        self.evidence_cache_stats: Dict[str, int] = {"lookups": 0, "memory_hits": 0, "store_hits": 0, "resumed": 0}
         self.project_root = Path(__file__).resolve().parents[4]
         self.local_pack_root = self.project_root / "knowledge_packs"
 
@@ -673,11 +723,31 @@ class WebSearchHandler:
         self._re_doi = re.compile(r"\b10\.\d{4,9}/[-._;()/:A-Z0-9]+\b", re.IGNORECASE)
         self._re_nct = re.compile(r"\bnct\d{8}\b", re.IGNORECASE)
         self._re_arxiv = re.compile(r"\barxiv[:\s]*\d{4}\.\d{4,5}\b", re.IGNORECASE)
+        register_terms(
+            self.research_terms,
+            self.crypto_terms,
+            self.index_terms,
+            self.weather_terms,
+            self.news_terms,
+            _STRONG_RESEARCH_TERMS,
+            _STOCK_KEYWORDS,
+        )
         self.last_research_bundle: Optional[Dict[str, Any]] = None
         self.last_browse_report: Optional[Dict[str, Any]] = None
 
     def _evidence_cache_key(self, query: str, *, mode: str, domain: str = "general") -> str:
-        return f"evidence::{str(domain or 'general').strip().lower()}::{str(mode or 'deep').strip().lower()}::{self._normalize_cache_key(query)}"
+        # Keyed by token signature so reordered/rephrased questions share the in-memory bundle too.
+        signature = query_signature(query) or self._normalize_cache_key(query)
+        return f"evidence::{str(domain or 'general').strip().lower()}::{str(mode or 'deep').strip().lower()}::{signature}"
+
+    def evidence_cache_hit_rate(self) -> Dict[str, Any]:
+        stats = dict(self.evidence_cache_stats)
+        lookups = int(stats.get("lookups") or 0)
+        hits = int(stats.get("memory_hits") or 0) + int(stats.get("store_hits") or 0)
+        stats["hit_rate"] = round(hits / lookups, 4) if lookups else 0.0
+        stats["resume_rate"] = round(int(stats.get("resumed") or 0) / lookups, 4) if lookups else 0.0
+        stats["store"] = dict(self.evidence_store.stats)
+        return stats
 
     def _evidence_cache_ttl_seconds(self, plan: BrowsePlan) -> int:
         if plan.needs_recency or plan.official_preferred:
@@ -736,16 +806,23 @@ class WebSearchHandler:
 
     def _resume_cached_evidence(self, query: str, plan: BrowsePlan, *, domain: str = "general") -> List[Dict[str, Any]]:
         cache_key = self._evidence_cache_key(query, mode=plan.mode, domain=domain)
+        self.evidence_cache_stats["lookups"] += 1
         payload = self.research_bundle_cache.get(cache_key)
-        if not isinstance(payload, dict):
+        cache_match = "memory"
+        if isinstance(payload, dict):
+            self.evidence_cache_stats["memory_hits"] += 1
+        else:
             payload = self.evidence_store.load(query, mode=plan.mode, domain=domain)
             if isinstance(payload, dict):
+                cache_match = str(payload.get("cache_match") or "exact")
+                self.evidence_cache_stats["store_hits"] += 1
                 self.research_bundle_cache.set(cache_key, payload)
         if not isinstance(payload, dict) or not self._cached_bundle_adequate(query, plan, payload):
             return []
         rows = self._cached_bundle_rows(payload)
         if not rows:
             return []
+        self.evidence_cache_stats["resumed"] += 1
         report = dict(payload.get("report") or {}) if isinstance(payload.get("report") or {}, dict) else {}
         limitations = [str(item or "").strip() for item in list(report.get("limitations") or payload.get("limitations") or []) if str(item or "").strip()]
         sources = [str(item or "").strip() for item in list(report.get("sources") or payload.get("artifact_refs") or []) if str(item or "").strip()]
@@ -774,6 +851,8 @@ class WebSearchHandler:
         if isinstance(self.last_browse_report, dict):
             self.last_browse_report["cached"] = True
             self.last_browse_report["cache_age_seconds"] = self.evidence_store.age_seconds(payload)
+            self.last_browse_report["cache_match"] = cache_match
+            self.last_browse_report["evidence_cache"] = self.evidence_cache_hit_rate()
             self.last_browse_report["artifact_refs"] = [canonicalize_url(item) for item in sources if canonicalize_url(item)]
         return rows
 
@@ -817,15 +896,13 @@ class WebSearchHandler:
         return datetime.now(self.timezone).strftime("%Y-%m-%d %H:%M:%S %Z")
 
     def _contains_query_term(self, query_lower: str, term: str) -> bool:
-        ql = str(query_lower or "").strip().lower()
         needle = str(term or "").strip().lower()
-        if not ql or not needle:
+        if not needle:
             return False
-        pattern = rf"(?<![a-z0-9]){re.escape(needle)}(?![a-z0-9])"
-        return re.search(pattern, ql) is not None
+        return analyze_query(query_lower).has_word(needle)
 
     def _contains_any_query_term(self, query_lower: str, terms: List[str] | tuple[str, ...]) -> bool:
-        return any(self._contains_query_term(query_lower, term) for term in list(terms or []))
+        return analyze_query(query_lower).has_any_word(terms or ())
 
     def _maybe_build_shadow_bundle(self, query: str, results: List[Dict[str, Any]], *, domain: str = "science") -> None:
         if not RESEARCHER_BUNDLE_SHADOW_MODE or bundle_from_results is None:
@@ -3569,6 +3646,8 @@ class WebSearchHandler:
                 category="general",
                 top_n=2,
                 max_n=6,
+                question=query,
+                until_adequate=True,
             )
         except Exception:
             pass
@@ -4221,6 +4300,8 @@ class WebSearchHandler:
                         category="general",
                         top_n=2,
                         max_n=6,
+                        question=query,
+                        until_adequate=True,
                     )
                 except Exception:
                     pass
@@ -4663,43 +4744,7 @@ class WebSearchHandler:
             # and is often academic/web-research
             return True
 
-        strong_research_terms = (
-            "guideline",
-            "guidelines",
-            "consensus",
-            "practice guideline",
-            "practice guidelines",
-            "recommendation",
-            "recommendations",
-            "protocol",
-            "protocols",
-            "standard of care",
-            "best practice",
-            "best practices",
-            "trial",
-            "trials",
-            "randomized",
-            "randomised",
-            "rct",
-            "rcts",
-            "systematic review",
-            "systematic reviews",
-            "meta-analysis",
-            "meta-analyses",
-            "meta analysis",
-            "meta analyses",
-            "study",
-            "studies",
-            "paper",
-            "papers",
-            "evidence",
-            "literature",
-            "clinical evidence",
-            "pubmed",
-            "europepmc",
-            "crossref",
-        )
-        if self._contains_any_query_term(ql, strong_research_terms):
+        if self._contains_any_query_term(ql, _STRONG_RESEARCH_TERMS):
             return True
 
         explainer_prefixes = (
@@ -4820,8 +4865,7 @@ class WebSearchHandler:
         if self._contains_any_query_term(ql, self.index_terms):
             matches.add("stock/commodity")
 
-        stock_keywords = ["stock", "stocks", "share price", "shares", "ticker", "price of", "market cap", "quote"]
-        if self._contains_any_query_term(ql, stock_keywords):
+        if self._contains_any_query_term(ql, _STOCK_KEYWORDS):
             matches.add("stock/commodity")
 
         # NOTE: removed this bug source:
@@ -5039,6 +5083,9 @@ Query: {query}
         category: str,
         top_n: int = 3,
         max_n: int = 6,
+        *,
+        question: str = "",
+        until_adequate: bool = False,
     ) -> List[Dict[str, Any]]:
         if not results:
             return results  # type: ignore
@@ -5046,6 +5093,12 @@ Query: {query}
         ranked = self._rank_results(results, category)
         ranked = self._dedupe_results(ranked)
 
+        if until_adequate and question:
+            # Fetching stops once the pages read answer ``question``; rows never streamed still get any cached text.
+            async for _row in self._stream_fetch_and_attach_content(results, category, top_n=top_n, max_n=max_n, question=question):
+                pass
+            return [self._with_cached_content(r) for r in ranked]
+
         pick_n = max(1, int(top_n))
         pick_n = min(pick_n, len(ranked))
 
@@ -5080,16 +5133,85 @@ Query: {query}
                 if tasks2:
                     await asyncio.gather(*tasks2, return_exceptions=True)
 
-        enriched: List[Dict[str, Any]] = []
-        for r in ranked:
-            url = r["url"]
-            content = self.page_cache.get(url)
-            rr: Dict[str, Any] = dict(r)
-            if isinstance(content, str) and content.strip():
-                rr["content"] = _safe_trim(content, 6000)
-            enriched.append(rr)
+        return [self._with_cached_content(r) for r in ranked]
+
+    def _with_cached_content(self, row: Dict[str, Any]) -> Dict[str, Any]:
+        rr: Dict[str, Any] = dict(row)
+        content = self.page_cache.get(row["url"])
+        if isinstance(content, str) and content.strip():
+            rr["content"] = _safe_trim(content, 6000)
+        return rr
+
+    async def _stream_fetch_and_attach_content(
+        self,
+        results: List[Dict[str, str]],
+        category: str,
+        *,
+        top_n: int = 3,
+        max_n: int = 6,
+        question: str = "",
+        is_adequate: Optional[Callable[[List[Dict[str, Any]]], bool]] = None,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Streaming counterpart of ``_fetch_and_attach_content``.
+
+        Rows of the same ranked pick are yielded as soon as their page text is
+        available (cached rows first), so one slow host no longer holds back
+        the rest. After each row the adequacy check runs over everything yielded
+        so far; once it passes, in-flight fetches are cancelled and the stream
+        ends. Without ``is_adequate`` the answer adequacy checks for
+        ``question`` are used, and without a question the stream only stops
+        when the fetches are exhausted.
+        """
+        if not results:
+            return
+        ranked = self._dedupe_results(self._rank_results(results, category))
+        if is_adequate is None and question:
+            is_adequate = lambda rows: assess_row_adequacy(question, rows).adequate  # noqa: E731
+
+        yielded: List[Dict[str, Any]] = []
 
-        return enriched
+        def _adequate() -> bool:
+            if is_adequate is None or not any(row.get("content") for row in yielded):
+                return False
+            try:
+                return bool(is_adequate(yielded))
+            except Exception as e:
+                logger.debug(f"Streaming adequacy check failed: {e}")
+                return False
+
+        pick_n = min(max(1, int(top_n)), len(ranked))
+        waves = [ranked[:pick_n]]
+        if pick_n < min(max_n, len(ranked)):
+            waves.append(ranked[pick_n : min(max_n, len(ranked))])
+
+        tasks: Dict[asyncio.Task[Any], Dict[str, Any]] = {}
+        async with httpx.AsyncClient() as client:
+            try:
+                for wave_index, wave in enumerate(waves):
+                    if wave_index > 0 and any(len(str(row.get("content") or "").strip()) > 400 for row in yielded):
+                        break
+                    for r in wave:
+                        cached = self.page_cache.get(r["url"])
+                        if isinstance(cached, str) and cached:
+                            row = self._with_cached_content(r)
+                            yielded.append(row)
+                            yield row
+                            if _adequate():
+                                return
+                        else:
+                            tasks[asyncio.create_task(self._bounded_fetch(client, r["url"]))] = r
+                    while tasks:
+                        done, _ = await asyncio.wait(list(tasks), return_when=asyncio.FIRST_COMPLETED)
+                        _consume_task_outcomes(list(done))
+                        for task in sorted(done, key=lambda t: ranked.index(tasks[t])):
+                            row = self._with_cached_content(tasks.pop(task))
+                            yielded.append(row)
+                            yield row
+                            if _adequate():
+                                return
+            finally:
+                await _cancel_tasks_silently(list(tasks))
 
     def _normalize_cache_key(self, q: str) -> str:
         qq = (q or "").lower().strip()
@@ -5178,6 +5300,10 @@ Query: {query}
         return has_latest and has_clinical
 
     def _query_focus_terms(self, query: str) -> List[str]:
+        qa = analyze_query(query)
+        return list(qa.memo("websearch.focus_terms", lambda: self._compute_focus_terms(qa.text)))
+
+    def _compute_focus_terms(self, query: str) -> List[str]:
         ql = (query or "").strip().lower()
         if not ql:
             return []
@@ -6473,7 +6599,7 @@ Query: {query}
 
         self._clear_browse_report()
         query_lower = query.lower().strip()
-        browse_plan = build_browse_plan(query, intent_hint=intent_hint, route_hint="websearch")
+        browse_plan = build_browse_plan(query, intent_hint=intent_hint, route_hint="websearch", analysis=analyze_query(query))
         self._append_browse_step(
             query,
             step="plan",
@@ -6761,7 +6887,7 @@ Query: {query}
 
         query_lower = q.lower()
         fetch_fullpage = self._needs_fullpage_fetch(query_lower)
-        browse_plan = build_browse_plan(q)
+        browse_plan = build_browse_plan(q, analysis=analyze_query(q))
         self._append_browse_step(
             q,
             step="plan",
@@ -6867,6 +6993,8 @@ Query: {query}
                         category="general",
                         top_n=3,
                         max_n=6,
+                        question=q,
+                        until_adequate=True,
                     )
                     content_count = sum(1 for row in enriched if str((row or {}).get("content") or "").strip())
                     if content_count: